@@ -0,0 +1,107 @@
+/**
+ * LLM Call Log Benchmark
+ * Appends 1M entries to an LLMLogStore in a temporary directory, then
+ * measures filtered paging, deep paging and latency/cost rollups, and the
+ * cost of appending on the request path.
+ *
+ * Usage: npx tsx scripts/bench-llm-log.ts [entryCount]
+ */
+
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { performance } from 'perf_hooks';
+import { LLMLogStore } from '../server/utils/llmLogStore.ts';
+import type { LLMLogEntry } from '../server/utils/llmLogger.ts';
+
+const ENTRY_COUNT = Number(process.argv[2]) || 1_000_000;
+const PROVIDERS = ['openai', 'gemini', 'lmstudio', 'claude-code'];
+const MODELS_PER_PROVIDER = 3;
+const PROJECT_COUNT = 200;
+const BASE_TIME = Date.parse('2025-01-01T00:00:00Z');
+
+function makeEntry(i: number): LLMLogEntry {
+  const provider = PROVIDERS[i % PROVIDERS.length];
+  return {
+    id: `log-${i}`,
+    timestamp: new Date(BASE_TIME + i * 100).toISOString(),
+    provider,
+    model: `${provider}-model-${i % MODELS_PER_PROVIDER}`,
+    projectId: `project-${i % PROJECT_COUNT}`,
+    request: {
+      prompt: 'Generate the feature list for the inventory system',
+      parameters: { temperature: 0.7, maxTokens: 4096 },
+    },
+    response: {
+      usage: { prompt_tokens: 1200, completion_tokens: 800, total_tokens: 2000 },
+    },
+    metrics: {
+      duration_ms: 200 + ((i * 7919) % 5000),
+      estimated_cost: provider === 'openai' ? 0.011 : undefined,
+    },
+    error: i % 50 === 0 ? { message: 'HTTP 429: rate limited', code: '429' } : undefined,
+  };
+}
+
+async function measure<T>(label: string, fn: () => Promise<T>): Promise<T> {
+  const start = performance.now();
+  const result = await fn();
+  console.log(`${label.padEnd(36)} ${(performance.now() - start).toFixed(1).padStart(10)} ms`);
+  return result;
+}
+
+async function main(): Promise<void> {
+  const logDir = await fs.mkdtemp(path.join(os.tmpdir(), 'bench-llm-log-'));
+  const store = new LLMLogStore({
+    logDir,
+    maxTotalBytes: Infinity,
+    maxAgeMs: Infinity,
+    segmentSpanMs: Infinity,
+    maxBatchSize: 5000,
+  });
+
+  try {
+    console.log(`${ENTRY_COUNT} entries`);
+
+    let appendMs = 0;
+    await measure('append + write', async () => {
+      for (let i = 0; i < ENTRY_COUNT; i++) {
+        const start = performance.now();
+        store.append(makeEntry(i));
+        appendMs += performance.now() - start;
+        if (i % 5000 === 4999) {
+          await store.flush();
+        }
+      }
+      await store.flush();
+    });
+    console.log(`${'append (request path, per entry)'.padEnd(36)} ${((appendMs * 1000) / ENTRY_COUNT).toFixed(2).padStart(10)} µs`);
+
+    const stats = await store.getStats();
+    console.log(`${stats.segments} segments, ${(stats.bytes / 1024 / 1024).toFixed(1)} MB`);
+
+    await measure('first page (no filter)', () => store.query({ limit: 50 }));
+    await measure('first page (project + errors)', () => store.query({ projectId: 'project-150', status: 'error', limit: 50 }));
+    await measure('first page (provider, last hour)', () =>
+      store.query({ provider: 'gemini', from: BASE_TIME + ENTRY_COUNT * 100 - 3_600_000, limit: 50 })
+    );
+
+    await measure('20 pages of 50 (model filter)', async () => {
+      let cursor: string | undefined;
+      for (let page = 0; page < 20; page++) {
+        const result = await store.query({ model: 'openai-model-1', cursor, limit: 50 });
+        cursor = result.nextCursor ?? undefined;
+      }
+    });
+
+    await measure('rollups by model (all entries)', () => store.getRollups({}, 'model'));
+    await measure('rollups by project (one provider)', () => store.getRollups({ provider: 'openai' }, 'project'));
+  } finally {
+    await fs.rm(logDir, { recursive: true, force: true });
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,143 @@
+/**
+ * Task Storage Benchmark
+ * Compares task lookup/update latency of the indexed task store against the
+ * previous full-workspace scan at 10/100/1000 projects.
+ *
+ * Usage: npx tsx scripts/bench-task-storage.ts
+ */
+
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { performance } from 'perf_hooks';
+import { randomUUID } from 'crypto';
+
+const PROJECT_COUNTS = [10, 100, 1000];
+const TASKS_PER_PROJECT = 20;
+const ITERATIONS = 200;
+
+interface BenchTask {
+  id: string;
+  projectId: string;
+  title: string;
+  featureList: string;
+  updatedAt: string;
+}
+
+/**
+ * Previous implementation: readdir + parse every project until a match
+ */
+async function scanGetTaskById(
+  workspacePath: string,
+  taskId: string
+): Promise<{ task: BenchTask; projectId: string } | null> {
+  const entries = await fs.readdir(workspacePath, { withFileTypes: true });
+  for (const entry of entries) {
+    if (entry.isDirectory()) {
+      try {
+        const content = await fs.readFile(path.join(workspacePath, entry.name, 'tasks', 'tasks.json'), 'utf-8');
+        const task = (JSON.parse(content) as BenchTask[]).find((t) => t.id === taskId);
+        if (task) {
+          return { task, projectId: entry.name };
+        }
+      } catch {
+        // Skip projects without tasks
+      }
+    }
+  }
+  return null;
+}
+
+/**
+ * Previous implementation: scan, then re-read and rewrite the project file
+ */
+async function scanUpdateTask(workspacePath: string, taskId: string, featureList: string): Promise<void> {
+  const result = await scanGetTaskById(workspacePath, taskId);
+  if (!result) {
+    throw new Error(`Task not found: ${taskId}`);
+  }
+  const tasksPath = path.join(workspacePath, result.projectId, 'tasks', 'tasks.json');
+  const tasks = JSON.parse(await fs.readFile(tasksPath, 'utf-8')) as BenchTask[];
+  const index = tasks.findIndex((t) => t.id === taskId);
+  tasks[index] = { ...tasks[index], featureList, updatedAt: new Date().toISOString() };
+  await fs.writeFile(tasksPath, JSON.stringify(tasks, null, 2), 'utf-8');
+}
+
+async function seedWorkspace(workspacePath: string, projectCount: number): Promise<string[]> {
+  const taskIds: string[] = [];
+  for (let p = 0; p < projectCount; p++) {
+    const projectId = randomUUID();
+    const tasksDir = path.join(workspacePath, projectId, 'tasks');
+    await fs.mkdir(tasksDir, { recursive: true });
+    const tasks: BenchTask[] = Array.from({ length: TASKS_PER_PROJECT }, (_, i) => ({
+      id: randomUUID(),
+      projectId,
+      title: `Task ${i}`,
+      featureList: 'x'.repeat(2000),
+      updatedAt: new Date().toISOString(),
+    }));
+    taskIds.push(...tasks.map((t) => t.id));
+    await fs.writeFile(path.join(tasksDir, 'tasks.json'), JSON.stringify(tasks, null, 2), 'utf-8');
+  }
+  return taskIds;
+}
+
+async function measure(iterations: number, fn: (i: number) => Promise<unknown>): Promise<number> {
+  const start = performance.now();
+  for (let i = 0; i < iterations; i++) {
+    await fn(i);
+  }
+  return (performance.now() - start) / iterations;
+}
+
+async function main(): Promise<void> {
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'task-bench-'));
+  process.chdir(root);
+
+  // Import after chdir so WORKSPACE_PATH points at the benchmark workspace
+  const { WORKSPACE_PATH } = await import('../server/utils/projectStorage.ts');
+  const taskStorage = await import('../server/utils/taskStorage.ts');
+
+  console.log(`Tasks per project: ${TASKS_PER_PROJECT}, iterations: ${ITERATIONS}`);
+  console.log('projects | scan lookup | indexed lookup | scan update | indexed update  (ms/op)');
+
+  try {
+    for (const projectCount of PROJECT_COUNTS) {
+      await fs.rm(WORKSPACE_PATH, { recursive: true, force: true });
+      await fs.mkdir(WORKSPACE_PATH, { recursive: true });
+      taskStorage.clearTaskStorageCache();
+
+      const taskIds = await seedWorkspace(WORKSPACE_PATH, projectCount);
+      const pick = (i: number): string => taskIds[(i * 7919) % taskIds.length];
+      const scanIterations = projectCount >= 1000 ? Math.max(20, ITERATIONS / 10) : ITERATIONS;
+
+      const scanLookup = await measure(scanIterations, (i) => scanGetTaskById(WORKSPACE_PATH, pick(i)));
+      const scanUpdate = await measure(scanIterations, (i) =>
+        scanUpdateTask(WORKSPACE_PATH, pick(i), `scan ${i}`)
+      );
+
+      // Warm the index and cache once, as a running server would be
+      for (const taskId of taskIds) {
+        await taskStorage.getTaskById(taskId);
+      }
+      const indexedLookup = await measure(ITERATIONS, (i) => taskStorage.getTaskById(pick(i)));
+      const indexedUpdate = await measure(ITERATIONS, (i) =>
+        taskStorage.updateTask(pick(i), { featureList: `indexed ${i}` })
+      );
+      await taskStorage.flushTaskIndex();
+
+      console.log(
+        `${String(projectCount).padStart(8)} | ${scanLookup.toFixed(3).padStart(11)} | ` +
+          `${indexedLookup.toFixed(3).padStart(14)} | ${scanUpdate.toFixed(3).padStart(11)} | ` +
+          `${indexedUpdate.toFixed(3).padStart(14)}`
+      );
+    }
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,157 @@
+/**
+ * Version Storage Benchmark
+ * Compares disk usage and save/list latency of the delta-compressed version
+ * store against the previous one-file-per-version layout at 100/500/1000
+ * revisions of a ~15 KB markdown document.
+ *
+ * Usage: npx tsx scripts/bench-version-storage.ts
+ */
+
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { performance } from 'perf_hooks';
+import { randomUUID } from 'crypto';
+
+const REVISION_COUNTS = [100, 500, 1000];
+const MEASURED_SAVES = 20;
+const LIST_ITERATIONS = 20;
+const DOCUMENT_LINES = 200;
+
+interface LegacyVersion {
+  id: string;
+  taskId: string;
+  content: string;
+  timestamp: string;
+  author: string;
+  versionNumber: number;
+}
+
+/**
+ * Document at a given revision: every revision rewrites one line and every
+ * tenth revision appends a paragraph
+ */
+function makeDocument(revision: number): string {
+  const lines = Array.from(
+    { length: DOCUMENT_LINES + Math.floor(revision / 10) },
+    (_, i) => `- Requirement ${i}: the system shall handle case ${i} as described in section ${i % 12}.`
+  );
+  lines[(revision * 37) % lines.length] = `- Requirement revised in revision ${revision}.`;
+  return `# Design Document\n\n${lines.join('\n')}\n`;
+}
+
+/**
+ * Previous implementation: read every version file to list or number versions
+ */
+async function legacyGetVersions(versionsDir: string): Promise<LegacyVersion[]> {
+  const ids = JSON.parse(await fs.readFile(path.join(versionsDir, 'versions.json'), 'utf-8')) as string[];
+  const versions: LegacyVersion[] = [];
+  for (const id of ids) {
+    versions.push(JSON.parse(await fs.readFile(path.join(versionsDir, `${id}.json`), 'utf-8')));
+  }
+  return versions.sort((a, b) => a.versionNumber - b.versionNumber);
+}
+
+async function legacySaveVersion(versionsDir: string, taskId: string, content: string, scan: boolean): Promise<void> {
+  await fs.mkdir(versionsDir, { recursive: true });
+  const indexPath = path.join(versionsDir, 'versions.json');
+  const ids = JSON.parse(await fs.readFile(indexPath, 'utf-8').catch(() => '[]')) as string[];
+
+  // Seeding skips the scan; measured saves pay for it as the old code did
+  const versionNumber = scan
+    ? Math.max(0, ...(await legacyGetVersions(versionsDir)).map((v) => v.versionNumber)) + 1
+    : ids.length + 1;
+
+  const version: LegacyVersion = {
+    id: randomUUID(),
+    taskId,
+    content,
+    timestamp: new Date().toISOString(),
+    author: 'bench',
+    versionNumber,
+  };
+  await fs.writeFile(path.join(versionsDir, `${version.id}.json`), JSON.stringify(version, null, 2), 'utf-8');
+  ids.push(version.id);
+  await fs.writeFile(indexPath, JSON.stringify(ids, null, 2), 'utf-8');
+}
+
+async function directorySize(dir: string): Promise<number> {
+  let total = 0;
+  for (const entry of await fs.readdir(dir)) {
+    total += (await fs.stat(path.join(dir, entry))).size;
+  }
+  return total;
+}
+
+async function measure(iterations: number, fn: (i: number) => Promise<unknown>): Promise<number> {
+  const start = performance.now();
+  for (let i = 0; i < iterations; i++) {
+    await fn(i);
+  }
+  return (performance.now() - start) / iterations;
+}
+
+function formatKb(bytes: number): string {
+  return `${(bytes / 1024).toFixed(0)} KB`;
+}
+
+async function main(): Promise<void> {
+  const root = await fs.mkdtemp(path.join(os.tmpdir(), 'version-bench-'));
+  process.chdir(root);
+
+  // Import after chdir so WORKSPACE_PATH points at the benchmark workspace
+  const { WORKSPACE_PATH } = await import('../server/utils/projectStorage.ts');
+  const versionStorage = await import('../server/utils/versionStorage.ts');
+
+  console.log(`Document: ~${formatKb(makeDocument(0).length)}, measured saves: ${MEASURED_SAVES}`);
+  console.log(
+    'revisions | legacy disk | delta disk | legacy save | delta save | legacy list | delta list | delta full list  (ms/op)'
+  );
+
+  try {
+    for (const revisions of REVISION_COUNTS) {
+      const projectId = randomUUID();
+      const legacyTask = randomUUID();
+      const deltaTask = randomUUID();
+      const legacyDir = path.join(WORKSPACE_PATH, projectId, 'tasks', legacyTask, 'versions');
+      const deltaDir = path.dirname(versionStorage.getVersionIndexFilePath(projectId, deltaTask));
+      const seeded = revisions - MEASURED_SAVES;
+
+      for (let i = 1; i <= seeded; i++) {
+        await legacySaveVersion(legacyDir, legacyTask, makeDocument(i), false);
+      }
+      const legacySave = await measure(MEASURED_SAVES, (i) =>
+        legacySaveVersion(legacyDir, legacyTask, makeDocument(seeded + i + 1), true)
+      );
+
+      for (let i = 1; i <= seeded; i++) {
+        await versionStorage.saveVersion(projectId, { taskId: deltaTask, content: makeDocument(i), author: 'bench' });
+      }
+      const deltaSave = await measure(MEASURED_SAVES, (i) =>
+        versionStorage.saveVersion(projectId, {
+          taskId: deltaTask,
+          content: makeDocument(seeded + i + 1),
+          author: 'bench',
+        })
+      );
+
+      const legacyList = await measure(LIST_ITERATIONS, () => legacyGetVersions(legacyDir));
+      const deltaList = await measure(LIST_ITERATIONS, () => versionStorage.listVersions(projectId, deltaTask));
+      const deltaFullList = await measure(LIST_ITERATIONS, () => versionStorage.getVersions(projectId, deltaTask));
+
+      console.log(
+        `${String(revisions).padStart(9)} | ${formatKb(await directorySize(legacyDir)).padStart(11)} | ` +
+          `${formatKb(await directorySize(deltaDir)).padStart(10)} | ${legacySave.toFixed(2).padStart(11)} | ` +
+          `${deltaSave.toFixed(2).padStart(10)} | ${legacyList.toFixed(2).padStart(11)} | ` +
+          `${deltaList.toFixed(2).padStart(10)} | ${deltaFullList.toFixed(2).padStart(15)}`
+      );
+    }
+  } finally {
+    await fs.rm(root, { recursive: true, force: true });
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -22,10 +22,12 @@ import {
   restoreArchivedTask,
   deleteProjectArchive,
 } from './routes/archives.ts';
-import { analyticsRouter } from './routes/analytics.ts';
-import { discoverProjectSystems } from './routes/discovery.ts';
+import { analyticsRouter, getAnalyticsSummaries } from './routes/analytics.ts';
+import { discoverProjectSystems, discoverProjectSystemsBatch } from './routes/discovery.ts';
 import { llmSettingsRouter } from './routes/llmSettings.ts';
 import { debugRouter } from './routes/debug.ts';
+import { passthroughRouter } from './routes/passthrough.ts';
+import { getPipelineScheduler } from './utils/pipelineScheduler.ts';
 import {
   getProjectCompletedDocuments,
   getProjectCompletedDocument,
@@ -73,6 +75,9 @@ export function createApp(): Express {
   app.get('/api/tasks/:taskId/qa', getTaskQA);
   app.post('/api/tasks/:taskId/generate-design', generateDesign);
 
+  // Passthrough pipeline routes (SPEC-PASSTHROUGH-001)
+  app.use('/api/tasks', passthroughRouter);
+
   // AI Generation routes (Claude Code Integration)
   app.use('/api/generate', generateRouter);
 
@@ -87,9 +92,11 @@ export function createApp(): Express {
 
   // Analytics routes
   app.use('/api/projects/:projectId/analytics', analyticsRouter);
+  app.get('/api/analytics/summaries', getAnalyticsSummaries);
 
   // Discovery routes (Auto-exploration)
   app.post('/api/projects/:projectId/discover', discoverProjectSystems);
+  app.post('/api/projects/:projectId/discover/batch', discoverProjectSystemsBatch);
 
   // Completed Documents routes (SPEC-DOCREF-001)
   app.get('/api/projects/:projectId/completed-documents', getProjectCompletedDocuments);
@@ -114,4 +121,9 @@ if (isMainModule) {
   app.listen(PORT, () => {
     console.log(`Server running on port ${PORT}`);
   });
+
+  // Resume pipelines that were queued or running before the last shutdown
+  getPipelineScheduler().start().catch((error) => {
+    console.error('Failed to start pipeline scheduler:', error);
+  });
 }
@@ -5,12 +5,13 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import request from 'supertest';
 import express, { type Express } from 'express';
-import { analyticsRouter } from '../analytics.ts';
+import { analyticsRouter, getAnalyticsSummaries } from '../analytics.ts';
 import type { DashboardSummary, TimelineDataPoint } from '../../../src/types/index.ts';
 
 // Mock analyticsStorage
 vi.mock('../../utils/analyticsStorage.ts', () => ({
   calculateSummary: vi.fn(),
+  calculateSummaries: vi.fn(),
   calculateTimeline: vi.fn(),
 }));
 
@@ -43,6 +44,7 @@ describe('Analytics API Routes', () => {
     app = express();
     app.use(express.json());
     app.use('/api/projects/:projectId/analytics', analyticsRouter);
+    app.get('/api/analytics/summaries', getAnalyticsSummaries);
     vi.clearAllMocks();
   });
 
@@ -183,4 +185,39 @@ describe('Analytics API Routes', () => {
       expect(response.body.error).toBe('Database error');
     });
   });
+
+  describe('GET /api/analytics/summaries', () => {
+    it('should return summaries for the requested projects', async () => {
+      const other = { ...mockSummary, projectId: 'project-2' };
+      vi.mocked(analyticsStorage.calculateSummaries).mockResolvedValueOnce([mockSummary, other]);
+
+      const response = await request(app)
+        .get('/api/analytics/summaries?projectIds=project-1,project-2,project-1')
+        .expect(200);
+
+      expect(response.body.data).toEqual([mockSummary, other]);
+      expect(analyticsStorage.calculateSummaries).toHaveBeenCalledWith(['project-1', 'project-2']);
+    });
+
+    it('should require projectIds', async () => {
+      const response = await request(app).get('/api/analytics/summaries').expect(400);
+
+      expect(response.body.success).toBe(false);
+    });
+  });
+
+  describe('timeline CSV usage columns', () => {
+    it('should include token and cost columns', async () => {
+      vi.mocked(analyticsStorage.calculateTimeline).mockResolvedValueOnce([
+        { ...mockTimeline[0], inputTokens: 1000, outputTokens: 500, estimatedCost: 0.0125 },
+      ]);
+
+      const response = await request(app)
+        .get('/api/projects/project-1/analytics/export')
+        .expect(200);
+
+      expect(response.text).toContain('Input Tokens,Output Tokens,Estimated Cost');
+      expect(response.text).toContain('2024-01-01,5,3,2,1000,500,0.012500');
+    });
+  });
 });
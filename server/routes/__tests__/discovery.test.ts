@@ -10,37 +10,32 @@
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import request from 'supertest';
 import express from 'express';
-import type { SystemDocument } from '../../../src/types/index.ts';
 
 // Mock modules before import
 vi.mock('../../utils/keywordExtractor.ts', () => ({
   extractKeywords: vi.fn(),
 }));
 
-vi.mock('../../utils/systemMatcher.ts', () => ({
-  matchSystemsByKeywords: vi.fn(),
-}));
-
 vi.mock('../../utils/projectStorage.ts', () => ({
   getProjectById: vi.fn(),
 }));
 
 vi.mock('../../utils/systemStorage.ts', () => ({
-  getSystemsByProject: vi.fn(),
+  matchSystemDocuments: vi.fn(),
+  matchSystemDocumentsBatch: vi.fn(),
 }));
 
 // Import after mocking
-import { discoverProjectSystems } from '../discovery.ts';
+import { discoverProjectSystems, discoverProjectSystemsBatch } from '../discovery.ts';
 import { extractKeywords } from '../../utils/keywordExtractor.ts';
-import { matchSystemsByKeywords } from '../../utils/systemMatcher.ts';
 import { getProjectById } from '../../utils/projectStorage.ts';
-import { getSystemsByProject } from '../../utils/systemStorage.ts';
+import { matchSystemDocuments, matchSystemDocumentsBatch } from '../../utils/systemStorage.ts';
 
 // Type cast mocks
 const mockExtractKeywords = vi.mocked(extractKeywords);
-const mockMatchSystemsByKeywords = vi.mocked(matchSystemsByKeywords);
 const mockGetProjectById = vi.mocked(getProjectById);
-const mockGetSystemsByProject = vi.mocked(getSystemsByProject);
+const mockMatchSystemDocuments = vi.mocked(matchSystemDocuments);
+const mockMatchSystemDocumentsBatch = vi.mocked(matchSystemDocumentsBatch);
 
 /**
  * Create test Express app with discovery router
@@ -49,6 +44,7 @@ function createTestApp() {
   const app = express();
   app.use(express.json());
   app.post('/api/projects/:projectId/discover', discoverProjectSystems);
+  app.post('/api/projects/:projectId/discover/batch', discoverProjectSystemsBatch);
   return app;
 }
 
@@ -69,24 +65,6 @@ function createMockProject(overrides = {}) {
   };
 }
 
-/**
- * Helper function to create mock system
- */
-function createMockSystem(overrides: Partial<SystemDocument> = {}): SystemDocument {
-  return {
-    id: 'system-1',
-    projectId: 'project-1',
-    name: 'Test System',
-    category: 'core',
-    tags: ['tag1', 'tag2'],
-    content: 'Test content',
-    dependencies: [],
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-    ...overrides,
-  };
-}
-
 /**
  * Generate feature text with minimum 100 characters
  */
@@ -112,16 +90,12 @@ describe('discovery API routes', () => {
       const featureText = generateValidFeatureText();
 
       mockGetProjectById.mockResolvedValue(createMockProject());
-      mockGetSystemsByProject.mockResolvedValue([
-        createMockSystem({ id: 'sys-1', name: 'Character System', tags: ['character', 'growth'] }),
-        createMockSystem({ id: 'sys-2', name: 'Level System', tags: ['level', 'progression'] }),
-      ]);
       mockExtractKeywords.mockReturnValue([
         { keyword: 'character', weight: 100 },
         { keyword: 'growth', weight: 80 },
         { keyword: 'level', weight: 60 },
       ]);
-      mockMatchSystemsByKeywords.mockReturnValue([
+      mockMatchSystemDocuments.mockResolvedValue([
         { systemId: 'sys-1', systemName: 'Character System', relevanceScore: 100, matchedTags: ['character', 'growth'] },
         { systemId: 'sys-2', systemName: 'Level System', relevanceScore: 50, matchedTags: ['level'] },
       ]);
@@ -137,6 +111,7 @@ describe('discovery API routes', () => {
       expect(response.body.data.analyzedKeywords).toEqual(['character', 'growth', 'level']);
       expect(Array.isArray(response.body.data.recommendations)).toBe(true);
       expect(response.body.data.recommendations.length).toBe(2);
+      expect(mockMatchSystemDocuments).toHaveBeenCalledWith('project-1', expect.any(Array), 5);
     });
 
     // Test 8: Missing featureText returns 400
@@ -178,7 +153,8 @@ describe('discovery API routes', () => {
     // Test 11: Internal error returns 500 with fallback
     it('should return 500 with error message on internal error', async () => {
       mockGetProjectById.mockResolvedValue(createMockProject());
-      mockGetSystemsByProject.mockRejectedValue(new Error('Database error'));
+      mockExtractKeywords.mockReturnValue([{ keyword: 'test', weight: 100 }]);
+      mockMatchSystemDocuments.mockRejectedValue(new Error('Database error'));
 
       const response = await request(app)
         .post('/api/projects/project-1/discover')
@@ -193,11 +169,8 @@ describe('discovery API routes', () => {
       const featureText = generateValidFeatureText();
 
       mockGetProjectById.mockResolvedValue(createMockProject());
-      mockGetSystemsByProject.mockResolvedValue([
-        createMockSystem({ id: 'sys-1', name: 'Test System', tags: ['test'] }),
-      ]);
       mockExtractKeywords.mockReturnValue([{ keyword: 'test', weight: 100 }]);
-      mockMatchSystemsByKeywords.mockReturnValue([
+      mockMatchSystemDocuments.mockResolvedValue([
         { systemId: 'sys-1', systemName: 'Test System', relevanceScore: 100, matchedTags: ['test'] },
       ]);
 
@@ -218,9 +191,8 @@ describe('discovery API routes', () => {
       const featureText = generateValidFeatureText();
 
       mockGetProjectById.mockResolvedValue(createMockProject());
-      mockGetSystemsByProject.mockResolvedValue([]);
       mockExtractKeywords.mockReturnValue([{ keyword: 'test', weight: 100 }]);
-      mockMatchSystemsByKeywords.mockReturnValue([]);
+      mockMatchSystemDocuments.mockResolvedValue([]);
 
       const response = await request(app)
         .post('/api/projects/project-1/discover')
@@ -236,11 +208,8 @@ describe('discovery API routes', () => {
       const featureText = generateValidFeatureText();
 
       mockGetProjectById.mockResolvedValue(createMockProject());
-      mockGetSystemsByProject.mockResolvedValue([
-        createMockSystem({ id: 'sys-1', tags: ['tag1'] }),
-      ]);
       mockExtractKeywords.mockReturnValue([]);
-      mockMatchSystemsByKeywords.mockReturnValue([]);
+      mockMatchSystemDocuments.mockResolvedValue([]);
 
       const response = await request(app)
         .post('/api/projects/project-1/discover')
@@ -250,4 +219,67 @@ describe('discovery API routes', () => {
       expect(response.body.success).toBe(true);
     });
   });
+
+  describe('POST /api/projects/:projectId/discover/batch', () => {
+    it('should return recommendations for each feature text in order', async () => {
+      mockGetProjectById.mockResolvedValue(createMockProject());
+      mockExtractKeywords
+        .mockReturnValueOnce([{ keyword: 'guild', weight: 100 }])
+        .mockReturnValueOnce([{ keyword: 'shop', weight: 100 }]);
+      mockMatchSystemDocumentsBatch.mockResolvedValue([
+        [{ systemId: 'sys-1', systemName: 'Guild System', relevanceScore: 100, matchedTags: ['guild'] }],
+        [],
+      ]);
+
+      const response = await request(app)
+        .post('/api/projects/project-1/discover/batch')
+        .send({ featureTexts: ['Guild raids', 'Item shop'] });
+
+      expect(response.status).toBe(200);
+      expect(mockMatchSystemDocumentsBatch).toHaveBeenCalledWith(
+        'project-1',
+        [[{ keyword: 'guild', weight: 100 }], [{ keyword: 'shop', weight: 100 }]],
+        5
+      );
+      expect(response.body.data.results).toEqual([
+        {
+          recommendations: [{ systemId: 'sys-1', systemName: 'Guild System', relevanceScore: 100, matchedTags: ['guild'] }],
+          isAIGenerated: false,
+          analyzedKeywords: ['guild'],
+        },
+        { recommendations: [], isAIGenerated: false, analyzedKeywords: ['shop'] },
+      ]);
+    });
+
+    it('should return 400 when featureTexts is not an array of strings', async () => {
+      for (const featureTexts of [undefined, [], ['ok', 42], 'text']) {
+        const response = await request(app)
+          .post('/api/projects/project-1/discover/batch')
+          .send({ featureTexts });
+
+        expect(response.status).toBe(400);
+        expect(response.body.error).toContain('featureTexts');
+      }
+      expect(mockMatchSystemDocumentsBatch).not.toHaveBeenCalled();
+    });
+
+    it('should return 400 when the batch is too large', async () => {
+      const response = await request(app)
+        .post('/api/projects/project-1/discover/batch')
+        .send({ featureTexts: Array.from({ length: 1001 }, () => 'x') });
+
+      expect(response.status).toBe(400);
+      expect(response.body.error).toContain('1000');
+    });
+
+    it('should return 404 when project does not exist', async () => {
+      mockGetProjectById.mockResolvedValue(null);
+
+      const response = await request(app)
+        .post('/api/projects/invalid-project/discover/batch')
+        .send({ featureTexts: ['Guild raids'] });
+
+      expect(response.status).toBe(404);
+    });
+  });
 });
@@ -3,7 +3,7 @@
  * Endpoints for dashboard analytics data
  */
 import { Router, type Request, type Response } from 'express';
-import { calculateSummary, calculateTimeline } from '../utils/analyticsStorage.ts';
+import { calculateSummary, calculateSummaries, calculateTimeline } from '../utils/analyticsStorage.ts';
 import type { PeriodFilter, TimelineDataPoint } from '../../src/types/index.ts';
 
 /**
@@ -27,10 +27,12 @@ function isValidPeriod(period: string): period is PeriodFilter {
  * Convert timeline data to CSV format
  */
 function timelineToCSV(timeline: TimelineDataPoint[]): string {
-  const headers = 'Date,Tasks Created,Tasks Completed,Documents Generated';
+  const headers =
+    'Date,Tasks Created,Tasks Completed,Documents Generated,Input Tokens,Output Tokens,Estimated Cost';
   const rows = timeline.map(
     (point) =>
-      `${point.date},${point.tasksCreated},${point.tasksCompleted},${point.documentsGenerated}`
+      `${point.date},${point.tasksCreated},${point.tasksCompleted},${point.documentsGenerated},` +
+      `${point.inputTokens ?? 0},${point.outputTokens ?? 0},${(point.estimatedCost ?? 0).toFixed(6)}`
   );
   return [headers, ...rows].join('\n');
 }
@@ -129,3 +131,39 @@ analyticsRouter.get('/export', async (req: Request, res: Response) => {
     });
   }
 });
+
+/**
+ * GET /api/analytics/summaries?projectIds=a,b
+ * Get dashboard summaries for several projects in one request
+ */
+export async function getAnalyticsSummaries(req: Request, res: Response): Promise<void> {
+  try {
+    const projectIds = ((req.query.projectIds as string) || '')
+      .split(',')
+      .map((id) => id.trim())
+      .filter((id) => id.length > 0);
+
+    if (projectIds.length === 0) {
+      res.status(400).json({
+        success: false,
+        data: null,
+        error: 'projectIds query parameter is required',
+      });
+      return;
+    }
+
+    const summaries = await calculateSummaries(Array.from(new Set(projectIds)));
+
+    res.json({
+      success: true,
+      data: summaries,
+      error: null,
+    });
+  } catch (error) {
+    res.status(500).json({
+      success: false,
+      data: null,
+      error: error instanceof Error ? error.message : 'Unknown error',
+    });
+  }
+}
@@ -14,7 +14,8 @@ import {
 } from '../utils/archiveStorage.ts';
 import {
   getTasksByProject,
-  saveProjectTasks,
+  removeProjectTask,
+  insertProjectTask,
 } from '../utils/taskStorage.ts';
 export const archivesRouter = Router();
 
@@ -123,12 +124,15 @@ export async function archiveTask(req: Request, res: Response): Promise<void> {
       return;
     }
 
-    // Create archive
-    const archive = await createArchive(projectId, taskId, task);
+    // Archive the current task and remove it from the tasks list under the lock
+    const archive = await removeProjectTask(projectId, taskId, (current) =>
+      createArchive(projectId, taskId, current)
+    );
 
-    // Remove task from tasks list
-    const updatedTasks = tasks.filter((t) => t.id !== taskId);
-    await saveProjectTasks(projectId, updatedTasks);
+    if (!archive) {
+      sendError(res, 404, 'Task not found');
+      return;
+    }
 
     res.status(201).json({
       success: true,
@@ -173,9 +177,7 @@ export async function restoreArchivedTask(req: Request, res: Response): Promise<
     }
 
     // Add restored task back to tasks list
-    const tasks = await getTasksByProject(projectId);
-    tasks.push(restoredTask);
-    await saveProjectTasks(projectId, tasks);
+    await insertProjectTask(projectId, restoredTask);
 
     sendSuccess(res, restoredTask);
   } catch (error) {
@@ -66,7 +66,8 @@ function parseQueryOptions(query: Request['query']): CompletedDocumentsQueryOpti
  * GET /api/projects/:projectId/completed-documents - Get all completed documents
  *
  * Query Parameters:
- * - search: Keyword to search in title, featureList, designDocument
+ * - search: Keywords to search in title, featureList, designDocument, prd
+ *   (results ranked by relevance)
  * - documentType: Filter by document type (design, prd, prototype) - comma-separated
  * - reference: Filter by reference IDs - comma-separated
  * - limit: Maximum number of results (default: 50, max: 100)
@@ -5,9 +5,74 @@
 import { Router, type Request, type Response } from 'express';
 import { sendSuccess, sendError } from '../utils/response.ts';
 import { getSharedLogs, getSharedLogger, clearSharedLogger } from '../utils/llmProvider.ts';
+import { getSharedResponseCache } from '../utils/llmResponseCache.ts';
+import { getSharedLogStore, type LLMLogFilter, type LLMLogGroupBy } from '../utils/llmLogStore.ts';
+import type { LLMLogEntry } from '../utils/llmLogger.ts';
 
 export const debugRouter = Router();
 
+const GROUP_BY_VALUES: LLMLogGroupBy[] = ['provider', 'model', 'project', 'none'];
+
+/**
+ * Transform LLMLogEntry to LLMCallLog format for client
+ */
+function toClientLog(log: LLMLogEntry) {
+  return {
+    id: log.id,
+    timestamp: log.timestamp,
+    provider: log.provider,
+    model: log.model,
+    projectId: log.projectId,
+    endpoint: log.response ? 'api' : 'error',
+    status: log.error ? 'error' : 'success',
+    statusCode: log.error ? undefined : 200,
+    duration: log.metrics?.duration_ms,
+    inputTokens: log.response?.usage?.prompt_tokens,
+    outputTokens: log.response?.usage?.completion_tokens,
+    totalTokens: log.response?.usage?.total_tokens,
+    cost: log.metrics?.estimated_cost,
+    error: log.error?.message,
+    request: log.request,
+    response: log.response,
+  };
+}
+
+/**
+ * Parse call log filters from query parameters
+ * @returns The filter, or an error message for an invalid parameter
+ */
+function parseLogFilter(query: Request['query']): LLMLogFilter | string {
+  const filter: LLMLogFilter = {};
+
+  for (const key of ['from', 'to'] as const) {
+    const value = query[key];
+    if (typeof value === 'string' && value !== '') {
+      const time = Date.parse(value);
+      if (Number.isNaN(time)) {
+        return `${key} must be an ISO timestamp`;
+      }
+      filter[key] = time;
+    }
+  }
+
+  for (const key of ['provider', 'model', 'projectId'] as const) {
+    const value = query[key];
+    if (typeof value === 'string' && value !== '') {
+      filter[key] = value;
+    }
+  }
+
+  const { status } = query;
+  if (status !== undefined) {
+    if (status !== 'success' && status !== 'error') {
+      return 'status must be success or error';
+    }
+    filter.status = status;
+  }
+
+  return filter;
+}
+
 /**
  * GET /api/debug/logs
  * Get all LLM API call logs from server
@@ -17,23 +82,7 @@ debugRouter.get('/logs', async (req: Request, res: Response): Promise<void> => {
     const logs = getSharedLogs();
 
     // Transform LLMLogEntry to LLMCallLog format for client
-    const clientLogs = logs.map(log => ({
-      id: log.id,
-      timestamp: log.timestamp,
-      provider: log.provider,
-      model: log.model,
-      endpoint: log.response ? 'api' : 'error',
-      status: log.error ? 'error' : 'success',
-      statusCode: log.error ? undefined : 200,
-      duration: log.metrics?.duration_ms,
-      inputTokens: log.response?.usage?.prompt_tokens,
-      outputTokens: log.response?.usage?.completion_tokens,
-      totalTokens: log.response?.usage?.total_tokens,
-      cost: log.metrics?.estimated_cost,
-      error: log.error?.message,
-      request: log.request,
-      response: log.response,
-    }));
+    const clientLogs = logs.map(toClientLog);
 
     sendSuccess(res, clientLogs);
   } catch (error) {
@@ -43,7 +92,7 @@ debugRouter.get('/logs', async (req: Request, res: Response): Promise<void> => {
 
 /**
  * DELETE /api/debug/logs
- * Clear all LLM API call logs
+ * Clear all LLM API call logs held in memory (the durable call log is kept)
  */
 debugRouter.delete('/logs', async (req: Request, res: Response): Promise<void> => {
   try {
@@ -54,6 +103,92 @@ debugRouter.delete('/logs', async (req: Request, res: Response): Promise<void> =
   }
 });
 
+/**
+ * GET /api/debug/logs/history
+ * Page through the durable LLM call log, newest first
+ * Query: from, to (ISO timestamps), provider, model, projectId,
+ * status (success | error), cursor, limit (default 50, max 1000)
+ */
+debugRouter.get('/logs/history', async (req: Request, res: Response): Promise<void> => {
+  try {
+    const filter = parseLogFilter(req.query);
+    if (typeof filter === 'string') {
+      sendError(res, 400, filter);
+      return;
+    }
+
+    const { cursor, limit } = req.query;
+    const pageSize = limit !== undefined ? Number(limit) : undefined;
+    if (pageSize !== undefined && !(Number.isInteger(pageSize) && pageSize > 0)) {
+      sendError(res, 400, 'limit must be a positive integer');
+      return;
+    }
+
+    const page = await getSharedLogStore().query({
+      ...filter,
+      cursor: typeof cursor === 'string' ? cursor : undefined,
+      limit: pageSize,
+    });
+
+    sendSuccess(res, {
+      logs: page.entries.map(toClientLog),
+      nextCursor: page.nextCursor,
+    });
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
+/**
+ * GET /api/debug/logs/rollups
+ * Latency (p50/p95/p99) and cost rollups over the durable LLM call log
+ * Query: the history filters plus groupBy (provider | model | project | none, default model)
+ */
+debugRouter.get('/logs/rollups', async (req: Request, res: Response): Promise<void> => {
+  try {
+    const filter = parseLogFilter(req.query);
+    if (typeof filter === 'string') {
+      sendError(res, 400, filter);
+      return;
+    }
+
+    const groupBy = (req.query.groupBy ?? 'model') as LLMLogGroupBy;
+    if (!GROUP_BY_VALUES.includes(groupBy)) {
+      sendError(res, 400, `groupBy must be one of: ${GROUP_BY_VALUES.join(', ')}`);
+      return;
+    }
+
+    sendSuccess(res, await getSharedLogStore().getRollups(filter, groupBy));
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
+/**
+ * GET /api/debug/logs/storage
+ * Size, entry count and time range of the durable LLM call log
+ */
+debugRouter.get('/logs/storage', async (req: Request, res: Response): Promise<void> => {
+  try {
+    sendSuccess(res, await getSharedLogStore().getStats());
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
+/**
+ * DELETE /api/debug/logs/history
+ * Delete the durable LLM call log
+ */
+debugRouter.delete('/logs/history', async (req: Request, res: Response): Promise<void> => {
+  try {
+    await getSharedLogStore().clear();
+    sendSuccess(res, { message: 'LLM call history cleared successfully' });
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
 /**
  * GET /api/debug/status
  * Get debug logging status and statistics
@@ -95,23 +230,7 @@ debugRouter.post('/sync', async (req: Request, res: Response): Promise<void> =>
     }
 
     // Transform to client format
-    const clientLogs = filteredLogs.map(log => ({
-      id: log.id,
-      timestamp: log.timestamp,
-      provider: log.provider,
-      model: log.model,
-      endpoint: log.response ? 'api' : 'error',
-      status: log.error ? 'error' : 'success',
-      statusCode: log.error ? undefined : 200,
-      duration: log.metrics?.duration_ms,
-      inputTokens: log.response?.usage?.prompt_tokens,
-      outputTokens: log.response?.usage?.completion_tokens,
-      totalTokens: log.response?.usage?.total_tokens,
-      cost: log.metrics?.estimated_cost,
-      error: log.error?.message,
-      request: log.request,
-      response: log.response,
-    }));
+    const clientLogs = filteredLogs.map(toClientLog);
 
     sendSuccess(res, {
       logs: clientLogs,
@@ -198,3 +317,42 @@ debugRouter.get('/logs/connection-tests/:provider', async (req: Request, res: Re
     sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
   }
 });
+
+/**
+ * GET /api/debug/llm-latency
+ * Get request latency histograms per provider and model
+ */
+debugRouter.get('/llm-latency', async (req: Request, res: Response): Promise<void> => {
+  try {
+    sendSuccess(res, getSharedLogger().getLatencyHistograms());
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
+/**
+ * GET /api/debug/llm-cache
+ * Get LLM response cache hit/miss counters and tokens/cost saved
+ */
+debugRouter.get('/llm-cache', async (req: Request, res: Response): Promise<void> => {
+  try {
+    sendSuccess(res, getSharedResponseCache().getStats());
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
+
+/**
+ * DELETE /api/debug/llm-cache
+ * Drop all cached LLM responses and reset the counters
+ */
+debugRouter.delete('/llm-cache', async (req: Request, res: Response): Promise<void> => {
+  try {
+    const cache = getSharedResponseCache();
+    await cache.clear();
+    cache.resetStats();
+    sendSuccess(res, { message: 'LLM response cache cleared successfully' });
+  } catch (error) {
+    sendError(res, 500, error instanceof Error ? error.message : 'Unknown error');
+  }
+});
@@ -6,13 +6,14 @@
  * - TASK-002: POST /api/projects/:projectId/discover endpoint
  * - TASK-002: Input validation (projectId, featureText min 100 chars)
  * - TASK-002: keywordExtractor + systemMatcher integration
+ * - POST /api/projects/:projectId/discover/batch for bulk feature-list import
  */
 import { Router, type Request, type Response } from 'express';
 import { sendSuccess, sendError } from '../utils/response.ts';
 import { getProjectById } from '../utils/projectStorage.ts';
-import { getSystemsByProject } from '../utils/systemStorage.ts';
+import { matchSystemDocuments, matchSystemDocumentsBatch } from '../utils/systemStorage.ts';
 import { extractKeywords } from '../utils/keywordExtractor.ts';
-import { matchSystemsByKeywords, type SystemMatchResult } from '../utils/systemMatcher.ts';
+import type { SystemMatchResult } from '../utils/systemMatcher.ts';
 
 export const discoveryRouter = Router();
 
@@ -26,6 +27,11 @@ const MIN_FEATURE_TEXT_LENGTH = 100;
  */
 const MAX_RECOMMENDATIONS = 5;
 
+/**
+ * Maximum number of feature texts per batch request
+ */
+const MAX_BATCH_SIZE = 1000;
+
 /**
  * Response data structure for discovery endpoint
  */
@@ -38,6 +44,14 @@ interface DiscoveryResponseData {
   analyzedKeywords: string[];
 }
 
+/**
+ * Response data structure for batch discovery endpoint
+ */
+interface BatchDiscoveryResponseData {
+  /** One entry per feature text, in request order */
+  results: DiscoveryResponseData[];
+}
+
 /**
  * POST /api/projects/:projectId/discover - Discover related systems
  *
@@ -77,14 +91,11 @@ export async function discoverProjectSystems(req: Request, res: Response): Promi
       return;
     }
 
-    // Get systems for this project
-    const systems = await getSystemsByProject(projectId);
-
     // Extract keywords from feature text
     const keywords = extractKeywords(featureText);
 
-    // Match systems by keywords
-    const recommendations = matchSystemsByKeywords(keywords, systems, MAX_RECOMMENDATIONS);
+    // Match against the project's system tag index
+    const recommendations = await matchSystemDocuments(projectId, keywords, MAX_RECOMMENDATIONS);
 
     // Build response
     const responseData: DiscoveryResponseData = {
@@ -100,5 +111,69 @@ export async function discoverProjectSystems(req: Request, res: Response): Promi
   }
 }
 
-// Mount the handler on the router
+/**
+ * POST /api/projects/:projectId/discover/batch - Discover related systems for many features
+ *
+ * Entries are not rejected individually: one shorter than 100 characters
+ * yields no keywords and therefore no recommendations.
+ *
+ * Path Parameters:
+ * - projectId: Project UUID
+ *
+ * Request Body:
+ * - featureTexts: string[] (required, 1-1000 entries)
+ *
+ * Response: ApiResponse<BatchDiscoveryResponseData>
+ * - 200: Discovery results per feature text
+ * - 400: Missing or invalid featureTexts
+ * - 404: Project not found
+ * - 500: Server error
+ */
+export async function discoverProjectSystemsBatch(req: Request, res: Response): Promise<void> {
+  try {
+    const { projectId } = req.params;
+    const { featureTexts } = req.body;
+
+    // Validate featureTexts is a non-empty array of strings
+    if (
+      !Array.isArray(featureTexts) ||
+      featureTexts.length === 0 ||
+      featureTexts.some((text) => typeof text !== 'string')
+    ) {
+      sendError(res, 400, 'featureTexts must be a non-empty array of strings');
+      return;
+    }
+
+    if (featureTexts.length > MAX_BATCH_SIZE) {
+      sendError(res, 400, `featureTexts must contain at most ${MAX_BATCH_SIZE} entries`);
+      return;
+    }
+
+    // Check if project exists
+    const project = await getProjectById(projectId);
+    if (!project) {
+      sendError(res, 404, 'Project not found');
+      return;
+    }
+
+    const keywordSets = (featureTexts as string[]).map((text) => extractKeywords(text));
+    const recommendations = await matchSystemDocumentsBatch(projectId, keywordSets, MAX_RECOMMENDATIONS);
+
+    const responseData: BatchDiscoveryResponseData = {
+      results: keywordSets.map((keywords, i) => ({
+        recommendations: recommendations[i],
+        isAIGenerated: false,
+        analyzedKeywords: keywords.map((k) => k.keyword),
+      })),
+    };
+
+    sendSuccess(res, responseData);
+  } catch (error) {
+    console.error('Error discovering systems in batch:', error);
+    sendError(res, 500, 'Failed to discover systems');
+  }
+}
+
+// Mount the handlers on the router
 discoveryRouter.post('/:projectId/discover', discoverProjectSystems);
+discoveryRouter.post('/:projectId/discover/batch', discoverProjectSystemsBatch);
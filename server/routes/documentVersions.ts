@@ -18,8 +18,9 @@
  *
  * ### List Versions
  * GET /api/tasks/:taskId/versions?projectId=:projectId
- * - Returns all versions sorted by version number
+ * - Returns version metadata (without content) sorted by version number
  * - Query parameter: projectId (required)
+ * - Query parameter: includeContent=true to include each version's content
  * - Response: 200 with array of versions
  *
  * ### Get Specific Version
@@ -41,6 +42,7 @@ import { Router, type Request, type Response } from 'express';
 import {
   saveVersion,
   getVersions,
+  listVersions,
   getVersion,
   restoreVersion,
   type SaveVersionInput
@@ -125,8 +127,9 @@ documentVersionsRouter.post(
  *
  * Query Parameters:
  * - projectId: string (required) - Project ID
+ * - includeContent: 'true' to return full versions instead of metadata
  *
- * Response: ApiResponse<DocumentVersion[]>
+ * Response: ApiResponse<VersionMetadata[] | DocumentVersion[]>
  * - 200: Versions retrieved successfully
  * - 400: Missing projectId
  * - 500: Server error
@@ -144,8 +147,11 @@ documentVersionsRouter.get(
         return;
       }
 
-      // Get all versions
-      const versions = await getVersions(projectId, taskId);
+      // Metadata comes from the index; content requires reading chunks
+      const versions =
+        req.query.includeContent === 'true'
+          ? await getVersions(projectId, taskId)
+          : await listVersions(projectId, taskId);
 
       sendSuccess(res, versions);
     } catch (error) {
@@ -11,7 +11,14 @@
  * - REQ-S-001: API validation
  */
 import { Router, type Request, type Response, type NextFunction } from 'express';
-import { callClaudeCode, type ClaudeCodeResult } from '../utils/claudeCodeRunner.ts';
+import {
+  callClaudeCode,
+  callClaudeCodeStream,
+  type ClaudeCodeResult,
+  type ClaudeCodeStreamOptions,
+  type ClaudeCodeStreamResult,
+} from '../utils/claudeCodeRunner.ts';
+import { openSSEStream, sendSSEEvent, startSSEHeartbeat } from '../utils/sse.ts';
 import {
   buildGeneratePrompt,
   buildReviewPrompt,
@@ -30,10 +37,13 @@ import {
   getModelConfigForStage,
   isProviderConfigured,
   type LLMModelConfig,
+  type LLMResult,
   type TaskStage,
   type LLMProvider,
 } from '../../src/types/llm.ts';
 import { addGenerationHistoryEntry } from '../utils/taskStorage.ts';
+import { withResponseCache } from '../utils/llmResponseCache.ts';
+import { extractTokenUsage, type TokenUsage } from '../utils/tokenExtractor.ts';
 import type { GenerationDocumentType, GenerationAction } from '../../src/types/index.ts';
 
 /**
@@ -70,11 +80,140 @@ export function setClaudeCodeRunner(runner: ClaudeCodeRunnerFn): void {
   claudeCodeRunner = runner;
 }
 
+/**
+ * Type for streaming Claude Code runner function (for dependency injection)
+ */
+type ClaudeCodeStreamRunnerFn = (
+  prompt: string,
+  workingDir: string,
+  options: ClaudeCodeStreamOptions
+) => Promise<ClaudeCodeStreamResult>;
+
+/**
+ * Injectable streaming Claude Code runner for testing
+ */
+let claudeCodeStreamRunner: ClaudeCodeStreamRunnerFn = callClaudeCodeStream;
+
+/**
+ * Set the streaming Claude Code runner (for testing)
+ */
+export function setClaudeCodeStreamRunner(runner: ClaudeCodeStreamRunnerFn): void {
+  claudeCodeStreamRunner = runner;
+}
+
 /**
  * Default working directory for Claude Code
  */
 const DEFAULT_WORKING_DIR = process.cwd();
 
+/**
+ * Model recorded for Claude Code calls made without a model configuration
+ */
+const CLAUDE_CODE_MODEL = 'claude-3.5-sonnet';
+
+/**
+ * Project and model a direct Claude Code call is logged under
+ */
+interface ClaudeCodeCallContext {
+  projectId?: string;
+  model?: string;
+}
+
+/**
+ * Record a direct Claude Code runner call in the shared LLM call log
+ * Routes that call the runner directly bypass ClaudeCodeProvider, so they are
+ * logged here with the same request, duration, usage and error fields.
+ */
+async function logClaudeCodeCall<T>(
+  prompt: string,
+  parameters: Record<string, unknown>,
+  context: ClaudeCodeCallContext,
+  run: () => Promise<T>,
+  describe: (result: T) => { content: string; usage?: TokenUsage }
+): Promise<T> {
+  const logger = getSharedLogger();
+  const id = `req-claude-code-${Date.now()}-${Math.random().toString(36).substring(2, 9)}`;
+  const startTime = Date.now();
+
+  logger.logRequest({
+    id,
+    provider: 'claude-code',
+    model: context.model || CLAUDE_CODE_MODEL,
+    projectId: context.projectId,
+    request: { prompt, parameters },
+  });
+
+  try {
+    const result = await run();
+    const { content, usage } = describe(result);
+    logger.logResponse({
+      id,
+      response: { content, usage },
+      metrics: { duration_ms: Date.now() - startTime },
+    });
+    return result;
+  } catch (error) {
+    const { name, message } = error as Error;
+    logger.logError({
+      id,
+      error: {
+        message,
+        code: name === 'ClaudeCodeTimeoutError' ? 'TIMEOUT' : name === 'ClaudeCodeError' ? 'CLAUDE_CODE_ERROR' : undefined,
+      },
+    });
+    throw error;
+  }
+}
+
+/**
+ * Run Claude Code through the injectable runner and log the call
+ */
+function runClaudeCode(
+  prompt: string,
+  workingDir: string,
+  options: { timeout: number; allowedTools: string[] },
+  context: ClaudeCodeCallContext = {}
+): Promise<ClaudeCodeResult> {
+  return logClaudeCodeCall(
+    prompt,
+    { ...options },
+    context,
+    () => claudeCodeRunner(prompt, workingDir, options),
+    (result) => ({
+      content: typeof result.output === 'string' ? result.output : result.rawOutput,
+      // The CLI's JSON result carries the usage of the whole run
+      usage: extractTokenUsage('claude-code', result.output),
+    })
+  );
+}
+
+/**
+ * Stream Claude Code through the injectable runner and log the call
+ */
+function streamClaudeCode(
+  prompt: string,
+  workingDir: string,
+  options: ClaudeCodeStreamOptions,
+  context: ClaudeCodeCallContext = {}
+): Promise<ClaudeCodeStreamResult> {
+  return logClaudeCodeCall(
+    prompt,
+    { timeout: options.timeout, allowedTools: options.allowedTools, stream: true },
+    context,
+    () => claudeCodeStreamRunner(prompt, workingDir, options),
+    (result) => ({
+      content: result.content,
+      usage: result.usage
+        ? {
+            prompt_tokens: result.usage.input,
+            completion_tokens: result.usage.output,
+            total_tokens: result.usage.input + result.usage.output,
+          }
+        : undefined,
+    })
+  );
+}
+
 /**
  * Validation middleware for required fields
  */
@@ -167,7 +306,7 @@ async function selectLLMProvider(
         apiKey: '',
         isEnabled: true,
         connectionStatus: 'connected',
-      }, true), // Enable shared logging
+      }, true, projectId), // Enable shared logging
       config: modelConfig,
       isDefault: true,
     };
@@ -204,9 +343,20 @@ async function selectLLMProvider(
     );
   }
 
-  // Create and return the provider with shared logging
+  // Create the provider with shared logging
+  let provider = createLLMProvider(providerSettings, true, projectId);
+
+  // Serve repeated identical requests from the response cache when enabled
+  if (settings.responseCache?.enabled) {
+    const { ttlHours } = settings.responseCache;
+    provider = withResponseCache(provider, {
+      endpoint: providerSettings.endpoint,
+      ttlMs: ttlHours !== undefined ? ttlHours * 60 * 60 * 1000 : undefined,
+    });
+  }
+
   return {
-    provider: createLLMProvider(providerSettings, true), // Enable shared logging
+    provider,
     config: modelConfig,
     isDefault: false,
   };
@@ -230,6 +380,8 @@ class LLMProviderError extends Error {
 /**
  * Record generation history for a task (SPEC-MODELHISTORY-001)
  * This is a non-blocking operation - errors are logged but don't affect the response
+ * Results served from the response cache are recorded as cached, without
+ * token usage, since no tokens were spent on them.
  */
 async function recordGenerationHistory(
   projectId: string | undefined,
@@ -239,7 +391,8 @@ async function recordGenerationHistory(
   provider: LLMProvider,
   model: string,
   tokens?: { input: number; output: number },
-  feedback?: string
+  feedback?: string,
+  cached?: boolean
 ): Promise<void> {
   if (!projectId || !taskId) {
     // Skip recording if projectId or taskId is not provided
@@ -252,8 +405,9 @@ async function recordGenerationHistory(
       action,
       provider,
       model,
-      tokens,
+      tokens: cached ? undefined : tokens,
       feedback,
+      cached,
     });
   } catch (error) {
     // Log error but don't fail the request
@@ -261,6 +415,63 @@ async function recordGenerationHistory(
   }
 }
 
+/**
+ * Map an LLM provider error to an HTTP status and response body
+ */
+function getLLMErrorResponse(
+  error: unknown,
+  provider?: string,
+  model?: string
+): { status: number; body: Record<string, unknown> } {
+  if (error instanceof LLMProviderError) {
+    return {
+      status: 400,
+      body: {
+        error: error.message,
+        provider: error.provider,
+        model: error.model,
+      },
+    };
+  }
+
+  // Handle Claude Code specific errors (for backward compatibility)
+  if (error instanceof Error) {
+    if (error.name === 'ClaudeCodeTimeoutError') {
+      return {
+        status: 504,
+        body: {
+          error: 'Claude Code process timeout',
+          message: error.message,
+          provider: provider || 'claude-code',
+          model: model || 'claude-3.5-sonnet',
+        },
+      };
+    }
+
+    if (error.name === 'ClaudeCodeError') {
+      return {
+        status: 500,
+        body: {
+          error: 'Claude Code execution failed',
+          message: error.message,
+          provider: provider || 'claude-code',
+          model: model || 'claude-3.5-sonnet',
+        },
+      };
+    }
+  }
+
+  const message = error instanceof Error ? error.message : 'Unknown error';
+  return {
+    status: 500,
+    body: {
+      error: `LLM generation failed: ${message}`,
+      provider: provider || 'unknown',
+      model: model || 'unknown',
+    },
+  };
+}
+
 /**
  * Handle LLM provider errors
  */
@@ -270,44 +481,183 @@ function handleLLMProviderError(
   provider?: string,
   model?: string
 ): void {
-  if (error instanceof LLMProviderError) {
-    res.status(400).json({
-      error: error.message,
-      provider: error.provider,
-      model: error.model,
-    });
+  const { status, body } = getLLMErrorResponse(error, provider, model);
+  res.status(status).json(body);
+}
+
+/**
+ * Options for a streamed document generation
+ */
+interface StreamGenerationOptions {
+  prompt: string;
+  stage: TaskStage;
+  documentType: GenerationDocumentType;
+  projectId?: string;
+  taskId?: string;
+  workingDir?: string;
+}
+
+/**
+ * Stream a document generation to the client as Server-Sent Events
+ *
+ * Events:
+ * - token: { text } for each fragment produced by the model
+ * - done:  { success, data, provider, model, tokens } once generation finishes
+ * - error: { status, error, provider, model, ... } if generation fails
+ *
+ * Provider selection errors are returned as regular JSON responses because
+ * they happen before the stream is opened.
+ */
+async function streamDocumentGeneration(
+  res: Response,
+  options: StreamGenerationOptions
+): Promise<void> {
+  const { prompt, stage, documentType, projectId, taskId } = options;
+  const workingDir = options.workingDir || DEFAULT_WORKING_DIR;
+
+  let selection: LLMProviderSelection;
+  try {
+    selection = await selectLLMProvider(projectId, stage);
+  } catch (error) {
+    handleLLMProviderError(error, res);
     return;
   }
 
-  // Handle Claude Code specific errors (for backward compatibility)
-  if (error instanceof Error) {
-    if (error.name === 'ClaudeCodeTimeoutError') {
-      res.status(504).json({
-        error: 'Claude Code process timeout',
-        message: error.message,
-        provider: provider || 'claude-code',
-        model: model || 'claude-3.5-sonnet',
-      });
+  const { provider, config, isDefault } = selection;
+
+  // Stop the upstream generation if the client goes away
+  const abortController = new AbortController();
+  res.on('close', () => {
+    if (!res.writableEnded) {
+      abortController.abort();
+    }
+  });
+
+  openSSEStream(res);
+  const stopHeartbeat = startSSEHeartbeat(res);
+  const onToken = (text: string) => sendSSEEvent(res, 'token', { text });
+
+  try {
+    let result: LLMResult;
+
+    if (isDefault) {
+      const streamed = await streamClaudeCode(prompt, workingDir, {
+        timeout: 180000,
+        allowedTools: ['Read', 'Grep'],
+        onText: onToken,
+        signal: abortController.signal,
+      }, { projectId, model: config.modelId });
+      result = {
+        success: true,
+        content: streamed.content,
+        rawOutput: streamed.rawOutput,
+        provider: config.provider,
+        model: config.modelId,
+        tokens: streamed.usage ?? undefined,
+      };
+    } else if (provider.generateStream) {
+      result = await provider.generateStream(
+        prompt,
+        config,
+        { onToken, signal: abortController.signal },
+        workingDir
+      );
+    } else {
+      // Provider without streaming support: deliver the whole result at once
+      result = await provider.generate(prompt, config, workingDir);
+      if (result.success && result.content) {
+        onToken(result.content);
+      }
+    }
+
+    if (abortController.signal.aborted) {
       return;
     }
 
-    if (error.name === 'ClaudeCodeError') {
-      res.status(500).json({
-        error: 'Claude Code execution failed',
-        message: error.message,
-        provider: provider || 'claude-code',
-        model: model || 'claude-3.5-sonnet',
+    if (!result.success) {
+      // NO AUTO-FALLBACK: Return error if LLM fails
+      sendSSEEvent(res, 'error', {
+        status: 500,
+        error: `LLM generation failed: ${result.error}`,
+        provider: result.provider,
+        model: result.model,
       });
       return;
     }
+
+    // Record generation history with final token usage (SPEC-MODELHISTORY-001)
+    await recordGenerationHistory(
+      projectId,
+      taskId,
+      documentType,
+      'create',
+      result.provider as LLMProvider,
+      result.model,
+      result.tokens,
+      undefined,
+      result.cached
+    );
+
+    sendSSEEvent(res, 'done', {
+      success: true,
+      data: result.content,
+      provider: result.provider,
+      model: result.model,
+      tokens: result.tokens,
+    });
+  } catch (error) {
+    if (!abortController.signal.aborted) {
+      const { status, body } = getLLMErrorResponse(error, config.provider, config.modelId);
+      sendSSEEvent(res, 'error', { status, ...body });
+    }
+  } finally {
+    stopHeartbeat();
+    res.end();
   }
+}
 
-  const message = error instanceof Error ? error.message : 'Unknown error';
-  res.status(500).json({
-    error: `LLM generation failed: ${message}`,
-    provider: provider || 'unknown',
-    model: model || 'unknown',
-  });
+/**
+ * Build the design document prompt from a request body
+ */
+function buildDesignDocumentRequestPrompt(body: Request['body']): string {
+  const { qaResponses, referenceSystemIds } = body;
+  return buildDesignDocumentPrompt(qaResponses, referenceSystemIds);
+}
+
+/**
+ * Build the PRD prompt from a request body
+ */
+function buildPRDRequestPrompt(body: Request['body']): string {
+  const { designDocContent, projectContext } = body;
+
+  // Handle projectContext: can be string (legacy) or ProjectContext object (new)
+  let parsedProjectContext: ProjectContext | undefined;
+  if (projectContext) {
+    if (typeof projectContext === 'string') {
+      // Legacy: string projectContext - parse as techStack description
+      parsedProjectContext = {
+        techStack: [projectContext],
+      };
+    } else if (typeof projectContext === 'object') {
+      // New: structured ProjectContext object
+      parsedProjectContext = projectContext as ProjectContext;
+    }
+  }
+
+  return buildPRDPrompt(designDocContent, parsedProjectContext);
+}
+
+/**
+ * Build the prototype prompt from a request body
+ */
+function buildPrototypeRequestPrompt(body: Request['body']): string {
+  const { prdContent, styleFramework } = body;
+
+  let prompt = buildPrototypePrompt(prdContent);
+  if (styleFramework) {
+    prompt += `\n\n## Styling Framework\nUse ${styleFramework} for styling.`;
+  }
+  return prompt;
 }
 
 /**
@@ -328,7 +678,7 @@ generateRouter.post(
         additionalContext,
       });
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Write', 'Grep'] }
@@ -364,7 +714,7 @@ generateRouter.post(
         additionalContext,
       });
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Write', 'Grep'] }
@@ -397,7 +747,7 @@ generateRouter.post(
         focusAreas,
       });
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Grep'] }
@@ -430,7 +780,7 @@ generateRouter.post(
         targets,
       });
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Write', 'Grep'] }
@@ -463,7 +813,7 @@ generateRouter.post(
         aspects,
       });
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Grep'] }
@@ -494,9 +844,9 @@ generateRouter.post(
     let selectedModel: string | undefined;
 
     try {
-      const { qaResponses, referenceSystemIds, workingDir, projectId, taskId } = req.body;
+      const { workingDir, projectId, taskId } = req.body;
 
-      const prompt = buildDesignDocumentPrompt(qaResponses, referenceSystemIds);
+      const prompt = buildDesignDocumentRequestPrompt(req.body);
 
       // Select LLM provider based on project settings
       const { provider, config, isDefault } = await selectLLMProvider(projectId, 'design');
@@ -505,10 +855,11 @@ generateRouter.post(
 
       // If using default Claude Code, use the claudeCodeRunner
       if (isDefault) {
-        const result = await claudeCodeRunner(
+        const result = await runClaudeCode(
           prompt,
           workingDir || DEFAULT_WORKING_DIR,
-          { timeout: 180000, allowedTools: ['Read', 'Grep'] }
+          { timeout: 180000, allowedTools: ['Read', 'Grep'] },
+          { projectId, model: config.modelId }
         );
 
         // Record generation history (SPEC-MODELHISTORY-001)
@@ -552,7 +903,9 @@ generateRouter.post(
         'create',
         result.provider as LLMProvider,
         result.model,
-        result.tokens
+        result.tokens,
+        undefined,
+        result.cached
       );
 
       res.json({
@@ -582,23 +935,9 @@ generateRouter.post(
     let selectedModel: string | undefined;
 
     try {
-      const { designDocContent, projectContext, workingDir, projectId, taskId } = req.body;
-
-      // Handle projectContext: can be string (legacy) or ProjectContext object (new)
-      let parsedProjectContext: ProjectContext | undefined;
-      if (projectContext) {
-        if (typeof projectContext === 'string') {
-          // Legacy: string projectContext - parse as techStack description
-          parsedProjectContext = {
-            techStack: [projectContext],
-          };
-        } else if (typeof projectContext === 'object') {
-          // New: structured ProjectContext object
-          parsedProjectContext = projectContext as ProjectContext;
-        }
-      }
+      const { workingDir, projectId, taskId } = req.body;
 
-      const prompt = buildPRDPrompt(designDocContent, parsedProjectContext);
+      const prompt = buildPRDRequestPrompt(req.body);
 
       // Select LLM provider based on project settings
       const { provider, config, isDefault } = await selectLLMProvider(projectId, 'prd');
@@ -607,10 +946,11 @@ generateRouter.post(
 
       // If using default Claude Code, use the claudeCodeRunner
       if (isDefault) {
-        const result = await claudeCodeRunner(
+        const result = await runClaudeCode(
           prompt,
           workingDir || DEFAULT_WORKING_DIR,
-          { timeout: 180000, allowedTools: ['Read', 'Grep'] }
+          { timeout: 180000, allowedTools: ['Read', 'Grep'] },
+          { projectId, model: config.modelId }
         );
 
         // Record generation history (SPEC-MODELHISTORY-001)
@@ -654,7 +994,9 @@ generateRouter.post(
         'create',
         result.provider as LLMProvider,
         result.model,
-        result.tokens
+        result.tokens,
+        undefined,
+        result.cached
       );
 
       res.json({
@@ -684,12 +1026,9 @@ generateRouter.post(
     let selectedModel: string | undefined;
 
     try {
-      const { prdContent, styleFramework, workingDir, projectId, taskId } = req.body;
+      const { workingDir, projectId, taskId } = req.body;
 
-      let prompt = buildPrototypePrompt(prdContent);
-      if (styleFramework) {
-        prompt += `\n\n## Styling Framework\nUse ${styleFramework} for styling.`;
-      }
+      const prompt = buildPrototypeRequestPrompt(req.body);
 
       // Select LLM provider based on project settings
       const { provider, config, isDefault } = await selectLLMProvider(projectId, 'prototype');
@@ -698,10 +1037,11 @@ generateRouter.post(
 
       // If using default Claude Code, use the claudeCodeRunner
       if (isDefault) {
-        const result = await claudeCodeRunner(
+        const result = await runClaudeCode(
           prompt,
           workingDir || DEFAULT_WORKING_DIR,
-          { timeout: 180000, allowedTools: ['Read', 'Grep'] }
+          { timeout: 180000, allowedTools: ['Read', 'Grep'] },
+          { projectId, model: config.modelId }
         );
 
         // Record generation history (SPEC-MODELHISTORY-001)
@@ -745,7 +1085,9 @@ generateRouter.post(
         'create',
         result.provider as LLMProvider,
         result.model,
-        result.tokens
+        result.tokens,
+        undefined,
+        result.cached
       );
 
       res.json({
@@ -761,6 +1103,72 @@ generateRouter.post(
   }
 );
 
+/**
+ * POST /api/generate/design-document/stream
+ * Stream design document generation as Server-Sent Events
+ * Accepts the same body as /design-document
+ */
+generateRouter.post(
+  '/design-document/stream',
+  validateRequired(['qaResponses']),
+  async (req: Request, res: Response) => {
+    const { workingDir, projectId, taskId } = req.body;
+
+    await streamDocumentGeneration(res, {
+      prompt: buildDesignDocumentRequestPrompt(req.body),
+      stage: 'design',
+      documentType: 'design',
+      projectId,
+      taskId,
+      workingDir,
+    });
+  }
+);
+
+/**
+ * POST /api/generate/prd/stream
+ * Stream PRD generation as Server-Sent Events
+ * Accepts the same body as /prd
+ */
+generateRouter.post(
+  '/prd/stream',
+  validateRequired(['designDocContent']),
+  async (req: Request, res: Response) => {
+    const { workingDir, projectId, taskId } = req.body;
+
+    await streamDocumentGeneration(res, {
+      prompt: buildPRDRequestPrompt(req.body),
+      stage: 'prd',
+      documentType: 'prd',
+      projectId,
+      taskId,
+      workingDir,
+    });
+  }
+);
+
+/**
+ * POST /api/generate/prototype/stream
+ * Stream prototype generation as Server-Sent Events
+ * Accepts the same body as /prototype
+ */
+generateRouter.post(
+  '/prototype/stream',
+  validateRequired(['prdContent']),
+  async (req: Request, res: Response) => {
+    const { workingDir, projectId, taskId } = req.body;
+
+    await streamDocumentGeneration(res, {
+      prompt: buildPrototypeRequestPrompt(req.body),
+      stage: 'prototype',
+      documentType: 'prototype',
+      projectId,
+      taskId,
+      workingDir,
+    });
+  }
+);
+
 /**
  * POST /api/generate/analyze-features
  * Analyze feature list and extract keywords
@@ -774,7 +1182,9 @@ generateRouter.post(
 
       const prompt = buildFeatureAnalysisPrompt(featureList);
 
-      const result = await claudeCodeRunner(
+      // Not response-cached: the request carries no project, so there is no
+      // per-project cache opt-in, and the analysis reads the working directory
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
         { timeout: 120000, allowedTools: ['Read', 'Grep'] }
@@ -808,10 +1218,11 @@ generateRouter.post(
         prompt = `## Document Type: ${documentType}\n\n${prompt}`;
       }
 
-      const result = await claudeCodeRunner(
+      const result = await runClaudeCode(
         prompt,
         workingDir || DEFAULT_WORKING_DIR,
-        { timeout: 180000, allowedTools: ['Read', 'Grep'] }
+        { timeout: 180000, allowedTools: ['Read', 'Grep'] },
+        { projectId }
       );
 
       // Record generation history for modification (SPEC-MODELHISTORY-001)
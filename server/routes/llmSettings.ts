@@ -15,6 +15,7 @@ import { createLLMProvider } from '../utils/llmProvider.ts';
 import { maskApiKey } from '../utils/encryption.ts';
 import {
   isValidProvider,
+  isValidTransportSettings,
   createDefaultProjectLLMSettings,
   type LLMProvider,
   type LLMProviderSettings,
@@ -24,6 +25,9 @@ import {
 
 export const llmSettingsRouter = Router();
 
+const INVALID_TRANSPORT_MESSAGE =
+  'Invalid transport settings: maxSockets and burst must be positive integers, requestsPerSecond a positive number';
+
 /**
  * GET /api/projects/:projectId/llm-settings
  * Get LLM settings for a project (API keys are masked)
@@ -78,6 +82,11 @@ llmSettingsRouter.put(
         return;
       }
 
+      if (body.providers?.some(provider => !isValidTransportSettings(provider.transport))) {
+        sendError(res, 400, INVALID_TRANSPORT_MESSAGE);
+        return;
+      }
+
       // Get existing settings or default
       const existingSettings = await getLLMSettingsOrDefault(projectId);
 
@@ -128,6 +137,11 @@ llmSettingsRouter.put(
         return;
       }
 
+      if (!isValidTransportSettings(updates.transport)) {
+        sendError(res, 400, INVALID_TRANSPORT_MESSAGE);
+        return;
+      }
+
       await updateProviderSettings(projectId, provider as LLMProvider, updates);
 
       const settings = await getLLMSettingsOrDefault(projectId);
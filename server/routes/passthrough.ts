@@ -9,6 +9,10 @@
  * - Canceling a pipeline
  * - Getting pipeline status
  * - Retrying failed stages
+ * - Scheduler metrics (queue depth, wait time, stage run time)
+ *
+ * Pipelines are executed by the shared PipelineScheduler; these routes only
+ * persist status changes and queue or signal the scheduler.
  */
 import { Router, type Request, type Response } from 'express';
 import type {
@@ -33,10 +37,12 @@ import {
 import { getTaskById } from '../utils/taskStorage.ts';
 import {
   createPipeline,
+  createDefaultPipelineStages,
   getPipelineByTaskId,
   updatePipelineStatus,
-  savePipeline,
 } from '../utils/passthroughStorage.ts';
+import { getNextStage } from '../utils/passthroughRunner.ts';
+import { getPipelineScheduler } from '../utils/pipelineScheduler.ts';
 
 export const passthroughRouter = Router();
 
@@ -114,10 +120,15 @@ passthroughRouter.post(
         return;
       }
 
-      // Create new pipeline
-      const pipeline = await createPipeline({
+      // Create new pipeline and queue it for execution
+      const pipeline = await createPipeline(
         taskId,
-        resumeFromStage,
+        taskResult.task.qaSession.id,
+        createDefaultPipelineStages()
+      );
+      await getPipelineScheduler().enqueue(pipeline, {
+        projectId: taskResult.projectId,
+        resumeFromStage: resumeFromStage ?? null,
       });
 
       sendApiSuccess(res, { pipeline, message: 'Pipeline started successfully' });
@@ -157,7 +168,8 @@ passthroughRouter.post(
         return;
       }
 
-      const updatedPipeline = await updatePipelineStatus(taskId, 'paused');
+      const updatedPipeline = await updatePipelineStatus(pipeline.id, 'paused');
+      getPipelineScheduler().signal(pipeline.id, 'pause');
       sendApiSuccess(res, { pipeline: updatedPipeline, message: 'Pipeline paused' });
     } catch (error) {
       sendApiError(
@@ -195,7 +207,10 @@ passthroughRouter.post(
         return;
       }
 
-      const updatedPipeline = await updatePipelineStatus(taskId, 'running');
+      const updatedPipeline = await updatePipelineStatus(pipeline.id, 'running');
+      await getPipelineScheduler().enqueue(pipeline, {
+        resumeFromStage: getNextStage(pipeline),
+      });
       sendApiSuccess(res, { pipeline: updatedPipeline, message: 'Pipeline resumed' });
     } catch (error) {
       sendApiError(
@@ -233,7 +248,8 @@ passthroughRouter.post(
         return;
       }
 
-      const updatedPipeline = await updatePipelineStatus(taskId, 'cancelled');
+      const updatedPipeline = await updatePipelineStatus(pipeline.id, 'cancelled');
+      getPipelineScheduler().signal(pipeline.id, 'cancel');
       sendApiSuccess(res, { pipeline: updatedPipeline, message: 'Pipeline cancelled' });
     } catch (error) {
       sendApiError(
@@ -311,8 +327,9 @@ passthroughRouter.post(
         return;
       }
 
-      // Reset stage status and restart pipeline
-      const updatedPipeline = await updatePipelineStatus(taskId, 'running');
+      // Reset stage status and restart pipeline from the requested stage
+      const updatedPipeline = await updatePipelineStatus(pipeline.id, 'running');
+      await getPipelineScheduler().enqueue(pipeline, { resumeFromStage: stage });
       sendApiSuccess(res, { pipeline: updatedPipeline, message: 'Stage retry initiated' });
     } catch (error) {
       sendApiError(
@@ -324,6 +341,25 @@ passthroughRouter.post(
   }
 );
 
+/**
+ * GET /api/tasks/passthrough/metrics
+ * Get scheduler queue depth, wait time and per-stage run time
+ */
+passthroughRouter.get(
+  '/passthrough/metrics',
+  async (_req: Request, res: Response): Promise<void> => {
+    try {
+      sendApiSuccess(res, getPipelineScheduler().getMetrics());
+    } catch (error) {
+      sendApiError(
+        res,
+        500,
+        error instanceof Error ? error.message : 'Failed to get scheduler metrics'
+      );
+    }
+  }
+);
+
 /**
  * Register passthrough routes with the main app
  * This function can be imported and called from the main server file
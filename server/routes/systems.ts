@@ -5,6 +5,7 @@
 import { Router, type Request, type Response } from 'express';
 import { v4 as uuidv4 } from 'uuid';
 import type { CreateSystemDocumentDto, UpdateSystemDocumentDto } from '../types.ts';
+import type { SystemDocument } from '../../src/types/index.ts';
 import { sendSuccess, sendError } from '../utils/response.ts';
 import { validateName, validateCategory } from '../utils/validation.ts';
 import { getProjectById } from '../utils/projectStorage.ts';
@@ -17,6 +18,8 @@ import {
   isSystemNameDuplicate,
   getUniqueCategories,
   getUniqueTags,
+  searchSystemDocuments,
+  type SystemSearchOptions,
 } from '../utils/systemStorage.ts';
 
 export const systemsRouter = Router({ mergeParams: true });
@@ -36,6 +39,36 @@ async function verifyProjectExists(req: Request, res: Response): Promise<boolean
   return true;
 }
 
+/**
+ * Load system documents for a list request
+ * `search`, `limit` and `offset` query parameters go through the search
+ * index; without them every document is returned as before.
+ */
+async function listSystemDocuments(projectId: string, query: Request['query']): Promise<SystemDocument[]> {
+  const search = typeof query.search === 'string' ? query.search.trim() : '';
+  const options: SystemSearchOptions = {};
+
+  if (typeof query.limit === 'string') {
+    const limit = parseInt(query.limit, 10);
+    if (!isNaN(limit) && limit > 0) {
+      options.limit = limit;
+    }
+  }
+
+  if (typeof query.offset === 'string') {
+    const offset = parseInt(query.offset, 10);
+    if (!isNaN(offset) && offset >= 0) {
+      options.offset = offset;
+    }
+  }
+
+  if (!search && options.limit === undefined && options.offset === undefined) {
+    return getAllSystemDocuments(projectId);
+  }
+
+  return searchSystemDocuments(projectId, search, options);
+}
+
 /**
  * GET /api/projects/:projectId/systems/categories - Get unique categories
  *
@@ -143,8 +176,13 @@ systemsRouter.post('/', async (req: Request, res: Response): Promise<void> => {
 /**
  * GET /api/projects/:projectId/systems - Get all system documents
  *
+ * Query Parameters:
+ * - search: Rank documents by relevance to this text
+ * - limit: Maximum number of results
+ * - offset: Number of results to skip
+ *
  * Response: ApiResponse<SystemDocument[]>
- * - 200: List of system documents sorted by createdAt descending
+ * - 200: List of system documents sorted by createdAt descending (or relevance)
  * - 404: Project not found
  * - 500: Server error
  */
@@ -156,7 +194,7 @@ systemsRouter.get('/', async (req: Request, res: Response): Promise<void> => {
       return;
     }
 
-    const systems = await getAllSystemDocuments(projectId);
+    const systems = await listSystemDocuments(projectId, req.query);
     sendSuccess(res, systems);
   } catch (error) {
     console.error('Error getting system documents:', error);
@@ -310,6 +348,9 @@ systemsRouter.delete('/:systemId', async (req: Request, res: Response): Promise<
  * Path Parameters:
  * - projectId: Project UUID
  *
+ * Query Parameters:
+ * - search, limit, offset: See the router's GET / handler
+ *
  * Response: ApiResponse<SystemDocument[]>
  * - 200: Systems retrieved successfully
  * - 404: Project not found
@@ -326,7 +367,7 @@ export async function getProjectSystems(req: Request, res: Response): Promise<vo
       return;
     }
 
-    const systems = await getAllSystemDocuments(projectId);
+    const systems = await listSystemDocuments(projectId, req.query);
     sendSuccess(res, systems);
   } catch (error) {
     console.error('Error getting systems:', error);
@@ -0,0 +1,174 @@
+/**
+ * Incremental Analytics Tests
+ * Materialized analytics must match a full recomputation after every write
+ */
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import path from 'path';
+import { v4 as uuidv4 } from 'uuid';
+import type { PeriodFilter } from '../../../src/types/index.ts';
+import {
+  calculateSummary,
+  calculateTimeline,
+  aggregateByPeriod,
+  clearAnalyticsCache,
+} from '../analyticsStorage.ts';
+import {
+  createTask,
+  updateTask,
+  deleteTask,
+  removeProjectTask,
+  insertProjectTask,
+  addGenerationHistoryEntry,
+  getTasksByProject,
+  flushTaskIndex,
+  clearTaskStorageCache,
+} from '../taskStorage.ts';
+import { createArchive, restoreArchive } from '../archiveStorage.ts';
+
+// Test workspace path - must match server's WORKSPACE_PATH
+const WORKSPACE_PATH = path.join(process.cwd(), 'workspace/projects');
+
+const PERIODS: PeriodFilter[] = ['daily', 'weekly', 'monthly'];
+
+describe('analyticsStorage (incremental)', () => {
+  let projectId: string;
+
+  async function cleanWorkspace(): Promise<void> {
+    await flushTaskIndex();
+    await fs.mkdir(WORKSPACE_PATH, { recursive: true });
+    const entries = await fs.readdir(WORKSPACE_PATH);
+    for (const entry of entries) {
+      if (entry !== '.gitkeep') {
+        await fs.rm(path.join(WORKSPACE_PATH, entry), { recursive: true, force: true });
+      }
+    }
+    clearTaskStorageCache();
+    clearAnalyticsCache();
+  }
+
+  async function expectMatchesFullRecompute(): Promise<void> {
+    const tasks = await getTasksByProject(projectId);
+    for (const period of PERIODS) {
+      expect(await calculateTimeline(projectId, period)).toEqual(aggregateByPeriod(tasks, period));
+    }
+    expect((await calculateSummary(projectId)).totalTasks).toBe(tasks.length);
+  }
+
+  beforeEach(async () => {
+    await cleanWorkspace();
+    projectId = uuidv4();
+    const tasksDir = path.join(WORKSPACE_PATH, projectId, 'tasks');
+    await fs.mkdir(tasksDir, { recursive: true });
+    await fs.writeFile(path.join(tasksDir, 'tasks.json'), '[]', 'utf-8');
+  });
+
+  afterEach(async () => {
+    await cleanWorkspace();
+  });
+
+  it('should stay consistent across creates, updates, generations and deletes', async () => {
+    // Materialize before any writes so later writes are applied incrementally
+    await calculateSummary(projectId);
+
+    const first = await createTask({ projectId, title: 'First' });
+    const second = await createTask({ projectId, title: 'Second' });
+    await expectMatchesFullRecompute();
+
+    await updateTask(first.id, { status: 'prototype', designDocument: 'd', prd: 'p', prototype: 'x' });
+    await addGenerationHistoryEntry(projectId, first.id, {
+      documentType: 'design',
+      action: 'create',
+      provider: 'openai',
+      model: 'gpt-4o',
+      tokens: { input: 1200, output: 800 },
+    });
+    await expectMatchesFullRecompute();
+
+    await deleteTask(second.id);
+    await expectMatchesFullRecompute();
+
+    const summary = await calculateSummary(projectId);
+    expect(summary.tasksByStatus.prototype).toBe(1);
+    expect(summary.documentsGenerated).toBe(3);
+  });
+
+  it('should total token usage and cost per period', async () => {
+    const task = await createTask({ projectId, title: 'Usage' });
+    await calculateSummary(projectId);
+
+    for (let i = 0; i < 2; i++) {
+      await addGenerationHistoryEntry(projectId, task.id, {
+        documentType: 'prd',
+        action: 'create',
+        provider: 'openai',
+        model: 'gpt-4o',
+        tokens: { input: 1000, output: 500 },
+      });
+    }
+
+    const [point] = await calculateTimeline(projectId, 'monthly');
+    expect(point.inputTokens).toBe(2000);
+    expect(point.outputTokens).toBe(1000);
+    expect(point.estimatedCost).toBeGreaterThan(0);
+  });
+
+  it('should not add periods for generations run after the task was created', async () => {
+    const task = await createTask({ projectId, title: 'Old' });
+    const tasksPath = path.join(WORKSPACE_PATH, projectId, 'tasks', 'tasks.json');
+    await fs.writeFile(tasksPath, JSON.stringify([{ ...task, createdAt: '2024-01-15T10:00:00Z' }]), 'utf-8');
+    await calculateSummary(projectId);
+
+    await addGenerationHistoryEntry(projectId, task.id, {
+      documentType: 'design',
+      action: 'create',
+      provider: 'openai',
+      model: 'gpt-4o',
+      tokens: { input: 1000, output: 500 },
+    });
+    await expectMatchesFullRecompute();
+
+    const timeline = await calculateTimeline(projectId, 'monthly');
+    expect(timeline).toHaveLength(1);
+    expect(timeline[0]).toMatchObject({ date: '2024-01', tasksCreated: 1, inputTokens: 1000 });
+  });
+
+  it('should rebuild after tasks.json is changed outside the store', async () => {
+    await createTask({ projectId, title: 'Tracked' });
+    expect((await calculateSummary(projectId)).totalTasks).toBe(1);
+
+    const tasksPath = path.join(WORKSPACE_PATH, projectId, 'tasks', 'tasks.json');
+    const tasks = JSON.parse(await fs.readFile(tasksPath, 'utf-8'));
+    tasks.push({ ...tasks[0], id: uuidv4(), title: 'Written externally' });
+    await fs.writeFile(tasksPath, JSON.stringify(tasks, null, 2), 'utf-8');
+
+    expect((await calculateSummary(projectId)).totalTasks).toBe(2);
+  });
+
+  it('should track archive writes', async () => {
+    const task = await createTask({ projectId, title: 'Done' });
+    await calculateSummary(projectId);
+
+    await createArchive(projectId, task.id, { ...task, status: 'prototype' });
+
+    expect((await calculateSummary(projectId)).archivedCount).toBe(1);
+  });
+
+  it('should apply archiving and restoring a task incrementally', async () => {
+    const task = await createTask({ projectId, title: 'Archived' });
+    await createTask({ projectId, title: 'Active' });
+    await updateTask(task.id, { status: 'prototype' });
+    await calculateSummary(projectId);
+
+    const archive = await removeProjectTask(projectId, task.id, (current) =>
+      createArchive(projectId, task.id, current)
+    );
+    await expectMatchesFullRecompute();
+    expect(await calculateSummary(projectId)).toMatchObject({ totalTasks: 1, archivedCount: 1 });
+
+    const restored = await restoreArchive(projectId, archive!.id);
+    await insertProjectTask(projectId, restored!);
+    await expectMatchesFullRecompute();
+    expect(await calculateSummary(projectId)).toMatchObject({ totalTasks: 2, archivedCount: 0 });
+  });
+});
@@ -13,10 +13,12 @@ import type { Task, Archive } from '../../../src/types/index.ts';
 // Mock taskStorage and archiveStorage
 vi.mock('../taskStorage.ts', () => ({
   getTasksByProject: vi.fn(),
+  onTasksWritten: vi.fn(),
 }));
 
 vi.mock('../archiveStorage.ts', () => ({
   getArchivesByProject: vi.fn(),
+  onArchivesWritten: vi.fn(),
 }));
 
 import * as taskStorage from '../taskStorage.ts';
@@ -271,5 +273,42 @@ describe('Analytics Storage', () => {
 
       expect(result).toEqual([]);
     });
+
+    it('should keep the per-period task counts of the original aggregation', () => {
+      const usage = { inputTokens: 0, outputTokens: 0, estimatedCost: 0 };
+
+      expect(aggregateByPeriod(mockTasks, 'daily')).toEqual([
+        { date: '2024-01-01', tasksCreated: 1, tasksCompleted: 0, documentsGenerated: 0, ...usage },
+        { date: '2024-01-02', tasksCreated: 1, tasksCompleted: 0, documentsGenerated: 1, ...usage },
+        { date: '2024-01-03', tasksCreated: 1, tasksCompleted: 0, documentsGenerated: 2, ...usage },
+        { date: '2024-01-04', tasksCreated: 1, tasksCompleted: 1, documentsGenerated: 3, ...usage },
+      ]);
+      expect(aggregateByPeriod(mockTasks, 'monthly')).toEqual([
+        { date: '2024-01', tasksCreated: 4, tasksCompleted: 1, documentsGenerated: 6, ...usage },
+      ]);
+    });
+
+    it('should count generation usage towards the period the task was created in', () => {
+      const task: Task = {
+        ...mockTasks[0],
+        generationHistory: [
+          {
+            id: 'gen-1',
+            documentType: 'design',
+            action: 'create',
+            provider: 'openai',
+            model: 'gpt-4o',
+            tokens: { input: 1000, output: 500 },
+            createdAt: '2024-03-15T10:00:00Z',
+          },
+        ],
+      };
+
+      const result = aggregateByPeriod([task], 'monthly');
+
+      expect(result).toHaveLength(1);
+      expect(result[0]).toMatchObject({ date: '2024-01', tasksCreated: 1, inputTokens: 1000, outputTokens: 500 });
+      expect(result[0].estimatedCost).toBeGreaterThan(0);
+    });
   });
 });
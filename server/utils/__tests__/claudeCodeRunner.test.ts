@@ -13,6 +13,8 @@ import { describe, it, expect, vi, beforeEach, afterEach, type Mock } from 'vite
 import { EventEmitter } from 'events';
 import {
   createClaudeCodeRunner,
+  createClaudeCodeStreamRunner,
+  parseStreamJsonLine,
   ClaudeCodeError,
   ClaudeCodeTimeoutError,
   type SpawnFunction,
@@ -268,4 +270,102 @@ describe('claudeCodeRunner', () => {
       expect(error).toBeInstanceOf(Error);
     });
   });
+
+  describe('callClaudeCodeStream', () => {
+    const delta = (text: string) =>
+      JSON.stringify({ type: 'stream_event', event: { type: 'content_block_delta', delta: { type: 'text_delta', text } } });
+    const result = JSON.stringify({
+      type: 'result',
+      subtype: 'success',
+      is_error: false,
+      result: 'Hello world',
+      usage: { input_tokens: 10, output_tokens: 3 },
+    });
+
+    it('should spawn claude with stream-json output', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText: vi.fn() });
+      mockProcess.emit('close', 0);
+      await resultPromise;
+
+      expect(mockSpawn).toHaveBeenCalledWith(
+        'claude',
+        ['-p', 'prompt', '--output-format', 'stream-json', '--verbose', '--include-partial-messages', '--allowedTools', 'Read,Write,Grep'],
+        { cwd: '/dir', stdio: ['ignore', 'pipe', 'pipe'] }
+      );
+    });
+
+    it('should forward text deltas as they arrive, across chunk boundaries', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+      const onText = vi.fn();
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText });
+      const first = `${delta('Hello')}\n`;
+      mockProcess.stdout.emit('data', Buffer.from(first.slice(0, 15)));
+      expect(onText).not.toHaveBeenCalled();
+      mockProcess.stdout.emit('data', Buffer.from(first.slice(15)));
+      expect(onText).toHaveBeenCalledWith('Hello');
+
+      mockProcess.stdout.emit('data', Buffer.from(`${delta(' world')}\n${result}\n`));
+      mockProcess.emit('close', 0);
+
+      const output = await resultPromise;
+      expect(onText).toHaveBeenCalledTimes(2);
+      expect(output.content).toBe('Hello world');
+      expect(output.usage).toEqual({ input: 10, output: 3 });
+    });
+
+    it('should fall back to whole assistant messages without partial deltas', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+      const onText = vi.fn();
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText });
+      const assistant = JSON.stringify({ type: 'assistant', message: { content: [{ type: 'text', text: 'Whole turn' }] } });
+      mockProcess.stdout.emit('data', Buffer.from(`${assistant}\n`));
+      mockProcess.emit('close', 0);
+
+      const output = await resultPromise;
+      expect(onText).toHaveBeenCalledWith('Whole turn');
+      expect(output.content).toBe('Whole turn');
+    });
+
+    it('should reject when the result reports an error', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText: vi.fn() });
+      mockProcess.stdout.emit('data', Buffer.from(JSON.stringify({ type: 'result', subtype: 'error_max_turns', is_error: true }) + '\n'));
+      mockProcess.emit('close', 0);
+
+      await expect(resultPromise).rejects.toThrow(ClaudeCodeError);
+    });
+
+    it('should kill the process when aborted', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+      const controller = new AbortController();
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText: vi.fn(), signal: controller.signal });
+      controller.abort();
+
+      await expect(resultPromise).rejects.toThrow('aborted');
+      expect(mockProcess.kill).toHaveBeenCalled();
+    });
+
+    it('should time out like the buffered runner', async () => {
+      const callClaudeCodeStream = createClaudeCodeStreamRunner(mockSpawn as unknown as SpawnFunction);
+
+      const resultPromise = callClaudeCodeStream('prompt', '/dir', { onText: vi.fn(), timeout: 1000 });
+      vi.advanceTimersByTime(1001);
+
+      await expect(resultPromise).rejects.toThrow(ClaudeCodeTimeoutError);
+    });
+  });
+
+  describe('parseStreamJsonLine', () => {
+    it('should ignore blank, invalid and non-text lines', () => {
+      expect(parseStreamJsonLine('')).toBeNull();
+      expect(parseStreamJsonLine('not json')).toBeNull();
+      expect(parseStreamJsonLine(JSON.stringify({ type: 'system', subtype: 'init' }))).toBeNull();
+    });
+  });
 });
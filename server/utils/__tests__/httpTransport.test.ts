@@ -0,0 +1,277 @@
+/**
+ * @vitest-environment node
+ */
+/**
+ * HTTP Transport Tests
+ * Connection reuse, rate limiting, Retry-After, single-flight and latency
+ * histograms against a local stub server
+ */
+
+import { describe, it, expect, beforeAll, afterAll, beforeEach, afterEach } from 'vitest';
+import http from 'http';
+import type { AddressInfo } from 'net';
+import { HttpTransport, parseRetryAfter, setSharedTransport } from '../httpTransport';
+import { LMStudioProvider } from '../llmProviders/lmstudio';
+import { LLMLogger } from '../llmLogger';
+
+const STREAM_DELAY_MS = 150;
+
+describe('HttpTransport', () => {
+  let server: http.Server;
+  let baseUrl: string;
+  let connections = 0;
+  let requests: string[] = [];
+  let limitedOnce = false;
+  let modelsDelayMs = 0;
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      requests.push(req.url || '');
+      req.resume();
+      req.on('end', () => {
+        if (req.url === '/v1/stream') {
+          res.writeHead(200, { 'Content-Type': 'text/event-stream' });
+          res.write('first ');
+          setTimeout(() => res.end('second'), STREAM_DELAY_MS);
+          return;
+        }
+
+        if (req.url === '/v1/limited' && !limitedOnce) {
+          limitedOnce = true;
+          res.writeHead(429, { 'Retry-After': '1', 'Content-Type': 'text/plain' });
+          res.end('slow down');
+          return;
+        }
+
+        const reply = () => {
+          res.writeHead(200, { 'Content-Type': 'application/json' });
+          res.end(JSON.stringify({ data: [{ id: 'local-model', object: 'model' }] }));
+        };
+        if (req.url === '/v1/models' && modelsDelayMs > 0) {
+          setTimeout(reply, modelsDelayMs);
+        } else {
+          reply();
+        }
+      });
+    });
+    server.on('connection', () => {
+      connections++;
+    });
+
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}/v1`;
+  });
+
+  afterAll(async () => {
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  let transport: HttpTransport;
+
+  beforeEach(() => {
+    connections = 0;
+    requests = [];
+    limitedOnce = false;
+    modelsDelayMs = 0;
+    transport = new HttpTransport();
+  });
+
+  afterEach(() => {
+    transport.destroy();
+    setSharedTransport(null);
+  });
+
+  async function get(path: string, provider = 'lmstudio', model?: string): Promise<Response> {
+    const response = await transport.request(`${baseUrl}${path}`, { method: 'GET' }, { provider, model, baseUrl });
+    await response.text();
+    return response;
+  }
+
+  describe('connection pooling', () => {
+    it('should reuse one keep-alive connection for sequential requests', async () => {
+      for (let i = 0; i < 5; i++) {
+        expect((await get('/models')).status).toBe(200);
+      }
+
+      expect(requests).toHaveLength(5);
+      expect(connections).toBe(1);
+    });
+
+    it('should cap concurrent connections per base URL', async () => {
+      transport.configurePool(baseUrl, { maxSockets: 2 });
+
+      await Promise.all(Array.from({ length: 6 }, () => get('/chat/completions')));
+
+      expect(requests).toHaveLength(6);
+      expect(connections).toBe(2);
+    });
+
+    it('should use a small pool for an LM Studio endpoint', async () => {
+      new LMStudioProvider({ endpoint: baseUrl, transport });
+
+      await Promise.all(Array.from({ length: 8 }, () => get('/chat/completions')));
+
+      expect(requests).toHaveLength(8);
+      expect(connections).toBeLessThanOrEqual(4);
+    });
+  });
+
+  describe('rate limiting', () => {
+    it('should spread requests beyond the burst at the refill rate', async () => {
+      transport.configureRateLimit('lmstudio', { capacity: 2, refillPerSecond: 10 });
+
+      const start = Date.now();
+      for (let i = 0; i < 4; i++) {
+        await get('/models');
+      }
+
+      // 2 from the burst, then one token per 100ms
+      expect(Date.now() - start).toBeGreaterThanOrEqual(180);
+    });
+
+    it('should keep a separate bucket per base URL of the same provider', async () => {
+      transport.configureRateLimit('openai', { capacity: 1, refillPerSecond: 1 });
+      const glmUrl = baseUrl.replace(/\/v1$/, '/glm/v4');
+
+      const start = Date.now();
+      await get('/models', 'openai');
+      const response = await transport.request(`${glmUrl}/models`, { method: 'GET' }, { provider: 'openai', baseUrl: glmUrl });
+      await response.text();
+
+      // Neither request waits for the other endpoint's token
+      expect(Date.now() - start).toBeLessThan(500);
+    });
+
+    it('should not grant a new burst when configurations for an endpoint alternate', async () => {
+      transport.configureRateLimit('lmstudio', { capacity: 2, refillPerSecond: 2 }, baseUrl);
+      await get('/models');
+      await get('/models');
+
+      const start = Date.now();
+      transport.configureRateLimit('lmstudio', { capacity: 3, refillPerSecond: 2 }, baseUrl);
+      transport.configureRateLimit('lmstudio', { capacity: 2, refillPerSecond: 2 }, baseUrl);
+      await get('/models');
+
+      // The spent burst carries over: the third request waits for a refill
+      expect(Date.now() - start).toBeGreaterThanOrEqual(300);
+    });
+
+    it('should reject invalid rate limits', () => {
+      expect(() => transport.configureRateLimit('lmstudio', { capacity: 1, refillPerSecond: NaN })).toThrow();
+      expect(() => transport.configureRateLimit('lmstudio', { capacity: 0, refillPerSecond: 1 })).toThrow();
+    });
+
+    it('should wait for Retry-After on 429 and retry', async () => {
+      const start = Date.now();
+      const response = await get('/limited');
+
+      expect(response.status).toBe(200);
+      expect(requests).toEqual(['/v1/limited', '/v1/limited']);
+      expect(Date.now() - start).toBeGreaterThanOrEqual(950);
+    });
+
+    it('should stop waiting for a token when the request is aborted', async () => {
+      transport.configureRateLimit('lmstudio', { capacity: 1, refillPerSecond: 0.1 });
+      await get('/models');
+      const controller = new AbortController();
+      setTimeout(() => controller.abort(), 50);
+
+      const start = Date.now();
+      const error = await transport
+        .request(`${baseUrl}/models`, { method: 'GET', signal: controller.signal }, { provider: 'lmstudio', baseUrl })
+        .catch((e: Error) => e);
+
+      expect((error as Error).name).toBe('AbortError');
+      expect(Date.now() - start).toBeLessThan(1000);
+      expect(requests).toHaveLength(1);
+    });
+
+    it('should stop waiting out Retry-After when the request is aborted', async () => {
+      const controller = new AbortController();
+      setTimeout(() => controller.abort(), 50);
+
+      const start = Date.now();
+      const error = await transport
+        .request(`${baseUrl}/limited`, { method: 'GET', signal: controller.signal }, { provider: 'lmstudio', baseUrl })
+        .catch((e: Error) => e);
+
+      expect((error as Error).name).toBe('AbortError');
+      expect(Date.now() - start).toBeLessThan(900);
+      expect(requests).toEqual(['/v1/limited']);
+    });
+
+    it('should return the 429 once retries are exhausted', async () => {
+      const strict = new HttpTransport({ maxRateLimitRetries: 0 });
+      const response = await strict.request(`${baseUrl}/limited`, { method: 'GET' }, { provider: 'lmstudio' });
+
+      expect(response.status).toBe(429);
+      expect(await response.text()).toBe('slow down');
+      strict.destroy();
+    });
+  });
+
+  describe('single-flight', () => {
+    it('should share one models request between concurrent callers', async () => {
+      modelsDelayMs = 50;
+      const provider = new LMStudioProvider({ endpoint: baseUrl, transport });
+
+      const results = await Promise.all([
+        provider.getAvailableModels(),
+        provider.getAvailableModels(),
+        provider.testConnection(),
+      ]);
+
+      expect(results[0]).toEqual(['local-model']);
+      expect(results[1]).toEqual(['local-model']);
+      expect(results[2].models).toEqual(['local-model']);
+      expect(requests).toEqual(['/v1/models']);
+
+      // Completed calls are not cached
+      await provider.getAvailableModels();
+      expect(requests).toHaveLength(2);
+    });
+  });
+
+  describe('latency histograms', () => {
+    it('should record latency per provider and model for LLMLogger', async () => {
+      setSharedTransport(transport);
+      await get('/chat/completions', 'lmstudio', 'local-model');
+      await get('/chat/completions', 'lmstudio', 'local-model');
+      await get('/models', 'openai');
+
+      const histograms = new LLMLogger().getLatencyHistograms();
+      const local = histograms.find((h) => h.provider === 'lmstudio' && h.model === 'local-model');
+
+      expect(local?.count).toBe(2);
+      expect(local?.buckets.reduce((sum, bucket) => sum + bucket.count, 0)).toBe(2);
+      expect(local?.p99).toBeLessThanOrEqual(local!.maxMs);
+      expect(histograms.find((h) => h.provider === 'openai')?.model).toBe('unknown');
+    });
+
+    it('should measure a streamed response to its last chunk', async () => {
+      const response = await transport.request(
+        `${baseUrl}/stream`,
+        { method: 'GET' },
+        { provider: 'lmstudio', model: 'streamed', baseUrl }
+      );
+      expect(transport.getLatencyHistograms()).toHaveLength(0);
+
+      expect(await response.text()).toBe('first second');
+
+      const [histogram] = transport.getLatencyHistograms();
+      expect(histogram.count).toBe(1);
+      expect(histogram.maxMs).toBeGreaterThanOrEqual(STREAM_DELAY_MS - 10);
+    });
+  });
+
+  describe('parseRetryAfter', () => {
+    it('should parse delay seconds and HTTP dates', () => {
+      const now = Date.parse('2025-01-01T00:00:00Z');
+
+      expect(parseRetryAfter('2', now)).toBe(2000);
+      expect(parseRetryAfter('Wed, 01 Jan 2025 00:00:05 GMT', now)).toBe(5000);
+      expect(parseRetryAfter('soon', now)).toBeNull();
+      expect(parseRetryAfter(null, now)).toBeNull();
+    });
+  });
+});
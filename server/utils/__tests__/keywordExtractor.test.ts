@@ -9,7 +9,7 @@
  * - Tag normalization (lowercase, special char removal, deduplication)
  */
 import { describe, it, expect } from 'vitest';
-import { extractKeywords } from '../keywordExtractor.ts';
+import { extractKeywords, tokenizeText } from '../keywordExtractor.ts';
 
 describe('keywordExtractor', () => {
   describe('extractKeywords - Basic Input Handling', () => {
@@ -318,4 +318,20 @@ describe('keywordExtractor', () => {
       });
     });
   });
+
+  describe('tokenizeText', () => {
+    it('should tokenize short text with the same filtering as extractKeywords', () => {
+      expect(tokenizeText('The Login-System 로그인 기능 and level99')).toEqual([
+        'login',
+        'system',
+        '로그인',
+        '기능',
+        'level',
+      ]);
+    });
+
+    it('should keep repeated terms', () => {
+      expect(tokenizeText('combat combat')).toEqual(['combat', 'combat']);
+    });
+  });
 });
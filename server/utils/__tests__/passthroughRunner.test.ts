@@ -6,19 +6,25 @@
  */
 
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
 import type {
   PassthroughPipeline,
   PassthroughStageName,
   PassthroughStageStatus,
 } from '../../../src/types/passthrough.ts';
 import type { Task } from '../../../src/types/index.ts';
-import type { LLMProvider } from '../../../src/types/llm.ts';
+import type { LLMResult } from '../../../src/types/llm.ts';
+import { createDefaultProjectLLMSettings, createDefaultModelConfig } from '../../../src/types/llm.ts';
 
 // Mock dependencies
 vi.mock('../passthroughStorage.ts', () => ({
   createPipeline: vi.fn(),
+  createDefaultPipelineStages: vi.fn(() => []),
   savePipeline: vi.fn(),
   getPipelineById: vi.fn(),
+  getPipelineByTaskId: vi.fn(),
   updatePipelineStatus: vi.fn(),
   updateStageProgress: vi.fn(),
 }));
@@ -63,6 +69,10 @@ import {
   buildPrototypePrompt,
 } from '../promptBuilder.ts';
 import { callClaudeCode } from '../claudeCodeRunner.ts';
+import { LLMResponseCache, setSharedResponseCache } from '../llmResponseCache.ts';
+import { LMStudioProvider } from '../llmProviders/lmstudio.ts';
+import { HttpTransport, setSharedTransport } from '../httpTransport.ts';
+import { LLMLogger } from '../llmLogger.ts';
 
 // Import the module under test
 import {
@@ -145,11 +155,13 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
     completedAt: null,
   };
 
-  const mockLLMSettings = {
-    provider: 'claude-code' as LLMProvider,
+  const mockLLMSettings = createDefaultProjectLLMSettings(mockProjectId);
+
+  const mockResult: LLMResult = {
+    success: true,
+    content: '# Design Document\n\nGenerated content',
+    provider: 'claude-code',
     model: 'claude-3.5-sonnet',
-    isEnabled: true,
-    connectionStatus: 'connected',
   };
 
   beforeEach(() => {
@@ -168,11 +180,8 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
 
     // Mock LLM provider
     const mockLLMProvider = {
-      generateText: vi.fn().mockResolvedValue('# Design Document\n\nGenerated content'),
-      chat: vi.fn().mockResolvedValue({
-        content: '# PRD\n\nGenerated content',
-        usage: { inputTokens: 100, outputTokens: 200 },
-      }),
+      provider: 'claude-code',
+      generate: vi.fn().mockResolvedValue(mockResult),
     };
     vi.mocked(createLLMProvider).mockReturnValue(mockLLMProvider as any);
 
@@ -185,6 +194,7 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
     vi.mocked(callClaudeCode).mockResolvedValue({
       success: true,
       output: '# Generated Document',
+      rawOutput: '# Generated Document',
     });
   });
 
@@ -229,17 +239,8 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
         qaSessionId: mockQaSessionId,
       };
 
-      // Mock pipeline to return paused status
-      let callCount = 0;
-      vi.mocked(getPipelineById).mockImplementation(async () => {
-        callCount++;
-        if (callCount === 1) {
-          return { ...mockPipeline, status: 'running', currentStage: 'design_doc' };
-        } else if (callCount === 2) {
-          return { ...mockPipeline, status: 'paused' };
-        }
-        return mockPipeline;
-      });
+      // Scheduler signals a pause before the next stage starts
+      options.control = { signal: 'pause' };
 
       // Act
       const result = await runPipeline(options);
@@ -259,16 +260,8 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
         qaSessionId: mockQaSessionId,
       };
 
-      // Mock pipeline to return cancelled status
-      vi.mocked(getPipelineById).mockResolvedValueOnce({
-        ...mockPipeline,
-        status: 'running',
-        currentStage: 'design_doc',
-      });
-      vi.mocked(getPipelineById).mockResolvedValueOnce({
-        ...mockPipeline,
-        status: 'cancelled',
-      });
+      // Scheduler signals a cancel before the next stage starts
+      options.control = { signal: 'cancel' };
 
       // Act
       const result = await runPipeline(options);
@@ -281,6 +274,26 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
       );
     });
 
+    it('should report each stage run time through the control channel', async () => {
+      // Arrange
+      const onStageFinished = vi.fn();
+      const options: PipelineRunnerOptions = {
+        taskId: mockTaskId,
+        qaSessionId: mockQaSessionId,
+        control: { signal: null, onStageFinished },
+      };
+
+      // Act
+      await runPipeline(options);
+
+      // Assert
+      expect(onStageFinished.mock.calls.map((call) => [call[0], call[2]])).toEqual([
+        ['design_doc', true],
+        ['prd', true],
+        ['prototype', true],
+      ]);
+    });
+
     it('should handle stage errors and update stage status', async () => {
       // Arrange
       const options: PipelineRunnerOptions = {
@@ -290,7 +303,8 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
 
       // Mock LLM provider to throw error
       const mockLLMProvider = {
-        generateText: vi.fn().mockRejectedValue(new Error('LLM service unavailable')),
+        provider: 'claude-code',
+        generate: vi.fn().mockRejectedValue(new Error('LLM service unavailable')),
       };
       vi.mocked(createLLMProvider).mockReturnValue(mockLLMProvider as any);
 
@@ -314,7 +328,8 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
 
       // Mock LLM provider to consistently fail
       const mockLLMProvider = {
-        generateText: vi.fn().mockRejectedValue(new Error('LLM service unavailable')),
+        provider: 'claude-code',
+        generate: vi.fn().mockRejectedValue(new Error('LLM service unavailable')),
       };
       vi.mocked(createLLMProvider).mockReturnValue(mockLLMProvider as any);
 
@@ -324,7 +339,7 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
       // Assert
       expect(result.status).toBe('failed');
       expect(result.stages[0].error?.retryCount).toBe(3);
-      expect(mockLLMProvider.generateText).toHaveBeenCalledTimes(3); // maxRetries + 1 initial attempt
+      expect(mockLLMProvider.generate).toHaveBeenCalledTimes(3); // maxRetries + 1 initial attempt
     });
   });
 
@@ -401,6 +416,87 @@ describe('Passthrough Pipeline Runner (TDD RED)', () => {
       expect(result.status).toBe('completed');
       expect(result.progress).toBe(100);
     });
+
+    it('should run document stages on the provider configured for the stage', async () => {
+      // Arrange
+      const openaiConfig = createDefaultModelConfig('openai', 'gpt-4o');
+      const settings = createDefaultProjectLLMSettings(mockProjectId);
+      settings.providers = settings.providers.map((p) =>
+        p.provider === 'openai' ? { ...p, apiKey: 'sk-test', isEnabled: true } : p
+      );
+      settings.taskStageConfig = { ...settings.taskStageConfig, designDoc: openaiConfig };
+
+      // Act
+      await runStage({ pipeline: mockPipeline, stage: mockPipeline.stages[0], task: mockTask, llmSettings: settings });
+      await runStage({ pipeline: mockPipeline, stage: mockPipeline.stages[2], task: mockTask, llmSettings: settings });
+
+      // Assert
+      expect(vi.mocked(createLLMProvider).mock.calls.map((call) => call[0].provider)).toEqual([
+        'openai',
+        'claude-code',
+      ]);
+      const provider = vi.mocked(createLLMProvider).mock.results[0].value;
+      expect(provider.generate).toHaveBeenCalledWith('Mock design doc prompt', openaiConfig, expect.any(String));
+    });
+
+    it('should fail a stage whose configured provider is not enabled', async () => {
+      // Arrange
+      const settings = createDefaultProjectLLMSettings(mockProjectId);
+      settings.taskStageConfig = {
+        ...settings.taskStageConfig,
+        prd: createDefaultModelConfig('openai', 'gpt-4o'),
+      };
+
+      // Act & Assert
+      await expect(
+        runStage({ pipeline: mockPipeline, stage: mockPipeline.stages[1], task: mockTask, llmSettings: settings })
+      ).rejects.toThrow('Provider openai is not enabled');
+      expect(createLLMProvider).not.toHaveBeenCalled();
+    });
+
+    it('should serve a re-run stage from the response cache when enabled', async () => {
+      // Arrange
+      const cacheDir = await fs.mkdtemp(path.join(os.tmpdir(), 'passthrough-cache-test-'));
+      setSharedResponseCache(new LLMResponseCache({ cacheDir }));
+      const fetchMock = vi.fn().mockResolvedValue({
+        ok: true,
+        json: async () => ({
+          model: 'local-model',
+          choices: [{ index: 0, message: { role: 'assistant', content: '# Generated Document' }, finish_reason: 'stop' }],
+          usage: { prompt_tokens: 10, completion_tokens: 5, total_tokens: 15 },
+        }),
+      });
+      setSharedTransport(new HttpTransport({ fetch: fetchMock }));
+      vi.mocked(createLLMProvider).mockImplementation(
+        (settings, _useSharedLogger, projectId) =>
+          new LMStudioProvider({ endpoint: settings.endpoint, projectId, logger: new LLMLogger() })
+      );
+      const cachedSettings = {
+        ...mockLLMSettings,
+        taskStageConfig: {
+          ...mockLLMSettings.taskStageConfig,
+          designDoc: createDefaultModelConfig('lmstudio', 'local-model'),
+        },
+        responseCache: { enabled: true },
+      };
+      const stage = mockPipeline.stages[0];
+
+      try {
+        // Act
+        await runStage({ pipeline: mockPipeline, stage, task: mockTask, llmSettings: cachedSettings });
+        await runStage({ pipeline: mockPipeline, stage, task: mockTask, llmSettings: cachedSettings });
+
+        // Assert
+        expect(fetchMock).toHaveBeenCalledTimes(1);
+        expect(updateTask).toHaveBeenLastCalledWith(mockTask.id, {
+          designDocument: '# Generated Document',
+        });
+      } finally {
+        setSharedResponseCache(null);
+        setSharedTransport(null);
+        await fs.rm(cacheDir, { recursive: true, force: true });
+      }
+    });
   });
 
   // -----------------------------------------------------------------------
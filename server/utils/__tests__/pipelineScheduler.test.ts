@@ -0,0 +1,275 @@
+/**
+ * Tests for Passthrough Pipeline Scheduler
+ * SPEC-PASSTHROUGH-001: Bounded worker pool, fairness, durable queue, signalling
+ */
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { rm, readFile } from 'fs/promises';
+import path from 'path';
+import { tmpdir } from 'os';
+import { v4 as uuidv4 } from 'uuid';
+import type { PassthroughPipeline } from '../../../src/types/passthrough';
+import type { LLMProvider } from '../../../src/types/llm';
+import type { PipelineRunnerOptions } from '../passthroughRunner';
+
+const TEST_PIPELINE_DIR = path.join(tmpdir(), `moai-test-scheduler-${uuidv4()}`);
+
+// Modules are loaded after MOAI_TEST_PIPELINE_DIR is set
+let schedulerModule: typeof import('../pipelineScheduler');
+let storageModule: typeof import('../passthroughStorage');
+
+interface Deferred {
+  options: PipelineRunnerOptions;
+  finish: (status?: PassthroughPipeline['status']) => void;
+}
+
+function makePipeline(taskId: string): PassthroughPipeline {
+  const now = new Date().toISOString();
+  return {
+    id: `pipeline-${taskId}`,
+    taskId,
+    qaSessionId: `qa-${taskId}`,
+    status: 'pending',
+    currentStage: null,
+    stages: [],
+    createdAt: now,
+    updatedAt: now,
+    startedAt: null,
+    completedAt: null,
+  };
+}
+
+describe('PipelineScheduler', () => {
+  const originalEnv = process.env.MOAI_TEST_PIPELINE_DIR;
+  let started: Deferred[];
+
+  // Runner whose pipelines finish only when the test says so
+  const runner = vi.fn(
+    (options: PipelineRunnerOptions) =>
+      new Promise<PassthroughPipeline>((resolve) => {
+        started.push({
+          options,
+          finish: (status = 'completed') => resolve({ ...makePipeline(options.taskId), status }),
+        });
+      })
+  );
+
+  // Providers are encoded in the project id for these tests
+  const resolveProviders = async (projectId: string): Promise<LLMProvider[]> => {
+    if (projectId.startsWith('cc-')) {
+      return ['claude-code'];
+    }
+    return projectId.startsWith('mixed-') ? ['openai', 'claude-code'] : ['openai'];
+  };
+
+  function createScheduler(maxWorkers: number, providerLimits = {}) {
+    return new schedulerModule.PipelineScheduler({ maxWorkers, providerLimits, runner, resolveProviders });
+  }
+
+  beforeEach(async () => {
+    process.env.MOAI_TEST_PIPELINE_DIR = TEST_PIPELINE_DIR;
+    vi.resetModules();
+    storageModule = await import('../passthroughStorage');
+    schedulerModule = await import('../pipelineScheduler');
+    started = [];
+    runner.mockClear();
+    await rm(TEST_PIPELINE_DIR, { recursive: true, force: true });
+  });
+
+  afterEach(async () => {
+    await rm(TEST_PIPELINE_DIR, { recursive: true, force: true });
+    process.env.MOAI_TEST_PIPELINE_DIR = originalEnv;
+  });
+
+  describe('concurrency limits', () => {
+    it('should respect the global worker limit', async () => {
+      const scheduler = createScheduler(2);
+
+      for (const taskId of ['t1', 't2', 't3']) {
+        await scheduler.enqueue(makePipeline(taskId), { projectId: 'p1' });
+      }
+
+      expect(started).toHaveLength(2);
+      expect(scheduler.getMetrics().queueDepth).toBe(1);
+
+      started[0].finish();
+      await vi.waitFor(() => expect(started).toHaveLength(3));
+    });
+
+    it('should respect per-provider limits without blocking other providers', async () => {
+      const scheduler = createScheduler(4, { 'claude-code': 1 });
+
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'cc-a' });
+      await scheduler.enqueue(makePipeline('t2'), { projectId: 'cc-b' });
+      await scheduler.enqueue(makePipeline('t3'), { projectId: 'api-a' });
+
+      expect(started.map((d) => d.options.taskId)).toEqual(['t1', 't3']);
+      expect(scheduler.getMetrics().runningByProvider).toEqual({ 'claude-code': 1, openai: 1 });
+      expect(scheduler.getMetrics().queuedByProvider).toEqual({ 'claude-code': 1 });
+    });
+
+    it('should count a job against every provider its stages use', async () => {
+      const scheduler = createScheduler(4, { 'claude-code': 1 });
+
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'mixed-a' });
+      await scheduler.enqueue(makePipeline('t2'), { projectId: 'cc-a' });
+      await scheduler.enqueue(makePipeline('t3'), { projectId: 'api-a' });
+
+      expect(started.map((d) => d.options.taskId)).toEqual(['t1', 't3']);
+      expect(scheduler.getMetrics().runningByProvider).toEqual({ 'claude-code': 1, openai: 2 });
+
+      started[0].finish();
+      await vi.waitFor(() => expect(started).toHaveLength(3));
+      expect(scheduler.getMetrics().runningByProvider).toEqual({ 'claude-code': 1, openai: 1 });
+    });
+  });
+
+  describe('fairness', () => {
+    it('should serve the least recently served project first', async () => {
+      const scheduler = createScheduler(1);
+
+      await scheduler.enqueue(makePipeline('a1'), { projectId: 'A' });
+      await scheduler.enqueue(makePipeline('a2'), { projectId: 'A' });
+      await scheduler.enqueue(makePipeline('a3'), { projectId: 'A' });
+      await scheduler.enqueue(makePipeline('b1'), { projectId: 'B' });
+
+      for (let i = 0; i < 3; i++) {
+        started[i].finish();
+        await vi.waitFor(() => expect(started).toHaveLength(i + 2));
+      }
+
+      expect(started.map((d) => d.options.taskId)).toEqual(['a1', 'b1', 'a2', 'a3']);
+    });
+  });
+
+  describe('signals', () => {
+    it('should deliver pause directly to a running pipeline', async () => {
+      const scheduler = createScheduler(1);
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'p1' });
+
+      expect(scheduler.signal('pipeline-t1', 'pause')).toBe(true);
+
+      expect(started[0].options.control?.signal).toBe('pause');
+    });
+
+    it('should drop a cancelled pipeline from the queue', async () => {
+      const scheduler = createScheduler(1);
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'p1' });
+      await scheduler.enqueue(makePipeline('t2'), { projectId: 'p1' });
+
+      expect(scheduler.signal('pipeline-t2', 'cancel')).toBe(true);
+      started[0].finish();
+      await scheduler.whenIdle();
+
+      expect(started).toHaveLength(1);
+      expect(scheduler.getMetrics().queueDepth).toBe(0);
+    });
+
+    it('should withdraw a pending pause when the pipeline is resumed', async () => {
+      const scheduler = createScheduler(1);
+      const pipeline = makePipeline('t1');
+      await scheduler.enqueue(pipeline, { projectId: 'p1' });
+
+      scheduler.signal(pipeline.id, 'pause');
+      await scheduler.enqueue(pipeline, { projectId: 'p1' });
+
+      expect(started).toHaveLength(1);
+      expect(started[0].options.control?.signal).toBeNull();
+    });
+  });
+
+  describe('durable queue', () => {
+    it('should persist queued and running jobs', async () => {
+      const scheduler = createScheduler(1);
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'p1' });
+      await scheduler.enqueue(makePipeline('t2'), { projectId: 'p1', resumeFromStage: 'prd' });
+
+      const jobs = JSON.parse(await readFile(storageModule.PIPELINE_QUEUE_PATH, 'utf-8'));
+
+      expect(jobs.map((j: { taskId: string; state: string }) => [j.taskId, j.state])).toEqual([
+        ['t1', 'running'],
+        ['t2', 'queued'],
+      ]);
+      expect(jobs[1].resumeFromStage).toBe('prd');
+    });
+
+    it('should resume interrupted pipelines after the last completed stage', async () => {
+      const pipeline = await storageModule.createPipeline(
+        'task-restart',
+        'qa-1',
+        storageModule.createDefaultPipelineStages()
+      );
+      pipeline.status = 'running';
+      pipeline.currentStage = 'design_doc';
+      await storageModule.savePipeline(pipeline);
+
+      await storageModule.savePipelineQueue([
+        {
+          pipelineId: pipeline.id,
+          taskId: 'task-restart',
+          projectId: 'p1',
+          qaSessionId: 'qa-1',
+          providers: ['openai'],
+          resumeFromStage: null,
+          state: 'running',
+          enqueuedAt: new Date().toISOString(),
+        },
+      ]);
+
+      const scheduler = createScheduler(1);
+      await scheduler.start();
+
+      expect(started).toHaveLength(1);
+      expect(started[0].options.taskId).toBe('task-restart');
+      expect(started[0].options.resumeFromStage).toBe('prd');
+    });
+
+    it('should restore the saved queue before a job enqueued ahead of start', async () => {
+      await storageModule.savePipelineQueue([
+        {
+          pipelineId: 'pipeline-saved',
+          taskId: 'saved',
+          projectId: 'p1',
+          qaSessionId: 'qa-saved',
+          providers: ['openai'],
+          resumeFromStage: null,
+          state: 'queued',
+          enqueuedAt: new Date().toISOString(),
+        },
+      ]);
+
+      const scheduler = createScheduler(1);
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'p1' });
+
+      const jobs = JSON.parse(await readFile(storageModule.PIPELINE_QUEUE_PATH, 'utf-8'));
+      expect(jobs.map((j: { taskId: string }) => j.taskId)).toEqual(['saved', 't1']);
+      expect(started.map((d) => d.options.taskId)).toEqual(['saved']);
+    });
+  });
+
+  describe('metrics', () => {
+    it('should record wait time, stage run time and outcomes', async () => {
+      const scheduler = createScheduler(1);
+      await scheduler.enqueue(makePipeline('t1'), { projectId: 'p1' });
+
+      started[0].options.control?.onStageFinished?.('design_doc', 120, true);
+      started[0].options.control?.onStageFinished?.('design_doc', 80, false);
+      started[0].finish('completed');
+      await scheduler.whenIdle();
+
+      const metrics = scheduler.getMetrics();
+      expect(metrics.waitTime.count).toBe(1);
+      expect(metrics.stageRunTime.design_doc).toEqual({ count: 2, averageMs: 100, maxMs: 120, failures: 1 });
+      expect(metrics.outcomes).toEqual({ completed: 1 });
+      expect(metrics.running).toBe(0);
+    });
+  });
+
+  describe('parseProviderLimits', () => {
+    it('should parse provider=limit pairs and ignore invalid entries', () => {
+      expect(schedulerModule.parseProviderLimits('claude-code=2, openai=5,gemini=0,bad')).toEqual({
+        'claude-code': 2,
+        openai: 5,
+      });
+    });
+  });
+});
@@ -0,0 +1,96 @@
+/**
+ * Search Index Tests
+ * BM25 ranking, prefix matching, incremental updates and pagination
+ */
+import { describe, it, expect, beforeEach } from 'vitest';
+import { SearchIndex } from '../searchIndex.ts';
+
+describe('SearchIndex', () => {
+  let index: SearchIndex;
+
+  beforeEach(() => {
+    index = new SearchIndex({ fieldWeights: { title: 3, body: 1 } });
+    index.add('login', { title: 'Login flow', body: 'OAuth authentication and session handling' });
+    index.add('payment', { title: 'Payment gateway', body: 'Checkout with login required' });
+    index.add('guild', { title: '길드 시스템', body: '길드원을 관리하는 기능' });
+  });
+
+  describe('search', () => {
+    it('should rank title matches above body matches', () => {
+      const { hits } = index.search('login');
+
+      expect(hits.map((h) => h.id)).toEqual(['login', 'payment']);
+      expect(hits[0].score).toBeGreaterThan(hits[1].score);
+    });
+
+    it('should require every query term to match', () => {
+      expect(index.search('login checkout').hits.map((h) => h.id)).toEqual(['payment']);
+      expect(index.search('login unknown').total).toBe(0);
+    });
+
+    it('should match indexed terms by prefix', () => {
+      expect(index.search('auth').hits.map((h) => h.id)).toEqual(['login']);
+      expect(index.search('길드원').hits.map((h) => h.id)).toEqual(['guild']);
+      expect(index.search('길드').hits.map((h) => h.id)).toEqual(['guild']);
+    });
+
+    it('should return nothing for queries without indexable terms', () => {
+      expect(index.search('the and')).toEqual({ total: 0, hits: [] });
+    });
+
+    it('should apply filters before counting and paginating', () => {
+      const result = index.search('login', { filter: (id) => id !== 'login' });
+
+      expect(result.total).toBe(1);
+      expect(result.hits.map((h) => h.id)).toEqual(['payment']);
+    });
+
+    it('should return the requested page of ranked hits', () => {
+      for (let i = 0; i < 10; i++) {
+        index.add(`doc-${i}`, { title: 'Report', body: 'report '.repeat(10 - i) });
+      }
+
+      const all = index.search('report');
+      const page = index.search('report', { offset: 3, limit: 4 });
+
+      expect(page.total).toBe(10);
+      expect(page.hits).toEqual(all.hits.slice(3, 7));
+    });
+
+    it('should pick small pages of many hits in the same order as a full listing', () => {
+      for (let i = 0; i < 100; i++) {
+        index.add(`doc-${i}`, { title: 'Report', body: 'report '.repeat(1 + (i % 7)) });
+      }
+
+      const all = index.search('report');
+      const page = index.search('report', { offset: 5, limit: 3 });
+
+      expect(all.hits).toHaveLength(100);
+      expect(page.hits).toEqual(all.hits.slice(5, 8));
+      // Equal scores keep insertion order
+      for (let i = 1; i < all.hits.length; i++) {
+        if (all.hits[i].score === all.hits[i - 1].score) {
+          expect(Number(all.hits[i].id.slice(4))).toBeGreaterThan(Number(all.hits[i - 1].id.slice(4)));
+        }
+      }
+    });
+  });
+
+  describe('updates', () => {
+    it('should replace a document when added again', () => {
+      index.add('login', { title: 'Signup flow', body: 'Registration' });
+
+      expect(index.search('signup').hits.map((h) => h.id)).toEqual(['login']);
+      expect(index.search('oauth').total).toBe(0);
+      expect(index.size).toBe(3);
+    });
+
+    it('should forget removed documents and their terms', () => {
+      expect(index.remove('payment')).toBe(true);
+
+      expect(index.search('gateway').total).toBe(0);
+      expect(index.search('gate').total).toBe(0);
+      expect(index.has('payment')).toBe(false);
+    });
+  });
+});
@@ -8,7 +8,7 @@
  * - TASK-001: Result sorting and limiting
  */
 import { describe, it, expect } from 'vitest';
-import { matchSystemsByKeywords } from '../systemMatcher.ts';
+import { matchSystemsByKeywords, SystemTagIndex } from '../systemMatcher.ts';
 import type { ExtractedKeyword } from '../keywordExtractor.ts';
 import type { SystemDocument } from '../../../src/types/index.ts';
 
@@ -260,4 +260,76 @@ describe('systemMatcher', () => {
       expect(results).toEqual([]);
     });
   });
+
+  describe('SystemTagIndex', () => {
+    it('should weight matches by keyword weight', () => {
+      const index = new SystemTagIndex();
+      index.add(createMockSystem({ id: 'combat', name: 'Combat', tags: ['combat'] }));
+      index.add(createMockSystem({ id: 'shop', name: 'Shop', tags: ['shop'] }));
+
+      const results = index.match([createMockKeyword('shop', 100), createMockKeyword('combat', 20)]);
+
+      expect(results.map((r) => r.systemId)).toEqual(['shop', 'combat']);
+      expect(results[0].relevanceScore).toBeGreaterThan(results[1].relevanceScore);
+    });
+
+    it('should rank rare tags above tags shared by every system', () => {
+      const index = new SystemTagIndex();
+      index.add(createMockSystem({ id: 'common', name: 'Common', tags: ['core'] }));
+      index.add(createMockSystem({ id: 'rare', name: 'Rare', tags: ['core', 'guild'] }));
+      index.add(createMockSystem({ id: 'other', name: 'Other', tags: ['core', 'ui'] }));
+
+      const results = index.match([createMockKeyword('core', 100), createMockKeyword('guild', 100)]);
+
+      expect(results[0]).toMatchObject({ systemId: 'rare', relevanceScore: 100, matchedTags: ['core', 'guild'] });
+      expect(results[1].relevanceScore).toBeLessThan(50);
+    });
+
+    it('should keep the best results in order without a full sort', () => {
+      const index = new SystemTagIndex();
+      for (let i = 0; i < 50; i++) {
+        const tags = Array.from({ length: i % 7 }, (_, t) => `tag${t}`);
+        index.add(createMockSystem({ id: `system-${i}`, name: `System ${i}`, tags }));
+      }
+      const keywords = Array.from({ length: 7 }, (_, t) => createMockKeyword(`tag${t}`, 100 - t));
+
+      const top = index.match(keywords, 10);
+      const all = index.match(keywords, 100);
+
+      expect(top).toEqual(all.slice(0, 10));
+      for (let i = 1; i < all.length; i++) {
+        expect(all[i - 1].relevanceScore).toBeGreaterThanOrEqual(all[i].relevanceScore);
+      }
+    });
+
+    it('should reflect updated and removed systems', () => {
+      const index = new SystemTagIndex();
+      index.add(createMockSystem({ id: 'system-1', tags: ['guild'] }));
+      index.add(createMockSystem({ id: 'system-2', tags: ['guild'] }));
+
+      index.add(createMockSystem({ id: 'system-1', tags: ['raid'] }));
+      expect(index.match([createMockKeyword('guild')]).map((r) => r.systemId)).toEqual(['system-2']);
+      expect(index.match([createMockKeyword('raid')]).map((r) => r.systemId)).toEqual(['system-1']);
+
+      expect(index.remove('system-2')).toBe(true);
+      expect(index.remove('system-2')).toBe(false);
+      expect(index.match([createMockKeyword('guild')])).toEqual([]);
+      expect(index.size).toBe(1);
+    });
+
+    it('should match a batch of keyword sets in input order', () => {
+      const index = new SystemTagIndex();
+      index.add(createMockSystem({ id: 'guild', name: 'Guild', tags: ['guild'] }));
+      index.add(createMockSystem({ id: 'shop', name: 'Shop', tags: ['shop'] }));
+
+      const results = index.matchBatch([
+        [createMockKeyword('shop')],
+        [createMockKeyword('unknown')],
+        [createMockKeyword('guild'), createMockKeyword('shop')],
+      ]);
+
+      expect(results.map((list) => list.map((r) => r.systemId))).toEqual([['shop'], [], ['guild', 'shop']]);
+      expect(results[2][0].relevanceScore).toBe(50);
+    });
+  });
 });
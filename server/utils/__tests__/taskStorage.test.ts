@@ -0,0 +1,270 @@
+/**
+ * Task Storage Tests
+ * Integration tests for the indexed, cached task store
+ */
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import path from 'path';
+import type { Task } from '../../../src/types/index.ts';
+import { v4 as uuidv4 } from 'uuid';
+import {
+  getTasksByProject,
+  getTaskById,
+  createTask,
+  updateTask,
+  deleteTask,
+  removeProjectTask,
+  insertProjectTask,
+  saveProjectTasks,
+  onTasksWritten,
+  addGenerationHistoryEntry,
+  flushTaskIndex,
+  clearTaskStorageCache,
+  type TaskChange,
+} from '../taskStorage.ts';
+
+// Test workspace path - must match server's WORKSPACE_PATH
+const WORKSPACE_PATH = path.join(process.cwd(), 'workspace/projects');
+const TASK_INDEX_PATH = path.join(WORKSPACE_PATH, '.task-index.json');
+
+describe('taskStorage', () => {
+  let testProjectId: string;
+
+  // Helper to create a project directory with an empty tasks.json
+  async function createTestProject(): Promise<string> {
+    const projectId = uuidv4();
+    const tasksDir = path.join(WORKSPACE_PATH, projectId, 'tasks');
+    await fs.mkdir(tasksDir, { recursive: true });
+    await fs.writeFile(path.join(tasksDir, 'tasks.json'), JSON.stringify([], null, 2), 'utf-8');
+    return projectId;
+  }
+
+  function getTasksPath(projectId: string): string {
+    return path.join(WORKSPACE_PATH, projectId, 'tasks', 'tasks.json');
+  }
+
+  async function cleanWorkspace(): Promise<void> {
+    await flushTaskIndex();
+    await fs.mkdir(WORKSPACE_PATH, { recursive: true });
+    const entries = await fs.readdir(WORKSPACE_PATH);
+    for (const entry of entries) {
+      if (entry !== '.gitkeep') {
+        await fs.rm(path.join(WORKSPACE_PATH, entry), { recursive: true, force: true });
+      }
+    }
+    clearTaskStorageCache();
+  }
+
+  beforeEach(async () => {
+    await cleanWorkspace();
+    testProjectId = await createTestProject();
+  });
+
+  afterEach(async () => {
+    await cleanWorkspace();
+  });
+
+  describe('getTaskById', () => {
+    it('should find a task created through the store', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Indexed' });
+
+      const result = await getTaskById(task.id);
+
+      expect(result?.projectId).toBe(testProjectId);
+      expect(result?.task.title).toBe('Indexed');
+    });
+
+    it('should persist the taskId to projectId index', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Persisted' });
+      await getTaskById(task.id);
+      await flushTaskIndex();
+
+      const index = JSON.parse(await fs.readFile(TASK_INDEX_PATH, 'utf-8')) as Record<string, string>;
+
+      expect(index[task.id]).toBe(testProjectId);
+    });
+
+    it('should find tasks written to disk outside the store', async () => {
+      await getTasksByProject(testProjectId);
+      const external = { id: uuidv4(), projectId: testProjectId, title: 'External' } as Task;
+      await fs.writeFile(getTasksPath(testProjectId), JSON.stringify([external]), 'utf-8');
+
+      const result = await getTaskById(external.id);
+
+      expect(result?.task.title).toBe('External');
+    });
+
+    it('should fall back to a scan when the index points at the wrong project', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Moved' });
+      await getTaskById(task.id);
+
+      const otherProjectId = await createTestProject();
+      await fs.writeFile(getTasksPath(testProjectId), JSON.stringify([]), 'utf-8');
+      await fs.writeFile(getTasksPath(otherProjectId), JSON.stringify([task]), 'utf-8');
+
+      const result = await getTaskById(task.id);
+
+      expect(result?.projectId).toBe(otherProjectId);
+    });
+
+    it('should return null for unknown tasks', async () => {
+      expect(await getTaskById('missing-task')).toBeNull();
+    });
+  });
+
+  describe('cache isolation', () => {
+    it('should not let callers mutate cached tasks', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Original' });
+
+      const tasks = await getTasksByProject(testProjectId);
+      tasks[0].title = 'Mutated';
+      const result = await getTaskById(task.id);
+      result!.task.title = 'Mutated again';
+
+      const reloaded = await getTaskById(task.id);
+      expect(reloaded?.task.title).toBe('Original');
+    });
+  });
+
+  describe('concurrent writes', () => {
+    it('should not lose concurrent updates to the same project', async () => {
+      const tasks = await Promise.all(
+        Array.from({ length: 10 }, (_, i) => createTask({ projectId: testProjectId, title: `Task ${i}` }))
+      );
+
+      await Promise.all(tasks.map((t) => updateTask(t.id, { featureList: `features of ${t.title}` })));
+
+      const stored = JSON.parse(await fs.readFile(getTasksPath(testProjectId), 'utf-8')) as Task[];
+      expect(stored).toHaveLength(10);
+      for (const task of stored) {
+        expect(task.featureList).toBe(`features of ${task.title}`);
+      }
+    });
+
+    it('should keep both an update and a history entry issued together', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Race' });
+
+      await Promise.all([
+        updateTask(task.id, { designDocument: 'Design' }),
+        addGenerationHistoryEntry(testProjectId, task.id, {
+          documentType: 'design',
+          action: 'create',
+          provider: 'openai',
+          model: 'gpt-4o',
+        }),
+      ]);
+
+      const result = await getTaskById(task.id);
+      expect(result?.task.designDocument).toBe('Design');
+      expect(result?.task.generationHistory).toHaveLength(1);
+    });
+  });
+
+  describe('removeProjectTask', () => {
+    it('should not lose an update to another task issued during the removal', async () => {
+      const removed = await createTask({ projectId: testProjectId, title: 'Removed' });
+      const kept = await createTask({ projectId: testProjectId, title: 'Kept' });
+
+      await Promise.all([
+        removeProjectTask(testProjectId, removed.id, async (task) => task.title),
+        updateTask(kept.id, { designDocument: 'Design' }),
+      ]);
+
+      const stored = await getTasksByProject(testProjectId);
+      expect(stored.map((t) => t.id)).toEqual([kept.id]);
+      expect(stored[0].designDocument).toBe('Design');
+    });
+
+    it('should pass the current task and keep it when beforeRemove throws', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Guarded' });
+      await updateTask(task.id, { prd: 'PRD' });
+
+      await expect(
+        removeProjectTask(testProjectId, task.id, async (current) => {
+          expect(current.prd).toBe('PRD');
+          throw new Error('archive failed');
+        })
+      ).rejects.toThrow('archive failed');
+
+      expect(await getTaskById(task.id)).not.toBeNull();
+    });
+
+    it('should return null for unknown tasks', async () => {
+      expect(await removeProjectTask(testProjectId, 'missing-task', async () => 'removed')).toBeNull();
+    });
+  });
+
+  describe('insertProjectTask', () => {
+    it('should keep an update issued together with the insert', async () => {
+      const existing = await createTask({ projectId: testProjectId, title: 'Existing' });
+      const restored = { ...existing, id: uuidv4(), title: 'Restored' };
+
+      await Promise.all([
+        insertProjectTask(testProjectId, restored),
+        updateTask(existing.id, { featureList: 'Updated' }),
+      ]);
+
+      const stored = await getTasksByProject(testProjectId);
+      expect(stored.map((t) => t.title)).toEqual(['Existing', 'Restored']);
+      expect(stored[0].featureList).toBe('Updated');
+      expect((await getTaskById(restored.id))?.projectId).toBe(testProjectId);
+    });
+
+    it('should replace a task with the same ID instead of duplicating it', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Original' });
+
+      await insertProjectTask(testProjectId, { ...task, title: 'Replaced' });
+
+      const stored = await getTasksByProject(testProjectId);
+      expect(stored).toHaveLength(1);
+      expect(stored[0].title).toBe('Replaced');
+    });
+  });
+
+  describe('write events', () => {
+    async function captureChanges(write: () => Promise<unknown>): Promise<(TaskChange[] | null)[]> {
+      const events: (TaskChange[] | null)[] = [];
+      const unsubscribe = onTasksWritten((event) => events.push(event.changes));
+      try {
+        await write();
+      } finally {
+        unsubscribe();
+      }
+      return events;
+    }
+
+    it('should report removed and inserted tasks individually', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Moved' });
+      await createTask({ projectId: testProjectId, title: 'Untouched' });
+
+      const removed = await captureChanges(() => removeProjectTask(testProjectId, task.id, async () => true));
+      const inserted = await captureChanges(() => insertProjectTask(testProjectId, task));
+
+      expect(removed).toEqual([[{ before: task, after: null }]]);
+      expect(inserted).toEqual([[{ before: null, after: task }]]);
+    });
+
+    it('should report only the tasks a full save changed', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Saved' });
+      const other = await createTask({ projectId: testProjectId, title: 'Other' });
+      const updated = { ...task, title: 'Renamed' };
+
+      const events = await captureChanges(() => saveProjectTasks(testProjectId, [updated, other]));
+
+      expect(events).toEqual([[{ before: task, after: updated }]]);
+    });
+  });
+
+  describe('deleteTask', () => {
+    it('should remove the task and its index entry', async () => {
+      const task = await createTask({ projectId: testProjectId, title: 'Doomed' });
+
+      expect(await deleteTask(task.id)).toBe(true);
+      await flushTaskIndex();
+
+      expect(await getTaskById(task.id)).toBeNull();
+      const index = JSON.parse(await fs.readFile(TASK_INDEX_PATH, 'utf-8')) as Record<string, string>;
+      expect(index[task.id]).toBeUndefined();
+    });
+  });
+});
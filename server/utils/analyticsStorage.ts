@@ -1,7 +1,15 @@
 /**
  * Analytics Storage Utilities
  * Functions for calculating dashboard analytics
+ *
+ * Per-project counters and daily/weekly/monthly buckets are materialized in
+ * memory. Task and archive writes update them incrementally; writes made
+ * outside the storage modules are detected by the files' mtime and size and
+ * trigger a lazy rebuild. aggregateByPeriod() is the independent full
+ * recomputation; both produce identical timelines. Generation usage counts
+ * towards the period its task was created in.
  */
+import path from 'path';
 import type {
   Task,
   DashboardSummary,
@@ -9,8 +17,77 @@ import type {
   PeriodFilter,
   TasksByStatus,
 } from '../../src/types/index.ts';
-import { getTasksByProject } from './taskStorage.ts';
-import { getArchivesByProject } from './archiveStorage.ts';
+import { getTasksByProject, onTasksWritten, type TasksWrittenEvent } from './taskStorage.ts';
+import { getArchivesByProject, onArchivesWritten, type ArchivesWrittenEvent } from './archiveStorage.ts';
+import { WORKSPACE_PATH } from './projectStorage.ts';
+import { calculateCost } from './modelPricing.ts';
+import { statFileVersion, isSameFileVersion, type FileVersion } from './atomicFile.ts';
+
+const PERIODS: PeriodFilter[] = ['daily', 'weekly', 'monthly'];
+
+/**
+ * Costs are summed in integer micro-dollars so that incremental updates and
+ * full recomputation never differ by floating point rounding
+ */
+const MICRO_USD = 1_000_000;
+
+// =============================================================================
+// Types
+// =============================================================================
+
+type PeriodKeys = Record<PeriodFilter, string>;
+
+/**
+ * Token usage totals of a task's generation history
+ */
+interface GenerationUsage {
+  inputTokens: number;
+  outputTokens: number;
+  costMicros: number;
+}
+
+/**
+ * Everything a single task adds to a project's analytics
+ */
+interface TaskContribution extends GenerationUsage {
+  status: Task['status'];
+  documents: number;
+  keys: PeriodKeys;
+}
+
+/**
+ * Aggregated values for one period
+ * The bucket is dropped when its last task is removed.
+ */
+interface PeriodBucket {
+  tasksCreated: number;
+  tasksCompleted: number;
+  documentsGenerated: number;
+  inputTokens: number;
+  outputTokens: number;
+  costMicros: number;
+}
+
+type PeriodBuckets = Record<PeriodFilter, Map<string, PeriodBucket>>;
+
+/**
+ * Materialized analytics for a project
+ */
+interface ProjectAnalytics {
+  tasksVersion: FileVersion | null;
+  archivesVersion: FileVersion | null;
+  contributions: Map<string, TaskContribution>;
+  tasksByStatus: TasksByStatus;
+  documentsGenerated: number;
+  archivedCount: number;
+  buckets: PeriodBuckets;
+  /** Sorted timelines, cleared whenever buckets change */
+  timelines: Partial<Record<PeriodFilter, TimelineDataPoint[]>>;
+}
+
+// =============================================================================
+// Period Helpers
+// =============================================================================
 
 /**
  * Count documents generated for a task
@@ -63,42 +140,302 @@ function getPeriodKey(date: Date, period: PeriodFilter): string {
 }
 
 /**
- * Calculate dashboard summary for a project
- * @param projectId - Project ID to calculate summary for
- * @returns Dashboard summary with statistics
+ * Parse a timestamp once and derive all period keys from it
  */
-export async function calculateSummary(projectId: string): Promise<DashboardSummary> {
-  const tasks = await getTasksByProject(projectId);
-  const archives = await getArchivesByProject(projectId);
-
-  const tasksByStatus: TasksByStatus = {
-    featurelist: 0,
-    design: 0,
-    prd: 0,
-    prototype: 0,
+function getPeriodKeys(timestamp: string): PeriodKeys {
+  const date = new Date(timestamp);
+  return {
+    daily: getPeriodKey(date, 'daily'),
+    weekly: getPeriodKey(date, 'weekly'),
+    monthly: getPeriodKey(date, 'monthly'),
   };
+}
+
+// =============================================================================
+// Contributions and Buckets
+// =============================================================================
+
+/**
+ * Sum the token usage and cost of a task's generation history
+ * Costs are rounded per generation so totals never depend on summing order.
+ */
+function getGenerationUsage(task: Task): GenerationUsage {
+  const usage: GenerationUsage = { inputTokens: 0, outputTokens: 0, costMicros: 0 };
+
+  for (const entry of task.generationHistory ?? []) {
+    const inputTokens = entry.tokens?.input ?? 0;
+    const outputTokens = entry.tokens?.output ?? 0;
+    usage.inputTokens += inputTokens;
+    usage.outputTokens += outputTokens;
+    usage.costMicros += Math.round(
+      calculateCost(entry.provider, entry.model, inputTokens, outputTokens) * MICRO_USD
+    );
+  }
+
+  return usage;
+}
+
+/**
+ * Compute what a task contributes to counters and period buckets
+ */
+function getTaskContribution(task: Task): TaskContribution {
+  return {
+    status: task.status,
+    documents: countDocuments(task),
+    keys: getPeriodKeys(task.createdAt),
+    ...getGenerationUsage(task),
+  };
+}
+
+function createBuckets(): PeriodBuckets {
+  return { daily: new Map(), weekly: new Map(), monthly: new Map() };
+}
+
+/**
+ * Add (sign = 1) or remove (sign = -1) a task's contribution from buckets
+ */
+function applyToBuckets(buckets: PeriodBuckets, contribution: TaskContribution, sign: 1 | -1): void {
+  for (const period of PERIODS) {
+    const key = contribution.keys[period];
+    let bucket = buckets[period].get(key);
+    if (!bucket) {
+      bucket = {
+        tasksCreated: 0,
+        tasksCompleted: 0,
+        documentsGenerated: 0,
+        inputTokens: 0,
+        outputTokens: 0,
+        costMicros: 0,
+      };
+      buckets[period].set(key, bucket);
+    }
+
+    bucket.tasksCreated += sign;
+    bucket.documentsGenerated += sign * contribution.documents;
+    if (contribution.status === 'prototype') {
+      bucket.tasksCompleted += sign;
+    }
+    bucket.inputTokens += sign * contribution.inputTokens;
+    bucket.outputTokens += sign * contribution.outputTokens;
+    bucket.costMicros += sign * contribution.costMicros;
+
+    if (bucket.tasksCreated === 0) {
+      buckets[period].delete(key);
+    }
+  }
+}
+
+/**
+ * Convert buckets to a timeline sorted by period key
+ */
+function bucketsToTimeline(buckets: Map<string, PeriodBucket>): TimelineDataPoint[] {
+  const sortedKeys = Array.from(buckets.keys()).sort();
+
+  return sortedKeys.map((key) => {
+    const bucket = buckets.get(key)!;
+    return {
+      date: key,
+      tasksCreated: bucket.tasksCreated,
+      tasksCompleted: bucket.tasksCompleted,
+      documentsGenerated: bucket.documentsGenerated,
+      inputTokens: bucket.inputTokens,
+      outputTokens: bucket.outputTokens,
+      estimatedCost: bucket.costMicros / MICRO_USD,
+    };
+  });
+}
 
-  let documentsGenerated = 0;
+// =============================================================================
+// Materialized Project Analytics
+// =============================================================================
+
+const projectAnalytics = new Map<string, ProjectAnalytics>();
+
+function getTasksFilePath(projectId: string): string {
+  return path.join(WORKSPACE_PATH, projectId, 'tasks', 'tasks.json');
+}
+
+function getArchivesFilePath(projectId: string): string {
+  return path.join(WORKSPACE_PATH, projectId, 'archives', 'archives.json');
+}
+
+function addTask(state: ProjectAnalytics, id: string, contribution: TaskContribution): void {
+  state.contributions.set(id, contribution);
+  state.tasksByStatus[contribution.status]++;
+  state.documentsGenerated += contribution.documents;
+  applyToBuckets(state.buckets, contribution, 1);
+}
+
+function removeTask(state: ProjectAnalytics, id: string): void {
+  const contribution = state.contributions.get(id);
+  if (!contribution) {
+    return;
+  }
+  state.contributions.delete(id);
+  state.tasksByStatus[contribution.status]--;
+  state.documentsGenerated -= contribution.documents;
+  applyToBuckets(state.buckets, contribution, -1);
+}
+
+/**
+ * Build a project's analytics from scratch
+ */
+function buildProjectAnalytics(
+  tasks: Task[],
+  archivedCount: number,
+  tasksVersion: FileVersion | null,
+  archivesVersion: FileVersion | null
+): ProjectAnalytics {
+  const state: ProjectAnalytics = {
+    tasksVersion,
+    archivesVersion,
+    contributions: new Map(),
+    tasksByStatus: { featurelist: 0, design: 0, prd: 0, prototype: 0 },
+    documentsGenerated: 0,
+    archivedCount,
+    buckets: createBuckets(),
+    timelines: {},
+  };
 
   for (const task of tasks) {
-    tasksByStatus[task.status]++;
-    documentsGenerated += countDocuments(task);
+    addTask(state, task.id, getTaskContribution(task));
   }
 
-  const totalTasks = tasks.length;
-  const completionRate = totalTasks > 0 ? tasksByStatus.prototype / totalTasks : 0;
+  return state;
+}
+
+/**
+ * Get a project's analytics, rebuilding when either file changed on disk
+ * Projects without a tasks file are recomputed on every call.
+ */
+async function getProjectAnalytics(projectId: string): Promise<ProjectAnalytics> {
+  const [tasksVersion, archivesVersion] = await Promise.all([
+    statFileVersion(getTasksFilePath(projectId)),
+    statFileVersion(getArchivesFilePath(projectId)),
+  ]);
+
+  const cached = projectAnalytics.get(projectId);
+  if (
+    cached &&
+    tasksVersion &&
+    isSameFileVersion(cached.tasksVersion, tasksVersion) &&
+    isSameFileVersion(cached.archivesVersion, archivesVersion)
+  ) {
+    return cached;
+  }
+
+  const [tasks, archives] = await Promise.all([
+    getTasksByProject(projectId),
+    getArchivesByProject(projectId),
+  ]);
+  const state = buildProjectAnalytics(tasks, archives.length, tasksVersion, archivesVersion);
+
+  if (tasksVersion) {
+    projectAnalytics.set(projectId, state);
+  } else {
+    projectAnalytics.delete(projectId);
+  }
+  return state;
+}
+
+/**
+ * Apply a task write to materialized analytics
+ * Changes are applied incrementally only when the analytics were built from
+ * the exact file version the write started from.
+ */
+function handleTasksWritten(event: TasksWrittenEvent): void {
+  const state = projectAnalytics.get(event.projectId);
+  if (!state) {
+    return;
+  }
+
+  if (!event.changes || !event.version || !isSameFileVersion(state.tasksVersion, event.previousVersion)) {
+    projectAnalytics.delete(event.projectId);
+    return;
+  }
+
+  try {
+    for (const { before, after } of event.changes) {
+      if (before) {
+        removeTask(state, before.id);
+      }
+      if (after) {
+        addTask(state, after.id, getTaskContribution(after));
+      }
+    }
+    state.tasksVersion = event.version;
+    state.timelines = {};
+  } catch {
+    // Leave it to the next request to rebuild from disk
+    projectAnalytics.delete(event.projectId);
+  }
+}
+
+/**
+ * Apply an archive write to materialized analytics
+ * Each write contains the full archive list, so the count is exact.
+ */
+function handleArchivesWritten(event: ArchivesWrittenEvent): void {
+  const state = projectAnalytics.get(event.projectId);
+  if (!state) {
+    return;
+  }
+
+  if (!event.version) {
+    projectAnalytics.delete(event.projectId);
+    return;
+  }
+
+  state.archivedCount = event.archiveCount;
+  state.archivesVersion = event.version;
+}
+
+onTasksWritten(handleTasksWritten);
+onArchivesWritten(handleArchivesWritten);
+
+/**
+ * Drop all materialized analytics (next request rebuilds from disk)
+ */
+export function clearAnalyticsCache(): void {
+  projectAnalytics.clear();
+}
+
+// =============================================================================
+// Public API
+// =============================================================================
+
+/**
+ * Calculate dashboard summary for a project
+ * @param projectId - Project ID to calculate summary for
+ * @returns Dashboard summary with statistics
+ */
+export async function calculateSummary(projectId: string): Promise<DashboardSummary> {
+  const state = await getProjectAnalytics(projectId);
+
+  const totalTasks = state.contributions.size;
+  const completionRate = totalTasks > 0 ? state.tasksByStatus.prototype / totalTasks : 0;
 
   return {
     projectId,
     totalTasks,
-    tasksByStatus,
+    tasksByStatus: { ...state.tasksByStatus },
     completionRate,
-    archivedCount: archives.length,
-    documentsGenerated,
+    archivedCount: state.archivedCount,
+    documentsGenerated: state.documentsGenerated,
     lastUpdated: new Date().toISOString(),
   };
 }
 
+/**
+ * Calculate dashboard summaries for several projects
+ * Unchanged projects are served from memory.
+ * @param projectIds - Project IDs to summarize
+ * @returns Summaries in the same order as projectIds
+ */
+export async function calculateSummaries(projectIds: string[]): Promise<DashboardSummary[]> {
+  return Promise.all(projectIds.map((projectId) => calculateSummary(projectId)));
+}
+
 /**
  * Calculate timeline data for a project
  * @param projectId - Project ID to calculate timeline for
@@ -109,8 +446,15 @@ export async function calculateTimeline(
   projectId: string,
   period: PeriodFilter
 ): Promise<TimelineDataPoint[]> {
-  const tasks = await getTasksByProject(projectId);
-  return aggregateByPeriod(tasks, period);
+  const state = await getProjectAnalytics(projectId);
+
+  let timeline = state.timelines[period];
+  if (!timeline) {
+    timeline = bucketsToTimeline(state.buckets[period]);
+    state.timelines[period] = timeline;
+  }
+
+  return timeline.map((point) => ({ ...point }));
 }
 
 /**
@@ -126,7 +470,14 @@ export function aggregateByPeriod(tasks: Task[], period: PeriodFilter): Timeline
 
   const periodMap = new Map<
     string,
-    { tasksCreated: number; tasksCompleted: number; documentsGenerated: number }
+    {
+      tasksCreated: number;
+      tasksCompleted: number;
+      documentsGenerated: number;
+      inputTokens: number;
+      outputTokens: number;
+      costMicros: number;
+    }
   >();
 
   for (const task of tasks) {
@@ -138,6 +489,9 @@ export function aggregateByPeriod(tasks: Task[], period: PeriodFilter): Timeline
         tasksCreated: 0,
         tasksCompleted: 0,
         documentsGenerated: 0,
+        inputTokens: 0,
+        outputTokens: 0,
+        costMicros: 0,
       });
     }
 
@@ -148,6 +502,11 @@ export function aggregateByPeriod(tasks: Task[], period: PeriodFilter): Timeline
     if (task.status === 'prototype') {
       entry.tasksCompleted++;
     }
+
+    const usage = getGenerationUsage(task);
+    entry.inputTokens += usage.inputTokens;
+    entry.outputTokens += usage.outputTokens;
+    entry.costMicros += usage.costMicros;
   }
 
   // Convert map to sorted array
@@ -161,6 +520,9 @@ export function aggregateByPeriod(tasks: Task[], period: PeriodFilter): Timeline
       tasksCreated: entry.tasksCreated,
       tasksCompleted: entry.tasksCompleted,
       documentsGenerated: entry.documentsGenerated,
+      inputTokens: entry.inputTokens,
+      outputTokens: entry.outputTokens,
+      estimatedCost: entry.costMicros / MICRO_USD,
     });
   }
 
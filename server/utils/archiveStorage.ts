@@ -8,6 +8,32 @@ import type { Task, Archive } from '../../src/types/index.ts';
 import { v4 as uuidv4 } from 'uuid';
 import { WORKSPACE_PATH } from './projectStorage.ts';
 
+/**
+ * Notification sent after a project's archives.json is written
+ */
+export interface ArchivesWrittenEvent {
+  projectId: string;
+  archiveCount: number;
+  /** Full archive list as written (shared, must not be mutated) */
+  archives: Archive[];
+  /** File version after the write (null if it could not be read back) */
+  version: { mtimeMs: number; size: number } | null;
+}
+
+const archiveWriteListeners = new Set<(event: ArchivesWrittenEvent) => void>();
+
+/**
+ * Subscribe to archive writes
+ * @param listener - Called after each successful write
+ * @returns Function that removes the listener
+ */
+export function onArchivesWritten(listener: (event: ArchivesWrittenEvent) => void): () => void {
+  archiveWriteListeners.add(listener);
+  return () => {
+    archiveWriteListeners.delete(listener);
+  };
+}
+
 /**
  * Get archives file path for a project
  */
@@ -65,6 +91,22 @@ async function saveProjectArchives(projectId: string, archives: Archive[]): Prom
   await fs.mkdir(archivesDir, { recursive: true });
 
   await fs.writeFile(archivesPath, JSON.stringify(archives, null, 2), 'utf-8');
+
+  let version: ArchivesWrittenEvent['version'] = null;
+  try {
+    const stat = await fs.stat(archivesPath);
+    version = { mtimeMs: stat.mtimeMs, size: stat.size };
+  } catch {
+    // Listeners fall back to re-reading the file
+  }
+
+  for (const listener of archiveWriteListeners) {
+    try {
+      listener({ projectId, archiveCount: archives.length, archives, version });
+    } catch (error) {
+      console.error('Archive write listener failed:', error);
+    }
+  }
 }
 
 /**
@@ -0,0 +1,89 @@
+/**
+ * Atomic File Utilities
+ * Crash-safe file writes, per-key write serialization and change detection
+ * for JSON stores
+ */
+import fs from 'fs/promises';
+import path from 'path';
+import { randomUUID } from 'crypto';
+
+/**
+ * Tail of the pending operation chain for each lock key
+ */
+const lockChains = new Map<string, Promise<unknown>>();
+
+/**
+ * Write a file atomically
+ * Content is written to a temporary file in the same directory and then
+ * renamed over the target, so readers never observe a partially written file.
+ * @param filePath - Target file path
+ * @param content - File content
+ */
+export async function writeFileAtomic(filePath: string, content: string): Promise<void> {
+  const tempPath = path.join(
+    path.dirname(filePath),
+    `.${path.basename(filePath)}.${randomUUID()}.tmp`
+  );
+
+  try {
+    await fs.writeFile(tempPath, content, 'utf-8');
+    await fs.rename(tempPath, filePath);
+  } catch (error) {
+    await fs.unlink(tempPath).catch(() => {
+      // Temp file may not have been created
+    });
+    throw error;
+  }
+}
+
+/**
+ * Run an operation exclusively for a lock key
+ * Operations sharing a key run one at a time in call order; a failed
+ * operation does not block the ones queued behind it.
+ * @param key - Lock key (e.g. a project ID or file path)
+ * @param operation - Async operation to run
+ * @returns Result of the operation
+ */
+export async function withFileLock<T>(key: string, operation: () => Promise<T>): Promise<T> {
+  const previous = lockChains.get(key) ?? Promise.resolve();
+  const current = previous.then(operation, operation);
+  const tail = current.catch(() => undefined);
+  lockChains.set(key, tail);
+
+  try {
+    return await current;
+  } finally {
+    if (lockChains.get(key) === tail) {
+      lockChains.delete(key);
+    }
+  }
+}
+
+/**
+ * Identifies a file's content for cache validation
+ */
+export interface FileVersion {
+  mtimeMs: number;
+  size: number;
+}
+
+/**
+ * Get a file's current version
+ * @param filePath - File path
+ * @returns Version, or null if the file cannot be stat'ed
+ */
+export async function statFileVersion(filePath: string): Promise<FileVersion | null> {
+  try {
+    const stat = await fs.stat(filePath);
+    return { mtimeMs: stat.mtimeMs, size: stat.size };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Check whether two file versions are the same (both null counts as same)
+ */
+export function isSameFileVersion(a: FileVersion | null, b: FileVersion | null): boolean {
+  return a === b || (a !== null && b !== null && a.mtimeMs === b.mtimeMs && a.size === b.size);
+}
@@ -8,6 +8,7 @@
  * - REQ-U-003: Handle errors and non-zero exit codes
  * - REQ-N-001: 120 second timeout (configurable)
  * - REQ-N-002: JSON output format
+ * - Streaming mode: incremental stream-json output for SSE endpoints
  */
 import { spawn, type ChildProcess, type SpawnOptions } from 'child_process';
 
@@ -43,6 +44,43 @@ export interface ClaudeCodeOptions {
   allowedTools?: string[];
 }
 
+/**
+ * Options for streaming Claude Code execution
+ */
+export interface ClaudeCodeStreamOptions extends ClaudeCodeOptions {
+  /** Called with each text fragment as it is produced */
+  onText: (text: string) => void;
+  /** Kills the process when signalled (e.g. client disconnected) */
+  signal?: AbortSignal;
+}
+
+/**
+ * Result of a streaming Claude Code execution
+ */
+export interface ClaudeCodeStreamResult {
+  /** Whether the execution completed successfully */
+  success: boolean;
+  /** Final generated text */
+  content: string;
+  /** Raw `result` event line from the CLI */
+  rawOutput: string;
+  /** Token usage reported by the CLI, if any */
+  usage: { input: number; output: number } | null;
+}
+
+/**
+ * A single parsed event from `--output-format stream-json`
+ */
+export type ClaudeStreamEvent =
+  | { kind: 'text_delta'; text: string }
+  | { kind: 'assistant_text'; text: string }
+  | {
+      kind: 'result';
+      text: string;
+      isError: boolean;
+      usage: { input: number; output: number } | null;
+    };
+
 /**
  * Type for spawn function (for dependency injection in tests)
  */
@@ -191,6 +229,215 @@ export function createClaudeCodeRunner(spawnFn: SpawnFunction = spawn) {
   };
 }
 
+/**
+ * Parse one line of `claude --output-format stream-json` output
+ * @returns The text-bearing event, or null for lines that carry no text
+ */
+export function parseStreamJsonLine(line: string): ClaudeStreamEvent | null {
+  const trimmed = line.trim();
+  if (!trimmed) {
+    return null;
+  }
+
+  let message: Record<string, unknown>;
+  try {
+    message = JSON.parse(trimmed) as Record<string, unknown>;
+  } catch {
+    return null;
+  }
+
+  // Token-level deltas (--include-partial-messages)
+  if (message.type === 'stream_event') {
+    const event = message.event as { type?: string; delta?: { type?: string; text?: string } } | undefined;
+    if (event?.type === 'content_block_delta' && event.delta?.type === 'text_delta' && event.delta.text) {
+      return { kind: 'text_delta', text: event.delta.text };
+    }
+    return null;
+  }
+
+  // Complete assistant turns
+  if (message.type === 'assistant') {
+    const content = (message.message as { content?: Array<{ type?: string; text?: string }> } | undefined)?.content;
+    const text = (content || [])
+      .filter((block) => block.type === 'text' && block.text)
+      .map((block) => block.text)
+      .join('');
+    return text ? { kind: 'assistant_text', text } : null;
+  }
+
+  // Final summary with usage
+  if (message.type === 'result') {
+    const usage = message.usage as { input_tokens?: number; output_tokens?: number } | undefined;
+    return {
+      kind: 'result',
+      text: typeof message.result === 'string' ? message.result : '',
+      isError: message.is_error === true || (typeof message.subtype === 'string' && message.subtype !== 'success'),
+      usage: usage && typeof usage.input_tokens === 'number' && typeof usage.output_tokens === 'number'
+        ? { input: usage.input_tokens, output: usage.output_tokens }
+        : null,
+    };
+  }
+
+  return null;
+}
+
+/**
+ * Streaming implementation with injectable spawn function
+ * Runs the CLI with stream-json output and forwards text as it arrives.
+ */
+export function createClaudeCodeStreamRunner(spawnFn: SpawnFunction = spawn) {
+  return async function callClaudeCodeStream(
+    prompt: string,
+    workingDir: string,
+    options: ClaudeCodeStreamOptions
+  ): Promise<ClaudeCodeStreamResult> {
+    const timeout = options.timeout ?? DEFAULT_TIMEOUT_MS;
+    const allowedTools = options.allowedTools ?? DEFAULT_ALLOWED_TOOLS;
+    const { onText, signal } = options;
+
+    return new Promise((resolve, reject) => {
+      const args = [
+        '-p',
+        prompt,
+        '--output-format',
+        'stream-json',
+        '--verbose',
+        '--include-partial-messages',
+        '--allowedTools',
+        allowedTools.join(','),
+      ];
+
+      const process = spawnFn('claude', args, {
+        cwd: workingDir,
+        stdio: ['ignore', 'pipe', 'pipe']
+      });
+
+      let lineBuffer = '';
+      let stderr = '';
+      let streamedText = '';
+      let sawDeltas = false;
+      let resultEvent: Extract<ClaudeStreamEvent, { kind: 'result' }> | null = null;
+      let resultLine = '';
+      let isCompleted = false;
+
+      const finish = (error: Error | null, result?: ClaudeCodeStreamResult) => {
+        if (isCompleted) {
+          return;
+        }
+        isCompleted = true;
+        clearTimeout(timeoutId);
+        signal?.removeEventListener('abort', onAbort);
+        if (error) {
+          reject(error);
+        } else {
+          resolve(result!);
+        }
+      };
+
+      const onAbort = () => {
+        process.kill();
+        finish(new ClaudeCodeError('Claude Code process aborted', null, stderr));
+      };
+
+      const handleLine = (line: string) => {
+        const event = parseStreamJsonLine(line);
+        if (!event) {
+          return;
+        }
+
+        if (event.kind === 'text_delta') {
+          sawDeltas = true;
+          streamedText += event.text;
+          onText(event.text);
+        } else if (event.kind === 'assistant_text') {
+          // Without partial messages each assistant turn arrives whole
+          if (!sawDeltas) {
+            streamedText += event.text;
+            onText(event.text);
+          }
+        } else {
+          resultEvent = event;
+          resultLine = line.trim();
+        }
+      };
+
+      const timeoutId = setTimeout(() => {
+        if (!isCompleted) {
+          process.kill();
+          finish(
+            new ClaudeCodeTimeoutError(
+              `Claude Code process timed out after ${timeout}ms`,
+              timeout
+            )
+          );
+        }
+      }, timeout);
+
+      if (signal?.aborted) {
+        onAbort();
+        return;
+      }
+      signal?.addEventListener('abort', onAbort);
+
+      // Parse stdout line by line as it arrives
+      process.stdout?.on('data', (data: Buffer) => {
+        lineBuffer += data.toString();
+        let newlineIndex = lineBuffer.indexOf('\n');
+        while (newlineIndex !== -1) {
+          handleLine(lineBuffer.slice(0, newlineIndex));
+          lineBuffer = lineBuffer.slice(newlineIndex + 1);
+          newlineIndex = lineBuffer.indexOf('\n');
+        }
+      });
+
+      process.stderr?.on('data', (data: Buffer) => {
+        stderr += data.toString();
+      });
+
+      process.on('error', (error: Error) => {
+        finish(
+          new ClaudeCodeError(
+            `Failed to spawn Claude Code process: ${error.message}`,
+            null,
+            stderr
+          )
+        );
+      });
+
+      process.on('close', (code: number | null) => {
+        if (lineBuffer) {
+          handleLine(lineBuffer);
+          lineBuffer = '';
+        }
+
+        if (code !== 0) {
+          finish(
+            new ClaudeCodeError(
+              `Claude Code process exited with code ${code}`,
+              code,
+              stderr
+            )
+          );
+          return;
+        }
+
+        const finalResult = resultEvent as Extract<ClaudeStreamEvent, { kind: 'result' }> | null;
+        if (finalResult?.isError) {
+          finish(new ClaudeCodeError(finalResult.text || 'Claude Code reported an error', code, stderr));
+          return;
+        }
+
+        finish(null, {
+          success: true,
+          content: finalResult?.text || streamedText,
+          rawOutput: resultLine,
+          usage: finalResult?.usage ?? null,
+        });
+      });
+    });
+  };
+}
+
 /**
  * Execute Claude Code CLI with the given prompt
  *
@@ -202,3 +449,15 @@ export function createClaudeCodeRunner(spawnFn: SpawnFunction = spawn) {
  * @throws ClaudeCodeTimeoutError on timeout
  */
 export const callClaudeCode = createClaudeCodeRunner();
+
+/**
+ * Execute Claude Code CLI in streaming mode
+ *
+ * @param prompt - The prompt to send to Claude Code
+ * @param workingDir - The working directory for the process
+ * @param options - Text callback, abort signal and optional configuration
+ * @returns Promise resolving to the final content and token usage
+ * @throws ClaudeCodeError on process failure or abort
+ * @throws ClaudeCodeTimeoutError on timeout
+ */
+export const callClaudeCodeStream = createClaudeCodeStreamRunner();
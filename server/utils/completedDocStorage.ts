@@ -5,21 +5,38 @@
  * Completed documents include:
  * - Tasks in 'prototype' status (active but complete)
  * - Archived tasks (stored in archives)
+ *
+ * Listing and search are served from a per-project index of summaries and
+ * a BM25 inverted index over the fields substring search has always covered
+ * (title, feature list, design document). Task and archive writes
+ * update it incrementally; files changed outside the storage modules are
+ * detected by mtime/size and trigger a rebuild.
  */
+import path from 'path';
 import type {
   Task,
+  Archive,
   CompletedDocumentSummary,
   CompletedDocumentDetail,
   CompletedDocumentsQueryOptions,
 } from '../../src/types/index.ts';
-import { getTasksByProject } from './taskStorage.ts';
-import { getArchivesByProject } from './archiveStorage.ts';
+import { getTasksByProject, onTasksWritten, type TasksWrittenEvent } from './taskStorage.ts';
+import { getArchivesByProject, onArchivesWritten, type ArchivesWrittenEvent } from './archiveStorage.ts';
+import { WORKSPACE_PATH } from './projectStorage.ts';
+import { statFileVersion, isSameFileVersion, type FileVersion } from './atomicFile.ts';
+import { SearchIndex } from './searchIndex.ts';
+import { tokenizeText } from './keywordExtractor.ts';
 
 /**
  * Default pagination limit
  */
 const DEFAULT_LIMIT = 50;
 
+/**
+ * Which documents a task has produced
+ */
+type DocumentTypeFlags = Pick<CompletedDocumentSummary, 'hasDesignDoc' | 'hasPrd' | 'hasPrototype'>;
+
 /**
  * Helper: Case-insensitive search in text
  * @param text - Text to search in (can be null)
@@ -33,6 +50,18 @@ export function searchInContent(text: string | null | undefined, keyword: string
   return text.toLowerCase().includes(keyword.toLowerCase());
 }
 
+/**
+ * Helper: Which documents a task has produced
+ * @param task - Task to check
+ */
+function getDocumentTypeFlags(task: Task): DocumentTypeFlags {
+  return {
+    hasDesignDoc: task.designDocument !== null && task.designDocument !== '',
+    hasPrd: task.prd !== null && task.prd !== '',
+    hasPrototype: task.prototype !== null && task.prototype !== '',
+  };
+}
+
 /**
  * Convert a Task to CompletedDocumentSummary
  * @param task - Task to convert
@@ -49,9 +78,7 @@ function taskToSummary(
     title: task.title,
     status: isArchived ? 'archived' : 'prototype',
     references: task.references,
-    hasDesignDoc: task.designDocument !== null && task.designDocument !== '',
-    hasPrd: task.prd !== null && task.prd !== '',
-    hasPrototype: task.prototype !== null && task.prototype !== '',
+    ...getDocumentTypeFlags(task),
     createdAt: task.createdAt,
     updatedAt: task.updatedAt,
     ...(archivedAt && { archivedAt }),
@@ -102,18 +129,17 @@ function matchesSearch(task: Task, keyword: string): boolean {
 
 /**
  * Filter document by document types
- * @param task - Task to check
+ * @param document - Task or summary to check
  * @param types - Document types to filter by (design, prd, prototype)
- * @returns true if task has any of the specified document types
+ * @returns true if the document has any of the specified document types
  */
-export function filterByDocumentType(task: Task, types: string[]): boolean {
+export function filterByDocumentType(document: Task | DocumentTypeFlags, types: string[]): boolean {
   if (!types || types.length === 0) {
     return true;
   }
 
-  const hasDesignDoc = task.designDocument !== null && task.designDocument !== '';
-  const hasPrd = task.prd !== null && task.prd !== '';
-  const hasPrototype = task.prototype !== null && task.prototype !== '';
+  const { hasDesignDoc, hasPrd, hasPrototype } =
+    'hasDesignDoc' in document ? document : getDocumentTypeFlags(document);
 
   return types.some((type) => {
     switch (type.toLowerCase()) {
@@ -131,22 +157,290 @@ export function filterByDocumentType(task: Task, types: string[]): boolean {
 
 /**
  * Filter document by references
- * @param task - Task to check
+ * @param document - Task or summary to check
  * @param referenceIds - Reference IDs to filter by
- * @returns true if task has any of the specified references
+ * @returns true if the document has any of the specified references
  */
-export function filterByReference(task: Task, referenceIds: string[]): boolean {
+export function filterByReference(document: Pick<Task, 'references'>, referenceIds: string[]): boolean {
   if (!referenceIds || referenceIds.length === 0) {
     return true;
   }
 
-  return referenceIds.some((refId) => task.references.includes(refId));
+  return referenceIds.some((refId) => document.references.includes(refId));
+}
+
+// =============================================================================
+// Document Index
+// =============================================================================
+
+/**
+ * Field weights for ranking (title matches count most)
+ * Same fields as matchesSearch.
+ */
+const SEARCH_FIELD_WEIGHTS = {
+  title: 3,
+  featureList: 1,
+  designDocument: 1,
+};
+
+const TASK_KEY_PREFIX = 'task:';
+const ARCHIVE_KEY_PREFIX = 'archive:';
+
+interface CompletedDocEntry {
+  summary: CompletedDocumentSummary;
+}
+
+interface ProjectDocumentIndex {
+  tasksVersion: FileVersion | null;
+  archivesVersion: FileVersion | null;
+  entries: Map<string, CompletedDocEntry>;
+  search: SearchIndex;
+  /**
+   * Relative position of every task in tasks.json. Task writes update tasks
+   * in place and append new ones, so positions only grow.
+   */
+  taskOrder: Map<string, number>;
+  nextTaskOrder: number;
+  /** Position of every archive in archives.json */
+  archiveOrder: Map<string, number>;
+  /** Entry keys in listing order, rebuilt lazily */
+  ordered: string[] | null;
+}
+
+const documentIndexes = new Map<string, ProjectDocumentIndex>();
+
+function taskKey(taskId: string): string {
+  return `${TASK_KEY_PREFIX}${taskId}`;
+}
+
+function archiveKey(archiveId: string): string {
+  return `${ARCHIVE_KEY_PREFIX}${archiveId}`;
+}
+
+function indexDocument(state: ProjectDocumentIndex, key: string, task: Task, entry: CompletedDocEntry): void {
+  state.entries.set(key, entry);
+  state.search.add(key, {
+    title: task.title,
+    featureList: task.featureList,
+    designDocument: task.designDocument,
+  });
+  state.ordered = null;
+}
+
+function indexTask(state: ProjectDocumentIndex, task: Task): void {
+  if (task.status !== 'prototype') {
+    return;
+  }
+  indexDocument(state, taskKey(task.id), task, { summary: taskToSummary(task, false) });
+}
+
+function indexArchive(state: ProjectDocumentIndex, archive: Archive): void {
+  indexDocument(state, archiveKey(archive.id), archive.task, {
+    summary: taskToSummary(archive.task, true, archive.archivedAt),
+  });
+}
+
+/**
+ * Record archive positions from the full archive list
+ */
+function setArchiveOrder(state: ProjectDocumentIndex, archives: Archive[]): void {
+  state.archiveOrder = new Map(archives.map((archive, i) => [archive.id, i]));
+  state.ordered = null;
+}
+
+/**
+ * Entry keys in file order: prototype tasks as in tasks.json, then archives
+ * as in archives.json
+ */
+function getListingOrder(state: ProjectDocumentIndex): string[] {
+  const rank = (key: string): [number, number] =>
+    key.startsWith(TASK_KEY_PREFIX)
+      ? [0, state.taskOrder.get(key.slice(TASK_KEY_PREFIX.length)) ?? 0]
+      : [1, state.archiveOrder.get(key.slice(ARCHIVE_KEY_PREFIX.length)) ?? 0];
+
+  return Array.from(state.entries.keys())
+    .map((key) => ({ key, rank: rank(key) }))
+    .sort((a, b) => a.rank[0] - b.rank[0] || a.rank[1] - b.rank[1])
+    .map(({ key }) => key);
+}
+
+function removeDocument(state: ProjectDocumentIndex, key: string): void {
+  if (state.entries.delete(key)) {
+    state.search.remove(key);
+    state.ordered = null;
+  }
 }
 
+/**
+ * Get a project's document index, rebuilding it when the files changed
+ * Projects with neither file are not cached.
+ */
+async function getProjectDocumentIndex(projectId: string): Promise<ProjectDocumentIndex> {
+  const [tasksVersion, archivesVersion] = await Promise.all([
+    statFileVersion(path.join(WORKSPACE_PATH, projectId, 'tasks', 'tasks.json')),
+    statFileVersion(path.join(WORKSPACE_PATH, projectId, 'archives', 'archives.json')),
+  ]);
+
+  const cached = documentIndexes.get(projectId);
+  if (
+    cached &&
+    isSameFileVersion(cached.tasksVersion, tasksVersion) &&
+    isSameFileVersion(cached.archivesVersion, archivesVersion)
+  ) {
+    return cached;
+  }
+
+  const [tasks, archives] = await Promise.all([
+    getTasksByProject(projectId),
+    getArchivesByProject(projectId),
+  ]);
+
+  const state: ProjectDocumentIndex = {
+    tasksVersion,
+    archivesVersion,
+    entries: new Map(),
+    search: new SearchIndex({ fieldWeights: SEARCH_FIELD_WEIGHTS }),
+    taskOrder: new Map(tasks.map((task, i) => [task.id, i])),
+    nextTaskOrder: tasks.length,
+    archiveOrder: new Map(),
+    ordered: null,
+  };
+  for (const task of tasks) {
+    indexTask(state, task);
+  }
+  for (const archive of archives) {
+    indexArchive(state, archive);
+  }
+  setArchiveOrder(state, archives);
+
+  if (tasksVersion || archivesVersion) {
+    documentIndexes.set(projectId, state);
+  } else {
+    documentIndexes.delete(projectId);
+  }
+  return state;
+}
+
+/**
+ * Apply task changes to a loaded index
+ */
+function handleTasksWritten(event: TasksWrittenEvent): void {
+  const state = documentIndexes.get(event.projectId);
+  if (!state) {
+    return;
+  }
+
+  if (!event.changes || !event.version || !isSameFileVersion(state.tasksVersion, event.previousVersion)) {
+    documentIndexes.delete(event.projectId);
+    return;
+  }
+
+  for (const { before, after } of event.changes) {
+    if (before) {
+      removeDocument(state, taskKey(before.id));
+      if (!after) {
+        state.taskOrder.delete(before.id);
+      }
+    }
+    if (after) {
+      if (!state.taskOrder.has(after.id)) {
+        state.taskOrder.set(after.id, state.nextTaskOrder++);
+      }
+      indexTask(state, after);
+    }
+  }
+  state.tasksVersion = event.version;
+}
+
+/**
+ * Reconcile archive changes with a loaded index
+ * Archives are not edited in place, so only added and removed IDs matter.
+ */
+function handleArchivesWritten(event: ArchivesWrittenEvent): void {
+  const state = documentIndexes.get(event.projectId);
+  if (!state) {
+    return;
+  }
+
+  if (!event.version) {
+    documentIndexes.delete(event.projectId);
+    return;
+  }
+
+  const currentKeys = new Set(event.archives.map((archive) => archiveKey(archive.id)));
+  for (const key of Array.from(state.entries.keys())) {
+    if (key.startsWith(ARCHIVE_KEY_PREFIX) && !currentKeys.has(key)) {
+      removeDocument(state, key);
+    }
+  }
+  for (const archive of event.archives) {
+    if (!state.entries.has(archiveKey(archive.id))) {
+      indexArchive(state, archive);
+    }
+  }
+  setArchiveOrder(state, event.archives);
+  state.archivesVersion = event.version;
+}
+
+onTasksWritten(handleTasksWritten);
+onArchivesWritten(handleArchivesWritten);
+
+/**
+ * Drop all document indexes (next request rebuilds from disk)
+ */
+export function clearCompletedDocumentIndex(): void {
+  documentIndexes.clear();
+}
+
+/**
+ * Check a summary against document type and reference filters
+ */
+function matchesFilters(
+  summary: CompletedDocumentSummary,
+  documentType: string[] | undefined,
+  reference: string[] | undefined
+): boolean {
+  return filterByDocumentType(summary, documentType ?? []) && filterByReference(summary, reference ?? []);
+}
+
+/**
+ * Substring search over loaded tasks
+ * Used only for queries with no indexable terms (e.g. only stopwords).
+ */
+async function scanCompletedDocuments(
+  projectId: string,
+  options: CompletedDocumentsQueryOptions
+): Promise<CompletedDocumentSummary[]> {
+  const { search = '', documentType, reference, limit = DEFAULT_LIMIT, offset = 0 } = options;
+
+  const allTasks = await getTasksByProject(projectId);
+  const archives = await getArchivesByProject(projectId);
+
+  const results = [
+    ...allTasks
+      .filter((task) => task.status === 'prototype' && matchesSearch(task, search))
+      .map((task) => taskToSummary(task, false)),
+    ...archives
+      .filter((archive) => matchesSearch(archive.task, search))
+      .map((archive) => taskToSummary(archive.task, true, archive.archivedAt)),
+  ].filter((summary) => matchesFilters(summary, documentType, reference));
+
+  return results.slice(offset, offset + limit);
+}
+
+// =============================================================================
+// Public API
+// =============================================================================
+
 /**
  * Get all completed documents for a project
  * Combines prototype tasks and archived tasks
  *
+ * Without a search keyword, documents are listed with prototype tasks first
+ * followed by archives, each in file order. With a keyword,
+ * results are ranked by BM25 relevance. Pagination is applied while walking
+ * the index, so only the requested page is materialized.
+ *
  * @param projectId - Project ID
  * @param options - Query options for filtering
  * @returns Array of completed document summaries
@@ -163,66 +457,40 @@ export async function getCompletedDocuments(
     offset = 0,
   } = options;
 
-  // Get prototype tasks from tasks.json
-  const allTasks = await getTasksByProject(projectId);
-  const prototypeTasks = allTasks.filter((task) => task.status === 'prototype');
-
-  // Get archived tasks from archives.json
-  const archives = await getArchivesByProject(projectId);
-
-  // Convert to summaries
-  const prototypeSummaries = prototypeTasks.map((task) =>
-    taskToSummary(task, false)
-  );
-  const archivedSummaries = archives.map((archive) =>
-    taskToSummary(archive.task, true, archive.archivedAt)
-  );
+  if (search && tokenizeText(search).length === 0) {
+    return scanCompletedDocuments(projectId, options);
+  }
 
-  // Combine all summaries
-  let results = [...prototypeSummaries, ...archivedSummaries];
+  const state = await getProjectDocumentIndex(projectId);
+  const passesFilters = (key: string): boolean =>
+    matchesFilters(state.entries.get(key)!.summary, documentType, reference);
 
-  // Apply search filter
   if (search) {
-    const allTasksForSearch = [
-      ...prototypeTasks,
-      ...archives.map((a) => a.task),
-    ];
-    const matchingTaskIds = new Set(
-      allTasksForSearch
-        .filter((task) => matchesSearch(task, search))
-        .map((task) => task.id)
-    );
-    results = results.filter((summary) => matchingTaskIds.has(summary.taskId));
+    const { hits } = state.search.search(search, { filter: passesFilters, offset, limit });
+    return hits.map((hit) => ({ ...state.entries.get(hit.id)!.summary }));
   }
 
-  // Apply document type filter
-  if (documentType && documentType.length > 0) {
-    const allTasksForFilter = [
-      ...prototypeTasks,
-      ...archives.map((a) => a.task),
-    ];
-    const taskMap = new Map(allTasksForFilter.map((t) => [t.id, t]));
-    results = results.filter((summary) => {
-      const task = taskMap.get(summary.taskId);
-      return task && filterByDocumentType(task, documentType);
-    });
+  if (!state.ordered) {
+    state.ordered = getListingOrder(state);
   }
 
-  // Apply reference filter
-  if (reference && reference.length > 0) {
-    const allTasksForFilter = [
-      ...prototypeTasks,
-      ...archives.map((a) => a.task),
-    ];
-    const taskMap = new Map(allTasksForFilter.map((t) => [t.id, t]));
-    results = results.filter((summary) => {
-      const task = taskMap.get(summary.taskId);
-      return task && filterByReference(task, reference);
-    });
+  const results: CompletedDocumentSummary[] = [];
+  let skipped = 0;
+  for (const key of state.ordered) {
+    if (results.length >= limit) {
+      break;
+    }
+    if (!passesFilters(key)) {
+      continue;
+    }
+    if (skipped < offset) {
+      skipped++;
+      continue;
+    }
+    results.push({ ...state.entries.get(key)!.summary });
   }
 
-  // Apply pagination
-  return results.slice(offset, offset + limit);
+  return results;
 }
 
 /**
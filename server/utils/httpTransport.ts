@@ -0,0 +1,663 @@
+/**
+ * HTTP Transport
+ * Shared transport for HTTP-based LLM providers
+ *
+ * Features:
+ * - Keep-alive connection pools per base URL (node http/https agents),
+ *   configurable for e.g. a local LM Studio server or an OpenAI-compatible
+ *   GLM endpoint
+ * - Single-flight coalescing of identical in-flight operations (model
+ *   listing, connection tests)
+ * - Token-bucket rate limiting per provider and base URL, so OpenAI-compatible
+ *   endpoints do not share OpenAI's budget; a 429 response blocks that
+ *   bucket for its Retry-After and the request is retried
+ * - Latency histograms per provider and model, read by LLMLogger
+ *
+ * Responses are standard fetch Response objects, so providers handle them
+ * the same way whichever sender is used.
+ */
+
+import http from 'http';
+import https from 'https';
+import { Readable } from 'stream';
+import { performance } from 'perf_hooks';
+
+// =============================================================================
+// Types
+// =============================================================================
+
+export interface TransportRequestInit {
+  method?: string;
+  headers?: Record<string, string>;
+  body?: string;
+  signal?: AbortSignal;
+}
+
+/**
+ * Sends one request; defaults to the pooled node http sender
+ */
+export type TransportFetch = (url: string, init: TransportRequestInit & { agent?: http.Agent }) => Promise<Response>;
+
+/**
+ * Who a request is made for: selects the pool, rate limiter and histogram
+ */
+export interface TransportTarget {
+  provider: string;
+  model?: string;
+  /** Pool and rate limit key; defaults to the request URL's origin */
+  baseUrl?: string;
+}
+
+export interface HttpPoolOptions {
+  /** Maximum concurrent sockets per base URL */
+  maxSockets?: number;
+  /** Maximum idle sockets kept open per base URL */
+  maxFreeSockets?: number;
+  /** TCP keep-alive initial delay for idle sockets */
+  keepAliveMsecs?: number;
+}
+
+export interface RateLimitOptions {
+  /** Burst size */
+  capacity: number;
+  /** Sustained requests per second */
+  refillPerSecond: number;
+}
+
+export interface HttpTransportOptions {
+  /** Replace the pooled sender (tests) */
+  fetch?: TransportFetch;
+  /** Pool options for base URLs without explicit configuration */
+  defaultPool?: HttpPoolOptions;
+  /** Rate limit for providers without explicit configuration */
+  defaultRateLimit?: RateLimitOptions;
+  /** How often a 429 response is retried before it is returned (default: 2) */
+  maxRateLimitRetries?: number;
+  /** Upper bound on how long a single Retry-After blocks a provider (default: 60000) */
+  maxRetryAfterMs?: number;
+}
+
+export interface LatencyBucket {
+  /** Upper bound in milliseconds; null for the overflow bucket */
+  le: number | null;
+  count: number;
+}
+
+export interface LatencyHistogramSnapshot {
+  provider: string;
+  model: string;
+  count: number;
+  sumMs: number;
+  minMs: number;
+  maxMs: number;
+  /** Percentiles estimated from bucket upper bounds */
+  p50: number;
+  p95: number;
+  p99: number;
+  buckets: LatencyBucket[];
+}
+
+// =============================================================================
+// Constants
+// =============================================================================
+
+const DEFAULT_POOL_OPTIONS: Required<HttpPoolOptions> = {
+  maxSockets: 16,
+  maxFreeSockets: 4,
+  keepAliveMsecs: 1000,
+};
+
+const DEFAULT_RATE_LIMIT: RateLimitOptions = {
+  capacity: 30,
+  refillPerSecond: 5,
+};
+
+const DEFAULT_MAX_RATE_LIMIT_RETRIES = 2;
+const DEFAULT_MAX_RETRY_AFTER_MS = 60_000;
+
+/**
+ * Wait applied to a 429 response without a usable Retry-After header
+ */
+const DEFAULT_RETRY_AFTER_MS = 1000;
+
+/**
+ * Histogram bucket upper bounds in milliseconds
+ */
+const LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10_000, 30_000, 60_000, 120_000];
+
+// =============================================================================
+// Pooled Sender
+// =============================================================================
+
+/**
+ * Send a request over a node http/https agent and wrap the reply in a Response
+ */
+function pooledFetch(url: string, init: TransportRequestInit & { agent?: http.Agent }): Promise<Response> {
+  return new Promise((resolve, reject) => {
+    const target = new URL(url);
+    const method = init.method ?? 'GET';
+    const options = { method, headers: init.headers, agent: init.agent, signal: init.signal };
+
+    const onResponse = (incoming: http.IncomingMessage) => {
+      const headers = new Headers();
+      for (const [name, value] of Object.entries(incoming.headers)) {
+        if (Array.isArray(value)) {
+          value.forEach((item) => headers.append(name, item));
+        } else if (value !== undefined) {
+          headers.set(name, value);
+        }
+      }
+
+      const status = incoming.statusCode ?? 500;
+      const hasBody = method !== 'HEAD' && status !== 204 && status !== 304;
+      if (!hasBody) {
+        incoming.resume();
+      }
+
+      resolve(
+        new Response(hasBody ? (Readable.toWeb(incoming) as ReadableStream<Uint8Array>) : null, {
+          status,
+          statusText: incoming.statusMessage,
+          headers,
+        })
+      );
+    };
+
+    const request =
+      target.protocol === 'https:'
+        ? https.request(target, options, onResponse)
+        : http.request(target, options, onResponse);
+
+    request.on('error', reject);
+    if (init.body !== undefined) {
+      request.write(init.body);
+    }
+    request.end();
+  });
+}
+
+/**
+ * Call `done` once the response body has been read to its end
+ * Streamed responses are thus measured to their last chunk rather than to
+ * their headers. Responses without a body complete immediately.
+ */
+function onBodyEnd(response: Response, done: () => void): Response {
+  if (!response.body) {
+    done();
+    return response;
+  }
+
+  const reader = response.body.getReader();
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        const { done: finished, value } = await reader.read();
+        if (finished) {
+          done();
+          controller.close();
+        } else {
+          controller.enqueue(value);
+        }
+      } catch (error) {
+        controller.error(error);
+      }
+    },
+    cancel(reason) {
+      return reader.cancel(reason);
+    },
+  });
+
+  return new Response(body, {
+    status: response.status,
+    statusText: response.statusText,
+    headers: response.headers,
+  });
+}
+
+// =============================================================================
+// Rate Limiter
+// =============================================================================
+
+function abortError(): DOMException {
+  return new DOMException('This operation was aborted', 'AbortError');
+}
+
+/**
+ * Wait for the given time; rejects with an AbortError as soon as the signal fires
+ */
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(abortError());
+      return;
+    }
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(abortError());
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
+}
+
+/**
+ * Settle with the promise, or reject with an AbortError as soon as the signal fires
+ */
+function abortable<T>(promise: Promise<T>, signal?: AbortSignal): Promise<T> {
+  if (!signal) {
+    return promise;
+  }
+  if (signal.aborted) {
+    return Promise.reject(abortError());
+  }
+  return new Promise((resolve, reject) => {
+    const onAbort = () => reject(abortError());
+    signal.addEventListener('abort', onAbort, { once: true });
+    promise.then(resolve, reject).finally(() => signal.removeEventListener('abort', onAbort));
+  });
+}
+
+/**
+ * Token bucket; callers are served in arrival order
+ */
+class TokenBucket {
+  private capacity: number;
+  private refillPerSecond: number;
+  private tokens: number;
+  private updatedAt = Date.now();
+  private blockedUntil = 0;
+  private queue: Promise<void> = Promise.resolve();
+
+  constructor(options: RateLimitOptions) {
+    validateRateLimit(options);
+    this.capacity = options.capacity;
+    this.refillPerSecond = options.refillPerSecond;
+    this.tokens = options.capacity;
+  }
+
+  /**
+   * Change burst size and refill rate in place
+   * Tokens left (capped at the new capacity), waiting callers and a
+   * Retry-After block carry over, so reconfiguring never grants a new burst.
+   */
+  configure(options: RateLimitOptions): void {
+    validateRateLimit(options);
+    this.refill(Date.now());
+    this.capacity = options.capacity;
+    this.refillPerSecond = options.refillPerSecond;
+    this.tokens = Math.min(this.tokens, this.capacity);
+  }
+
+  /**
+   * Resolve once a token has been taken
+   * An aborted caller leaves the queue at once and its turn is skipped
+   * without taking a token.
+   * @param signal - Rejects the wait with an AbortError when fired
+   */
+  acquire(signal?: AbortSignal): Promise<void> {
+    const turn = this.queue.then(() => (signal?.aborted ? undefined : this.take(signal)));
+    this.queue = turn.catch(() => undefined);
+    return abortable(turn, signal);
+  }
+
+  /**
+   * Stop handing out tokens until the given time (429 Retry-After)
+   */
+  blockUntil(time: number): void {
+    this.blockedUntil = Math.max(this.blockedUntil, time);
+    this.tokens = 0;
+    this.updatedAt = Math.max(this.updatedAt, this.blockedUntil);
+  }
+
+  private async take(signal?: AbortSignal): Promise<void> {
+    for (;;) {
+      const now = Date.now();
+      if (now < this.blockedUntil) {
+        await sleep(this.blockedUntil - now, signal);
+        continue;
+      }
+
+      this.refill(now);
+      if (this.tokens >= 1) {
+        this.tokens -= 1;
+        return;
+      }
+      await sleep(Math.ceil(((1 - this.tokens) / this.refillPerSecond) * 1000), signal);
+    }
+  }
+
+  private refill(now: number): void {
+    if (now > this.updatedAt) {
+      this.tokens = Math.min(this.capacity, this.tokens + ((now - this.updatedAt) / 1000) * this.refillPerSecond);
+      this.updatedAt = now;
+    }
+  }
+}
+
+function validateRateLimit(options: RateLimitOptions): void {
+  if (!(options.capacity >= 1) || !(options.refillPerSecond > 0) || !Number.isFinite(options.refillPerSecond)) {
+    throw new Error('Rate limit needs capacity >= 1 and refillPerSecond > 0');
+  }
+}
+
+/**
+ * Parse a Retry-After header (delay in seconds or HTTP date) into milliseconds
+ */
+export function parseRetryAfter(value: string | null | undefined, now: number = Date.now()): number | null {
+  if (!value) {
+    return null;
+  }
+  const trimmed = value.trim();
+  if (/^\d+(\.\d+)?$/.test(trimmed)) {
+    return Math.round(Number(trimmed) * 1000);
+  }
+  const date = Date.parse(trimmed);
+  return Number.isNaN(date) ? null : Math.max(0, date - now);
+}
+
+// =============================================================================
+// Latency Histogram
+// =============================================================================
+
+class LatencyHistogram {
+  private readonly counts = new Array<number>(LATENCY_BUCKETS_MS.length + 1).fill(0);
+  private count = 0;
+  private sumMs = 0;
+  private minMs = Infinity;
+  private maxMs = 0;
+
+  record(ms: number): void {
+    let bucket = 0;
+    while (bucket < LATENCY_BUCKETS_MS.length && ms > LATENCY_BUCKETS_MS[bucket]) {
+      bucket++;
+    }
+    this.counts[bucket]++;
+    this.count++;
+    this.sumMs += ms;
+    this.minMs = Math.min(this.minMs, ms);
+    this.maxMs = Math.max(this.maxMs, ms);
+  }
+
+  snapshot(provider: string, model: string): LatencyHistogramSnapshot {
+    return {
+      provider,
+      model,
+      count: this.count,
+      sumMs: Math.round(this.sumMs),
+      minMs: this.count > 0 ? Math.round(this.minMs) : 0,
+      maxMs: Math.round(this.maxMs),
+      p50: this.percentile(0.5),
+      p95: this.percentile(0.95),
+      p99: this.percentile(0.99),
+      buckets: this.counts.map((count, i) => ({ le: LATENCY_BUCKETS_MS[i] ?? null, count })),
+    };
+  }
+
+  /**
+   * Upper bound of the bucket holding the given rank, capped at the maximum seen
+   */
+  private percentile(fraction: number): number {
+    if (this.count === 0) {
+      return 0;
+    }
+    const rank = Math.ceil(fraction * this.count);
+    let seen = 0;
+    for (let i = 0; i < this.counts.length; i++) {
+      seen += this.counts[i];
+      if (seen >= rank) {
+        return Math.round(Math.min(LATENCY_BUCKETS_MS[i] ?? Infinity, this.maxMs));
+      }
+    }
+    return Math.round(this.maxMs);
+  }
+}
+
+// =============================================================================
+// HTTP Transport
+// =============================================================================
+
+export class HttpTransport {
+  private readonly send: TransportFetch;
+  private readonly defaultPool: Required<HttpPoolOptions>;
+  private readonly defaultRateLimit: RateLimitOptions;
+  private readonly maxRateLimitRetries: number;
+  private readonly maxRetryAfterMs: number;
+
+  private readonly poolOptions = new Map<string, Required<HttpPoolOptions>>();
+  /** "protocol baseUrl" -> agent */
+  private readonly agents = new Map<string, http.Agent>();
+  /** provider or "provider baseUrl" -> options */
+  private readonly rateLimitOptions = new Map<string, RateLimitOptions>();
+  /** "provider baseUrl" -> bucket */
+  private readonly buckets = new Map<string, TokenBucket>();
+  private readonly inFlight = new Map<string, Promise<unknown>>();
+  /** provider -> model -> histogram */
+  private readonly histograms = new Map<string, Map<string, LatencyHistogram>>();
+
+  constructor(options: HttpTransportOptions = {}) {
+    this.send = options.fetch ?? pooledFetch;
+    this.defaultPool = { ...DEFAULT_POOL_OPTIONS, ...options.defaultPool };
+    this.defaultRateLimit = options.defaultRateLimit ?? DEFAULT_RATE_LIMIT;
+    this.maxRateLimitRetries = options.maxRateLimitRetries ?? DEFAULT_MAX_RATE_LIMIT_RETRIES;
+    this.maxRetryAfterMs = options.maxRetryAfterMs ?? DEFAULT_MAX_RETRY_AFTER_MS;
+  }
+
+  /**
+   * Configure the connection pool for a base URL
+   * Socket limits are changed on the existing agents, keeping their open
+   * connections; a new keep-alive interval takes effect for new requests and
+   * sockets of the previous pool are left to close.
+   */
+  configurePool(baseUrl: string, options: HttpPoolOptions): void {
+    const key = normalizeBaseUrl(baseUrl);
+    const pool = { ...this.defaultPool, ...options };
+    const current = this.poolOptions.get(key);
+    if (
+      current &&
+      current.maxSockets === pool.maxSockets &&
+      current.maxFreeSockets === pool.maxFreeSockets &&
+      current.keepAliveMsecs === pool.keepAliveMsecs
+    ) {
+      return;
+    }
+    this.poolOptions.set(key, pool);
+    for (const protocol of ['http:', 'https:']) {
+      const agentKey = `${protocol} ${key}`;
+      const agent = this.agents.get(agentKey);
+      if (agent && current?.keepAliveMsecs === pool.keepAliveMsecs) {
+        agent.maxSockets = pool.maxSockets;
+        agent.maxFreeSockets = pool.maxFreeSockets;
+      } else {
+        this.agents.delete(agentKey);
+      }
+    }
+  }
+
+  /**
+   * Configure the token bucket for a provider
+   * Without a base URL the options apply to each of the provider's base URLs
+   * that has no configuration of its own; every base URL keeps its own bucket.
+   * Existing buckets are reconfigured in place and keep their remaining
+   * tokens, so callers alternating between configurations for the same
+   * endpoint never refill it to a full burst.
+   * @param provider - Provider identifier
+   * @param options - Burst size and refill rate
+   * @param baseUrl - Limit only this endpoint of the provider
+   */
+  configureRateLimit(provider: string, options: RateLimitOptions, baseUrl?: string): void {
+    const key = baseUrl ? bucketKey(provider, baseUrl) : provider;
+    const current = this.rateLimitOptions.get(key);
+    if (current && current.capacity === options.capacity && current.refillPerSecond === options.refillPerSecond) {
+      return;
+    }
+    validateRateLimit(options);
+    this.rateLimitOptions.set(key, options);
+    for (const [bucketId, bucket] of this.buckets) {
+      if (bucketId === key || (!baseUrl && bucketId.startsWith(`${provider} `))) {
+        bucket.configure(this.getRateLimitOptions(bucketId, provider));
+      }
+    }
+  }
+
+  /**
+   * Send a request through the rate limiter and pool of its provider and base URL
+   * A 429 blocks that rate limiter for its Retry-After and is retried; the last
+   * 429 is returned if retries run out. Waiting for a token or a Retry-After
+   * ends with an AbortError as soon as init.signal fires. Latency is recorded
+   * once the response body has been read to its end.
+   * @param url - Full request URL
+   * @param init - Method, headers, body and abort signal
+   * @param target - Provider/model (histogram) and base URL (pool); provider and
+   *   base URL together select the rate limiter
+   */
+  async request(url: string, init: TransportRequestInit, target: TransportTarget): Promise<Response> {
+    const { origin, protocol } = new URL(url);
+    const baseUrl = target.baseUrl ?? origin;
+    const bucket = this.getBucket(target.provider, baseUrl);
+    const agent = this.getAgent(baseUrl, protocol);
+
+    for (let attempt = 0; ; attempt++) {
+      await bucket.acquire(init.signal);
+
+      const startTime = performance.now();
+      const response = await this.send(url, { ...init, agent });
+
+      if (response.status !== 429 || attempt >= this.maxRateLimitRetries) {
+        return onBodyEnd(response, () =>
+          this.recordLatency(target.provider, target.model, performance.now() - startTime)
+        );
+      }
+
+      const delay = Math.min(
+        parseRetryAfter(response.headers?.get('retry-after')) ?? DEFAULT_RETRY_AFTER_MS,
+        this.maxRetryAfterMs
+      );
+      bucket.blockUntil(Date.now() + delay);
+      await response.body?.cancel();
+    }
+  }
+
+  /**
+   * Run an operation once for all concurrent callers with the same key
+   * @param key - Identifies the operation, including anything that changes its result
+   * @param operation - Started only if no identical operation is in flight
+   */
+  singleFlight<T>(key: string, operation: () => Promise<T>): Promise<T> {
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      return pending as Promise<T>;
+    }
+
+    const promise = (async () => {
+      try {
+        return await operation();
+      } finally {
+        this.inFlight.delete(key);
+      }
+    })();
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
+  /**
+   * Latency histograms for every provider/model that has completed a request
+   */
+  getLatencyHistograms(): LatencyHistogramSnapshot[] {
+    const snapshots: LatencyHistogramSnapshot[] = [];
+    for (const [provider, models] of this.histograms) {
+      for (const [model, histogram] of models) {
+        snapshots.push(histogram.snapshot(provider, model));
+      }
+    }
+    return snapshots;
+  }
+
+  resetLatencyHistograms(): void {
+    this.histograms.clear();
+  }
+
+  /**
+   * Close all pooled sockets
+   */
+  destroy(): void {
+    for (const agent of this.agents.values()) {
+      agent.destroy();
+    }
+    this.agents.clear();
+  }
+
+  private getAgent(baseUrl: string, protocol: string): http.Agent {
+    const normalized = normalizeBaseUrl(baseUrl);
+    const key = `${protocol} ${normalized}`;
+    let agent = this.agents.get(key);
+    if (!agent) {
+      const options = { keepAlive: true, ...(this.poolOptions.get(normalized) ?? this.defaultPool) };
+      agent = protocol === 'https:' ? new https.Agent(options) : new http.Agent(options);
+      this.agents.set(key, agent);
+    }
+    return agent;
+  }
+
+  private getBucket(provider: string, baseUrl: string): TokenBucket {
+    const key = bucketKey(provider, baseUrl);
+    let bucket = this.buckets.get(key);
+    if (!bucket) {
+      bucket = new TokenBucket(this.getRateLimitOptions(key, provider));
+      this.buckets.set(key, bucket);
+    }
+    return bucket;
+  }
+
+  private getRateLimitOptions(key: string, provider: string): RateLimitOptions {
+    return this.rateLimitOptions.get(key) ?? this.rateLimitOptions.get(provider) ?? this.defaultRateLimit;
+  }
+
+  private recordLatency(provider: string, model: string | undefined, ms: number): void {
+    let models = this.histograms.get(provider);
+    if (!models) {
+      models = new Map();
+      this.histograms.set(provider, models);
+    }
+    const key = model || 'unknown';
+    let histogram = models.get(key);
+    if (!histogram) {
+      histogram = new LatencyHistogram();
+      models.set(key, histogram);
+    }
+    histogram.record(ms);
+  }
+}
+
+function normalizeBaseUrl(baseUrl: string): string {
+  return baseUrl.replace(/\/+$/, '');
+}
+
+function bucketKey(provider: string, baseUrl: string): string {
+  return `${provider} ${normalizeBaseUrl(baseUrl)}`;
+}
+
+// =============================================================================
+// Shared Instance
+// =============================================================================
+
+let sharedTransport: HttpTransport | null = null;
+
+/**
+ * Get or create the transport shared by all providers
+ */
+export function getSharedTransport(): HttpTransport {
+  if (!sharedTransport) {
+    sharedTransport = new HttpTransport();
+  }
+  return sharedTransport;
+}
+
+/**
+ * Replace the shared transport (tests, custom configuration)
+ */
+export function setSharedTransport(transport: HttpTransport | null): void {
+  sharedTransport = transport;
+}
@@ -118,6 +118,28 @@ export function extractKeywords(text: string): ExtractedKeyword[] {
     .slice(0, MAX_KEYWORDS);
 }
 
+/**
+ * Splits text into searchable terms
+ *
+ * Applies the same normalization, Korean/English tokenization and stopword
+ * filtering as extractKeywords, without a minimum text length. Terms are
+ * returned in order and may repeat.
+ *
+ * @param text - Text to tokenize
+ * @returns Array of lowercase terms
+ *
+ * @example
+ * tokenizeText('Login System 로그인 기능');
+ * // Returns: ['login', 'system', '로그인', '기능']
+ */
+export function tokenizeText(text: string): string[] {
+  if (!text) {
+    return [];
+  }
+
+  return tokenize(normalizeText(text)).filter(isKeywordCandidate);
+}
+
 /**
  * Normalizes text by converting to lowercase and cleaning whitespace
  */
@@ -163,23 +185,7 @@ function calculateFrequency(words: string[]): Map<string, number> {
   const frequency = new Map<string, number>();
 
   for (const word of words) {
-    // Skip short words
-    if (word.length < MIN_KEYWORD_LENGTH) {
-      continue;
-    }
-
-    // Skip pure numbers
-    if (/^\d+$/.test(word)) {
-      continue;
-    }
-
-    // Check if word is a Korean stopword
-    if (isKoreanWord(word) && KOREAN_STOPWORDS.has(word)) {
-      continue;
-    }
-
-    // Check if word is an English stopword
-    if (isEnglishWord(word) && ENGLISH_STOPWORDS.has(word)) {
+    if (!isKeywordCandidate(word)) {
       continue;
     }
 
@@ -191,6 +197,33 @@ function calculateFrequency(words: string[]): Map<string, number> {
   return frequency;
 }
 
+/**
+ * Checks if a token can be a keyword (not too short, numeric or a stopword)
+ */
+function isKeywordCandidate(word: string): boolean {
+  // Skip short words
+  if (word.length < MIN_KEYWORD_LENGTH) {
+    return false;
+  }
+
+  // Skip pure numbers
+  if (/^\d+$/.test(word)) {
+    return false;
+  }
+
+  // Check if word is a Korean stopword
+  if (isKoreanWord(word) && KOREAN_STOPWORDS.has(word)) {
+    return false;
+  }
+
+  // Check if word is an English stopword
+  if (isEnglishWord(word) && ENGLISH_STOPWORDS.has(word)) {
+    return false;
+  }
+
+  return true;
+}
+
 /**
  * Checks if a word contains Korean characters
  */
@@ -0,0 +1,964 @@
+/**
+ * LLM Log Store
+ * Durable, append-only log of LLM calls on disk behind the in-memory
+ * LLMLogger hot tail
+ *
+ * Entries are kept in size- and time-bounded segments under the workspace.
+ * Each segment is three files named by a zero-padded sequence number:
+ * - NNNNNNNN.log  - NDJSON, one completed entry per line (source of truth)
+ * - NNNNNNNN.idx  - fixed-size binary rows, one per line: location, timestamp,
+ *                   latency, cost, tokens and dictionary codes for
+ *                   provider/model/project
+ * - NNNNNNNN.json - segment summary: row count, time range and the
+ *                   provider/model/project dictionaries the rows refer to
+ *
+ * Features:
+ * - Batched asynchronous writes off the request path
+ * - Size- and age-based retention (oldest segments are dropped whole)
+ * - Paged, filtered queries that skip segments by their summary, scan only
+ *   the index rows of the rest and read just the lines they return
+ * - p50/p95/p99 latency and cost rollups computed from index rows alone
+ * - Crash recovery: the newest segment's index and summary are rebuilt from
+ *   its .log on open, dropping a partially written last line
+ */
+
+import fs from 'fs/promises';
+import path from 'path';
+import type { LLMLogEntry } from './llmLogger';
+import { writeFileAtomic } from './atomicFile';
+
+/**
+ * Default on-disk location for the call log
+ */
+export const LLM_LOG_PATH = path.join(process.cwd(), 'workspace/llm-logs');
+
+const DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024;
+const DEFAULT_SEGMENT_SPAN_MS = 24 * 60 * 60 * 1000;
+const DEFAULT_MAX_TOTAL_BYTES = 512 * 1024 * 1024;
+const DEFAULT_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000;
+const DEFAULT_FLUSH_INTERVAL_MS = 250;
+const DEFAULT_MAX_BATCH_SIZE = 500;
+const DEFAULT_PAGE_SIZE = 50;
+const MAX_PAGE_SIZE = 1000;
+
+/**
+ * Index row layout (little-endian)
+ *   0 u32 line offset      4 u32 line length
+ *   8 f64 timestamp (ms)  16 f64 duration (ms, NaN if unknown)
+ *  24 f64 cost (USD, NaN if unknown)
+ *  32 u32 input tokens    36 u32 output tokens
+ *  40 u16 provider code   42 u16 model code   44 u16 project code
+ *  46 u8  flags           47 (padding)
+ */
+const ROW_SIZE = 48;
+const FLAG_ERROR = 1;
+const NO_PROJECT = 0xffff;
+
+/**
+ * A segment is sealed once any of its dictionaries reaches this size
+ */
+const MAX_DICTIONARY_SIZE = 0xfffe;
+
+// =============================================================================
+// Types
+// =============================================================================
+
+export interface LLMLogStoreOptions {
+  logDir?: string;
+  /** Start a new segment once the active one reaches this size */
+  maxSegmentBytes?: number;
+  /** Start a new segment once the active one spans this much time */
+  segmentSpanMs?: number;
+  /** Drop the oldest segments while the log is larger than this */
+  maxTotalBytes?: number;
+  /** Drop segments whose newest entry is older than this */
+  maxAgeMs?: number;
+  /** How long appended entries wait before they are written */
+  flushIntervalMs?: number;
+  /** Write immediately once this many entries are waiting */
+  maxBatchSize?: number;
+}
+
+export interface LLMLogFilter {
+  /** Earliest entry timestamp (ms since epoch, inclusive) */
+  from?: number;
+  /** Latest entry timestamp (ms since epoch, inclusive) */
+  to?: number;
+  provider?: string;
+  model?: string;
+  projectId?: string;
+  status?: 'success' | 'error';
+}
+
+export interface LLMLogQuery extends LLMLogFilter {
+  /** nextCursor of the previous page */
+  cursor?: string;
+  /** Page size (default: 50, max: 1000) */
+  limit?: number;
+}
+
+export interface LLMLogPage {
+  /** Newest first, in write order */
+  entries: LLMLogEntry[];
+  /** Pass as cursor to get the next page; null when there are no more entries */
+  nextCursor: string | null;
+}
+
+export type LLMLogGroupBy = 'provider' | 'model' | 'project' | 'none';
+
+export interface LLMLogPercentiles {
+  p50: number;
+  p95: number;
+  p99: number;
+}
+
+export interface LLMLogRollup {
+  provider?: string;
+  model?: string;
+  projectId?: string;
+  count: number;
+  errorCount: number;
+  /** Over entries that recorded a duration */
+  latencyMs: LLMLogPercentiles & { avg: number; max: number };
+  /** Over entries that recorded a cost */
+  cost: LLMLogPercentiles & { total: number; avg: number };
+  tokens: {
+    input: number;
+    output: number;
+  };
+}
+
+export interface LLMLogStoreStats {
+  segments: number;
+  entries: number;
+  bytes: number;
+  pending: number;
+  oldestTimestamp: string | null;
+  newestTimestamp: string | null;
+}
+
+/**
+ * Contents of NNNNNNNN.json
+ */
+interface SegmentSummary {
+  count: number;
+  /** Size of the .log file covered by the index */
+  bytes: number;
+  minTimestamp: number;
+  maxTimestamp: number;
+  providers: string[];
+  models: string[];
+  projects: string[];
+}
+
+interface Segment extends SegmentSummary {
+  id: number;
+  /** Dictionary lookups for the active segment */
+  codes?: {
+    providers: Map<string, number>;
+    models: Map<string, number>;
+    projects: Map<string, number>;
+  };
+}
+
+/**
+ * Dictionary codes a row must carry to match a filter
+ */
+interface RowCodes {
+  provider?: number;
+  model?: number;
+  project?: number;
+}
+
+/**
+ * Decoded index row
+ */
+interface IndexRow {
+  offset: number;
+  length: number;
+  timestamp: number;
+  durationMs: number;
+  cost: number;
+  inputTokens: number;
+  outputTokens: number;
+  provider: number;
+  model: number;
+  project: number;
+  error: boolean;
+}
+
+// =============================================================================
+// Row Encoding
+// =============================================================================
+
+/**
+ * Project an entry belongs to: explicit, or from connection test parameters
+ */
+function projectOf(entry: LLMLogEntry): string | undefined {
+  if (entry.projectId) {
+    return entry.projectId;
+  }
+  const fromParameters = entry.request?.parameters?.projectId;
+  return typeof fromParameters === 'string' ? fromParameters : undefined;
+}
+
+function writeRow(buffer: Buffer, at: number, row: IndexRow): void {
+  buffer.writeUInt32LE(row.offset, at);
+  buffer.writeUInt32LE(row.length, at + 4);
+  buffer.writeDoubleLE(row.timestamp, at + 8);
+  buffer.writeDoubleLE(row.durationMs, at + 16);
+  buffer.writeDoubleLE(row.cost, at + 24);
+  buffer.writeUInt32LE(clampUInt32(row.inputTokens), at + 32);
+  buffer.writeUInt32LE(clampUInt32(row.outputTokens), at + 36);
+  buffer.writeUInt16LE(row.provider, at + 40);
+  buffer.writeUInt16LE(row.model, at + 42);
+  buffer.writeUInt16LE(row.project, at + 44);
+  buffer.writeUInt8(row.error ? FLAG_ERROR : 0, at + 46);
+}
+
+function clampUInt32(value: number): number {
+  return Math.min(Math.max(0, Math.floor(value) || 0), 0xffffffff);
+}
+
+function readRow(buffer: Buffer, at: number): IndexRow {
+  return {
+    offset: buffer.readUInt32LE(at),
+    length: buffer.readUInt32LE(at + 4),
+    timestamp: buffer.readDoubleLE(at + 8),
+    durationMs: buffer.readDoubleLE(at + 16),
+    cost: buffer.readDoubleLE(at + 24),
+    inputTokens: buffer.readUInt32LE(at + 32),
+    outputTokens: buffer.readUInt32LE(at + 36),
+    provider: buffer.readUInt16LE(at + 40),
+    model: buffer.readUInt16LE(at + 42),
+    project: buffer.readUInt16LE(at + 44),
+    error: (buffer.readUInt8(at + 46) & FLAG_ERROR) !== 0,
+  };
+}
+
+function emptySummary(): SegmentSummary {
+  return {
+    count: 0,
+    bytes: 0,
+    minTimestamp: Infinity,
+    maxTimestamp: -Infinity,
+    providers: [],
+    models: [],
+    projects: [],
+  };
+}
+
+function dictionaryCode(segment: Segment, key: 'providers' | 'models' | 'projects', value: string): number {
+  const codes = segment.codes![key];
+  let code = codes.get(value);
+  if (code === undefined) {
+    code = segment[key].length;
+    segment[key].push(value);
+    codes.set(value, code);
+  }
+  return code;
+}
+
+/**
+ * Exact percentile of sorted values (nearest rank)
+ */
+function percentile(sorted: Float64Array, fraction: number): number {
+  if (sorted.length === 0) {
+    return 0;
+  }
+  return sorted[Math.min(sorted.length - 1, Math.max(0, Math.ceil(fraction * sorted.length) - 1))];
+}
+
+/**
+ * Growable list of doubles, cheaper than number[] for millions of values
+ */
+class DoubleList {
+  private values = new Float64Array(64);
+  length = 0;
+
+  push(value: number): void {
+    if (this.length === this.values.length) {
+      const grown = new Float64Array(this.values.length * 2);
+      grown.set(this.values);
+      this.values = grown;
+    }
+    this.values[this.length++] = value;
+  }
+
+  sorted(): Float64Array {
+    return this.values.slice(0, this.length).sort();
+  }
+}
+
+interface RollupAccumulator {
+  provider?: string;
+  model?: string;
+  projectId?: string;
+  count: number;
+  errorCount: number;
+  durations: DoubleList;
+  costs: DoubleList;
+  inputTokens: number;
+  outputTokens: number;
+}
+
+// =============================================================================
+// Log Store
+// =============================================================================
+
+export class LLMLogStore {
+  private readonly logDir: string;
+  private readonly maxSegmentBytes: number;
+  private readonly segmentSpanMs: number;
+  private readonly maxTotalBytes: number;
+  private readonly maxAgeMs: number;
+  private readonly flushIntervalMs: number;
+  private readonly maxBatchSize: number;
+
+  /** Entries waiting to be written, by ID so repeated updates collapse */
+  private pending = new Map<string, LLMLogEntry>();
+  private flushTimer: NodeJS.Timeout | null = null;
+  /** Tail of the write chain; writes and queries run one at a time */
+  private writing: Promise<void> = Promise.resolve();
+  /** Oldest first; the last one is the active segment */
+  private segments: Segment[] | null = null;
+
+  constructor(options: LLMLogStoreOptions = {}) {
+    this.logDir = options.logDir ?? LLM_LOG_PATH;
+    this.maxSegmentBytes = options.maxSegmentBytes ?? DEFAULT_MAX_SEGMENT_BYTES;
+    this.segmentSpanMs = options.segmentSpanMs ?? DEFAULT_SEGMENT_SPAN_MS;
+    this.maxTotalBytes = options.maxTotalBytes ?? DEFAULT_MAX_TOTAL_BYTES;
+    this.maxAgeMs = options.maxAgeMs ?? DEFAULT_MAX_AGE_MS;
+    this.flushIntervalMs = options.flushIntervalMs ?? DEFAULT_FLUSH_INTERVAL_MS;
+    this.maxBatchSize = options.maxBatchSize ?? DEFAULT_MAX_BATCH_SIZE;
+  }
+
+  /**
+   * Queue a completed entry for writing
+   * The entry is serialized when the batch is written, so updates made to it
+   * before then are included. An entry appended again after it was written
+   * is stored as a new record.
+   * @param entry - Completed log entry
+   */
+  append(entry: LLMLogEntry): void {
+    this.pending.delete(entry.id);
+    this.pending.set(entry.id, entry);
+
+    if (this.pending.size >= this.maxBatchSize) {
+      void this.flush();
+    } else if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        this.flushTimer = null;
+        void this.flush();
+      }, this.flushIntervalMs);
+      this.flushTimer.unref();
+    }
+  }
+
+  /**
+   * Write all queued entries
+   * Write failures are reported and the batch is dropped; they never reach
+   * the caller that logged the entry.
+   */
+  flush(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (this.pending.size === 0) {
+      return this.writing;
+    }
+
+    const batch = Array.from(this.pending.values());
+    this.pending.clear();
+
+    return this.enqueue(async () => {
+      try {
+        await this.writeBatch(batch);
+        await this.applyRetention(Date.now());
+      } catch (error) {
+        console.error(`Failed to write ${batch.length} LLM log entries:`, error);
+        // Re-read the segments from disk before the next write
+        this.segments = null;
+      }
+    });
+  }
+
+  /**
+   * Page through stored entries, newest first
+   * @param query - Filters, cursor and page size
+   */
+  async query(query: LLMLogQuery = {}): Promise<LLMLogPage> {
+    await this.flush();
+    return this.enqueue(() => this.readPage(query));
+  }
+
+  /**
+   * Latency and cost rollups over stored entries
+   * @param filter - Entries to include
+   * @param groupBy - One rollup per provider, provider/model, project, or one overall
+   */
+  async getRollups(filter: LLMLogFilter = {}, groupBy: LLMLogGroupBy = 'model'): Promise<LLMLogRollup[]> {
+    await this.flush();
+    return this.enqueue(() => this.computeRollups(filter, groupBy));
+  }
+
+  async getStats(): Promise<LLMLogStoreStats> {
+    await this.flush();
+    return this.enqueue(async () => {
+      const segments = await this.load();
+      const stored = segments.filter((segment) => segment.count > 0);
+      return {
+        segments: segments.length,
+        entries: segments.reduce((sum, segment) => sum + segment.count, 0),
+        bytes: segments.reduce((sum, segment) => sum + this.segmentSize(segment), 0),
+        pending: this.pending.size,
+        oldestTimestamp: stored.length > 0 ? new Date(Math.min(...stored.map((s) => s.minTimestamp))).toISOString() : null,
+        newestTimestamp: stored.length > 0 ? new Date(Math.max(...stored.map((s) => s.maxTimestamp))).toISOString() : null,
+      };
+    });
+  }
+
+  /**
+   * Delete every stored and queued entry
+   */
+  async clear(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    this.pending.clear();
+
+    await this.enqueue(async () => {
+      const segments = await this.load();
+      for (const segment of segments) {
+        await this.deleteSegment(segment);
+      }
+      this.segments = [];
+    });
+  }
+
+  /**
+   * Write queued entries and stop the flush timer
+   */
+  async close(): Promise<void> {
+    await this.flush();
+  }
+
+  // ===========================================================================
+  // Writing
+  // ===========================================================================
+
+  private enqueue<T>(operation: () => Promise<T>): Promise<T> {
+    const result = this.writing.then(operation);
+    this.writing = result.then(
+      () => undefined,
+      () => undefined
+    );
+    return result;
+  }
+
+  private async writeBatch(batch: LLMLogEntry[]): Promise<void> {
+    const segments = await this.load();
+    let segment = await this.activeSegment(segments);
+    let lines: Buffer[] = [];
+    let rows: Buffer[] = [];
+
+    const writeOut = async (): Promise<void> => {
+      if (lines.length === 0) {
+        return;
+      }
+      await fs.appendFile(this.filePath(segment.id, 'log'), Buffer.concat(lines));
+      await fs.appendFile(this.filePath(segment.id, 'idx'), Buffer.concat(rows));
+      await this.writeSummary(segment);
+      lines = [];
+      rows = [];
+    };
+
+    for (const entry of batch) {
+      const line = Buffer.from(JSON.stringify(entry) + '\n', 'utf-8');
+      const timestamp = Date.parse(entry.timestamp) || Date.now();
+
+      if (segment.count > 0 && this.isFull(segment, line.length, timestamp)) {
+        await writeOut();
+        segment = await this.startSegment(segments);
+      }
+
+      const row = Buffer.alloc(ROW_SIZE);
+      writeRow(row, 0, this.indexEntry(segment, entry, timestamp, segment.bytes, line.length));
+      lines.push(line);
+      rows.push(row);
+      segment.bytes += line.length;
+    }
+
+    await writeOut();
+  }
+
+  private isFull(segment: Segment, lineLength: number, timestamp: number): boolean {
+    return (
+      segment.bytes + lineLength > this.maxSegmentBytes ||
+      timestamp - segment.minTimestamp > this.segmentSpanMs ||
+      segment.providers.length >= MAX_DICTIONARY_SIZE ||
+      segment.models.length >= MAX_DICTIONARY_SIZE ||
+      segment.projects.length >= MAX_DICTIONARY_SIZE
+    );
+  }
+
+  /**
+   * Add an entry to a segment's summary and build its index row
+   */
+  private indexEntry(segment: Segment, entry: LLMLogEntry, timestamp: number, offset: number, length: number): IndexRow {
+    const projectId = projectOf(entry);
+    segment.count++;
+    segment.minTimestamp = Math.min(segment.minTimestamp, timestamp);
+    segment.maxTimestamp = Math.max(segment.maxTimestamp, timestamp);
+
+    return {
+      offset,
+      length,
+      timestamp,
+      durationMs: entry.metrics?.duration_ms ?? NaN,
+      cost: entry.metrics?.estimated_cost ?? NaN,
+      inputTokens: entry.response?.usage?.prompt_tokens ?? 0,
+      outputTokens: entry.response?.usage?.completion_tokens ?? 0,
+      provider: dictionaryCode(segment, 'providers', entry.provider),
+      model: dictionaryCode(segment, 'models', entry.model),
+      project: projectId !== undefined ? dictionaryCode(segment, 'projects', projectId) : NO_PROJECT,
+      error: entry.error !== undefined,
+    };
+  }
+
+  private async activeSegment(segments: Segment[]): Promise<Segment> {
+    const last = segments[segments.length - 1];
+    return last?.codes ? last : this.startSegment(segments);
+  }
+
+  private async startSegment(segments: Segment[]): Promise<Segment> {
+    const previous = segments[segments.length - 1];
+    if (previous) {
+      delete previous.codes;
+    }
+
+    const segment: Segment = {
+      id: (previous?.id ?? 0) + 1,
+      ...emptySummary(),
+      codes: { providers: new Map(), models: new Map(), projects: new Map() },
+    };
+    await fs.writeFile(this.filePath(segment.id, 'log'), '');
+    await fs.writeFile(this.filePath(segment.id, 'idx'), '');
+    await this.writeSummary(segment);
+    segments.push(segment);
+    return segment;
+  }
+
+  private async writeSummary(segment: Segment): Promise<void> {
+    const summary: SegmentSummary = {
+      count: segment.count,
+      bytes: segment.bytes,
+      minTimestamp: segment.minTimestamp,
+      maxTimestamp: segment.maxTimestamp,
+      providers: segment.providers,
+      models: segment.models,
+      projects: segment.projects,
+    };
+    await writeFileAtomic(this.filePath(segment.id, 'json'), JSON.stringify(summary));
+  }
+
+  /**
+   * Drop the oldest segments while the log is too large or too old
+   * The active segment is never dropped.
+   */
+  private async applyRetention(now: number): Promise<void> {
+    const segments = await this.load();
+    let totalBytes = segments.reduce((sum, segment) => sum + this.segmentSize(segment), 0);
+
+    while (segments.length > 1) {
+      const oldest = segments[0];
+      if (totalBytes <= this.maxTotalBytes && oldest.maxTimestamp >= now - this.maxAgeMs) {
+        break;
+      }
+      await this.deleteSegment(oldest);
+      segments.shift();
+      totalBytes -= this.segmentSize(oldest);
+    }
+  }
+
+  private async deleteSegment(segment: Segment): Promise<void> {
+    for (const extension of ['json', 'idx', 'log']) {
+      await fs.rm(this.filePath(segment.id, extension), { force: true });
+    }
+  }
+
+  // ===========================================================================
+  // Loading and Recovery
+  // ===========================================================================
+
+  /**
+   * Load segment summaries, recovering the newest segment from its .log
+   */
+  private async load(): Promise<Segment[]> {
+    if (this.segments) {
+      return this.segments;
+    }
+
+    await fs.mkdir(this.logDir, { recursive: true });
+    const ids = new Set<number>();
+    for (const file of await fs.readdir(this.logDir)) {
+      const match = /^(\d{8})\.log$/.exec(file);
+      if (match) {
+        ids.add(Number(match[1]));
+      }
+    }
+
+    const sorted = Array.from(ids).sort((a, b) => a - b);
+    const segments: Segment[] = [];
+    for (const id of sorted) {
+      const isActive = id === sorted[sorted.length - 1];
+      const summary = isActive ? null : await this.readSummary(id);
+      segments.push(summary ? { id, ...summary } : await this.rebuildSegment(id, isActive));
+    }
+
+    this.segments = segments;
+    return segments;
+  }
+
+  private async readSummary(id: number): Promise<SegmentSummary | null> {
+    try {
+      const summary = JSON.parse(await fs.readFile(this.filePath(id, 'json'), 'utf-8')) as SegmentSummary;
+      const idx = await fs.stat(this.filePath(id, 'idx'));
+      if (idx.size < summary.count * ROW_SIZE) {
+        return null;
+      }
+      // An empty segment's time range does not survive JSON
+      return summary.count > 0 ? summary : emptySummary();
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Rebuild a segment's index and summary from its .log
+   * A trailing line that is incomplete or not valid JSON is cut off.
+   */
+  private async rebuildSegment(id: number, active: boolean): Promise<Segment> {
+    const segment: Segment = {
+      id,
+      ...emptySummary(),
+      codes: { providers: new Map(), models: new Map(), projects: new Map() },
+    };
+    const content = await fs.readFile(this.filePath(id, 'log'));
+    const rows: Buffer[] = [];
+
+    let start = 0;
+    while (start < content.length) {
+      const end = content.indexOf(0x0a, start);
+      if (end === -1) {
+        break;
+      }
+      let entry: LLMLogEntry;
+      try {
+        entry = JSON.parse(content.subarray(start, end).toString('utf-8')) as LLMLogEntry;
+      } catch {
+        break;
+      }
+      const row = Buffer.alloc(ROW_SIZE);
+      const timestamp = Date.parse(entry.timestamp) || 0;
+      writeRow(row, 0, this.indexEntry(segment, entry, timestamp, start, end + 1 - start));
+      rows.push(row);
+      start = end + 1;
+    }
+
+    segment.bytes = start;
+    if (start < content.length) {
+      await fs.truncate(this.filePath(id, 'log'), start);
+    }
+    await fs.writeFile(this.filePath(id, 'idx'), Buffer.concat(rows));
+    await this.writeSummary(segment);
+
+    if (!active) {
+      delete segment.codes;
+    }
+    return segment;
+  }
+
+  // ===========================================================================
+  // Reading
+  // ===========================================================================
+
+  /**
+   * Codes a segment's rows must carry to match the filter, or null if no
+   * row in the segment can match
+   */
+  private segmentFilter(segment: Segment, filter: LLMLogFilter): RowCodes | null {
+    if (segment.count === 0) {
+      return null;
+    }
+    if (filter.from !== undefined && segment.maxTimestamp < filter.from) {
+      return null;
+    }
+    if (filter.to !== undefined && segment.minTimestamp > filter.to) {
+      return null;
+    }
+
+    const codes: RowCodes = {};
+    const lookups: Array<[keyof RowCodes, string | undefined, string[]]> = [
+      ['provider', filter.provider, segment.providers],
+      ['model', filter.model, segment.models],
+      ['project', filter.projectId, segment.projects],
+    ];
+    for (const [key, value, dictionary] of lookups) {
+      if (value === undefined) {
+        continue;
+      }
+      const code = dictionary.indexOf(value);
+      if (code === -1) {
+        return null;
+      }
+      codes[key] = code;
+    }
+    return codes;
+  }
+
+  /**
+   * Whether the index row at a byte position matches the filter
+   * Reads fields straight from the buffer; scans touch every row.
+   */
+  private rowMatches(buffer: Buffer, at: number, filter: LLMLogFilter, codes: RowCodes): boolean {
+    if (filter.from !== undefined || filter.to !== undefined) {
+      const timestamp = buffer.readDoubleLE(at + 8);
+      if ((filter.from !== undefined && timestamp < filter.from) || (filter.to !== undefined && timestamp > filter.to)) {
+        return false;
+      }
+    }
+    return (
+      (codes.provider === undefined || buffer.readUInt16LE(at + 40) === codes.provider) &&
+      (codes.model === undefined || buffer.readUInt16LE(at + 42) === codes.model) &&
+      (codes.project === undefined || buffer.readUInt16LE(at + 44) === codes.project) &&
+      (filter.status === undefined || ((buffer[at + 46] & FLAG_ERROR) !== 0) === (filter.status === 'error'))
+    );
+  }
+
+  /**
+   * Index rows of a segment (only the rows its summary covers)
+   */
+  private async readRows(segment: Segment): Promise<Buffer> {
+    const buffer = await fs.readFile(this.filePath(segment.id, 'idx'));
+    return buffer.subarray(0, Math.min(buffer.length, segment.count * ROW_SIZE));
+  }
+
+  private async readPage(query: LLMLogQuery): Promise<LLMLogPage> {
+    const limit = Math.min(Math.max(1, Math.floor(query.limit ?? DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE);
+    const cursor = parseCursor(query.cursor);
+    const segments = await this.load();
+    const entries: LLMLogEntry[] = [];
+
+    for (let s = segments.length - 1; s >= 0 && entries.length < limit; s--) {
+      const segment = segments[s];
+      if (cursor && segment.id > cursor.segment) {
+        continue;
+      }
+      const codes = this.segmentFilter(segment, query);
+      if (!codes) {
+        continue;
+      }
+
+      const buffer = await this.readRows(segment);
+      const rowCount = buffer.length / ROW_SIZE;
+      const firstRow = cursor && segment.id === cursor.segment ? Math.min(cursor.row, rowCount) : rowCount;
+      const matches: Array<{ row: number; index: IndexRow }> = [];
+
+      for (let r = firstRow - 1; r >= 0 && entries.length + matches.length < limit; r--) {
+        if (this.rowMatches(buffer, r * ROW_SIZE, query, codes)) {
+          matches.push({ row: r, index: readRow(buffer, r * ROW_SIZE) });
+        }
+      }
+      if (matches.length === 0) {
+        continue;
+      }
+
+      entries.push(...(await this.readEntries(segment, matches.map((match) => match.index))));
+      if (entries.length === limit) {
+        const last = matches[matches.length - 1];
+        return { entries, nextCursor: formatCursor(segment.id, last.row) };
+      }
+    }
+
+    return { entries, nextCursor: null };
+  }
+
+  private async readEntries(segment: Segment, rows: IndexRow[]): Promise<LLMLogEntry[]> {
+    const handle = await fs.open(this.filePath(segment.id, 'log'), 'r');
+    try {
+      const entries: LLMLogEntry[] = [];
+      for (const row of rows) {
+        const buffer = Buffer.alloc(row.length);
+        await handle.read(buffer, 0, row.length, row.offset);
+        entries.push(JSON.parse(buffer.toString('utf-8')) as LLMLogEntry);
+      }
+      return entries;
+    } finally {
+      await handle.close();
+    }
+  }
+
+  private async computeRollups(filter: LLMLogFilter, groupBy: LLMLogGroupBy): Promise<LLMLogRollup[]> {
+    const groups = new Map<string, RollupAccumulator>();
+
+    for (const segment of await this.load()) {
+      const codes = this.segmentFilter(segment, filter);
+      if (!codes) {
+        continue;
+      }
+
+      const buffer = await this.readRows(segment);
+
+      // Groups by dictionary codes within this segment, resolved to names once per segment
+      const segmentGroups = new Map<number, RollupAccumulator>();
+      const groupFor = (at: number): RollupAccumulator => {
+        const providerCode = buffer.readUInt16LE(at + 40);
+        const modelCode = buffer.readUInt16LE(at + 42);
+        const projectCode = buffer.readUInt16LE(at + 44);
+        const code =
+          groupBy === 'model' ? providerCode * 0x10000 + modelCode
+          : groupBy === 'provider' ? providerCode
+          : groupBy === 'project' ? projectCode
+          : 0;
+
+        let group = segmentGroups.get(code);
+        if (!group) {
+          const provider = groupBy === 'provider' || groupBy === 'model' ? segment.providers[providerCode] : undefined;
+          const model = groupBy === 'model' ? segment.models[modelCode] : undefined;
+          const projectId = groupBy === 'project' && projectCode !== NO_PROJECT ? segment.projects[projectCode] : undefined;
+          const key = JSON.stringify([provider, model, projectId]);
+
+          group = groups.get(key);
+          if (!group) {
+            group = {
+              provider,
+              model,
+              projectId,
+              count: 0,
+              errorCount: 0,
+              durations: new DoubleList(),
+              costs: new DoubleList(),
+              inputTokens: 0,
+              outputTokens: 0,
+            };
+            groups.set(key, group);
+          }
+          segmentGroups.set(code, group);
+        }
+        return group;
+      };
+
+      for (let at = 0; at < buffer.length; at += ROW_SIZE) {
+        if (!this.rowMatches(buffer, at, filter, codes)) {
+          continue;
+        }
+
+        const group = groupFor(at);
+        const durationMs = buffer.readDoubleLE(at + 16);
+        const cost = buffer.readDoubleLE(at + 24);
+
+        group.count++;
+        if ((buffer[at + 46] & FLAG_ERROR) !== 0) {
+          group.errorCount++;
+        }
+        if (!Number.isNaN(durationMs)) {
+          group.durations.push(durationMs);
+        }
+        if (!Number.isNaN(cost)) {
+          group.costs.push(cost);
+        }
+        group.inputTokens += buffer.readUInt32LE(at + 32);
+        group.outputTokens += buffer.readUInt32LE(at + 36);
+      }
+    }
+
+    return Array.from(groups.values(), toRollup).sort((a, b) => b.count - a.count);
+  }
+
+  private segmentSize(segment: Segment): number {
+    return segment.bytes + segment.count * ROW_SIZE;
+  }
+
+  private filePath(id: number, extension: string): string {
+    return path.join(this.logDir, `${String(id).padStart(8, '0')}.${extension}`);
+  }
+}
+
+// =============================================================================
+// Helpers
+// =============================================================================
+
+function formatCursor(segment: number, row: number): string {
+  return `${segment}.${row}`;
+}
+
+function parseCursor(cursor: string | undefined): { segment: number; row: number } | null {
+  const match = cursor ? /^(\d+)\.(\d+)$/.exec(cursor) : null;
+  return match ? { segment: Number(match[1]), row: Number(match[2]) } : null;
+}
+
+function toRollup(group: RollupAccumulator): LLMLogRollup {
+  const durations = group.durations.sorted();
+  const costs = group.costs.sorted();
+  const totalDuration = durations.reduce((sum, value) => sum + value, 0);
+  const totalCost = costs.reduce((sum, value) => sum + value, 0);
+
+  const rollup: LLMLogRollup = {
+    count: group.count,
+    errorCount: group.errorCount,
+    latencyMs: {
+      p50: percentile(durations, 0.5),
+      p95: percentile(durations, 0.95),
+      p99: percentile(durations, 0.99),
+      avg: durations.length > 0 ? totalDuration / durations.length : 0,
+      max: durations.length > 0 ? durations[durations.length - 1] : 0,
+    },
+    cost: {
+      p50: percentile(costs, 0.5),
+      p95: percentile(costs, 0.95),
+      p99: percentile(costs, 0.99),
+      total: totalCost,
+      avg: costs.length > 0 ? totalCost / costs.length : 0,
+    },
+    tokens: {
+      input: group.inputTokens,
+      output: group.outputTokens,
+    },
+  };
+  if (group.provider !== undefined) {
+    rollup.provider = group.provider;
+  }
+  if (group.model !== undefined) {
+    rollup.model = group.model;
+  }
+  if (group.projectId !== undefined) {
+    rollup.projectId = group.projectId;
+  }
+  return rollup;
+}
+
+// =============================================================================
+// Shared Instance
+// =============================================================================
+
+let sharedStore: LLMLogStore | null = null;
+
+/**
+ * Get or create the call log store used by the shared logger
+ */
+export function getSharedLogStore(): LLMLogStore {
+  if (!sharedStore) {
+    sharedStore = new LLMLogStore();
+  }
+  return sharedStore;
+}
+
+/**
+ * Replace the shared call log store (tests, custom configuration)
+ */
+export function setSharedLogStore(store: LLMLogStore | null): void {
+  sharedStore = store;
+}
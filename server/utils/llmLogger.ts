@@ -1,9 +1,15 @@
 import type { LLMProvider } from '../../src/types/llm';
+import { getSharedTransport, type LatencyHistogramSnapshot } from './httpTransport';
+import type { LLMLogStore } from './llmLogStore';
 
 /**
  * LLM Logger - Server-side LLM API call logger
  * Thread-safe in-memory logger with automatic log rotation
  *
+ * The in-memory log is a hot tail of the most recent entries. With an
+ * LLMLogStore attached, every completed entry (response or error logged) is
+ * also appended to the durable on-disk call log.
+ *
  * Features:
  * - Request/Response/Error logging
  * - Connection test logging (SPEC-LLM-002)
@@ -12,6 +18,7 @@ import type { LLMProvider } from '../../src/types/llm';
  * - API key masking
  * - Token usage tracking
  * - Cost estimation support
+ * - Latency histograms per provider/model (from the shared HTTP transport)
  */
 
 /**
@@ -27,6 +34,8 @@ export interface LLMLogEntry {
   provider: string;
   /** Model identifier */
   model: string;
+  /** Project the call was made for (if known) */
+  projectId?: string;
   /** Request details */
   request?: {
     /** User prompt (may be truncated) */
@@ -102,18 +111,40 @@ export interface ConnectionTestFailureParams {
   };
 }
 
+/**
+ * LLM Logger options
+ */
+export interface LLMLoggerOptions {
+  /** Durable call log that completed entries are appended to */
+  store?: LLMLogStore | null;
+}
+
 /**
  * LLM Logger Class
  * Thread-safe in-memory logger with automatic log rotation
  */
 export class LLMLogger {
+  private readonly store: LLMLogStore | null;
   private logs: Map<string, LLMLogEntry> = new Map();
   private logOrder: string[] = [];
+  /** Untruncated entries of calls still in flight, persisted on completion */
+  private pending: Map<string, LLMLogEntry> = new Map();
   // 메모리 누수 수정: 최대 로그 개수를 1000에서 100으로 축소하여 메모리 사용량 감소
   private readonly MAX_LOGS = 100;
   // 메모리 누수 수정: 개별 로그 항목의 최대 크기를 10KB로 제한
   private readonly MAX_LOG_SIZE = 10 * 1024; // 10KB in bytes
 
+  constructor(options: LLMLoggerOptions = {}) {
+    this.store = options.store ?? null;
+  }
+
+  /**
+   * Durable call log behind this logger, if any
+   */
+  getStore(): LLMLogStore | null {
+    return this.store;
+  }
+
   /**
    * Log a request to the LLM API
    * Creates a new log entry or updates an existing one
@@ -127,9 +158,11 @@ export class LLMLogger {
       timestamp,
       provider: entry.provider || 'unknown',
       model: entry.model || 'unknown',
+      projectId: entry.projectId,
       request: this.maskSensitiveData(entry.request),
     };
 
+    this.pending.set(id, logEntry);
     this.addLog(id, logEntry);
   }
 
@@ -139,31 +172,35 @@ export class LLMLogger {
    */
   logResponse(entry: Partial<LLMLogEntry>): void {
     const id = entry.id || this.generateId();
-    const existing = this.logs.get(id);
+    const existing = this.pending.get(id) ?? this.logs.get(id);
+    let logEntry: LLMLogEntry;
 
     if (existing) {
       // Update existing entry
-      existing.response = entry.response;
+      logEntry = { ...existing, response: entry.response };
       if (entry.metrics) {
-        existing.metrics = entry.metrics;
+        logEntry.metrics = entry.metrics;
       }
       // Preserve request from new entry if provided (for connection test logs)
       if (entry.request) {
-        existing.request = entry.request;
+        logEntry.request = entry.request;
       }
     } else {
       // Create new entry
-      const logEntry: LLMLogEntry = {
+      logEntry = {
         id,
         timestamp: entry.timestamp || new Date().toISOString(),
         provider: entry.provider || 'unknown',
         model: entry.model || 'unknown',
+        projectId: entry.projectId,
         response: entry.response,
         metrics: entry.metrics,
         request: entry.request,
       };
-      this.addLog(id, logEntry);
     }
+
+    this.addLog(id, logEntry);
+    this.persist(id, logEntry);
   }
 
   /**
@@ -172,27 +209,31 @@ export class LLMLogger {
    */
   logError(entry: Partial<LLMLogEntry>): void {
     const id = entry.id || this.generateId();
-    const existing = this.logs.get(id);
+    const existing = this.pending.get(id) ?? this.logs.get(id);
+    let logEntry: LLMLogEntry;
 
     if (existing) {
       // Update existing entry
-      existing.error = entry.error;
+      logEntry = { ...existing, error: entry.error };
       // Preserve request from new entry if provided (for connection test logs)
       if (entry.request) {
-        existing.request = entry.request;
+        logEntry.request = entry.request;
       }
     } else {
       // Create new entry
-      const logEntry: LLMLogEntry = {
+      logEntry = {
         id,
         timestamp: entry.timestamp || new Date().toISOString(),
         provider: entry.provider || 'unknown',
         model: entry.model || 'unknown',
+        projectId: entry.projectId,
         error: entry.error,
         request: entry.request,
       };
-      this.addLog(id, logEntry);
     }
+
+    this.addLog(id, logEntry);
+    this.persist(id, logEntry);
   }
 
   /**
@@ -205,12 +246,22 @@ export class LLMLogger {
 
   /**
    * Clear all log entries
+   * Only the in-memory hot tail; the durable call log is cleared separately.
    */
   clearLogs(): void {
     this.logs.clear();
+    this.pending.clear();
     this.logOrder = [];
   }
 
+  /**
+   * Get request latency histograms per provider and model
+   * Recorded by the shared HTTP transport for every provider request
+   */
+  getLatencyHistograms(): LatencyHistogramSnapshot[] {
+    return getSharedTransport().getLatencyHistograms();
+  }
+
   /**
    * Log connection test start (SPEC-LLM-002)
    */
@@ -308,6 +359,18 @@ export class LLMLogger {
     );
   }
 
+  /**
+   * Append a completed entry to the durable call log
+   * The store gets the untruncated entry; only the in-memory tail is size
+   * limited. Writes are batched by the store and never block the caller.
+   */
+  private persist(id: string, entry: LLMLogEntry): void {
+    this.pending.delete(id);
+    if (this.store) {
+      this.store.append(entry);
+    }
+  }
+
   /**
    * Add a log entry maintaining order and rotation
    */
@@ -324,6 +387,7 @@ export class LLMLogger {
         const oldestId = this.logOrder.shift();
         if (oldestId) {
           this.logs.delete(oldestId);
+          this.pending.delete(oldestId);
         }
       }
     }
@@ -336,20 +400,21 @@ export class LLMLogger {
    * 주요 필드의 내용을 적절한 길이로 잘라내어 JSON 직렬화 크기를 제한
    */
   private limitLogSize(entry: LLMLogEntry): LLMLogEntry {
+    // Nested objects are copied so the caller's (persisted) entry stays whole
     const limited: LLMLogEntry = { ...entry };
 
     // 프롬프트 및 응답 내용 제한
-    if (limited.request?.prompt) {
-      limited.request.prompt = this.truncateString(limited.request.prompt, 1000);
+    if (entry.request?.prompt) {
+      limited.request = { ...entry.request, prompt: this.truncateString(entry.request.prompt, 1000) };
     }
 
-    if (limited.response?.content) {
-      limited.response.content = this.truncateString(limited.response.content, 2000);
+    if (entry.response?.content) {
+      limited.response = { ...entry.response, content: this.truncateString(entry.response.content, 2000) };
     }
 
     // 에러 메시지 제한
-    if (limited.error?.message) {
-      limited.error.message = this.truncateString(limited.error.message, 500);
+    if (entry.error?.message) {
+      limited.error = { ...entry.error, message: this.truncateString(entry.error.message, 500) };
     }
 
     return limited;
@@ -4,9 +4,10 @@
  * Supports shared logging for debug mode
  */
 
-import type { LLMProvider, LLMProviderSettings } from '../../src/types/llm';
+import { isValidTransportSettings, type LLMProvider, type LLMProviderSettings } from '../../src/types/llm';
 import {
   type LLMProviderInterface,
+  type ProviderConfig,
   OpenAIProvider,
   GeminiProvider,
   LMStudioProvider,
@@ -15,6 +16,7 @@ import {
 import { decryptApiKey, isEncrypted } from './encryption';
 import { LLMLogger } from './llmLogger';
 import type { LLMLogEntry } from './llmLogger';
+import { getSharedLogStore } from './llmLogStore';
 import { calculateCost } from './modelPricing';
 
 /**
@@ -25,10 +27,11 @@ let sharedLogger: LLMLogger | null = null;
 
 /**
  * Get or create the shared logger instance
+ * Completed entries are also appended to the shared durable call log.
  */
 export function getSharedLogger(): LLMLogger {
   if (!sharedLogger) {
-    sharedLogger = new LLMLogger();
+    sharedLogger = new LLMLogger({ store: getSharedLogStore() });
   }
   return sharedLogger;
 }
@@ -42,6 +45,7 @@ export function setSharedLogger(logger: LLMLogger): void {
 
 /**
  * Clear the shared logger instance and reset logs
+ * The durable call log is kept; see LLMLogStore.clear.
  */
 export function clearSharedLogger(): void {
   if (sharedLogger) {
@@ -61,23 +65,39 @@ export function getSharedLogs(): LLMLogEntry[] {
  * Create an LLM provider instance based on settings
  * @param settings - Provider settings including API key and endpoint
  * @param useSharedLogger - Whether to use the shared logger for debug mode
+ * @param projectId - Project the provider is used for (recorded in call logs)
  * @returns LLM provider instance
  */
 export function createLLMProvider(
   settings: LLMProviderSettings,
-  useSharedLogger: boolean = false
+  useSharedLogger: boolean = false,
+  projectId?: string
 ): LLMProviderInterface {
   // Decrypt API key if encrypted
   const apiKey = settings.apiKey && isEncrypted(settings.apiKey)
     ? decryptApiKey(settings.apiKey)
     : settings.apiKey;
 
-  const config = {
+  const config: ProviderConfig = {
     apiKey,
     endpoint: settings.endpoint,
     logger: useSharedLogger ? getSharedLogger() : undefined,
+    projectId,
   };
 
+  // Connection limits configured for the endpoint (server defaults if invalid)
+  const transport = isValidTransportSettings(settings.transport) ? settings.transport : undefined;
+  const { maxSockets, requestsPerSecond, burst } = transport ?? {};
+  if (maxSockets) {
+    config.pool = { maxSockets };
+  }
+  if (requestsPerSecond) {
+    config.rateLimit = {
+      capacity: Math.max(1, burst ?? Math.ceil(requestsPerSecond)),
+      refillPerSecond: requestsPerSecond,
+    };
+  }
+
   switch (settings.provider) {
     case 'openai':
       return new OpenAIProvider(config);
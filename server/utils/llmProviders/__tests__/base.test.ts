@@ -5,6 +5,7 @@
 
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { BaseHTTPProvider } from '../base';
+import { HttpTransport, setSharedTransport } from '../../httpTransport';
 import type { LLMProvider, LLMModelConfig } from '../../../../src/types/llm';
 
 // Mock implementation of BaseHTTPProvider for testing
@@ -33,10 +34,12 @@ describe('BaseHTTPProvider - requiresAuth Flag', () => {
     // Mock fetch globally
     fetchMock = vi.fn();
     global.fetch = fetchMock;
+    setSharedTransport(new HttpTransport({ fetch: fetchMock }));
   });
 
   afterEach(() => {
     vi.restoreAllMocks();
+    setSharedTransport(null);
   });
 
   describe('requiresAuth default value', () => {
@@ -5,6 +5,7 @@
 
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { LMStudioProvider } from '../lmstudio';
+import { HttpTransport, setSharedTransport } from '../../httpTransport';
 import type { LLMModelConfig } from '../../../../src/types/llm';
 
 describe('LMStudioProvider - Refactored Implementation', () => {
@@ -14,10 +15,12 @@ describe('LMStudioProvider - Refactored Implementation', () => {
     // Mock fetch globally
     fetchMock = vi.fn();
     global.fetch = fetchMock;
+    setSharedTransport(new HttpTransport({ fetch: fetchMock }));
   });
 
   afterEach(() => {
     vi.restoreAllMocks();
+    setSharedTransport(null);
   });
 
   describe('requiresAuth configuration', () => {
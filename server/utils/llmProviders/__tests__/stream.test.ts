@@ -0,0 +1,171 @@
+/**
+ * @vitest-environment node
+ */
+/**
+ * Streaming Generation Tests
+ * Providers stream tokens from a local mock server that emits chunked SSE
+ */
+
+import { describe, it, expect, beforeAll, afterAll, vi } from 'vitest';
+import http from 'http';
+import type { AddressInfo } from 'net';
+import { LMStudioProvider } from '../lmstudio';
+import { OpenAIProvider } from '../openai';
+import { GeminiProvider } from '../gemini';
+import { LLMLogger } from '../../llmLogger';
+import type { LLMModelConfig } from '../../../../src/types/llm';
+
+const config: LLMModelConfig = {
+  provider: 'lmstudio',
+  modelId: 'test-model',
+  temperature: 0.7,
+  maxTokens: 1000,
+  topP: 1,
+};
+
+interface RecordedRequest {
+  url: string;
+  headers: http.IncomingHttpHeaders;
+  body: Record<string, unknown>;
+}
+
+describe('Provider streaming', () => {
+  let server: http.Server;
+  let baseUrl: string;
+  let lastRequest: RecordedRequest | null = null;
+  let releaseStream: (() => void) | null = null;
+
+  beforeAll(async () => {
+    server = http.createServer((req, res) => {
+      let raw = '';
+      req.on('data', (chunk) => {
+        raw += chunk;
+      });
+      req.on('end', () => {
+        lastRequest = { url: req.url || '', headers: req.headers, body: JSON.parse(raw || '{}') };
+
+        if (req.url?.startsWith('/fail/')) {
+          res.writeHead(500, { 'Content-Type': 'text/plain' });
+          res.end('model crashed');
+          return;
+        }
+
+        res.writeHead(200, { 'Content-Type': 'text/event-stream' });
+
+        if (req.url?.includes('streamGenerateContent')) {
+          res.write(`data: ${JSON.stringify({ candidates: [{ content: { parts: [{ text: 'Hel' }] } }] })}\n\n`);
+          res.write(`data: ${JSON.stringify({
+            candidates: [{ content: { parts: [{ text: 'lo' }] } }],
+            usageMetadata: { promptTokenCount: 4, candidatesTokenCount: 2, totalTokenCount: 6 },
+          })}\n\n`);
+          res.end();
+          return;
+        }
+
+        // OpenAI-compatible: first token immediately, rest after release
+        res.write(`data: ${JSON.stringify({ choices: [{ index: 0, delta: { content: 'Hello' }, finish_reason: null }] })}\n\n`);
+        releaseStream = () => {
+          releaseStream = null;
+          // Split one event across two writes to exercise the parser
+          const second = `data: ${JSON.stringify({ choices: [{ index: 0, delta: { content: ' world' }, finish_reason: null }] })}\n\n`;
+          res.write(second.slice(0, 10));
+          res.write(second.slice(10));
+          res.write(`data: ${JSON.stringify({
+            choices: [],
+            usage: { prompt_tokens: 12, completion_tokens: 2, total_tokens: 14 },
+          })}\n\n`);
+          res.write('data: [DONE]\n\n');
+          res.end();
+        };
+      });
+    });
+
+    await new Promise<void>((resolve) => server.listen(0, '127.0.0.1', resolve));
+    baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+  });
+
+  afterAll(async () => {
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+  });
+
+  it('should deliver the first token before the response completes', async () => {
+    const provider = new LMStudioProvider({ endpoint: `${baseUrl}/v1` });
+    const tokens: string[] = [];
+
+    const resultPromise = provider.generateStream('test prompt', config, {
+      onToken: (text) => {
+        tokens.push(text);
+        if (tokens.length === 1) {
+          // Server holds the rest of the stream until the first token is seen
+          expect(tokens).toEqual(['Hello']);
+          releaseStream?.();
+        }
+      },
+    });
+
+    const result = await resultPromise;
+
+    expect(tokens).toEqual(['Hello', ' world']);
+    expect(result.success).toBe(true);
+    expect(result.content).toBe('Hello world');
+    expect(result.tokens).toEqual({ input: 12, output: 2 });
+    expect(lastRequest?.body.stream).toBe(true);
+    expect(lastRequest?.headers.authorization).toBeUndefined();
+  });
+
+  it('should send the OpenAI API key as a bearer token', async () => {
+    const provider = new OpenAIProvider({ apiKey: 'sk-test', endpoint: `${baseUrl}/v1` });
+    const tokens: string[] = [];
+
+    const result = await provider.generateStream('test prompt', config, {
+      onToken: (text) => {
+        tokens.push(text);
+        releaseStream?.();
+      },
+    });
+
+    expect(result.content).toBe('Hello world');
+    expect(lastRequest?.headers.authorization).toBe('Bearer sk-test');
+    expect(lastRequest?.body.stream_options).toEqual({ include_usage: true });
+  });
+
+  it('should stream Gemini SSE chunks with usage metadata', async () => {
+    const provider = new GeminiProvider({ apiKey: 'gm-key', endpoint: `${baseUrl}/v1beta` });
+    const tokens: string[] = [];
+
+    const result = await provider.generateStream('test prompt', { ...config, provider: 'gemini' }, {
+      onToken: (text) => tokens.push(text),
+    });
+
+    expect(tokens).toEqual(['Hel', 'lo']);
+    expect(result.tokens).toEqual({ input: 4, output: 2 });
+    expect(lastRequest?.url).toContain(':streamGenerateContent?alt=sse&key=gm-key');
+    expect(lastRequest?.headers.authorization).toBeUndefined();
+  });
+
+  it('should return a failed result when aborted', async () => {
+    const provider = new LMStudioProvider({ endpoint: `${baseUrl}/v1` });
+    const controller = new AbortController();
+
+    const result = await provider.generateStream('test prompt', config, {
+      onToken: () => controller.abort(),
+      signal: controller.signal,
+    });
+    releaseStream?.();
+
+    expect(result.success).toBe(false);
+  });
+
+  it('should log a failed HTTP response once, with its status code', async () => {
+    const logger = new LLMLogger();
+    const logError = vi.spyOn(logger, 'logError');
+    const provider = new LMStudioProvider({ endpoint: `${baseUrl}/fail/v1`, logger });
+
+    const result = await provider.generateStream('test prompt', config, { onToken: () => {} });
+
+    expect(result.success).toBe(false);
+    expect(result.error).toBe('HTTP 500: model crashed');
+    expect(logError).toHaveBeenCalledTimes(1);
+    expect(logger.getLogs()[0].error).toEqual({ message: 'HTTP 500: model crashed', code: '500' });
+  });
+});
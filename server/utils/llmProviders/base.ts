@@ -3,10 +3,19 @@
  * Common interface for all LLM providers
  */
 
+import { createHash } from 'crypto';
 import type { LLMProvider, LLMModelConfig, LLMResult, ConnectionTestResult, ConnectionError, ConnectionErrorCode } from '../../../src/types/llm';
 import { LLMLogger } from '../llmLogger';
-import { extractTokenUsage } from '../tokenExtractor';
+import {
+  getSharedTransport,
+  type HttpPoolOptions,
+  type HttpTransport,
+  type RateLimitOptions,
+  type TransportRequestInit,
+} from '../httpTransport';
+import { extractTokenUsage, type TokenUsage } from '../tokenExtractor';
 import { calculateCost } from '../modelPricing';
+import { readSSEStream } from '../sse';
 
 /**
  * Default retry configuration
@@ -51,6 +60,16 @@ function classifyError(error: unknown): ConnectionError {
       };
     }
 
+    // Rate limited: the transport already waited out Retry-After before giving up
+    if (message.includes('429')) {
+      return {
+        code: 'API_ERROR',
+        message: error.message,
+        retryable: false,
+        details: { originalError: error.message },
+      };
+    }
+
     // Authentication errors
     if (message.includes('unauthorized') || message.includes('authentication') || message.includes('401') || message.includes('403')) {
       return {
@@ -99,6 +118,28 @@ function classifyError(error: unknown): ConnectionError {
   };
 }
 
+/**
+ * Handlers for streaming generation
+ */
+export interface StreamHandlers {
+  /** Called with each text fragment as soon as it arrives */
+  onToken: (text: string) => void;
+  /** Aborts the upstream request when signalled (e.g. client disconnected) */
+  signal?: AbortSignal;
+}
+
+/**
+ * Options for streaming HTTP requests
+ */
+export interface StreamRequestOptions {
+  /** External abort signal */
+  signal?: AbortSignal;
+  /** Abort if no bytes arrive for this long (default: 120000) */
+  idleTimeoutMs?: number;
+  /** Send the Authorization header (default: provider's requiresAuth) */
+  useAuthHeader?: boolean;
+}
+
 /**
  * Common interface that all LLM providers must implement
  */
@@ -106,6 +147,13 @@ export interface LLMProviderInterface {
   /** Provider identifier */
   readonly provider: LLMProvider;
 
+  /**
+   * Whether generation reads files from the working directory
+   * Such output depends on files a response cache key cannot see, so it is
+   * never cached.
+   */
+  readonly readsWorkingDir?: boolean;
+
   /**
    * Generate content using the LLM
    * @param prompt - The prompt to send to the model
@@ -115,6 +163,22 @@ export interface LLMProviderInterface {
    */
   generate(prompt: string, config: LLMModelConfig, workingDir?: string): Promise<LLMResult>;
 
+  /**
+   * Generate content, delivering text to the caller as it is produced
+   * The resolved result carries the full content and final token usage.
+   * @param prompt - The prompt to send to the model
+   * @param config - Model configuration including temperature, maxTokens, etc.
+   * @param handlers - Token callback and optional abort signal
+   * @param workingDir - Working directory for file operations (Claude Code)
+   * @returns Promise with the generation result
+   */
+  generateStream?(
+    prompt: string,
+    config: LLMModelConfig,
+    handlers: StreamHandlers,
+    workingDir?: string
+  ): Promise<LLMResult>;
+
   /**
    * Test the connection to the provider
    * @returns Promise with connection test result
@@ -143,6 +207,10 @@ export interface ProviderConfig {
   logger?: LLMLogger; // Optional shared logger instance
   retryConfig?: Partial<RetryConfig>; // Optional retry configuration
   requiresAuth?: boolean; // Whether provider requires Authorization header (default: true)
+  transport?: HttpTransport; // Optional transport (default: shared pooled transport)
+  projectId?: string; // Project the provider is used for (recorded in call logs)
+  pool?: HttpPoolOptions; // Connection pool for the endpoint (default: transport default)
+  rateLimit?: RateLimitOptions; // Rate limit for the endpoint (default: transport default)
 }
 
 /**
@@ -196,6 +264,8 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
   protected logger: LLMLogger;
   protected retryConfig: RetryConfig;
   protected requiresAuth: boolean; // Whether Authorization header should be included
+  protected transport: HttpTransport;
+  protected projectId?: string;
 
   constructor(config: ProviderConfig, defaultEndpoint: string) {
     this.apiKey = config.apiKey || '';
@@ -203,6 +273,8 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
     this.logger = config.logger || new LLMLogger();
     this.retryConfig = { ...DEFAULT_RETRY_CONFIG, ...config.retryConfig };
     this.requiresAuth = config.requiresAuth ?? true; // Default to true for most providers
+    this.transport = config.transport || getSharedTransport();
+    this.projectId = config.projectId;
   }
 
   abstract generate(prompt: string, config: LLMModelConfig, workingDir?: string): Promise<LLMResult>;
@@ -231,19 +303,24 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
         });
       }
 
-      // Use retry logic for connection test
-      const models = await retryWithBackoff(
-        () => this.getAvailableModels(),
-        this.retryConfig,
-        (attempt, error) => {
-          this.logger.logError({
-            id: `test-${this.provider}-${attempt}`,
-            error: {
-              message: `Retry attempt ${attempt}: ${error.message}`,
-              code: error.code,
-            },
-          });
-        }
+      // Use retry logic for connection test; concurrent tests share one run
+      const models = await this.coalesce('test-connection', () =>
+        retryWithBackoff(
+          () => this.getAvailableModels(),
+          this.retryConfig,
+          (attempt, error) => {
+            this.logger.logError({
+              id: `test-${this.provider}-${attempt}`,
+              provider: this.provider,
+              model: 'connection-test',
+              projectId: projectId ?? this.projectId,
+              error: {
+                message: `Retry attempt ${attempt}: ${error.message}`,
+                code: error.code,
+              },
+            });
+          }
+        )
       );
 
       const latency = Date.now() - startTime;
@@ -289,6 +366,9 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
 
       this.logger.logError({
         id: `test-${this.provider}-failed`,
+        provider: this.provider,
+        model: 'connection-test',
+        projectId: projectId ?? this.projectId,
         error: {
           message: classifiedError.message,
           code: classifiedError.code,
@@ -338,6 +418,7 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
       id: requestId,
       provider: this.provider,
       model: config.modelId,
+      projectId: this.projectId,
       request: {
         prompt: this.truncatePrompt(body),
         parameters: {
@@ -350,6 +431,7 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
 
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
+    let errorCode: string | undefined;
 
     try {
       const headers: Record<string, string> = {
@@ -361,27 +443,18 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
         headers['Authorization'] = `Bearer ${this.apiKey}`;
       }
 
-      const response = await fetch(url, {
+      const response = await this.send(url, {
         method: 'POST',
         headers,
         body: JSON.stringify(body),
         signal: controller.signal,
-      });
+      }, config.modelId);
 
       if (!response.ok) {
         const errorText = await response.text();
-        const error = new Error(`HTTP ${response.status}: ${errorText}`);
-
-        // Log error
-        this.logger.logError({
-          id: requestId,
-          error: {
-            message: error.message,
-            code: response.status.toString(),
-          },
-        });
-
-        throw error;
+        // Logged once, with the status code, by the catch below
+        errorCode = response.status.toString();
+        throw new Error(`HTTP ${response.status}: ${errorText}`);
       }
 
       const data = await response.json() as T;
@@ -420,19 +493,181 @@ export abstract class BaseHTTPProvider implements LLMProviderInterface {
 
       return data;
     } catch (error) {
-      // Log error if not already logged
       if (error instanceof Error) {
         this.logger.logError({
           id: requestId,
           error: {
             message: error.message,
+            code: errorCode,
+          },
+        });
+      }
+      throw error;
+    } finally {
+      clearTimeout(timeoutId);
+    }
+  }
+
+  /**
+   * Make a streaming HTTP request and parse the SSE response
+   * Each event payload is JSON-parsed and handed to onChunk. Token usage is
+   * taken from the last chunk that reports it and logged like makeRequest.
+   * @returns Token usage reported by the stream, if any
+   */
+  protected async makeStreamingRequest(
+    url: string,
+    body: unknown,
+    config: LLMModelConfig,
+    onChunk: (chunk: unknown) => void,
+    options: StreamRequestOptions = {}
+  ): Promise<TokenUsage | undefined> {
+    const { signal, idleTimeoutMs = 120000, useAuthHeader = this.requiresAuth } = options;
+    const requestId = this.generateRequestId();
+    const startTime = Date.now();
+
+    // Log request before API call
+    this.logger.logRequest({
+      id: requestId,
+      provider: this.provider,
+      model: config.modelId,
+      projectId: this.projectId,
+      request: {
+        prompt: this.truncatePrompt(body),
+        parameters: {
+          temperature: config.temperature,
+          maxTokens: config.maxTokens,
+          topP: config.topP,
+          stream: true,
+        },
+      },
+    });
+
+    const controller = new AbortController();
+    const abortFromCaller = () => controller.abort();
+    if (signal?.aborted) {
+      controller.abort();
+    }
+    signal?.addEventListener('abort', abortFromCaller);
+
+    // Idle timeout: reset whenever bytes arrive
+    let timeoutId = setTimeout(() => controller.abort(), idleTimeoutMs);
+    const resetIdleTimeout = () => {
+      clearTimeout(timeoutId);
+      timeoutId = setTimeout(() => controller.abort(), idleTimeoutMs);
+    };
+    let errorCode: string | undefined;
+
+    try {
+      const headers: Record<string, string> = {
+        'Content-Type': 'application/json',
+        Accept: 'text/event-stream',
+      };
+
+      if (useAuthHeader) {
+        headers['Authorization'] = `Bearer ${this.apiKey}`;
+      }
+
+      const response = await this.send(url, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify(body),
+        signal: controller.signal,
+      }, config.modelId);
+
+      if (!response.ok || !response.body) {
+        const errorText = await response.text();
+        // Logged once, with the status code, by the catch below
+        errorCode = response.status.toString();
+        throw new Error(`HTTP ${response.status}: ${errorText}`);
+      }
+
+      let tokenUsage: TokenUsage | undefined;
+      await readSSEStream(
+        response.body,
+        (data) => {
+          if (data === '[DONE]') {
+            return;
+          }
+          const chunk = JSON.parse(data) as unknown;
+          tokenUsage = extractTokenUsage(this.provider, chunk) ?? tokenUsage;
+          onChunk(chunk);
+        },
+        resetIdleTimeout
+      );
+
+      const durationMs = Date.now() - startTime;
+      const estimatedCost = tokenUsage
+        ? calculateCost(this.provider, config.modelId, tokenUsage.prompt_tokens, tokenUsage.completion_tokens)
+        : 0;
+
+      this.logger.logResponse({
+        id: requestId,
+        response: tokenUsage ? { usage: tokenUsage } : undefined,
+        metrics: {
+          duration_ms: durationMs,
+          estimated_cost: estimatedCost > 0 ? estimatedCost : undefined,
+        },
+      });
+
+      return tokenUsage;
+    } catch (error) {
+      if (error instanceof Error) {
+        this.logger.logError({
+          id: requestId,
+          error: {
+            message: error.message,
+            code: errorCode,
           },
         });
       }
       throw error;
     } finally {
       clearTimeout(timeoutId);
+      signal?.removeEventListener('abort', abortFromCaller);
+    }
+  }
+
+  /**
+   * Apply connection pool and rate limit settings to this provider's endpoint
+   * Called by subclass constructors, once `provider` is set. Providers are
+   * created per request, so unchanged settings keep the existing pool and
+   * rate limiter.
+   * @param pool - Pool options; the transport default when omitted
+   * @param rateLimit - Rate limit; the transport default when omitted
+   */
+  protected configureTransport(pool?: HttpPoolOptions, rateLimit?: RateLimitOptions): void {
+    if (pool) {
+      this.transport.configurePool(this.endpoint, pool);
     }
+    if (rateLimit) {
+      this.transport.configureRateLimit(this.provider, rateLimit, this.endpoint);
+    }
+  }
+
+  /**
+   * Send a request through the shared transport
+   * Pools connections and rate-limits per provider endpoint.
+   * @param url - Full request URL
+   * @param init - Method, headers, body and abort signal
+   * @param model - Model ID for latency histograms
+   */
+  protected send(url: string, init: TransportRequestInit, model?: string): Promise<Response> {
+    return this.transport.request(url, init, {
+      provider: this.provider,
+      model,
+      baseUrl: this.endpoint,
+    });
+  }
+
+  /**
+   * Share one run of an operation between concurrent identical calls
+   * Calls with the same provider, endpoint and API key are identical.
+   * @param operation - Operation name, e.g. 'list-models'
+   * @param run - Performs the operation
+   */
+  protected coalesce<T>(operation: string, run: () => Promise<T>): Promise<T> {
+    const keyHash = createHash('sha256').update(this.apiKey).digest('hex').slice(0, 16);
+    return this.transport.singleFlight(`${this.provider}:${operation}:${this.endpoint}:${keyHash}`, run);
   }
 
   /**
@@ -4,8 +4,8 @@
  */
 
 import type { LLMModelConfig, LLMResult, ConnectionTestResult } from '../../../src/types/llm';
-import type { LLMProviderInterface, ProviderConfig } from './base';
-import { callClaudeCode, ClaudeCodeError, ClaudeCodeTimeoutError } from '../claudeCodeRunner';
+import type { LLMProviderInterface, ProviderConfig, StreamHandlers } from './base';
+import { callClaudeCode, callClaudeCodeStream, ClaudeCodeError, ClaudeCodeTimeoutError } from '../claudeCodeRunner';
 import { LLMLogger } from '../llmLogger';
 
 /**
@@ -15,14 +15,17 @@ import { LLMLogger } from '../llmLogger';
  */
 export class ClaudeCodeProvider implements LLMProviderInterface {
   readonly provider = 'claude-code' as const;
+  // Generation runs with Read/Grep over the working directory
+  readonly readsWorkingDir = true;
   private logger: LLMLogger;
+  private projectId?: string;
   // 메모리 누수 수정: setTimeout ID를 저장하여 타이머 정리 가능
   private testTimeoutId: NodeJS.Timeout | null = null;
 
-  // eslint-disable-next-line @typescript-eslint/no-unused-vars
-  constructor(_config?: ProviderConfig) {
-    // Claude Code doesn't need configuration - uses CLI
-    this.logger = new LLMLogger();
+  constructor(config?: ProviderConfig) {
+    // Claude Code doesn't need credentials - uses CLI; only logging is configurable
+    this.logger = config?.logger || new LLMLogger();
+    this.projectId = config?.projectId;
   }
 
   async generate(prompt: string, config: LLMModelConfig, workingDir?: string): Promise<LLMResult> {
@@ -35,6 +38,7 @@ export class ClaudeCodeProvider implements LLMProviderInterface {
       id: requestId,
       provider: this.provider,
       model: config.modelId || 'claude-3.5-sonnet',
+      projectId: this.projectId,
       request: {
         prompt: this.truncatePrompt(prompt),
         parameters: {
@@ -122,6 +126,86 @@ export class ClaudeCodeProvider implements LLMProviderInterface {
     }
   }
 
+  async generateStream(
+    prompt: string,
+    config: LLMModelConfig,
+    handlers: StreamHandlers,
+    workingDir?: string
+  ): Promise<LLMResult> {
+    const effectiveWorkingDir = workingDir || process.cwd();
+    const requestId = this.generateRequestId();
+    const startTime = Date.now();
+    const model = config.modelId || 'claude-3.5-sonnet';
+
+    // Log request
+    this.logger.logRequest({
+      id: requestId,
+      provider: this.provider,
+      model,
+      projectId: this.projectId,
+      request: {
+        prompt: this.truncatePrompt(prompt),
+        parameters: {
+          timeout: 180000,
+          allowedTools: ['Read', 'Grep'],
+          stream: true,
+        },
+      },
+    });
+
+    try {
+      const result = await callClaudeCodeStream(prompt, effectiveWorkingDir, {
+        timeout: 180000, // 3 minutes for document generation
+        allowedTools: ['Read', 'Grep'], // Read-only for generation
+        onText: handlers.onToken,
+        signal: handlers.signal,
+      });
+
+      this.logger.logResponse({
+        id: requestId,
+        response: {
+          content: result.content.substring(0, 200), // Truncate for logging
+          usage: result.usage ? {
+            prompt_tokens: result.usage.input,
+            completion_tokens: result.usage.output,
+            total_tokens: result.usage.input + result.usage.output,
+          } : undefined,
+        },
+        metrics: {
+          duration_ms: Date.now() - startTime,
+        },
+      });
+
+      return {
+        success: true,
+        content: result.content,
+        rawOutput: result.rawOutput,
+        provider: this.provider,
+        model,
+        tokens: result.usage ?? undefined,
+      };
+    } catch (error) {
+      if (error instanceof Error) {
+        this.logger.logError({
+          id: requestId,
+          error: {
+            message: error.message,
+            code: error instanceof ClaudeCodeTimeoutError ? 'TIMEOUT' : error instanceof ClaudeCodeError ? 'CLAUDE_CODE_ERROR' : undefined,
+          },
+        });
+      }
+
+      return {
+        success: false,
+        error: error instanceof ClaudeCodeTimeoutError
+          ? `Generation timed out after ${error.timeout / 1000} seconds`
+          : error instanceof Error ? error.message : 'Unknown error',
+        provider: this.provider,
+        model: config.modelId,
+      };
+    }
+  }
+
   async testConnection(): Promise<ConnectionTestResult> {
     // Claude Code is always available if CLI is installed
     try {
@@ -4,7 +4,7 @@
  */
 
 import type { LLMModelConfig, LLMResult, ConnectionTestResult } from '../../../src/types/llm';
-import { BaseHTTPProvider, type ProviderConfig } from './base';
+import { BaseHTTPProvider, type ProviderConfig, type StreamHandlers } from './base';
 import { extractTokenUsage } from '../tokenExtractor';
 import { calculateCost } from '../modelPricing';
 
@@ -48,6 +48,7 @@ export class GeminiProvider extends BaseHTTPProvider {
 
   constructor(config: ProviderConfig) {
     super(config, GEMINI_API_ENDPOINT);
+    this.configureTransport(config.pool, config.rateLimit);
   }
 
   async generate(prompt: string, config: LLMModelConfig): Promise<LLMResult> {
@@ -104,53 +105,121 @@ export class GeminiProvider extends BaseHTTPProvider {
     }
   }
 
-  async testConnection(): Promise<ConnectionTestResult> {
+  async generateStream(
+    prompt: string,
+    config: LLMModelConfig,
+    handlers: StreamHandlers
+  ): Promise<LLMResult> {
     if (!this.apiKey) {
       return {
         success: false,
-        error: 'API key not configured',
+        error: 'Google AI API key not configured',
+        provider: this.provider,
+        model: config.modelId,
       };
     }
 
-    const startTime = Date.now();
-
     try {
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 10000);
+      // alt=sse switches streamGenerateContent to Server-Sent Events
+      const url = `${this.endpoint}/models/${config.modelId}:streamGenerateContent?alt=sse&key=${this.apiKey}`;
 
-      // List models to test connection
-      const response = await fetch(
-        `${this.endpoint}/models?key=${this.apiKey}`,
+      let content = '';
+      const usage = await this.makeStreamingRequest(
+        url,
         {
-          method: 'GET',
-          signal: controller.signal,
-        }
+          contents: [
+            {
+              parts: [{ text: prompt }],
+            },
+          ],
+          generationConfig: {
+            temperature: config.temperature,
+            maxOutputTokens: config.maxTokens,
+            topP: config.topP,
+          },
+        },
+        config,
+        (chunk) => {
+          const parts = (chunk as Partial<GeminiGenerateResponse>).candidates?.[0]?.content?.parts || [];
+          const text = parts.map((part) => part.text || '').join('');
+          if (text) {
+            content += text;
+            handlers.onToken(text);
+          }
+        },
+        { signal: handlers.signal, useAuthHeader: false } // Gemini uses the key query param
       );
 
-      clearTimeout(timeoutId);
-
-      if (!response.ok) {
-        const errorText = await response.text();
-        return {
-          success: false,
-          error: `HTTP ${response.status}: ${errorText}`,
-        };
-      }
-
-      const data = await response.json() as GeminiModelsResponse;
-      const models = this.filterGenerativeModels(data.models);
-
       return {
         success: true,
-        latency: Date.now() - startTime,
-        models,
+        content,
+        provider: this.provider,
+        model: config.modelId,
+        tokens: usage ? {
+          input: usage.prompt_tokens,
+          output: usage.completion_tokens,
+        } : undefined,
       };
     } catch (error) {
       return {
         success: false,
         error: error instanceof Error ? error.message : 'Unknown error',
+        provider: this.provider,
+        model: config.modelId,
+      };
+    }
+  }
+
+  async testConnection(): Promise<ConnectionTestResult> {
+    if (!this.apiKey) {
+      return {
+        success: false,
+        error: 'API key not configured',
       };
     }
+
+    // Concurrent tests against the same endpoint and key share one request
+    return this.coalesce('test-connection', async () => {
+      const startTime = Date.now();
+
+      try {
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), 10000);
+
+        // List models to test connection
+        const response = await this.send(
+          `${this.endpoint}/models?key=${this.apiKey}`,
+          {
+            method: 'GET',
+            signal: controller.signal,
+          }
+        );
+
+        clearTimeout(timeoutId);
+
+        if (!response.ok) {
+          const errorText = await response.text();
+          return {
+            success: false,
+            error: `HTTP ${response.status}: ${errorText}`,
+          };
+        }
+
+        const data = await response.json() as GeminiModelsResponse;
+        const models = this.filterGenerativeModels(data.models);
+
+        return {
+          success: true,
+          latency: Date.now() - startTime,
+          models,
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: error instanceof Error ? error.message : 'Unknown error',
+        };
+      }
+    });
   }
 
   async getAvailableModels(): Promise<string[]> {
@@ -175,6 +244,7 @@ export class GeminiProvider extends BaseHTTPProvider {
       id: requestId,
       provider: this.provider,
       model: config.modelId,
+      projectId: this.projectId,
       request: {
         prompt: this.truncatePrompt(body),
         parameters: {
@@ -189,14 +259,14 @@ export class GeminiProvider extends BaseHTTPProvider {
     const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
 
     try {
-      const response = await fetch(url, {
+      const response = await this.send(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify(body),
         signal: controller.signal,
-      });
+      }, config.modelId);
 
       if (!response.ok) {
         const errorText = await response.text();
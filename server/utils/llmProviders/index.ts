@@ -4,7 +4,7 @@
  */
 
 // Re-export base types and classes
-export type { LLMProviderInterface, ProviderConfig } from './base';
+export type { LLMProviderInterface, ProviderConfig, StreamHandlers } from './base';
 export { BaseHTTPProvider } from './base';
 
 // Re-export individual providers
@@ -4,12 +4,21 @@
  */
 
 import type { LLMModelConfig, LLMResult } from '../../../src/types/llm';
-import { BaseHTTPProvider, type ProviderConfig } from './base';
+import { BaseHTTPProvider, type ProviderConfig, type StreamHandlers } from './base';
+import { extractChatCompletionDelta } from './openai';
 import { extractTokenUsage } from '../tokenExtractor';
 import { calculateCost } from '../modelPricing';
+import type { HttpPoolOptions, RateLimitOptions } from '../httpTransport';
 
 const LMSTUDIO_DEFAULT_ENDPOINT = 'http://localhost:1234/v1';
 
+/**
+ * A local server works through requests a few at a time and has no quota, so
+ * keep few connections open and only guard against runaway loops
+ */
+const LMSTUDIO_POOL: HttpPoolOptions = { maxSockets: 4, maxFreeSockets: 2 };
+const LMSTUDIO_RATE_LIMIT: RateLimitOptions = { capacity: 100, refillPerSecond: 50 };
+
 // LMStudio uses OpenAI-compatible API format
 interface LMStudioChatMessage {
   role: 'system' | 'user' | 'assistant';
@@ -53,6 +62,7 @@ export class LMStudioProvider extends BaseHTTPProvider {
     super(config, config.endpoint || LMSTUDIO_DEFAULT_ENDPOINT);
     // LMStudio doesn't require API key but set a default for logging
     this.apiKey = config.apiKey || 'lm-studio';
+    this.configureTransport(config.pool ?? LMSTUDIO_POOL, config.rateLimit ?? LMSTUDIO_RATE_LIMIT);
   }
 
   async generate(prompt: string, config: LLMModelConfig): Promise<LLMResult> {
@@ -95,31 +105,87 @@ export class LMStudioProvider extends BaseHTTPProvider {
     }
   }
 
+  async generateStream(
+    prompt: string,
+    config: LLMModelConfig,
+    handlers: StreamHandlers
+  ): Promise<LLMResult> {
+    try {
+      let content = '';
+      const usage = await this.makeStreamingRequest(
+        `${this.endpoint}/chat/completions`,
+        {
+          model: config.modelId || 'local-model',
+          messages: [
+            { role: 'user', content: prompt },
+          ],
+          temperature: config.temperature,
+          max_tokens: config.maxTokens,
+          top_p: config.topP,
+          stream: true,
+          stream_options: { include_usage: true },
+        },
+        config,
+        (chunk) => {
+          const text = extractChatCompletionDelta(chunk);
+          if (text) {
+            content += text;
+            handlers.onToken(text);
+          }
+        },
+        { signal: handlers.signal }
+      );
+
+      return {
+        success: true,
+        content,
+        provider: this.provider,
+        model: config.modelId || 'local-model',
+        tokens: usage ? {
+          input: usage.prompt_tokens,
+          output: usage.completion_tokens,
+        } : undefined,
+      };
+    } catch (error) {
+      return {
+        success: false,
+        error: error instanceof Error ? error.message : 'Unknown error',
+        provider: this.provider,
+        model: config.modelId,
+      };
+    }
+  }
+
   /**
    * Get available models from LM Studio server
    * Calls /models endpoint directly with 5 second timeout
+   * Concurrent calls share one request
    * Returns empty array on error (server not running or other issues)
    */
   async getAvailableModels(): Promise<string[]> {
-    try {
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 5000);
+    return this.coalesce('list-models', async () => {
+      try {
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), 5000);
+
+        const response = await this.send(`${this.endpoint}/models`, {
+          method: 'GET',
+          signal: controller.signal,
+        });
 
-      const response = await fetch(`${this.endpoint}/models`, {
-        method: 'GET',
-        signal: controller.signal,
-      });
+        clearTimeout(timeoutId);
 
-      clearTimeout(timeoutId);
+        if (!response.ok) {
+          // Release the pooled connection
+          await response.body?.cancel();
+          return [];
+        }
 
-      if (!response.ok) {
+        const data = await response.json() as LMStudioModelsResponse;
+        return data.data?.map(m => m.id) || [];
+      } catch {
         return [];
       }
-
-      const data = await response.json() as LMStudioModelsResponse;
-      return data.data?.map(m => m.id) || [];
-    } catch {
-      return [];
-    }
+    });
   }
 }
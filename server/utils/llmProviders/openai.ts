@@ -4,7 +4,7 @@
  */
 
 import type { LLMModelConfig, LLMResult, ConnectionTestResult } from '../../../src/types/llm';
-import { BaseHTTPProvider, type ProviderConfig } from './base';
+import { BaseHTTPProvider, type ProviderConfig, type StreamHandlers } from './base';
 
 const OPENAI_API_ENDPOINT = 'https://api.openai.com/v1';
 
@@ -31,6 +31,16 @@ interface OpenAIChatCompletionResponse {
   };
 }
 
+interface OpenAIChatCompletionChunk {
+  choices?: Array<{
+    index: number;
+    delta?: {
+      content?: string | null;
+    };
+    finish_reason: string | null;
+  }>;
+}
+
 interface OpenAIModelsResponse {
   data: Array<{
     id: string;
@@ -39,6 +49,15 @@ interface OpenAIModelsResponse {
   }>;
 }
 
+/**
+ * Extract the text delta from an OpenAI-compatible streaming chunk
+ * Shared with other OpenAI-compatible providers (LMStudio)
+ */
+export function extractChatCompletionDelta(chunk: unknown): string {
+  const choices = (chunk as OpenAIChatCompletionChunk | null)?.choices;
+  return choices?.[0]?.delta?.content || '';
+}
+
 /**
  * OpenAI Provider
  * Supports: gpt-4o, gpt-4o-mini, gpt-4-turbo
@@ -48,6 +67,7 @@ export class OpenAIProvider extends BaseHTTPProvider {
 
   constructor(config: ProviderConfig) {
     super(config, OPENAI_API_ENDPOINT);
+    this.configureTransport(config.pool, config.rateLimit);
   }
 
   async generate(prompt: string, config: LLMModelConfig): Promise<LLMResult> {
@@ -98,53 +118,116 @@ export class OpenAIProvider extends BaseHTTPProvider {
     }
   }
 
-  async testConnection(): Promise<ConnectionTestResult> {
+  async generateStream(
+    prompt: string,
+    config: LLMModelConfig,
+    handlers: StreamHandlers
+  ): Promise<LLMResult> {
     if (!this.apiKey) {
       return {
         success: false,
-        error: 'API key not configured',
+        error: 'OpenAI API key not configured',
+        provider: this.provider,
+        model: config.modelId,
       };
     }
 
-    const startTime = Date.now();
-
     try {
-      // Use models endpoint to test connection
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 10000);
-
-      const response = await fetch(`${this.endpoint}/models`, {
-        method: 'GET',
-        headers: {
-          'Authorization': `Bearer ${this.apiKey}`,
+      let content = '';
+      const usage = await this.makeStreamingRequest(
+        `${this.endpoint}/chat/completions`,
+        {
+          model: config.modelId,
+          messages: [
+            { role: 'user', content: prompt },
+          ],
+          temperature: config.temperature,
+          max_tokens: config.maxTokens,
+          top_p: config.topP,
+          stream: true,
+          stream_options: { include_usage: true },
         },
-        signal: controller.signal,
-      });
-
-      clearTimeout(timeoutId);
-
-      if (!response.ok) {
-        const errorText = await response.text();
-        return {
-          success: false,
-          error: `HTTP ${response.status}: ${errorText}`,
-        };
-      }
-
-      const data = await response.json() as OpenAIModelsResponse;
-      const models = this.filterChatModels(data.data.map(m => m.id));
+        config,
+        (chunk) => {
+          const text = extractChatCompletionDelta(chunk);
+          if (text) {
+            content += text;
+            handlers.onToken(text);
+          }
+        },
+        { signal: handlers.signal }
+      );
 
       return {
         success: true,
-        latency: Date.now() - startTime,
-        models,
+        content,
+        provider: this.provider,
+        model: config.modelId,
+        tokens: usage ? {
+          input: usage.prompt_tokens,
+          output: usage.completion_tokens,
+        } : undefined,
       };
     } catch (error) {
       return {
         success: false,
         error: error instanceof Error ? error.message : 'Unknown error',
+        provider: this.provider,
+        model: config.modelId,
+      };
+    }
+  }
+
+  async testConnection(): Promise<ConnectionTestResult> {
+    if (!this.apiKey) {
+      return {
+        success: false,
+        error: 'API key not configured',
       };
     }
+
+    // Concurrent tests against the same endpoint and key share one request
+    return this.coalesce('test-connection', async () => {
+      const startTime = Date.now();
+
+      try {
+        // Use models endpoint to test connection
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), 10000);
+
+        const response = await this.send(`${this.endpoint}/models`, {
+          method: 'GET',
+          headers: {
+            'Authorization': `Bearer ${this.apiKey}`,
+          },
+          signal: controller.signal,
+        });
+
+        clearTimeout(timeoutId);
+
+        if (!response.ok) {
+          const errorText = await response.text();
+          return {
+            success: false,
+            error: `HTTP ${response.status}: ${errorText}`,
+          };
+        }
+
+        const data = await response.json() as OpenAIModelsResponse;
+        const models = this.filterChatModels(data.data.map(m => m.id));
+
+        return {
+          success: true,
+          latency: Date.now() - startTime,
+          models,
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: error instanceof Error ? error.message : 'Unknown error',
+        };
+      }
+    });
   }
 
   async getAvailableModels(): Promise<string[]> {
@@ -154,8 +237,13 @@ export class OpenAIProvider extends BaseHTTPProvider {
 
   /**
    * Filter models to only include chat-capable models
+   * OpenAI-compatible endpoints (e.g. GLM) list their own model names, so
+   * filtering only applies to the OpenAI API itself.
    */
   private filterChatModels(modelIds: string[]): string[] {
+    if (this.endpoint !== OPENAI_API_ENDPOINT) {
+      return modelIds;
+    }
     const chatModelPrefixes = ['gpt-4', 'gpt-3.5'];
     return modelIds.filter(id =>
       chatModelPrefixes.some(prefix => id.startsWith(prefix))
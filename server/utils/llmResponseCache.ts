@@ -0,0 +1,563 @@
+/**
+ * LLM Response Cache
+ * Content-addressed cache for deterministic LLM requests: a bounded in-memory
+ * LRU in front of an on-disk tier under the workspace, with TTL and
+ * size-based eviction and hit/miss/tokens-saved accounting.
+ */
+
+import fs from 'fs/promises';
+import path from 'path';
+import { createHash } from 'crypto';
+import type { LLMModelConfig, LLMProvider, LLMResult } from '../../src/types/llm';
+import type { LLMProviderInterface, StreamHandlers } from './llmProviders';
+import { writeFileAtomic } from './atomicFile';
+import { calculateCost } from './modelPricing';
+
+/**
+ * Default on-disk location for cached responses
+ */
+export const LLM_CACHE_PATH = path.join(process.cwd(), 'workspace/llm-cache');
+
+const DEFAULT_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+const DEFAULT_MAX_MEMORY_ENTRIES = 200;
+const DEFAULT_MAX_MEMORY_BYTES = 32 * 1024 * 1024;
+const DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024;
+
+/**
+ * Fraction of the disk budget to shrink to once it is exceeded, so that
+ * eviction does not run again on the very next write
+ */
+const DISK_EVICTION_TARGET = 0.9;
+
+// =============================================================================
+// Types
+// =============================================================================
+
+export interface LLMResponseCacheOptions {
+  cacheDir?: string;
+  ttlMs?: number;
+  maxMemoryEntries?: number;
+  maxMemoryBytes?: number;
+  maxDiskBytes?: number;
+}
+
+/**
+ * Everything that influences a model response and therefore the cache key
+ */
+export interface ResponseCacheKeyParts {
+  provider: LLMProvider;
+  config: LLMModelConfig;
+  prompt: string;
+  endpoint?: string;
+}
+
+export interface ResponseCacheStats {
+  hits: number;
+  memoryHits: number;
+  diskHits: number;
+  misses: number;
+  stores: number;
+  evictions: number;
+  memoryEntries: number;
+  memoryBytes: number;
+  diskEntries: number;
+  diskBytes: number;
+  tokensSaved: {
+    input: number;
+    output: number;
+  };
+  costSaved: number;
+}
+
+interface CacheEntry {
+  key: string;
+  createdAt: number;
+  /** Creation time plus the TTL the entry was stored with */
+  expiresAt: number;
+  result: LLMResult;
+}
+
+/**
+ * Disk index entry
+ * Entry files are written once, so their mtime is set to the expiry time and
+ * their atime records the last access.
+ */
+interface DiskEntryInfo {
+  size: number;
+  expiresAt: number;
+  lastAccess: number;
+}
+
+// =============================================================================
+// Cache
+// =============================================================================
+
+/**
+ * Two-tier LLM response cache
+ * Memory entries are kept in Map insertion order, which doubles as LRU order.
+ * The disk index is built lazily from the cache directory on first use.
+ */
+export class LLMResponseCache {
+  private readonly cacheDir: string;
+  private readonly ttlMs: number;
+  private readonly maxMemoryEntries: number;
+  private readonly maxMemoryBytes: number;
+  private readonly maxDiskBytes: number;
+
+  private memory = new Map<string, { entry: CacheEntry; size: number }>();
+  private memoryBytes = 0;
+  private diskIndex: Map<string, DiskEntryInfo> | null = null;
+  private diskIndexLoading: Promise<Map<string, DiskEntryInfo>> | null = null;
+  private diskBytes = 0;
+  /** Earliest time an indexed disk entry can expire */
+  private nextExpiry = Infinity;
+
+  private counters = {
+    memoryHits: 0,
+    diskHits: 0,
+    misses: 0,
+    stores: 0,
+    evictions: 0,
+    inputTokensSaved: 0,
+    outputTokensSaved: 0,
+    costSaved: 0,
+  };
+
+  constructor(options: LLMResponseCacheOptions = {}) {
+    this.cacheDir = options.cacheDir ?? LLM_CACHE_PATH;
+    this.ttlMs = options.ttlMs ?? DEFAULT_TTL_MS;
+    this.maxMemoryEntries = options.maxMemoryEntries ?? DEFAULT_MAX_MEMORY_ENTRIES;
+    this.maxMemoryBytes = options.maxMemoryBytes ?? DEFAULT_MAX_MEMORY_BYTES;
+    this.maxDiskBytes = options.maxDiskBytes ?? DEFAULT_MAX_DISK_BYTES;
+  }
+
+  /**
+   * Build a content-addressed key for a request
+   * Only fields that change the model output take part in the hash.
+   */
+  static createKey(parts: ResponseCacheKeyParts): string {
+    const { provider, config, prompt, endpoint } = parts;
+    const material = JSON.stringify({
+      provider,
+      model: config.modelId,
+      temperature: config.temperature,
+      maxTokens: config.maxTokens,
+      topP: config.topP,
+      endpoint: endpoint ?? null,
+      prompt,
+    });
+    return createHash('sha256').update(material).digest('hex');
+  }
+
+  /**
+   * Look up a cached result
+   * @param key - Key from createKey()
+   * @param ttlMs - Optional per-call TTL overriding the cache default
+   * @returns A copy of the cached result, or null on miss
+   */
+  async get(key: string, ttlMs: number = this.ttlMs): Promise<LLMResult | null> {
+    const now = Date.now();
+
+    const cached = this.memory.get(key);
+    if (cached) {
+      if (now - cached.entry.createdAt <= ttlMs) {
+        // Move to the most recently used position
+        this.memory.delete(key);
+        this.memory.set(key, cached);
+        this.touchDisk(key, cached.entry.expiresAt, now);
+        this.recordHit(cached.entry.result, 'memory');
+        return structuredClone(cached.entry.result);
+      }
+      this.removeFromMemory(key);
+    }
+
+    const entry = await this.readDiskEntry(key);
+    if (entry && now - entry.createdAt <= ttlMs) {
+      this.addToMemory(entry);
+      this.touchDisk(key, entry.expiresAt, now);
+      this.recordHit(entry.result, 'disk');
+      return structuredClone(entry.result);
+    }
+
+    this.counters.misses++;
+    return null;
+  }
+
+  /**
+   * Store a successful result
+   * Failed results are never cached. Disk write errors are swallowed; the
+   * memory tier still serves the entry.
+   * @param ttlMs - Optional per-call TTL; the disk tier drops the entry once
+   *   it has passed
+   */
+  async set(key: string, result: LLMResult, ttlMs: number = this.ttlMs): Promise<void> {
+    if (!result.success) {
+      return;
+    }
+
+    const createdAt = Date.now();
+    const entry: CacheEntry = { key, createdAt, expiresAt: createdAt + ttlMs, result: structuredClone(result) };
+    this.addToMemory(entry);
+    this.counters.stores++;
+
+    try {
+      const index = await this.loadDiskIndex();
+      const content = JSON.stringify(entry);
+      const filePath = this.getEntryPath(key);
+      await fs.mkdir(path.dirname(filePath), { recursive: true });
+      await writeFileAtomic(filePath, content);
+      await fs.utimes(filePath, new Date(entry.createdAt), new Date(entry.expiresAt));
+
+      const previous = index.get(key);
+      const size = Buffer.byteLength(content);
+      this.diskBytes += size - (previous?.size ?? 0);
+      index.set(key, { size, expiresAt: entry.expiresAt, lastAccess: entry.createdAt });
+      this.nextExpiry = Math.min(this.nextExpiry, entry.expiresAt);
+
+      await this.sweepExpired(index);
+      if (this.diskBytes > this.maxDiskBytes) {
+        await this.evictDisk(index);
+      }
+    } catch (error) {
+      console.warn('Failed to persist LLM response cache entry:', error);
+    }
+  }
+
+  /**
+   * Remove every entry from both tiers
+   */
+  async clear(): Promise<void> {
+    this.memory.clear();
+    this.memoryBytes = 0;
+    this.diskIndex = null;
+    this.diskIndexLoading = null;
+    this.diskBytes = 0;
+    this.nextExpiry = Infinity;
+    await fs.rm(this.cacheDir, { recursive: true, force: true });
+  }
+
+  /**
+   * Hit/miss counters and the tokens and cost the cache has avoided
+   */
+  getStats(): ResponseCacheStats {
+    const { memoryHits, diskHits, misses, stores, evictions } = this.counters;
+    return {
+      hits: memoryHits + diskHits,
+      memoryHits,
+      diskHits,
+      misses,
+      stores,
+      evictions,
+      memoryEntries: this.memory.size,
+      memoryBytes: this.memoryBytes,
+      diskEntries: this.diskIndex?.size ?? 0,
+      diskBytes: this.diskBytes,
+      tokensSaved: {
+        input: this.counters.inputTokensSaved,
+        output: this.counters.outputTokensSaved,
+      },
+      costSaved: this.counters.costSaved,
+    };
+  }
+
+  /**
+   * Reset counters without dropping cached entries
+   */
+  resetStats(): void {
+    for (const key of Object.keys(this.counters) as Array<keyof typeof this.counters>) {
+      this.counters[key] = 0;
+    }
+  }
+
+  // ===========================================================================
+  // Internals
+  // ===========================================================================
+
+  private getEntryPath(key: string): string {
+    return path.join(this.cacheDir, key.slice(0, 2), `${key}.json`);
+  }
+
+  private recordHit(result: LLMResult, tier: 'memory' | 'disk'): void {
+    if (tier === 'memory') {
+      this.counters.memoryHits++;
+    } else {
+      this.counters.diskHits++;
+    }
+
+    if (result.tokens) {
+      this.counters.inputTokensSaved += result.tokens.input;
+      this.counters.outputTokensSaved += result.tokens.output;
+      this.counters.costSaved += calculateCost(
+        result.provider,
+        result.model,
+        result.tokens.input,
+        result.tokens.output
+      );
+    }
+  }
+
+  private addToMemory(entry: CacheEntry): void {
+    this.removeFromMemory(entry.key);
+
+    const size = Buffer.byteLength(JSON.stringify(entry));
+    if (size > this.maxMemoryBytes) {
+      return;
+    }
+
+    this.memory.set(entry.key, { entry, size });
+    this.memoryBytes += size;
+
+    while (this.memory.size > this.maxMemoryEntries || this.memoryBytes > this.maxMemoryBytes) {
+      const oldestKey = this.memory.keys().next().value as string;
+      this.removeFromMemory(oldestKey);
+      this.counters.evictions++;
+    }
+  }
+
+  private removeFromMemory(key: string): void {
+    const cached = this.memory.get(key);
+    if (cached) {
+      this.memory.delete(key);
+      this.memoryBytes -= cached.size;
+    }
+  }
+
+  private async readDiskEntry(key: string): Promise<CacheEntry | null> {
+    try {
+      const content = await fs.readFile(this.getEntryPath(key), 'utf-8');
+      const entry = JSON.parse(content) as CacheEntry;
+      return entry.key === key ? entry : null;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Record access time in the disk index; LRU order survives restarts via
+   * the file atime, which is updated in the background while the mtime keeps
+   * the expiry time
+   */
+  private touchDisk(key: string, expiresAt: number, now: number): void {
+    const info = this.diskIndex?.get(key);
+    if (info) {
+      info.lastAccess = now;
+    }
+    fs.utimes(this.getEntryPath(key), new Date(now), new Date(expiresAt)).catch(() => {
+      // Entry may have been evicted concurrently
+    });
+  }
+
+  private async loadDiskIndex(): Promise<Map<string, DiskEntryInfo>> {
+    if (this.diskIndex) {
+      return this.diskIndex;
+    }
+    if (!this.diskIndexLoading) {
+      this.diskIndexLoading = this.scanDisk().then(async (index) => {
+        this.diskIndex = index;
+        this.diskBytes = 0;
+        this.nextExpiry = 0;
+        for (const info of index.values()) {
+          this.diskBytes += info.size;
+        }
+        await this.sweepExpired(index);
+        return index;
+      });
+    }
+    return this.diskIndexLoading;
+  }
+
+  private async scanDisk(): Promise<Map<string, DiskEntryInfo>> {
+    const index = new Map<string, DiskEntryInfo>();
+    let shards: string[];
+    try {
+      shards = await fs.readdir(this.cacheDir);
+    } catch {
+      return index;
+    }
+
+    for (const shard of shards) {
+      let files: string[];
+      try {
+        files = await fs.readdir(path.join(this.cacheDir, shard));
+      } catch {
+        continue;
+      }
+      for (const file of files) {
+        if (!file.endsWith('.json') || file.startsWith('.')) {
+          continue;
+        }
+        try {
+          const stat = await fs.stat(path.join(this.cacheDir, shard, file));
+          index.set(file.slice(0, -'.json'.length), {
+            size: stat.size,
+            expiresAt: stat.mtimeMs,
+            lastAccess: stat.atimeMs,
+          });
+        } catch {
+          // Removed while scanning
+        }
+      }
+    }
+    return index;
+  }
+
+  /**
+   * Drop entries past their expiry
+   * Each entry expires by the TTL it was stored with, so a project with a
+   * longer per-project TTL keeps its entries on disk that long. Runs only
+   * once the earliest indexed expiry has passed, so most writes skip the scan.
+   */
+  private async sweepExpired(index: Map<string, DiskEntryInfo>): Promise<void> {
+    const now = Date.now();
+    if (now < this.nextExpiry) {
+      return;
+    }
+
+    let nextExpiry = Infinity;
+    for (const [key, info] of [...index.entries()]) {
+      if (now > info.expiresAt) {
+        await this.removeFromDisk(index, key, info);
+      } else {
+        nextExpiry = Math.min(nextExpiry, info.expiresAt);
+      }
+    }
+    this.nextExpiry = nextExpiry;
+  }
+
+  /**
+   * Drop least recently used entries until the disk tier is back under its
+   * target size
+   */
+  private async evictDisk(index: Map<string, DiskEntryInfo>): Promise<void> {
+    const target = this.maxDiskBytes * DISK_EVICTION_TARGET;
+    const byAccess = [...index.entries()].sort((a, b) => a[1].lastAccess - b[1].lastAccess);
+
+    for (const [key, info] of byAccess) {
+      if (this.diskBytes <= target) {
+        break;
+      }
+      await this.removeFromDisk(index, key, info);
+    }
+  }
+
+  private async removeFromDisk(
+    index: Map<string, DiskEntryInfo>,
+    key: string,
+    info: DiskEntryInfo
+  ): Promise<void> {
+    index.delete(key);
+    this.diskBytes -= info.size;
+    this.removeFromMemory(key);
+    this.counters.evictions++;
+    await fs.rm(this.getEntryPath(key), { force: true });
+  }
+}
+
+// =============================================================================
+// Shared Instance
+// =============================================================================
+
+let sharedCache: LLMResponseCache | null = null;
+
+/**
+ * Get or create the process-wide response cache
+ */
+export function getSharedResponseCache(): LLMResponseCache {
+  if (!sharedCache) {
+    sharedCache = new LLMResponseCache();
+  }
+  return sharedCache;
+}
+
+/**
+ * Replace the process-wide response cache (used by tests)
+ */
+export function setSharedResponseCache(cache: LLMResponseCache | null): void {
+  sharedCache = cache;
+}
+
+// =============================================================================
+// Provider Wrapper
+// =============================================================================
+
+export interface ResponseCacheProviderOptions {
+  cache?: LLMResponseCache;
+  ttlMs?: number;
+  endpoint?: string;
+}
+
+/**
+ * Wrap a provider so identical requests are served from the cache
+ * Results served from the cache are marked `cached`. Streaming requests that
+ * hit the cache deliver the stored content as a single token. Providers that
+ * read the working directory while generating are returned unwrapped: their
+ * output depends on files the key cannot see.
+ * @param provider - Provider to delegate misses to
+ * @param options - Cache instance, per-project TTL and endpoint for the key
+ */
+export function withResponseCache(
+  provider: LLMProviderInterface,
+  options: ResponseCacheProviderOptions = {}
+): LLMProviderInterface {
+  if (provider.readsWorkingDir) {
+    return provider;
+  }
+
+  const cache = options.cache ?? getSharedResponseCache();
+
+  const keyFor = (prompt: string, config: LLMModelConfig): string =>
+    LLMResponseCache.createKey({
+      provider: provider.provider,
+      config,
+      prompt,
+      endpoint: options.endpoint,
+    });
+
+  const cached: LLMProviderInterface = {
+    provider: provider.provider,
+
+    async generate(prompt: string, config: LLMModelConfig, workingDir?: string): Promise<LLMResult> {
+      const key = keyFor(prompt, config);
+      const hit = await cache.get(key, options.ttlMs);
+      if (hit) {
+        return { ...hit, cached: true };
+      }
+
+      const result = await provider.generate(prompt, config, workingDir);
+      await cache.set(key, result, options.ttlMs);
+      return result;
+    },
+
+    testConnection: () => provider.testConnection(),
+    getAvailableModels: () => provider.getAvailableModels(),
+  };
+
+  if (provider.generateStream) {
+    const generateStream = provider.generateStream.bind(provider);
+    cached.generateStream = async (
+      prompt: string,
+      config: LLMModelConfig,
+      handlers: StreamHandlers,
+      workingDir?: string
+    ): Promise<LLMResult> => {
+      const key = keyFor(prompt, config);
+      const hit = await cache.get(key, options.ttlMs);
+      if (hit) {
+        if (hit.content) {
+          handlers.onToken(hit.content);
+        }
+        return { ...hit, cached: true };
+      }
+
+      const result = await generateStream(prompt, config, handlers, workingDir);
+      await cache.set(key, result, options.ttlMs);
+      return result;
+    };
+  }
+
+  if (provider.cleanup) {
+    cached.cleanup = provider.cleanup.bind(provider);
+  }
+
+  return cached;
+}
@@ -13,14 +13,25 @@ import type {
   PassthroughPipelineStatus,
 } from '../../src/types/passthrough.ts';
 import type { Task } from '../../src/types/index.ts';
-import type { LLMProvider } from '../../src/types/llm.ts';
+import type {
+  LLMModelConfig,
+  LLMProviderSettings,
+  ProjectLLMSettings,
+  TaskStage,
+} from '../../src/types/llm.ts';
+import {
+  createDefaultModelConfig,
+  getModelConfigForStage,
+  isProviderConfigured,
+} from '../../src/types/llm.ts';
 import type { LLMProviderInterface } from './llmProvider.ts';
 
 // Storage operations
 import {
   createPipeline,
+  createDefaultPipelineStages,
   savePipeline,
-  getPipelineById,
+  getPipelineByTaskId,
   updatePipelineStatus,
   updateStageProgress,
 } from './passthroughStorage.ts';
@@ -33,6 +44,7 @@ import { getLLMSettingsOrDefault } from './llmSettingsStorage.ts';
 
 // LLM provider
 import { createLLMProvider } from './llmProvider.ts';
+import { withResponseCache } from './llmResponseCache.ts';
 
 // Prompt builders
 import {
@@ -41,13 +53,25 @@ import {
   buildPrototypePrompt,
 } from './promptBuilder.ts';
 
-// Claude Code runner
-import { callClaudeCode } from './claudeCodeRunner.ts';
-
 // =============================================================================
 // Types
 // =============================================================================
 
+/**
+ * Pause/cancel request delivered to a running pipeline
+ */
+export type PipelineSignal = 'pause' | 'cancel';
+
+/**
+ * Live control channel between the scheduler and a running pipeline
+ */
+export interface PipelineControl {
+  /** Latest pause/cancel request, checked before each stage */
+  signal: PipelineSignal | null;
+  /** Reports the run time of each stage attempt */
+  onStageFinished?: (stage: PassthroughStageName, durationMs: number, success: boolean) => void;
+}
+
 /**
  * Options for running a pipeline
  */
@@ -60,6 +84,8 @@ export interface PipelineRunnerOptions {
   maxRetries?: number;
   /** Stage to resume from (for retry scenarios) */
   resumeFromStage?: PassthroughStageName | null;
+  /** Pause/cancel signalling and stage timing (set by the scheduler) */
+  control?: PipelineControl;
 }
 
 /**
@@ -73,7 +99,9 @@ export interface StageRunnerOptions {
   /** Task context */
   task: Task;
   /** LLM settings to use */
-  llmSettings: any;
+  llmSettings: ProjectLLMSettings;
+  /** Project the pipeline belongs to (recorded on LLM call logs) */
+  projectId?: string;
 }
 
 /**
@@ -103,7 +131,7 @@ export interface ErrorHandlerOptions {
 export async function runPipeline(
   options: PipelineRunnerOptions
 ): Promise<PassthroughPipeline> {
-  const { taskId, qaSessionId, maxRetries = 3, resumeFromStage } = options;
+  const { taskId, qaSessionId, maxRetries = 3, resumeFromStage, control } = options;
 
   // Get task information
   const taskResult = await getTaskById(taskId);
@@ -116,13 +144,10 @@ export async function runPipeline(
   const llmSettings = await getLLMSettingsOrDefault(projectId);
 
   // Check if pipeline already exists (resume scenario)
-  let pipeline = await getPipelineById(taskId);
+  let pipeline = await getPipelineByTaskId(taskId);
   if (!pipeline) {
     // Create new pipeline
-    pipeline = await createPipeline({
-      taskId,
-      qaSessionId,
-    });
+    pipeline = await createPipeline(taskId, qaSessionId, createDefaultPipelineStages());
   }
 
   // Determine starting stage
@@ -133,24 +158,25 @@ export async function runPipeline(
       throw new Error(`Invalid resume stage: ${resumeFromStage}`);
     }
   } else if (pipeline.currentStage) {
-    // Resume from current stage if pipeline is paused
-    stageIndex = pipeline.stages.findIndex((s) => s.name === pipeline.currentStage);
+    // Resume after the last completed stage if pipeline is paused
+    const nextStage = getNextStage(pipeline);
+    stageIndex = nextStage
+      ? Math.max(0, pipeline.stages.findIndex((s) => s.name === nextStage))
+      : pipeline.stages.length;
   }
 
   // Execute each stage
   for (let i = stageIndex; i < pipeline.stages.length; i++) {
     const stage = pipeline.stages[i];
 
-    // Check if pipeline was paused or cancelled before starting stage
-    pipeline = await getPipelineById(pipeline.id) || pipeline;
-
-    if (isPipelinePaused(pipeline)) {
+    // Pause/cancel requests are signalled directly before each stage
+    if (control?.signal === 'pause') {
       pipeline.status = 'paused';
       await updatePipelineStatus(pipeline.id, 'paused');
       return pipeline;
     }
 
-    if (isPipelineCancelled(pipeline)) {
+    if (control?.signal === 'cancel') {
       pipeline.status = 'cancelled';
       await updatePipelineStatus(pipeline.id, 'cancelled');
       return pipeline;
@@ -161,6 +187,7 @@ export async function runPipeline(
     let stageCompleted = false;
 
     while (retryCount <= maxRetries && !stageCompleted) {
+      const attemptStartedAt = Date.now();
       try {
         // Update stage to running (only on first attempt, don't save)
         if (retryCount === 0) {
@@ -175,17 +202,23 @@ export async function runPipeline(
           stage,
           task,
           llmSettings,
+          projectId,
         });
 
         // Update stage in pipeline as completed
         const stageIndexInPipeline = pipeline.stages.findIndex((s) => s.id === stage.id);
         pipeline.stages[stageIndexInPipeline] = updatedStage;
+        control?.onStageFinished?.(stage.name, Date.now() - attemptStartedAt, true);
+
+        // Record the completed stage so getNextStage() can resume after it
+        pipeline.currentStage = stage.name;
 
         // Save only after successful completion
         await savePipeline(pipeline);
         stageCompleted = true;
       } catch (error) {
         retryCount++;
+        control?.onStageFinished?.(stage.name, Date.now() - attemptStartedAt, false);
 
         // Handle error
         const errorHandlerResult = await handleStageError({
@@ -213,7 +246,6 @@ export async function runPipeline(
     }
 
     // Update overall progress (don't save, will save after next stage completes)
-    pipeline.currentStage = stage.name;
     pipeline.status = 'running';
     if (!pipeline.startedAt) {
       pipeline.startedAt = new Date().toISOString();
@@ -229,7 +261,6 @@ export async function runPipeline(
   }
 
   // All stages completed
-  pipeline = await getPipelineById(pipeline.id) || pipeline;
   pipeline.status = 'completed';
   pipeline.currentStage = null;
   pipeline.completedAt = new Date().toISOString();
@@ -250,18 +281,89 @@ export async function runPipeline(
 // Stage Execution
 // =============================================================================
 
+/**
+ * Project stage configuration used by each document stage
+ */
+const STAGE_CONFIG_KEYS: Partial<Record<PassthroughStageName, TaskStage>> = {
+  design_doc: 'design',
+  prd: 'prd',
+};
+
+/**
+ * Claude Code needs no credentials, so it is always available
+ */
+const CLAUDE_CODE_SETTINGS: LLMProviderSettings = {
+  provider: 'claude-code',
+  apiKey: '',
+  isEnabled: true,
+  connectionStatus: 'connected',
+};
+
+/**
+ * Model configuration a stage runs with
+ * The design document and PRD stages use the project's stage configuration,
+ * like the generate routes. The prototype stage always runs on Claude Code.
+ */
+export function getStageModelConfig(
+  llmSettings: ProjectLLMSettings,
+  stageName: PassthroughStageName
+): LLMModelConfig {
+  const stage = STAGE_CONFIG_KEYS[stageName];
+  return stage
+    ? getModelConfigForStage(llmSettings.taskStageConfig, stage)
+    : createDefaultModelConfig('claude-code', 'claude-3.5-sonnet');
+}
+
+/**
+ * Resolve the model a stage runs on
+ * A configured provider other than Claude Code must be enabled and set up.
+ * @returns Model configuration and the settings of the provider serving it
+ */
+export function resolveStageModel(
+  llmSettings: ProjectLLMSettings,
+  stageName: PassthroughStageName
+): { config: LLMModelConfig; providerSettings: LLMProviderSettings } {
+  const config = getStageModelConfig(llmSettings, stageName);
+
+  if (config.provider === 'claude-code') {
+    return { config, providerSettings: CLAUDE_CODE_SETTINGS };
+  }
+
+  const providerSettings = llmSettings.providers.find((p) => p.provider === config.provider);
+  if (!providerSettings) {
+    throw new Error(`Provider ${config.provider} not found in settings`);
+  }
+  if (!providerSettings.isEnabled) {
+    throw new Error(`Provider ${config.provider} is not enabled. Please enable it in project settings.`);
+  }
+  if (!isProviderConfigured(providerSettings)) {
+    throw new Error(`Provider ${config.provider} is not configured. Please add API key or configure endpoint.`);
+  }
+  return { config, providerSettings };
+}
+
 /**
  * Run a single pipeline stage
  */
 export async function runStage(options: StageRunnerOptions): Promise<PassthroughStage> {
-  const { pipeline, stage, task, llmSettings } = options;
+  const { pipeline, stage, task, llmSettings, projectId } = options;
 
   // Update progress
   const updatedStage: PassthroughStage = { ...stage, status: 'running', progress: 50 };
 
   try {
-    // Create LLM provider
-    const provider = createLLMProvider(llmSettings);
+    // Create LLM provider for this stage
+    const { config, providerSettings } = resolveStageModel(llmSettings, stage.name);
+    let provider = createLLMProvider(providerSettings, true, projectId);
+
+    // Serve stage retries and re-runs from the response cache when enabled
+    if (llmSettings.responseCache?.enabled) {
+      const { ttlHours } = llmSettings.responseCache;
+      provider = withResponseCache(provider, {
+        endpoint: providerSettings.endpoint,
+        ttlMs: ttlHours !== undefined ? ttlHours * 60 * 60 * 1000 : undefined,
+      });
+    }
 
     // Build prompt based on stage
     let prompt = '';
@@ -274,7 +376,7 @@ export async function runStage(options: StageRunnerOptions): Promise<Passthrough
           qaAnswers: task.qaAnswers,
           references: [],
         });
-        result = await generateDocumentContent(provider, prompt, task);
+        result = await generateDocumentContent(provider, config, prompt);
         // Update task with design document
         await updateTask(task.id, { designDocument: result });
         break;
@@ -284,7 +386,7 @@ export async function runStage(options: StageRunnerOptions): Promise<Passthrough
           designDocument: task.designDocument || '',
           references: [],
         });
-        result = await generateDocumentContent(provider, prompt, task);
+        result = await generateDocumentContent(provider, config, prompt);
         // Update task with PRD
         await updateTask(task.id, { prd: result });
         break;
@@ -294,7 +396,7 @@ export async function runStage(options: StageRunnerOptions): Promise<Passthrough
           prd: task.prd || '',
           techStack: [],
         });
-        result = await generatePrototypeCode(provider, prompt, task);
+        result = await generatePrototypeCode(provider, config, prompt);
         // Update task with prototype
         await updateTask(task.id, { prototype: result });
         break;
@@ -327,29 +429,14 @@ export async function runStage(options: StageRunnerOptions): Promise<Passthrough
  */
 async function generateDocumentContent(
   provider: LLMProviderInterface,
-  prompt: string,
-  task: Task
+  config: LLMModelConfig,
+  prompt: string
 ): Promise<string> {
-  // Try using provider's generateText method
-  if ('generateText' in provider && typeof provider.generateText === 'function') {
-    const result = await provider.generateText(prompt);
-    return result;
-  }
-
-  // Fallback to chat method
-  if ('chat' in provider && typeof provider.chat === 'function') {
-    const result = await provider.chat([
-      { role: 'user', content: prompt },
-    ]);
-    return result.content || result.text || '';
+  const result = await provider.generate(prompt, config, process.cwd());
+  if (result.success && result.content) {
+    return result.content;
   }
-
-  // Final fallback to Claude Code runner
-  const result = await callClaudeCode(prompt, process.cwd(), { timeout: 120000 });
-  if (result.success && result.output) {
-    return typeof result.output === 'string' ? result.output : JSON.stringify(result.output);
-  }
-  throw new Error('Failed to generate document content');
+  throw new Error(result.error || 'Failed to generate document content');
 }
 
 /**
@@ -357,18 +444,14 @@ async function generateDocumentContent(
  */
 async function generatePrototypeCode(
   provider: LLMProviderInterface,
-  prompt: string,
-  task: Task
+  config: LLMModelConfig,
+  prompt: string
 ): Promise<string> {
-  try {
-    const result = await callClaudeCode(prompt, process.cwd(), { timeout: 180000 });
-    if (result.success && result.output) {
-      return typeof result.output === 'string' ? result.output : JSON.stringify(result.output);
-    }
-    throw new Error('Failed to generate prototype code');
-  } catch (error) {
-    throw new Error(`Prototype generation failed: ${(error as Error).message}`);
+  const result = await provider.generate(prompt, config, process.cwd());
+  if (result.success && result.content) {
+    return result.content;
   }
+  throw new Error(`Prototype generation failed: ${result.error || 'Failed to generate prototype code'}`);
 }
 
 // =============================================================================
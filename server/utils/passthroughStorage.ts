@@ -6,7 +6,14 @@ import * as fs from 'fs/promises';
 import * as path from 'path';
 import { fileURLToPath } from 'url';
 import { v4 as uuidv4 } from 'uuid';
-import type { PassthroughPipeline, PassthroughStage, PassthroughStageError } from '../../src/types/passthrough';
+import type {
+  PassthroughPipeline,
+  PassthroughStage,
+  PassthroughStageError,
+  PassthroughStageName,
+} from '../../src/types/passthrough';
+import type { LLMProvider } from '../../src/types/llm';
+import { writeFileAtomic } from './atomicFile';
 
 // Get directory path for ES modules
 const __filename = fileURLToPath(import.meta.url);
@@ -18,6 +25,37 @@ const __dirname = path.dirname(__filename);
 export const PIPELINES_DIR = process.env.MOAI_TEST_PIPELINE_DIR ||
   path.resolve(__dirname, '../../workspace/passthrough-pipelines');
 
+/**
+ * Path to the durable scheduler queue
+ * Kept in a subdirectory so listPipelines() never mistakes it for a pipeline
+ */
+export const PIPELINE_QUEUE_PATH = path.join(PIPELINES_DIR, 'queue', 'jobs.json');
+
+/**
+ * Display names for the default pipeline stages, in execution order
+ */
+const DEFAULT_STAGES: Array<{ name: PassthroughStageName; displayName: string }> = [
+  { name: 'design_doc', displayName: 'Design Document' },
+  { name: 'prd', displayName: 'Product Requirements Document' },
+  { name: 'prototype', displayName: 'Prototype' },
+];
+
+/**
+ * Job waiting for or holding a scheduler worker
+ */
+export interface PipelineQueueJob {
+  pipelineId: string;
+  taskId: string;
+  projectId: string;
+  qaSessionId: string;
+  /** Providers whose concurrency limits the job counts against */
+  providers: LLMProvider[];
+  /** Stage to start from when the job is dispatched */
+  resumeFromStage: PassthroughStageName | null;
+  state: 'queued' | 'running';
+  enqueuedAt: string;
+}
+
 /**
  * Ensure pipelines directory exists
  */
@@ -43,6 +81,22 @@ function getPipelineFilePathByTaskId(taskId: string): string {
   return path.join(PIPELINES_DIR, `task-${taskId}.json`);
 }
 
+/**
+ * Create the design_doc -> prd -> prototype stages for a new pipeline
+ */
+export function createDefaultPipelineStages(): PassthroughStage[] {
+  return DEFAULT_STAGES.map(({ name, displayName }) => ({
+    id: `stage-${name}`,
+    name,
+    displayName,
+    status: 'pending',
+    startedAt: null,
+    completedAt: null,
+    error: null,
+    progress: 0,
+  }));
+}
+
 /**
  * Create a new passthrough pipeline
  */
@@ -277,3 +331,24 @@ export async function updateStageProgress(
   await savePipeline(pipeline);
   return pipeline;
 }
+
+/**
+ * Load the scheduler queue persisted by savePipelineQueue
+ */
+export async function loadPipelineQueue(): Promise<PipelineQueueJob[]> {
+  try {
+    const content = await fs.readFile(PIPELINE_QUEUE_PATH, 'utf-8');
+    const jobs = JSON.parse(content);
+    return Array.isArray(jobs) ? (jobs as PipelineQueueJob[]) : [];
+  } catch {
+    return [];
+  }
+}
+
+/**
+ * Persist the scheduler queue (queued and running jobs)
+ */
+export async function savePipelineQueue(jobs: PipelineQueueJob[]): Promise<void> {
+  await fs.mkdir(path.dirname(PIPELINE_QUEUE_PATH), { recursive: true });
+  await writeFileAtomic(PIPELINE_QUEUE_PATH, JSON.stringify(jobs, null, 2));
+}
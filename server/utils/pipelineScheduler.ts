@@ -0,0 +1,503 @@
+/**
+ * Passthrough Pipeline Scheduler
+ * SPEC-PASSTHROUGH-001: Runs queued pipelines on a bounded worker pool
+ *
+ * Features:
+ * - Durable job queue under PIPELINES_DIR, resumed after a restart from the
+ *   stage getNextStage() reports
+ * - Global worker limit plus per-provider concurrency limits
+ * - Fair dispatch across projects (least recently served project first)
+ * - Direct pause/cancel signalling to running pipelines
+ * - Queue depth, wait time and per-stage run time metrics
+ */
+
+import type {
+  PassthroughPipeline,
+  PassthroughPipelineStatus,
+  PassthroughStageName,
+} from '../../src/types/passthrough.ts';
+import type { LLMProvider } from '../../src/types/llm.ts';
+import {
+  PIPELINE_QUEUE_PATH,
+  getPipelineById,
+  loadPipelineQueue,
+  savePipelineQueue,
+  updatePipelineStatus,
+  type PipelineQueueJob,
+} from './passthroughStorage.ts';
+import {
+  runPipeline,
+  getNextStage,
+  getStageModelConfig,
+  type PipelineControl,
+  type PipelineRunnerOptions,
+  type PipelineSignal,
+} from './passthroughRunner.ts';
+import { getTaskById } from './taskStorage.ts';
+import { getLLMSettingsOrDefault } from './llmSettingsStorage.ts';
+import { withFileLock } from './atomicFile.ts';
+
+// =============================================================================
+// Types
+// =============================================================================
+
+/**
+ * Scheduler configuration
+ */
+export interface PipelineSchedulerOptions {
+  /** Maximum pipelines running at once across all providers (default: 4) */
+  maxWorkers?: number;
+  /** Maximum pipelines running at once per provider (default: maxWorkers) */
+  providerLimits?: Partial<Record<LLMProvider, number>>;
+  /** Pipeline executor (default: runPipeline) */
+  runner?: (options: PipelineRunnerOptions) => Promise<PassthroughPipeline>;
+  /** Resolves which providers a project's pipeline stages run on */
+  resolveProviders?: (projectId: string) => Promise<LLMProvider[]>;
+}
+
+/**
+ * Options for queueing a pipeline
+ */
+export interface EnqueuePipelineOptions {
+  /** Project the task belongs to (looked up from the task when omitted) */
+  projectId?: string;
+  /** Stage to start from (default: first stage) */
+  resumeFromStage?: PassthroughStageName | null;
+}
+
+/**
+ * Aggregated run time statistics
+ */
+export interface DurationStats {
+  count: number;
+  averageMs: number;
+  maxMs: number;
+}
+
+/**
+ * Snapshot returned by the metrics endpoint
+ */
+export interface PipelineSchedulerMetrics {
+  maxWorkers: number;
+  providerLimits: Partial<Record<LLMProvider, number>>;
+  queueDepth: number;
+  queuedByProject: Record<string, number>;
+  queuedByProvider: Partial<Record<LLMProvider, number>>;
+  running: number;
+  runningByProvider: Partial<Record<LLMProvider, number>>;
+  waitTime: DurationStats & { oldestQueuedMs: number };
+  stageRunTime: Partial<Record<PassthroughStageName, DurationStats & { failures: number }>>;
+  outcomes: Partial<Record<PassthroughPipelineStatus, number>>;
+}
+
+interface RunningJob {
+  job: PipelineQueueJob;
+  control: PipelineControl;
+  done: Promise<void>;
+}
+
+interface DurationAccumulator {
+  count: number;
+  totalMs: number;
+  maxMs: number;
+  failures: number;
+}
+
+// =============================================================================
+// Defaults
+// =============================================================================
+
+const DEFAULT_MAX_WORKERS = 4;
+
+/**
+ * Claude Code spawns a local CLI process per stage, so it gets a tighter
+ * default limit than the HTTP providers
+ */
+const DEFAULT_PROVIDER_LIMITS: Partial<Record<LLMProvider, number>> = {
+  'claude-code': 2,
+};
+
+/**
+ * Parse a provider limit list such as "claude-code=2,openai=4"
+ */
+export function parseProviderLimits(value: string | undefined): Partial<Record<LLMProvider, number>> {
+  const limits: Partial<Record<LLMProvider, number>> = {};
+  if (!value) {
+    return limits;
+  }
+
+  for (const entry of value.split(',')) {
+    const [provider, limit] = entry.split('=').map((part) => part.trim());
+    const parsed = Number.parseInt(limit, 10);
+    if (provider && Number.isFinite(parsed) && parsed > 0) {
+      limits[provider as LLMProvider] = parsed;
+    }
+  }
+  return limits;
+}
+
+/**
+ * Default provider resolution: every provider the pipeline's stages run on
+ * A job holds a slot with each of them for its whole run, so a pipeline
+ * whose prototype stage runs on Claude Code always counts against Claude
+ * Code's limit.
+ */
+async function resolvePipelineProviders(projectId: string): Promise<LLMProvider[]> {
+  const settings = await getLLMSettingsOrDefault(projectId);
+  const stageOrder: PassthroughStageName[] = ['design_doc', 'prd', 'prototype'];
+  const providers = new Set(stageOrder.map((stage) => getStageModelConfig(settings, stage).provider));
+  return [...providers];
+}
+
+function summarize(acc: DurationAccumulator): DurationStats {
+  return {
+    count: acc.count,
+    averageMs: acc.count > 0 ? Math.round(acc.totalMs / acc.count) : 0,
+    maxMs: acc.maxMs,
+  };
+}
+
+function record(acc: DurationAccumulator, durationMs: number): void {
+  acc.count++;
+  acc.totalMs += durationMs;
+  acc.maxMs = Math.max(acc.maxMs, durationMs);
+}
+
+// =============================================================================
+// Scheduler
+// =============================================================================
+
+/**
+ * Bounded worker pool for passthrough pipelines
+ */
+export class PipelineScheduler {
+  private readonly maxWorkers: number;
+  private readonly providerLimits: Partial<Record<LLMProvider, number>>;
+  private readonly runner: (options: PipelineRunnerOptions) => Promise<PassthroughPipeline>;
+  private readonly resolveProviders: (projectId: string) => Promise<LLMProvider[]>;
+
+  /** Queued jobs in arrival order */
+  private queue: PipelineQueueJob[] = [];
+  private running = new Map<string, RunningJob>();
+  private runningByProvider = new Map<LLMProvider, number>();
+
+  /** Dispatch sequence number of each project's most recent job */
+  private lastServed = new Map<string, number>();
+  private dispatchSeq = 0;
+
+  /** Restore of the persisted queue; enqueue waits for it before writing */
+  private starting: Promise<void> | null = null;
+  private persisting: Promise<void> = Promise.resolve();
+
+  private waitTime: DurationAccumulator = { count: 0, totalMs: 0, maxMs: 0, failures: 0 };
+  private stageRunTime = new Map<PassthroughStageName, DurationAccumulator>();
+  private outcomes = new Map<PassthroughPipelineStatus, number>();
+
+  constructor(options: PipelineSchedulerOptions = {}) {
+    this.maxWorkers = Math.max(1, options.maxWorkers ?? DEFAULT_MAX_WORKERS);
+    this.providerLimits = { ...DEFAULT_PROVIDER_LIMITS, ...options.providerLimits };
+    this.runner = options.runner ?? runPipeline;
+    this.resolveProviders = options.resolveProviders ?? resolvePipelineProviders;
+  }
+
+  /**
+   * Restore the persisted queue and start dispatching
+   * Jobs that were running when the server stopped continue from the stage
+   * after the last one their pipeline completed. Safe to call repeatedly;
+   * every caller waits for the same restore.
+   */
+  start(): Promise<void> {
+    if (!this.starting) {
+      this.starting = this.restore().catch((error) => {
+        // Allow a later call to retry
+        this.starting = null;
+        throw error;
+      });
+    }
+    return this.starting;
+  }
+
+  private async restore(): Promise<void> {
+    const restored: PipelineQueueJob[] = [];
+    for (const job of await loadPipelineQueue()) {
+      if (this.isKnown(job.pipelineId)) {
+        continue;
+      }
+
+      if (job.state === 'running') {
+        const pipeline = await getPipelineById(job.pipelineId);
+        if (!pipeline || pipeline.status === 'paused' || pipeline.status === 'cancelled') {
+          continue;
+        }
+        if (pipeline.currentStage) {
+          const nextStage = getNextStage(pipeline);
+          if (!nextStage) {
+            continue;
+          }
+          job.resumeFromStage = nextStage;
+        }
+      }
+
+      restored.push({ ...job, state: 'queued' });
+    }
+
+    // Restored jobs were queued first, so they go ahead of anything new
+    this.queue = [...restored, ...this.queue];
+    await this.persist();
+    this.dispatch();
+  }
+
+  /**
+   * Queue a pipeline for execution
+   * Queueing a pipeline that is already queued or running is a no-op, except
+   * that it withdraws a pause that has not taken effect yet. The persisted
+   * queue is restored first, so writing the new job cannot overwrite it.
+   */
+  async enqueue(pipeline: PassthroughPipeline, options: EnqueuePipelineOptions = {}): Promise<void> {
+    await this.start();
+
+    const running = this.running.get(pipeline.id);
+    if (running) {
+      if (running.control.signal === 'pause') {
+        running.control.signal = null;
+      }
+      return;
+    }
+    if (this.queue.some((job) => job.pipelineId === pipeline.id)) {
+      return;
+    }
+
+    let projectId = options.projectId;
+    if (!projectId) {
+      const taskResult = await getTaskById(pipeline.taskId);
+      if (!taskResult) {
+        throw new Error(`Task not found: ${pipeline.taskId}`);
+      }
+      projectId = taskResult.projectId;
+    }
+
+    this.queue.push({
+      pipelineId: pipeline.id,
+      taskId: pipeline.taskId,
+      projectId,
+      qaSessionId: pipeline.qaSessionId,
+      providers: await this.resolveProviders(projectId),
+      resumeFromStage: options.resumeFromStage ?? null,
+      state: 'queued',
+      enqueuedAt: new Date().toISOString(),
+    });
+
+    await this.persist();
+    this.dispatch();
+  }
+
+  /**
+   * Deliver a pause/cancel request
+   * Running pipelines stop before their next stage; queued ones are dropped
+   * from the queue immediately.
+   * @returns Whether the pipeline was queued or running
+   */
+  signal(pipelineId: string, signal: PipelineSignal): boolean {
+    const running = this.running.get(pipelineId);
+    if (running) {
+      running.control.signal = signal;
+      return true;
+    }
+
+    const index = this.queue.findIndex((job) => job.pipelineId === pipelineId);
+    if (index === -1) {
+      return false;
+    }
+    this.queue.splice(index, 1);
+    void this.persist();
+    return true;
+  }
+
+  /**
+   * Resolve once no pipelines are running and the queue file is written
+   */
+  async whenIdle(): Promise<void> {
+    while (this.running.size > 0) {
+      await Promise.all([...this.running.values()].map((entry) => entry.done));
+    }
+    await this.persisting;
+  }
+
+  /**
+   * Queue depth, wait time and per-stage run time
+   */
+  getMetrics(): PipelineSchedulerMetrics {
+    const now = Date.now();
+    const queuedByProject: Record<string, number> = {};
+    const queuedByProvider: Partial<Record<LLMProvider, number>> = {};
+    let oldestQueuedMs = 0;
+
+    for (const job of this.queue) {
+      queuedByProject[job.projectId] = (queuedByProject[job.projectId] ?? 0) + 1;
+      for (const provider of job.providers) {
+        queuedByProvider[provider] = (queuedByProvider[provider] ?? 0) + 1;
+      }
+      oldestQueuedMs = Math.max(oldestQueuedMs, now - new Date(job.enqueuedAt).getTime());
+    }
+
+    const stageRunTime: PipelineSchedulerMetrics['stageRunTime'] = {};
+    for (const [stage, acc] of this.stageRunTime) {
+      stageRunTime[stage] = { ...summarize(acc), failures: acc.failures };
+    }
+
+    return {
+      maxWorkers: this.maxWorkers,
+      providerLimits: { ...this.providerLimits },
+      queueDepth: this.queue.length,
+      queuedByProject,
+      queuedByProvider,
+      running: this.running.size,
+      runningByProvider: Object.fromEntries(this.runningByProvider),
+      waitTime: { ...summarize(this.waitTime), oldestQueuedMs },
+      stageRunTime,
+      outcomes: Object.fromEntries(this.outcomes),
+    };
+  }
+
+  // ===========================================================================
+  // Dispatch
+  // ===========================================================================
+
+  private isKnown(pipelineId: string): boolean {
+    return this.running.has(pipelineId) || this.queue.some((job) => job.pipelineId === pipelineId);
+  }
+
+  private hasCapacity(providers: LLMProvider[]): boolean {
+    return providers.every((provider) => {
+      const limit = this.providerLimits[provider] ?? this.maxWorkers;
+      return (this.runningByProvider.get(provider) ?? 0) < limit;
+    });
+  }
+
+  private countRunning(providers: LLMProvider[], delta: number): void {
+    for (const provider of providers) {
+      this.runningByProvider.set(provider, (this.runningByProvider.get(provider) ?? 0) + delta);
+    }
+  }
+
+  /**
+   * Pick the runnable job whose project was served least recently
+   * Ties go to the job that has waited longest.
+   */
+  private pickNextJob(): PipelineQueueJob | null {
+    let best: PipelineQueueJob | null = null;
+    let bestServed = Infinity;
+
+    for (const job of this.queue) {
+      if (!this.hasCapacity(job.providers)) {
+        continue;
+      }
+      const served = this.lastServed.get(job.projectId) ?? -1;
+      if (served < bestServed) {
+        best = job;
+        bestServed = served;
+      }
+    }
+    return best;
+  }
+
+  private dispatch(): void {
+    while (this.running.size < this.maxWorkers) {
+      const job = this.pickNextJob();
+      if (!job) {
+        return;
+      }
+      this.startJob(job);
+    }
+  }
+
+  private startJob(job: PipelineQueueJob): void {
+    this.queue.splice(this.queue.indexOf(job), 1);
+    job.state = 'running';
+    this.lastServed.set(job.projectId, ++this.dispatchSeq);
+    this.countRunning(job.providers, 1);
+    record(this.waitTime, Date.now() - new Date(job.enqueuedAt).getTime());
+
+    const control: PipelineControl = {
+      signal: null,
+      onStageFinished: (stage, durationMs, success) => this.recordStageRun(stage, durationMs, success),
+    };
+
+    const done = this.runner({
+      taskId: job.taskId,
+      qaSessionId: job.qaSessionId,
+      resumeFromStage: job.resumeFromStage,
+      control,
+    })
+      .then((pipeline) => pipeline.status)
+      .catch(async (error: unknown) => {
+        console.error(`Pipeline ${job.pipelineId} failed:`, error);
+        await updatePipelineStatus(job.pipelineId, 'failed').catch(() => null);
+        return 'failed' as const;
+      })
+      .then((status) => {
+        this.outcomes.set(status, (this.outcomes.get(status) ?? 0) + 1);
+        this.running.delete(job.pipelineId);
+        this.countRunning(job.providers, -1);
+        void this.persist();
+        this.dispatch();
+      });
+
+    this.running.set(job.pipelineId, { job, control, done });
+    void this.persist();
+  }
+
+  private recordStageRun(stage: PassthroughStageName, durationMs: number, success: boolean): void {
+    let acc = this.stageRunTime.get(stage);
+    if (!acc) {
+      acc = { count: 0, totalMs: 0, maxMs: 0, failures: 0 };
+      this.stageRunTime.set(stage, acc);
+    }
+    record(acc, durationMs);
+    if (!success) {
+      acc.failures++;
+    }
+  }
+
+  /**
+   * Write running and queued jobs to disk
+   * Writes are serialized; each one snapshots the state at the time it runs.
+   */
+  private persist(): Promise<void> {
+    this.persisting = withFileLock(PIPELINE_QUEUE_PATH, () =>
+      savePipelineQueue([...[...this.running.values()].map((entry) => entry.job), ...this.queue])
+    ).catch((error) => {
+      console.error('Failed to persist pipeline queue:', error);
+    });
+    return this.persisting;
+  }
+}
+
+// =============================================================================
+// Shared Instance
+// =============================================================================
+
+let sharedScheduler: PipelineScheduler | null = null;
+
+/**
+ * Get or create the process-wide scheduler
+ * Limits can be set with PASSTHROUGH_MAX_WORKERS and
+ * PASSTHROUGH_PROVIDER_CONCURRENCY (e.g. "claude-code=2,openai=4").
+ */
+export function getPipelineScheduler(): PipelineScheduler {
+  if (!sharedScheduler) {
+    const maxWorkers = Number.parseInt(process.env.PASSTHROUGH_MAX_WORKERS ?? '', 10);
+    sharedScheduler = new PipelineScheduler({
+      maxWorkers: Number.isFinite(maxWorkers) ? maxWorkers : undefined,
+      providerLimits: parseProviderLimits(process.env.PASSTHROUGH_PROVIDER_CONCURRENCY),
+    });
+  }
+  return sharedScheduler;
+}
+
+/**
+ * Replace the process-wide scheduler (used by tests)
+ */
+export function setPipelineScheduler(scheduler: PipelineScheduler | null): void {
+  sharedScheduler = scheduler;
+}
@@ -0,0 +1,352 @@
+/**
+ * Search Index
+ * In-memory inverted index with BM25 ranking
+ *
+ * Documents are made of named fields whose term frequencies are scaled by a
+ * per-field weight (e.g. titles count more than bodies). Text is tokenized
+ * with the Korean/English tokenizer from keywordExtractor.
+ *
+ * Every query term must match a document, either exactly or as a prefix of
+ * an indexed term (so "로그인" still finds "로그인을" and "auth" finds
+ * "authentication"). Prefix matches score less than exact ones.
+ */
+import { tokenizeText } from './keywordExtractor.ts';
+
+// =============================================================================
+// Types
+// =============================================================================
+
+export interface SearchIndexOptions {
+  /** Weight applied to term frequencies per field; unknown fields use 1 */
+  fieldWeights?: Record<string, number>;
+  /** BM25 term frequency saturation */
+  k1?: number;
+  /** BM25 length normalization */
+  b?: number;
+}
+
+export interface SearchHit {
+  id: string;
+  score: number;
+}
+
+export interface SearchOptions {
+  /** Only documents passing the filter are counted and returned */
+  filter?: (id: string) => boolean;
+  offset?: number;
+  limit?: number;
+}
+
+export interface SearchResult {
+  /** Number of matching documents (after filtering) */
+  total: number;
+  /** Requested page, best match first */
+  hits: SearchHit[];
+}
+
+/** Hit with the document's insertion sequence, for tie-breaking */
+interface RankedHit extends SearchHit {
+  sequence: number;
+}
+
+interface IndexedDocument {
+  terms: Map<string, number>;
+  length: number;
+  /** Insertion sequence, used to break score ties */
+  sequence: number;
+}
+
+// =============================================================================
+// Constants
+// =============================================================================
+
+const DEFAULT_K1 = 1.2;
+const DEFAULT_B = 0.75;
+
+/**
+ * Score multiplier for terms matched by prefix instead of exactly
+ */
+const PREFIX_MATCH_WEIGHT = 0.5;
+
+// =============================================================================
+// Search Index
+// =============================================================================
+
+export class SearchIndex {
+  private readonly fieldWeights: Record<string, number>;
+  private readonly k1: number;
+  private readonly b: number;
+
+  /** term -> document id -> weighted term frequency */
+  private readonly postings = new Map<string, Map<string, number>>();
+  private readonly documents = new Map<string, IndexedDocument>();
+  private totalLength = 0;
+  private sequence = 0;
+
+  /** Sorted vocabulary for prefix lookups, rebuilt lazily */
+  private sortedTerms: string[] | null = null;
+
+  constructor(options: SearchIndexOptions = {}) {
+    this.fieldWeights = options.fieldWeights ?? {};
+    this.k1 = options.k1 ?? DEFAULT_K1;
+    this.b = options.b ?? DEFAULT_B;
+  }
+
+  /**
+   * Number of indexed documents
+   */
+  get size(): number {
+    return this.documents.size;
+  }
+
+  has(id: string): boolean {
+    return this.documents.has(id);
+  }
+
+  /**
+   * Add or replace a document
+   * @param id - Document ID
+   * @param fields - Field name -> text (null/undefined fields are skipped)
+   */
+  add(id: string, fields: Record<string, string | null | undefined>): void {
+    this.remove(id);
+
+    const terms = new Map<string, number>();
+    let length = 0;
+
+    for (const [field, text] of Object.entries(fields)) {
+      if (!text) {
+        continue;
+      }
+      const weight = this.fieldWeights[field] ?? 1;
+      for (const term of tokenizeText(text)) {
+        terms.set(term, (terms.get(term) ?? 0) + weight);
+        length++;
+      }
+    }
+
+    for (const [term, frequency] of terms) {
+      let posting = this.postings.get(term);
+      if (!posting) {
+        posting = new Map();
+        this.postings.set(term, posting);
+        this.sortedTerms = null;
+      }
+      posting.set(id, frequency);
+    }
+
+    this.documents.set(id, { terms, length, sequence: this.sequence++ });
+    this.totalLength += length;
+  }
+
+  /**
+   * Remove a document
+   * @returns true if the document was indexed
+   */
+  remove(id: string): boolean {
+    const document = this.documents.get(id);
+    if (!document) {
+      return false;
+    }
+
+    for (const term of document.terms.keys()) {
+      const posting = this.postings.get(term);
+      if (!posting) {
+        continue;
+      }
+      posting.delete(id);
+      if (posting.size === 0) {
+        this.postings.delete(term);
+        this.sortedTerms = null;
+      }
+    }
+
+    this.documents.delete(id);
+    this.totalLength -= document.length;
+    return true;
+  }
+
+  clear(): void {
+    this.postings.clear();
+    this.documents.clear();
+    this.totalLength = 0;
+    this.sortedTerms = null;
+  }
+
+  /**
+   * Rank documents matching every term of the query
+   * Small pages are picked without sorting every match.
+   * @param query - Free text query
+   * @param options - Filter and pagination
+   */
+  search(query: string, options: SearchOptions = {}): SearchResult {
+    const { filter, offset = 0, limit = Infinity } = options;
+    const queryTerms = [...new Set(tokenizeText(query))];
+
+    if (queryTerms.length === 0 || this.documents.size === 0) {
+      return { total: 0, hits: [] };
+    }
+
+    // Score each query term separately; a document must match all of them
+    let scores: Map<string, number> | null = null;
+
+    for (const queryTerm of queryTerms) {
+      const termScores = new Map<string, number>();
+
+      for (const [term, matchWeight] of this.expandTerm(queryTerm)) {
+        const posting = this.postings.get(term)!;
+        const idf = this.idf(posting.size);
+        for (const [id, frequency] of posting) {
+          if (scores && !scores.has(id)) {
+            continue;
+          }
+          const score = matchWeight * idf * this.saturate(frequency, this.documents.get(id)!.length);
+          termScores.set(id, Math.max(termScores.get(id) ?? 0, score));
+        }
+      }
+
+      if (scores) {
+        for (const [id, score] of termScores) {
+          termScores.set(id, score + scores.get(id)!);
+        }
+      }
+      scores = termScores;
+
+      if (scores.size === 0) {
+        return { total: 0, hits: [] };
+      }
+    }
+
+    return this.selectPage(scores!, filter, offset, limit);
+  }
+
+  /**
+   * Exact term plus indexed terms it is a prefix of, with match weights
+   */
+  private expandTerm(queryTerm: string): Array<[string, number]> {
+    const matches: Array<[string, number]> = [];
+    if (this.postings.has(queryTerm)) {
+      matches.push([queryTerm, 1]);
+    }
+
+    const terms = this.getSortedTerms();
+    for (let i = lowerBound(terms, queryTerm); i < terms.length && terms[i].startsWith(queryTerm); i++) {
+      if (terms[i] !== queryTerm) {
+        matches.push([terms[i], PREFIX_MATCH_WEIGHT]);
+      }
+    }
+    return matches;
+  }
+
+  private getSortedTerms(): string[] {
+    if (!this.sortedTerms) {
+      this.sortedTerms = Array.from(this.postings.keys()).sort();
+    }
+    return this.sortedTerms;
+  }
+
+  private idf(documentFrequency: number): number {
+    const n = this.documents.size;
+    return Math.log(1 + (n - documentFrequency + 0.5) / (documentFrequency + 0.5));
+  }
+
+  private saturate(frequency: number, length: number): number {
+    const averageLength = this.totalLength / this.documents.size || 1;
+    return (
+      (frequency * (this.k1 + 1)) /
+      (frequency + this.k1 * (1 - this.b + (this.b * length) / averageLength))
+    );
+  }
+
+  /**
+   * Pick the requested page of hits, best first
+   * Small pages keep only the best offset + limit hits; when the page covers
+   * a large share of the matches (e.g. no limit) they are sorted once instead.
+   */
+  private selectPage(
+    scores: Map<string, number>,
+    filter: SearchOptions['filter'],
+    offset: number,
+    limit: number
+  ): SearchResult {
+    const matches: RankedHit[] = [];
+    for (const [id, score] of scores) {
+      if (!filter || filter(id)) {
+        matches.push({ id, score, sequence: this.documents.get(id)!.sequence });
+      }
+    }
+
+    const keep = offset + limit;
+    const top = keep * 4 >= matches.length ? matches.sort(compareHits) : selectTop(matches, keep);
+
+    return {
+      total: matches.length,
+      hits: top.slice(offset, keep).map(({ id, score }) => ({ id, score })),
+    };
+  }
+}
+
+// =============================================================================
+// Helpers
+// =============================================================================
+
+/**
+ * Higher score first; earlier-indexed document first on ties
+ */
+function ranksBefore(a: RankedHit, b: RankedHit): boolean {
+  return a.score > b.score || (a.score === b.score && a.sequence < b.sequence);
+}
+
+function compareHits(a: RankedHit, b: RankedHit): number {
+  return b.score - a.score || a.sequence - b.sequence;
+}
+
+/**
+ * Best `keep` hits in rank order, without sorting every hit
+ */
+function selectTop(hits: RankedHit[], keep: number): RankedHit[] {
+  const top: RankedHit[] = [];
+  if (keep === 0) {
+    return top;
+  }
+
+  for (const hit of hits) {
+    if (top.length >= keep && !ranksBefore(hit, top[top.length - 1])) {
+      continue;
+    }
+
+    // Binary insertion keeps `top` ordered best first
+    let low = 0;
+    let high = top.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (ranksBefore(top[mid], hit)) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    top.splice(low, 0, hit);
+    if (top.length > keep) {
+      top.pop();
+    }
+  }
+  return top;
+}
+
+/**
+ * First index in a sorted array whose value is >= target
+ */
+function lowerBound(values: string[], target: string): number {
+  let low = 0;
+  let high = values.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (values[mid] < target) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+}
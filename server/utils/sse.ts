@@ -0,0 +1,164 @@
+/**
+ * Server-Sent Events Utilities
+ * Writing SSE responses to clients and reading SSE streams from LLM APIs
+ */
+import type { Response } from 'express';
+
+/**
+ * Default interval for SSE keep-alive comments (15 seconds)
+ */
+const DEFAULT_HEARTBEAT_MS = 15000;
+
+// =============================================================================
+// Server Side (Express -> client)
+// =============================================================================
+
+/**
+ * Start an SSE response
+ * Headers are flushed immediately so the client sees the first byte before
+ * the model produces any output.
+ * @param res - Express response object
+ */
+export function openSSEStream(res: Response): void {
+  res.status(200);
+  res.setHeader('Content-Type', 'text/event-stream; charset=utf-8');
+  res.setHeader('Cache-Control', 'no-cache, no-transform');
+  res.setHeader('Connection', 'keep-alive');
+  res.setHeader('X-Accel-Buffering', 'no');
+  res.flushHeaders();
+}
+
+/**
+ * Write a named SSE event with a JSON payload
+ * @param res - Express response object
+ * @param event - Event name (e.g. 'token', 'done', 'error')
+ * @param data - Payload, serialized as JSON
+ */
+export function sendSSEEvent(res: Response, event: string, data: unknown): void {
+  if (res.writableEnded) {
+    return;
+  }
+  res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+}
+
+/**
+ * Periodically write SSE comments so proxies keep the connection open
+ * while the model has not produced output yet
+ * @param res - Express response object
+ * @param intervalMs - Heartbeat interval
+ * @returns Function that stops the heartbeat
+ */
+export function startSSEHeartbeat(res: Response, intervalMs: number = DEFAULT_HEARTBEAT_MS): () => void {
+  const intervalId = setInterval(() => {
+    if (!res.writableEnded) {
+      res.write(': keep-alive\n\n');
+    }
+  }, intervalMs);
+
+  return () => clearInterval(intervalId);
+}
+
+// =============================================================================
+// Client Side (LLM API -> server)
+// =============================================================================
+
+/**
+ * Incremental SSE parser
+ * Feed decoded text with push(); complete events are emitted as their
+ * concatenated `data:` lines.
+ */
+export class SSEParser {
+  private buffer = '';
+  private dataLines: string[] = [];
+  private readonly onData: (data: string) => void;
+
+  constructor(onData: (data: string) => void) {
+    this.onData = onData;
+  }
+
+  /**
+   * Parse a chunk of decoded text
+   */
+  push(chunk: string): void {
+    this.buffer += chunk;
+
+    let newlineIndex = this.buffer.indexOf('\n');
+    while (newlineIndex !== -1) {
+      let line = this.buffer.slice(0, newlineIndex);
+      this.buffer = this.buffer.slice(newlineIndex + 1);
+      if (line.endsWith('\r')) {
+        line = line.slice(0, -1);
+      }
+      this.processLine(line);
+      newlineIndex = this.buffer.indexOf('\n');
+    }
+  }
+
+  /**
+   * Flush any event left without a trailing blank line
+   */
+  end(): void {
+    if (this.buffer) {
+      this.processLine(this.buffer);
+      this.buffer = '';
+    }
+    this.dispatch();
+  }
+
+  private processLine(line: string): void {
+    if (line === '') {
+      this.dispatch();
+      return;
+    }
+
+    // Comment lines (keep-alives) are ignored
+    if (line.startsWith(':')) {
+      return;
+    }
+
+    if (line.startsWith('data:')) {
+      const value = line.slice(5);
+      this.dataLines.push(value.startsWith(' ') ? value.slice(1) : value);
+    }
+  }
+
+  private dispatch(): void {
+    if (this.dataLines.length === 0) {
+      return;
+    }
+    const data = this.dataLines.join('\n');
+    this.dataLines = [];
+    this.onData(data);
+  }
+}
+
+/**
+ * Read an SSE response body to completion
+ * @param body - Response body stream from fetch
+ * @param onData - Called with each event's data payload
+ * @param onChunk - Called whenever bytes arrive (used for idle timeouts)
+ */
+export async function readSSEStream(
+  body: ReadableStream<Uint8Array>,
+  onData: (data: string) => void,
+  onChunk?: () => void
+): Promise<void> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  const parser = new SSEParser(onData);
+
+  try {
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) {
+        break;
+      }
+      onChunk?.();
+      parser.push(decoder.decode(value, { stream: true }));
+    }
+    parser.push(decoder.decode());
+    parser.end();
+  } finally {
+    reader.releaseLock();
+  }
+}
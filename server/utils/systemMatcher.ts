@@ -8,6 +8,12 @@
  * - TASK-001: Keyword-tag matching logic
  * - TASK-001: Relevance score calculation (based on matched tags ratio)
  * - TASK-001: Result sorting and limiting (max 5 by default)
+ *
+ * Matching goes through a SystemTagIndex: a tag -> systems posting index
+ * that is kept up to date as systems change, so a query only visits the
+ * systems sharing at least one tag with the keywords. Each matched tag
+ * contributes keyword weight x tag IDF (rare tags count more than tags
+ * every system has), and only the best maxResults are kept via a heap.
  */
 
 import type { ExtractedKeyword } from './keywordExtractor.ts';
@@ -21,26 +27,216 @@ export interface SystemMatchResult {
   systemId: string;
   /** Name of the matched system */
   systemName: string;
-  /** Relevance score (0-100) based on matched tags ratio */
+  /** Relevance score (0-100): weighted share of the keywords the system matched */
   relevanceScore: number;
   /** List of tags that matched the keywords */
   matchedTags: string[];
 }
 
+/**
+ * Fields of a system the matcher needs
+ */
+export type MatchableSystem = Pick<SystemDocument, 'id' | 'name' | 'tags'>;
+
+interface IndexedSystem {
+  id: string;
+  name: string;
+  /** Lowercased, de-duplicated tags */
+  tags: Set<string>;
+  /** Insertion sequence, used to break score ties */
+  sequence: number;
+}
+
 /**
  * Default maximum number of results to return
  */
 const DEFAULT_MAX_RESULTS = 5;
 
+/**
+ * Keywords weighted below this still count when they match
+ */
+const MIN_KEYWORD_WEIGHT = 1;
+
+// =============================================================================
+// Tag Index
+// =============================================================================
+
+export class SystemTagIndex {
+  /** tag -> slots of the systems carrying it */
+  private readonly postings = new Map<string, Set<number>>();
+  /** system id -> slot */
+  private readonly slots = new Map<string, number>();
+  private readonly systems: Array<IndexedSystem | undefined> = [];
+  private readonly freeSlots: number[] = [];
+  private sequence = 0;
+
+  /** Score accumulator indexed by slot, reused across queries */
+  private scores = new Float64Array(0);
+
+  /**
+   * Number of indexed systems
+   */
+  get size(): number {
+    return this.slots.size;
+  }
+
+  has(systemId: string): boolean {
+    return this.slots.has(systemId);
+  }
+
+  /**
+   * Add or replace a system
+   * A replaced system keeps its position for tie-breaking.
+   * @param system - System ID, name and tags
+   */
+  add(system: MatchableSystem): void {
+    const existing = this.slots.get(system.id);
+    const sequence = existing !== undefined ? this.systems[existing]!.sequence : this.sequence++;
+    this.remove(system.id);
+
+    const slot = this.freeSlots.pop() ?? this.systems.length;
+    const tags = new Set(system.tags.map((tag) => tag.toLowerCase()));
+    this.systems[slot] = { id: system.id, name: system.name, tags, sequence };
+    this.slots.set(system.id, slot);
+
+    for (const tag of tags) {
+      let posting = this.postings.get(tag);
+      if (!posting) {
+        posting = new Set();
+        this.postings.set(tag, posting);
+      }
+      posting.add(slot);
+    }
+  }
+
+  /**
+   * Remove a system
+   * @returns true if the system was indexed
+   */
+  remove(systemId: string): boolean {
+    const slot = this.slots.get(systemId);
+    if (slot === undefined) {
+      return false;
+    }
+
+    for (const tag of this.systems[slot]!.tags) {
+      const posting = this.postings.get(tag);
+      if (!posting) {
+        continue;
+      }
+      posting.delete(slot);
+      if (posting.size === 0) {
+        this.postings.delete(tag);
+      }
+    }
+
+    this.systems[slot] = undefined;
+    this.slots.delete(systemId);
+    this.freeSlots.push(slot);
+    return true;
+  }
+
+  clear(): void {
+    this.postings.clear();
+    this.slots.clear();
+    this.systems.length = 0;
+    this.freeSlots.length = 0;
+  }
+
+  /**
+   * Match systems against one set of keywords
+   * @param keywords - Extracted keywords from feature text
+   * @param maxResults - Maximum number of results to return (default: 5)
+   * @returns Matches sorted by relevance score, best first
+   */
+  match(keywords: ExtractedKeyword[], maxResults: number = DEFAULT_MAX_RESULTS): SystemMatchResult[] {
+    if (keywords.length === 0 || this.slots.size === 0 || maxResults <= 0) {
+      return [];
+    }
+
+    if (this.scores.length < this.systems.length) {
+      this.scores = new Float64Array(Math.max(this.systems.length, this.scores.length * 2));
+    }
+    const scores = this.scores;
+
+    // Case-insensitive keywords; a repeated keyword keeps its highest weight
+    const weights = new Map<string, number>();
+    for (const { keyword, weight } of keywords) {
+      const normalized = keyword.toLowerCase();
+      weights.set(normalized, Math.max(weights.get(normalized) ?? 0, weight, MIN_KEYWORD_WEIGHT));
+    }
+
+    // Accumulate keyword weight x tag IDF for every system carrying the tag
+    const touched: number[] = [];
+    let maxScore = 0;
+    for (const [keyword, weight] of weights) {
+      const posting = this.postings.get(keyword);
+      const contribution = weight * this.idf(posting?.size ?? 1);
+      maxScore += contribution;
+      if (!posting) {
+        continue;
+      }
+      for (const slot of posting) {
+        if (scores[slot] === 0) {
+          touched.push(slot);
+        }
+        scores[slot] += contribution;
+      }
+    }
+
+    const ranksBefore = (a: number, b: number): boolean =>
+      scores[a] > scores[b] || (scores[a] === scores[b] && this.systems[a]!.sequence < this.systems[b]!.sequence);
+
+    const results = selectTop(touched, maxResults, ranksBefore).map((slot) => {
+      const system = this.systems[slot]!;
+      return {
+        systemId: system.id,
+        systemName: system.name,
+        relevanceScore: Math.round((scores[slot] / maxScore) * 100),
+        matchedTags: Array.from(weights.keys()).filter((keyword) => system.tags.has(keyword)),
+      };
+    });
+
+    for (const slot of touched) {
+      scores[slot] = 0;
+    }
+    return results;
+  }
+
+  /**
+   * Match systems against many keyword sets at once (e.g. a feature list import)
+   * @param keywordSets - Keywords extracted from each feature text
+   * @param maxResults - Maximum number of results per feature (default: 5)
+   * @returns One result list per keyword set, in input order
+   */
+  matchBatch(keywordSets: ExtractedKeyword[][], maxResults: number = DEFAULT_MAX_RESULTS): SystemMatchResult[][] {
+    return keywordSets.map((keywords) => this.match(keywords, maxResults));
+  }
+
+  /**
+   * Smoothed IDF; always positive so a tag every system has still counts
+   */
+  private idf(documentFrequency: number): number {
+    return Math.log(1 + this.slots.size / documentFrequency);
+  }
+}
+
+// =============================================================================
+// Matching
+// =============================================================================
+
 /**
  * Match systems by keywords extracted from feature text
  *
+ * Builds a throwaway SystemTagIndex over the given systems; callers that
+ * match repeatedly against the same systems should keep an index instead
+ * (systemStorage maintains one per project).
+ *
  * Process:
  * 1. Extract keyword strings (case-insensitive)
- * 2. For each system, find matching tags
- * 3. Calculate relevance score based on matched tags ratio
- * 4. Sort by relevance score (descending)
- * 5. Limit to maxResults
+ * 2. Look up the systems carrying each keyword as a tag
+ * 3. Score each system by the keyword weights and IDF of its matched tags
+ * 4. Keep the best maxResults, sorted by score (descending)
  *
  * @param keywords - Extracted keywords from feature text
  * @param systems - Available system documents to match against
@@ -55,7 +251,7 @@ const DEFAULT_MAX_RESULTS = 5;
  */
 export function matchSystemsByKeywords(
   keywords: ExtractedKeyword[],
-  systems: SystemDocument[],
+  systems: MatchableSystem[],
   maxResults: number = DEFAULT_MAX_RESULTS
 ): SystemMatchResult[] {
   // Handle edge cases
@@ -63,39 +259,65 @@ export function matchSystemsByKeywords(
     return [];
   }
 
-  // Normalize keywords to lowercase for case-insensitive matching
-  const keywordSet = new Set(keywords.map((k) => k.keyword.toLowerCase()));
-
-  // Match systems and calculate scores
-  const results: SystemMatchResult[] = [];
-
+  const index = new SystemTagIndex();
   for (const system of systems) {
-    // Find matching tags (case-insensitive)
-    const matchedTags: string[] = [];
+    index.add(system);
+  }
+  return index.match(keywords, maxResults);
+}
 
-    for (const tag of system.tags) {
-      if (keywordSet.has(tag.toLowerCase())) {
-        matchedTags.push(tag.toLowerCase());
-      }
-    }
+// =============================================================================
+// Helpers
+// =============================================================================
+
+/**
+ * Best k items, best first, using a bounded heap whose root is the worst kept item
+ * @param items - Candidates
+ * @param k - Number of items to keep
+ * @param ranksBefore - Strict ordering, true if a ranks ahead of b
+ */
+function selectTop(items: number[], k: number, ranksBefore: (a: number, b: number) => boolean): number[] {
+  const heap: number[] = [];
 
-    // Skip systems with no matches
-    if (matchedTags.length === 0) {
-      continue;
+  for (const item of items) {
+    if (heap.length < k) {
+      heap.push(item);
+      siftUp(heap, heap.length - 1, ranksBefore);
+    } else if (ranksBefore(item, heap[0])) {
+      heap[0] = item;
+      siftDown(heap, 0, ranksBefore);
     }
+  }
 
-    // Calculate relevance score based on matched tags ratio
-    // Score = (matched tags / total keywords) * 100
-    const relevanceScore = Math.round((matchedTags.length / keywordSet.size) * 100);
+  return heap.sort((a, b) => (ranksBefore(a, b) ? -1 : ranksBefore(b, a) ? 1 : 0));
+}
 
-    results.push({
-      systemId: system.id,
-      systemName: system.name,
-      relevanceScore,
-      matchedTags,
-    });
+function siftUp(heap: number[], index: number, ranksBefore: (a: number, b: number) => boolean): void {
+  while (index > 0) {
+    const parent = (index - 1) >>> 1;
+    if (!ranksBefore(heap[parent], heap[index])) {
+      return;
+    }
+    [heap[parent], heap[index]] = [heap[index], heap[parent]];
+    index = parent;
   }
+}
 
-  // Sort by relevance score (descending) and limit results
-  return results.sort((a, b) => b.relevanceScore - a.relevanceScore).slice(0, maxResults);
+function siftDown(heap: number[], index: number, ranksBefore: (a: number, b: number) => boolean): void {
+  for (;;) {
+    const left = index * 2 + 1;
+    const right = left + 1;
+    let worst = index;
+    if (left < heap.length && ranksBefore(heap[worst], heap[left])) {
+      worst = left;
+    }
+    if (right < heap.length && ranksBefore(heap[worst], heap[right])) {
+      worst = right;
+    }
+    if (worst === index) {
+      return;
+    }
+    [heap[worst], heap[index]] = [heap[index], heap[worst]];
+    index = worst;
+  }
 }
@@ -1,12 +1,24 @@
 /**
  * System Document Storage Utilities
  * File system operations for system document persistence
+ *
+ * Search and paginated listing use a per-project BM25 index over names,
+ * categories, tags and markdown content. Writes made through this module
+ * update it incrementally; a changed systems.json (mtime/size) triggers a
+ * rebuild. Edits to .md files made outside this module are not detected.
+ *
+ * The same per-project state holds a tag index used by discovery to match
+ * feature keywords against system tags without reloading systems.
  */
 import fs from 'fs/promises';
 import path from 'path';
 import type { SystemDocument } from '../../src/types/index.ts';
 import type { CreateSystemDocumentDto, UpdateSystemDocumentDto } from '../types.ts';
 import { WORKSPACE_PATH } from './projectStorage.ts';
+import { statFileVersion, isSameFileVersion, type FileVersion } from './atomicFile.ts';
+import { SearchIndex } from './searchIndex.ts';
+import { tokenizeText, type ExtractedKeyword } from './keywordExtractor.ts';
+import { SystemTagIndex, type SystemMatchResult } from './systemMatcher.ts';
 
 /**
  * Get systems directory path for a project
@@ -96,6 +108,203 @@ async function deleteSystemContent(projectId: string, systemId: string): Promise
   }
 }
 
+// =============================================================================
+// Search Index
+// =============================================================================
+
+type SystemMetadata = Omit<SystemDocument, 'content'>;
+
+/**
+ * Field weights for ranking
+ */
+const SEARCH_FIELD_WEIGHTS = {
+  name: 3,
+  category: 2,
+  tags: 2,
+  content: 1,
+};
+
+interface ProjectSystemIndex {
+  /** systems.json version the index reflects */
+  version: FileVersion | null;
+  metadata: Map<string, SystemMetadata>;
+  search: SearchIndex;
+  tags: SystemTagIndex;
+  /** IDs sorted by createdAt descending, rebuilt lazily */
+  ordered: string[] | null;
+}
+
+export interface SystemSearchOptions {
+  limit?: number;
+  offset?: number;
+}
+
+const systemIndexes = new Map<string, ProjectSystemIndex>();
+
+function indexSystem(state: ProjectSystemIndex, doc: SystemDocument): void {
+  const { content, ...metadata } = doc;
+  state.metadata.set(doc.id, metadata);
+  state.search.add(doc.id, {
+    name: doc.name,
+    category: doc.category,
+    tags: doc.tags.join(' '),
+    content,
+  });
+  state.tags.add(doc);
+  state.ordered = null;
+}
+
+/**
+ * Get a project's system index, rebuilding it when systems.json changed
+ */
+async function getProjectSystemIndex(projectId: string): Promise<ProjectSystemIndex> {
+  const version = await statFileVersion(getSystemsJsonPath(projectId));
+  const cached = systemIndexes.get(projectId);
+  if (cached && version && isSameFileVersion(cached.version, version)) {
+    return cached;
+  }
+
+  const state: ProjectSystemIndex = {
+    version,
+    metadata: new Map(),
+    search: new SearchIndex({ fieldWeights: SEARCH_FIELD_WEIGHTS }),
+    tags: new SystemTagIndex(),
+    ordered: null,
+  };
+  for (const doc of await getAllSystemDocuments(projectId)) {
+    indexSystem(state, doc);
+  }
+
+  if (version) {
+    systemIndexes.set(projectId, state);
+  } else {
+    systemIndexes.delete(projectId);
+  }
+  return state;
+}
+
+/**
+ * Apply a write made by this module to a loaded index
+ * @param previousVersion - systems.json version before the write
+ * @param doc - Saved document, or null if it was deleted
+ */
+async function syncSystemIndex(
+  projectId: string,
+  previousVersion: FileVersion | null,
+  systemId: string,
+  doc: SystemDocument | null
+): Promise<void> {
+  const state = systemIndexes.get(projectId);
+  if (!state) {
+    return;
+  }
+
+  const version = await statFileVersion(getSystemsJsonPath(projectId));
+  if (!version || !isSameFileVersion(state.version, previousVersion)) {
+    systemIndexes.delete(projectId);
+    return;
+  }
+
+  if (doc) {
+    indexSystem(state, doc);
+  } else if (state.metadata.delete(systemId)) {
+    state.search.remove(systemId);
+    state.tags.remove(systemId);
+    state.ordered = null;
+  }
+  state.version = version;
+}
+
+/**
+ * Drop all system indexes (next search rebuilds from disk)
+ */
+export function clearSystemSearchIndex(): void {
+  systemIndexes.clear();
+}
+
+/**
+ * Search system documents
+ *
+ * An empty query lists documents by createdAt descending. Otherwise results
+ * are ranked by BM25 relevance over name, category, tags and content. Only
+ * the requested page has its content loaded.
+ *
+ * @param projectId - Project UUID
+ * @param query - Search text (empty for all documents)
+ * @param options - Pagination
+ * @returns Matching system documents with content
+ */
+export async function searchSystemDocuments(
+  projectId: string,
+  query: string,
+  options: SystemSearchOptions = {}
+): Promise<SystemDocument[]> {
+  const { limit = Infinity, offset = 0 } = options;
+  const trimmed = query.trim();
+
+  // Queries made only of stopwords cannot use the index
+  if (trimmed && tokenizeText(trimmed).length === 0) {
+    const keyword = trimmed.toLowerCase();
+    const matches = (await getAllSystemDocuments(projectId)).filter((doc) =>
+      [doc.name, doc.category, doc.content, ...doc.tags].some((text) => text.toLowerCase().includes(keyword))
+    );
+    return matches.slice(offset, offset + limit);
+  }
+
+  const state = await getProjectSystemIndex(projectId);
+
+  let ids: string[];
+  if (trimmed) {
+    ids = state.search.search(trimmed, { offset, limit }).hits.map((hit) => hit.id);
+  } else {
+    if (!state.ordered) {
+      state.ordered = Array.from(state.metadata.values())
+        .sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime())
+        .map((metadata) => metadata.id);
+    }
+    ids = state.ordered.slice(offset, offset + limit);
+  }
+
+  return Promise.all(
+    ids.map(async (id) => ({
+      ...state.metadata.get(id)!,
+      content: await readSystemContent(projectId, id),
+    }))
+  );
+}
+
+/**
+ * Match a project's systems against keywords extracted from feature text
+ * @param projectId - Project UUID
+ * @param keywords - Extracted keywords
+ * @param maxResults - Maximum number of results
+ * @returns Matches sorted by relevance score
+ */
+export async function matchSystemDocuments(
+  projectId: string,
+  keywords: ExtractedKeyword[],
+  maxResults?: number
+): Promise<SystemMatchResult[]> {
+  const state = await getProjectSystemIndex(projectId);
+  return state.tags.match(keywords, maxResults);
+}
+
+/**
+ * Match a project's systems against many keyword sets in one pass
+ * @param projectId - Project UUID
+ * @param keywordSets - Keywords extracted from each feature text
+ * @param maxResults - Maximum number of results per feature
+ * @returns One result list per keyword set, in input order
+ */
+export async function matchSystemDocumentsBatch(
+  projectId: string,
+  keywordSets: ExtractedKeyword[][],
+  maxResults?: number
+): Promise<SystemMatchResult[][]> {
+  const state = await getProjectSystemIndex(projectId);
+  return state.tags.matchBatch(keywordSets, maxResults);
+}
+
 /**
  * Get all system documents from a project
  * @param projectId - Project UUID
@@ -179,8 +388,10 @@ export async function createSystemDocument(
   systems.push(metadataToStore);
 
   // Write metadata and content
+  const previousVersion = await statFileVersion(getSystemsJsonPath(projectId));
   await writeSystemsJson(projectId, systems);
   await writeSystemContent(projectId, systemId, systemDocument.content);
+  await syncSystemIndex(projectId, previousVersion, systemId, systemDocument);
 
   return systemDocument;
 }
@@ -216,6 +427,7 @@ export async function updateSystemDocument(
   // Update metadata in systems.json
   const systems = await readSystemsJson(projectId);
   const index = systems.findIndex(s => s.id === systemId);
+  const previousVersion = await statFileVersion(getSystemsJsonPath(projectId));
 
   if (index !== -1) {
     systems[index] = {
@@ -233,6 +445,7 @@ export async function updateSystemDocument(
 
   // Update content file
   await writeSystemContent(projectId, systemId, updated.content);
+  await syncSystemIndex(projectId, previousVersion, systemId, updated);
 
   return updated;
 }
@@ -246,10 +459,12 @@ export async function deleteSystemDocument(projectId: string, systemId: string):
   // Remove from systems.json
   const systems = await readSystemsJson(projectId);
   const filteredSystems = systems.filter(s => s.id !== systemId);
+  const previousVersion = await statFileVersion(getSystemsJsonPath(projectId));
   await writeSystemsJson(projectId, filteredSystems);
 
   // Delete content file
   await deleteSystemContent(projectId, systemId);
+  await syncSystemIndex(projectId, previousVersion, systemId, null);
 }
 
 /**
@@ -316,8 +531,10 @@ export async function saveSystemDocument(projectId: string, doc: SystemDocument)
     systems.push(metadata);
   }
 
+  const previousVersion = await statFileVersion(getSystemsJsonPath(projectId));
   await writeSystemsJson(projectId, systems);
   await writeSystemContent(projectId, doc.id, content);
+  await syncSystemIndex(projectId, previousVersion, doc.id, doc);
 }
 
 // Alias exports for backward compatibility
@@ -1,9 +1,16 @@
 /**
  * Task Storage Utilities
  * File system operations for task persistence
+ *
+ * Tasks are cached in memory per project (validated against the file's
+ * mtime and size, so external writes are picked up) and a persistent
+ * taskId -> projectId index avoids scanning every project on lookup.
+ * Writes are atomic and serialized per project, and listeners registered
+ * with onTasksWritten() are told which tasks each write changed.
  */
 import fs from 'fs/promises';
 import path from 'path';
+import type { Stats } from 'fs';
 import type {
   Task,
   TaskStatus,
@@ -15,12 +22,73 @@ import type {
 import type { LLMProvider } from '../../src/types/llm.ts';
 import { v4 as uuidv4 } from 'uuid';
 import { WORKSPACE_PATH } from './projectStorage.ts';
+import { writeFileAtomic, withFileLock } from './atomicFile.ts';
 
 /**
  * Valid task statuses
  */
 const VALID_STATUSES: TaskStatus[] = ['featurelist', 'design', 'prd', 'prototype'];
 
+/**
+ * Path to the persistent taskId -> projectId index
+ */
+const TASK_INDEX_PATH = path.join(WORKSPACE_PATH, '.task-index.json');
+
+/**
+ * Cached tasks of a single project
+ */
+interface CachedProjectTasks {
+  tasks: Task[];
+  byId: Map<string, Task>;
+  mtimeMs: number;
+  size: number;
+}
+
+/**
+ * In-memory task cache keyed by project ID
+ */
+const taskCache = new Map<string, CachedProjectTasks>();
+
+/**
+ * File version (mtime and size) a cache entry was read from
+ */
+export interface TasksFileVersion {
+  mtimeMs: number;
+  size: number;
+}
+
+/**
+ * A single task added, changed or removed by a write
+ */
+export interface TaskChange {
+  before: Task | null;
+  after: Task | null;
+}
+
+/**
+ * Notification sent after a project's tasks.json is written
+ * Task objects are shared with the cache and must not be mutated.
+ */
+export interface TasksWrittenEvent {
+  projectId: string;
+  /** Per-task changes, or null when the whole list was replaced */
+  changes: TaskChange[] | null;
+  /** File version the changes were applied to (null if unknown) */
+  previousVersion: TasksFileVersion | null;
+  /** File version after the write (null if it could not be read back) */
+  version: TasksFileVersion | null;
+}
+
+const taskWriteListeners = new Set<(event: TasksWrittenEvent) => void>();
+
+/**
+ * taskId -> projectId index (loaded lazily)
+ */
+let taskProjectIndex: Map<string, string> | null = null;
+let taskIndexLoading: Promise<Map<string, string>> | null = null;
+let taskIndexDirty = false;
+let taskIndexWrite: Promise<void> | null = null;
+
 /**
  * Check if a status is valid
  */
@@ -36,36 +104,332 @@ function getTasksFilePath(projectId: string): string {
 }
 
 /**
- * Get all tasks for a project
- * @param projectId - Project ID
- * @returns Array of tasks for the project
+ * Get project lock key for task writes
  */
-export async function getTasksByProject(projectId: string): Promise<Task[]> {
+function getTasksLockKey(projectId: string): string {
+  return `tasks:${projectId}`;
+}
+
+// =============================================================================
+// Task Index
+// =============================================================================
+
+/**
+ * Load the taskId -> projectId index from disk
+ */
+async function loadTaskIndex(): Promise<Map<string, string>> {
+  if (taskProjectIndex) {
+    return taskProjectIndex;
+  }
+
+  if (!taskIndexLoading) {
+    taskIndexLoading = (async () => {
+      const index = new Map<string, string>();
+      try {
+        const content = await fs.readFile(TASK_INDEX_PATH, 'utf-8');
+        const entries = JSON.parse(content) as Record<string, string>;
+        for (const [taskId, projectId] of Object.entries(entries)) {
+          index.set(taskId, projectId);
+        }
+      } catch {
+        // Missing or corrupt index is rebuilt from project scans
+      }
+      taskProjectIndex = index;
+      taskIndexLoading = null;
+      return index;
+    })();
+  }
+
+  return taskIndexLoading;
+}
+
+/**
+ * Persist the task index in the background
+ * Concurrent changes are coalesced into a single trailing write.
+ */
+function scheduleTaskIndexPersist(): void {
+  taskIndexDirty = true;
+  if (taskIndexWrite) {
+    return;
+  }
+
+  taskIndexWrite = (async () => {
+    while (taskIndexDirty && taskProjectIndex) {
+      taskIndexDirty = false;
+      try {
+        await writeFileAtomic(TASK_INDEX_PATH, JSON.stringify(Object.fromEntries(taskProjectIndex)));
+      } catch {
+        // The index is a lookup hint; it is rebuilt on the next scan
+      }
+    }
+    taskIndexWrite = null;
+  })();
+}
+
+/**
+ * Sync index entries for a project with its current task list
+ */
+function indexProjectTasks(projectId: string, tasks: Task[], previous?: Task[]): void {
+  if (!taskProjectIndex) {
+    return;
+  }
+
+  let changed = false;
+
+  if (previous) {
+    const currentIds = new Set(tasks.map((t) => t.id));
+    for (const task of previous) {
+      if (!currentIds.has(task.id) && taskProjectIndex.get(task.id) === projectId) {
+        taskProjectIndex.delete(task.id);
+        changed = true;
+      }
+    }
+  }
+
+  for (const task of tasks) {
+    if (taskProjectIndex.get(task.id) !== projectId) {
+      taskProjectIndex.set(task.id, projectId);
+      changed = true;
+    }
+  }
+
+  if (changed) {
+    scheduleTaskIndexPersist();
+  }
+}
+
+/**
+ * Wait for any pending task index write to finish
+ */
+export async function flushTaskIndex(): Promise<void> {
+  while (taskIndexWrite) {
+    await taskIndexWrite;
+  }
+}
+
+/**
+ * Drop the in-memory task cache and index
+ * The next access reloads both from disk.
+ */
+export function clearTaskStorageCache(): void {
+  taskCache.clear();
+  taskProjectIndex = null;
+}
+
+// =============================================================================
+// Write Notifications
+// =============================================================================
+
+/**
+ * Subscribe to task writes
+ * @param listener - Called synchronously after each successful write
+ * @returns Function that removes the listener
+ */
+export function onTasksWritten(listener: (event: TasksWrittenEvent) => void): () => void {
+  taskWriteListeners.add(listener);
+  return () => {
+    taskWriteListeners.delete(listener);
+  };
+}
+
+function emitTasksWritten(event: TasksWrittenEvent): void {
+  for (const listener of taskWriteListeners) {
+    try {
+      listener(event);
+    } catch (error) {
+      console.error('Task write listener failed:', error);
+    }
+  }
+}
+
+/**
+ * Work out which tasks a mutation added, replaced or removed
+ * Mutations replace changed tasks with new objects, so anything still in
+ * `untouched` is unchanged.
+ */
+function collectTaskChanges(
+  previous: CachedProjectTasks | null,
+  tasks: Task[],
+  untouched: Set<Task>
+): TaskChange[] | null {
+  if (!previous) {
+    return null;
+  }
+
+  const changes: TaskChange[] = [];
+  const remainingIds = new Set<string>();
+
+  for (const task of tasks) {
+    remainingIds.add(task.id);
+    if (!untouched.has(task)) {
+      changes.push({ before: previous.byId.get(task.id) ?? null, after: task });
+    }
+  }
+
+  for (const task of previous.tasks) {
+    if (!remainingIds.has(task.id)) {
+      changes.push({ before: task, after: null });
+    }
+  }
+
+  return changes;
+}
+
+// =============================================================================
+// Cached Reads and Writes
+// =============================================================================
+
+/**
+ * Load a project's tasks through the cache
+ * Returned objects are owned by the cache and must not be mutated.
+ */
+async function loadProjectTasks(projectId: string): Promise<CachedProjectTasks | null> {
   const tasksPath = getTasksFilePath(projectId);
 
+  let stat: Stats;
+  try {
+    stat = await fs.stat(tasksPath);
+  } catch {
+    taskCache.delete(projectId);
+    return null;
+  }
+
+  const cached = taskCache.get(projectId);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return cached;
+  }
+
   try {
     const content = await fs.readFile(tasksPath, 'utf-8');
-    return JSON.parse(content) as Task[];
+    const tasks = JSON.parse(content) as Task[];
+    const entry: CachedProjectTasks = {
+      tasks,
+      byId: new Map(tasks.map((t) => [t.id, t])),
+      mtimeMs: stat.mtimeMs,
+      size: stat.size,
+    };
+    taskCache.set(projectId, entry);
+    indexProjectTasks(projectId, tasks, cached?.tasks);
+    return entry;
   } catch {
-    return [];
+    taskCache.delete(projectId);
+    return null;
   }
 }
 
+/**
+ * Write a project's tasks atomically and refresh the cache
+ * Callers must hold the project's task lock.
+ * @param changes - Tasks changed relative to the cached list, or null
+ */
+async function writeProjectTasks(
+  projectId: string,
+  tasks: Task[],
+  changes: TaskChange[] | null
+): Promise<void> {
+  const tasksPath = getTasksFilePath(projectId);
+  const previous = taskCache.get(projectId);
+
+  await writeFileAtomic(tasksPath, JSON.stringify(tasks, null, 2));
+
+  let version: TasksFileVersion | null = null;
+  try {
+    const stat = await fs.stat(tasksPath);
+    const cachedTasks = structuredClone(tasks);
+    taskCache.set(projectId, {
+      tasks: cachedTasks,
+      byId: new Map(cachedTasks.map((t) => [t.id, t])),
+      mtimeMs: stat.mtimeMs,
+      size: stat.size,
+    });
+    version = { mtimeMs: stat.mtimeMs, size: stat.size };
+  } catch {
+    taskCache.delete(projectId);
+  }
+
+  indexProjectTasks(projectId, tasks, previous?.tasks);
+
+  emitTasksWritten({
+    projectId,
+    changes,
+    previousVersion: previous ? { mtimeMs: previous.mtimeMs, size: previous.size } : null,
+    version,
+  });
+}
+
+/**
+ * Read-modify-write a project's task list under the project lock
+ * @param projectId - Project ID
+ * @param mutate - Receives a mutable copy of the tasks; returns the result
+ *   and whether the list should be saved. May be async, in which case the
+ *   lock is held until it settles.
+ */
+async function modifyProjectTasks<T>(
+  projectId: string,
+  mutate: (tasks: Task[]) => { result: T; save: boolean } | Promise<{ result: T; save: boolean }>
+): Promise<T> {
+  return withFileLock(getTasksLockKey(projectId), async () => {
+    const cached = await loadProjectTasks(projectId);
+    const tasks = cached ? structuredClone(cached.tasks) : [];
+    const untouched = new Set(tasks);
+    const { result, save } = await mutate(tasks);
+    if (save) {
+      await writeProjectTasks(projectId, tasks, collectTaskChanges(cached, tasks, untouched));
+    }
+    return result;
+  });
+}
+
+// =============================================================================
+// Public API
+// =============================================================================
+
+/**
+ * Get all tasks for a project
+ * @param projectId - Project ID
+ * @returns Array of tasks for the project
+ */
+export async function getTasksByProject(projectId: string): Promise<Task[]> {
+  const cached = await loadProjectTasks(projectId);
+  return cached ? structuredClone(cached.tasks) : [];
+}
+
+/**
+ * Find a task in a project through the cache
+ */
+async function findTaskInProject(projectId: string, taskId: string): Promise<Task | null> {
+  const cached = await loadProjectTasks(projectId);
+  return cached?.byId.get(taskId) ?? null;
+}
+
 /**
  * Get a task by ID across all projects
+ * Uses the taskId -> projectId index and falls back to a project scan for
+ * tasks written outside this module.
  * @param taskId - Task ID to find
  * @returns Task and its project ID if found, null otherwise
  */
 export async function getTaskById(taskId: string): Promise<{ task: Task; projectId: string } | null> {
+  const index = await loadTaskIndex();
+
+  const indexedProjectId = index.get(taskId);
+  if (indexedProjectId) {
+    const task = await findTaskInProject(indexedProjectId, taskId);
+    if (task) {
+      return { task: structuredClone(task), projectId: indexedProjectId };
+    }
+    index.delete(taskId);
+    scheduleTaskIndexPersist();
+  }
+
   try {
     const entries = await fs.readdir(WORKSPACE_PATH, { withFileTypes: true });
 
     for (const entry of entries) {
       if (entry.isDirectory() && entry.name !== '.gitkeep') {
-        const tasks = await getTasksByProject(entry.name);
-        const task = tasks.find((t) => t.id === taskId);
+        const task = await findTaskInProject(entry.name, taskId);
         if (task) {
-          return { task, projectId: entry.name };
+          return { task: structuredClone(task), projectId: entry.name };
         }
       }
     }
@@ -78,12 +442,21 @@ export async function getTaskById(taskId: string): Promise<{ task: Task; project
 
 /**
  * Save tasks for a project
+ * Tasks equal to the stored ones are kept as is, so listeners get per-task
+ * changes instead of a whole-list replacement.
  * @param projectId - Project ID
  * @param tasks - Tasks array to save
  */
 export async function saveProjectTasks(projectId: string, tasks: Task[]): Promise<void> {
-  const tasksPath = getTasksFilePath(projectId);
-  await fs.writeFile(tasksPath, JSON.stringify(tasks, null, 2), 'utf-8');
+  await modifyProjectTasks(projectId, (current) => {
+    const currentById = new Map(current.map((t) => [t.id, t]));
+    const next = tasks.map((task) => {
+      const existing = currentById.get(task.id);
+      return existing && JSON.stringify(existing) === JSON.stringify(task) ? existing : structuredClone(task);
+    });
+    current.splice(0, current.length, ...next);
+    return { result: undefined, save: true };
+  });
 }
 
 /**
@@ -98,24 +471,22 @@ export async function updateTask(taskId: string, updates: Partial<Task>): Promis
     return null;
   }
 
-  const { task, projectId } = result;
-  const tasks = await getTasksByProject(projectId);
-  const taskIndex = tasks.findIndex((t) => t.id === taskId);
-
-  if (taskIndex === -1) {
-    return null;
-  }
+  return modifyProjectTasks(result.projectId, (tasks) => {
+    const taskIndex = tasks.findIndex((t) => t.id === taskId);
 
-  const updatedTask: Task = {
-    ...task,
-    ...updates,
-    updatedAt: new Date().toISOString(),
-  };
+    if (taskIndex === -1) {
+      return { result: null, save: false };
+    }
 
-  tasks[taskIndex] = updatedTask;
-  await saveProjectTasks(projectId, tasks);
+    const updatedTask: Task = {
+      ...tasks[taskIndex],
+      ...updates,
+      updatedAt: new Date().toISOString(),
+    };
 
-  return updatedTask;
+    tasks[taskIndex] = updatedTask;
+    return { result: structuredClone(updatedTask), save: true };
+  });
 }
 
 /**
@@ -144,9 +515,11 @@ export async function createTask(data: CreateTaskDto): Promise<Task> {
     updatedAt: now,
   };
 
-  const tasks = await getTasksByProject(data.projectId);
-  tasks.push(newTask);
-  await saveProjectTasks(data.projectId, tasks);
+  await loadTaskIndex();
+  await modifyProjectTasks(data.projectId, (tasks) => {
+    tasks.push(newTask);
+    return { result: undefined, save: true };
+  });
 
   return newTask;
 }
@@ -164,6 +537,7 @@ export interface AddGenerationHistoryInput {
     output: number;
   };
   feedback?: string;
+  cached?: boolean;
 }
 
 /**
@@ -179,43 +553,43 @@ export async function addGenerationHistoryEntry(
   entry: AddGenerationHistoryInput
 ): Promise<Task | null> {
   try {
-    const tasks = await getTasksByProject(projectId);
-    const taskIndex = tasks.findIndex((t) => t.id === taskId);
-
-    if (taskIndex === -1) {
-      console.error(`Task ${taskId} not found in project ${projectId}`);
-      return null;
-    }
+    return await modifyProjectTasks(projectId, (tasks) => {
+      const taskIndex = tasks.findIndex((t) => t.id === taskId);
 
-    const task = tasks[taskIndex];
-
-    // Create the full history entry with id and timestamp
-    const historyEntry: GenerationHistoryEntry = {
-      id: uuidv4(),
-      documentType: entry.documentType,
-      action: entry.action,
-      provider: entry.provider,
-      model: entry.model,
-      createdAt: new Date().toISOString(),
-      ...(entry.tokens && { tokens: entry.tokens }),
-      ...(entry.feedback && { feedback: entry.feedback }),
-    };
+      if (taskIndex === -1) {
+        console.error(`Task ${taskId} not found in project ${projectId}`);
+        return { result: null, save: false };
+      }
 
-    // Initialize generationHistory if it doesn't exist (backward compatibility)
-    const generationHistory = task.generationHistory ?? [];
-    generationHistory.push(historyEntry);
+      const task = tasks[taskIndex];
+
+      // Create the full history entry with id and timestamp
+      const historyEntry: GenerationHistoryEntry = {
+        id: uuidv4(),
+        documentType: entry.documentType,
+        action: entry.action,
+        provider: entry.provider,
+        model: entry.model,
+        createdAt: new Date().toISOString(),
+        ...(entry.tokens && { tokens: entry.tokens }),
+        ...(entry.feedback && { feedback: entry.feedback }),
+        ...(entry.cached && { cached: true }),
+      };
 
-    // Update task
-    const updatedTask: Task = {
-      ...task,
-      generationHistory,
-      updatedAt: new Date().toISOString(),
-    };
+      // Initialize generationHistory if it doesn't exist (backward compatibility)
+      const generationHistory = task.generationHistory ?? [];
+      generationHistory.push(historyEntry);
 
-    tasks[taskIndex] = updatedTask;
-    await saveProjectTasks(projectId, tasks);
+      // Update task
+      const updatedTask: Task = {
+        ...task,
+        generationHistory,
+        updatedAt: new Date().toISOString(),
+      };
 
-    return updatedTask;
+      tasks[taskIndex] = updatedTask;
+      return { result: structuredClone(updatedTask), save: true };
+    });
   } catch (error) {
     console.error('Error adding generation history entry:', error);
     return null;
@@ -233,16 +607,63 @@ export async function deleteTask(taskId: string): Promise<boolean> {
     return false;
   }
 
-  const { projectId } = result;
-  const tasks = await getTasksByProject(projectId);
-  const filteredTasks = tasks.filter((t) => t.id !== taskId);
+  return modifyProjectTasks(result.projectId, (tasks) => {
+    const taskIndex = tasks.findIndex((t) => t.id === taskId);
 
-  if (filteredTasks.length === tasks.length) {
-    return false; // Task was not in the list
-  }
+    if (taskIndex === -1) {
+      return { result: false, save: false }; // Task was not in the list
+    }
+
+    tasks.splice(taskIndex, 1);
+    return { result: true, save: true };
+  });
+}
+
+/**
+ * Remove a task from a project under the project lock
+ * `beforeRemove` runs under the lock with the current task, so it sees any
+ * update that landed before it; if it throws, the task is kept.
+ * @param projectId - Project ID
+ * @param taskId - Task ID to remove
+ * @param beforeRemove - Runs before the task is removed (e.g. to archive it)
+ * @returns Result of beforeRemove, or null if the task was not found
+ */
+export async function removeProjectTask<T>(
+  projectId: string,
+  taskId: string,
+  beforeRemove: (task: Task) => Promise<T>
+): Promise<T | null> {
+  return modifyProjectTasks(projectId, async (tasks) => {
+    const taskIndex = tasks.findIndex((t) => t.id === taskId);
+
+    if (taskIndex === -1) {
+      return { result: null, save: false };
+    }
+
+    const result = await beforeRemove(structuredClone(tasks[taskIndex]));
+    tasks.splice(taskIndex, 1);
+    return { result, save: true };
+  });
+}
 
-  await saveProjectTasks(projectId, filteredTasks);
-  return true;
+/**
+ * Insert a task into a project under the project lock
+ * Replaces a task with the same ID instead of adding a duplicate.
+ * @param projectId - Project ID
+ * @param task - Task to insert
+ */
+export async function insertProjectTask(projectId: string, task: Task): Promise<void> {
+  await loadTaskIndex();
+  await modifyProjectTasks(projectId, (tasks) => {
+    const taskIndex = tasks.findIndex((t) => t.id === task.id);
+
+    if (taskIndex === -1) {
+      tasks.push(structuredClone(task));
+    } else {
+      tasks[taskIndex] = structuredClone(task);
+    }
+    return { result: undefined, save: true };
+  });
 }
 
 /**
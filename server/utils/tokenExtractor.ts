@@ -5,7 +5,7 @@
  * Supports:
  * - OpenAI format (used by OpenAI, LMStudio, and other OpenAI-compatible APIs)
  * - Google Gemini format
- * - ClaudeCode (no token information available)
+ * - ClaudeCode CLI JSON result (usage is present only in --output-format json)
  */
 
 import type { LLMProvider } from '../../src/types/llm';
@@ -44,7 +44,7 @@ export function extractTokenUsage(
     case 'gemini':
       return extractGeminiFormat(response);
     case 'claude-code':
-      return undefined; // ClaudeCode CLI doesn't provide token usage
+      return extractClaudeCodeFormat(response);
     default:
       return undefined;
   }
@@ -120,3 +120,34 @@ function extractGeminiFormat(response: unknown): TokenUsage | undefined {
     total_tokens: totalTokenCount,
   };
 }
+
+/**
+ * Extract tokens from a Claude Code CLI JSON result
+ * Plain text output carries no usage.
+ */
+function extractClaudeCodeFormat(response: unknown): TokenUsage | undefined {
+  if (!response || typeof response !== 'object') {
+    return undefined;
+  }
+
+  const obj = response as Record<string, unknown>;
+  const usage = obj.usage;
+
+  if (!usage || typeof usage !== 'object') {
+    return undefined;
+  }
+
+  const usageObj = usage as Record<string, unknown>;
+  const inputTokens = usageObj.input_tokens;
+  const outputTokens = usageObj.output_tokens;
+
+  if (typeof inputTokens !== 'number' || typeof outputTokens !== 'number') {
+    return undefined;
+  }
+
+  return {
+    prompt_tokens: inputTokens,
+    completion_tokens: outputTokens,
+    total_tokens: inputTokens + outputTokens,
+  };
+}
@@ -6,21 +6,34 @@
  * - Parent-child version tracking
  * - Change description support
  * - Task-scoped version isolation
+ * - Delta compression (periodic full snapshots plus line diffs)
+ *
+ * Content is stored in chunk files. Each chunk starts with a full snapshot
+ * and holds up to SNAPSHOT_INTERVAL - 1 line deltas, each relative to the
+ * version before it. A new snapshot is started when the chunk is full or
+ * when a delta would not be smaller than the content itself.
+ *
+ * Version metadata (number, author, timestamp, ...) lives in the index, so
+ * listing versions never touches content.
  *
  * File Structure:
  * workspace/projects/{projectId}/tasks/{taskId}/versions/
- *   ├── versions.json (index of all version IDs)
- *   ├── {versionId1}.json
- *   ├── {versionId2}.json
+ *   ├── versions.json (index: metadata and chunk location of every version)
+ *   ├── chunk-{n}.json (snapshot + deltas, numbered from 1)
  *   └── ...
  *
+ * Tasks still using the previous layout (a versions.json array of IDs and
+ * one {versionId}.json file per version) are migrated on first access.
+ *
  * @module versionStorage
  */
 
 import fs from 'fs/promises';
 import path from 'path';
+import * as diff from 'diff';
 import { v4 as uuidv4 } from 'uuid';
 import { WORKSPACE_PATH } from './projectStorage';
+import { writeFileAtomic, withFileLock } from './atomicFile';
 
 /**
  * Document Version interface
@@ -45,6 +58,14 @@ export interface DocumentVersion {
   parentVersionId?: string;
 }
 
+/**
+ * Version metadata without content
+ */
+export interface VersionMetadata extends Omit<DocumentVersion, 'content'> {
+  /** Length of the document content in characters */
+  contentLength: number;
+}
+
 /**
  * Input for creating a new version
  */
@@ -61,6 +82,63 @@ export interface SaveVersionInput {
   parentVersionId?: string;
 }
 
+// =============================================================================
+// Storage Format
+// =============================================================================
+
+/**
+ * Maximum number of versions per chunk (one snapshot plus deltas)
+ * Bounds the number of deltas applied to reconstruct any version.
+ */
+export const SNAPSHOT_INTERVAL = 25;
+
+/**
+ * Maximum number of chunk or legacy files read at once
+ */
+const READ_CONCURRENCY = 8;
+
+/**
+ * Edits beyond this many lines are stored as a snapshot instead of a delta
+ */
+const MAX_DELTA_EDIT_LENGTH = 10_000;
+
+const INDEX_FORMAT = 2;
+
+/**
+ * Delta operation applied to the previous version's content:
+ * - positive number: copy that many characters
+ * - negative number: skip that many characters
+ * - string: insert it
+ */
+type DeltaOp = number | string;
+
+/**
+ * Chunk file: a full snapshot followed by successive deltas
+ */
+interface VersionChunk {
+  snapshot: string;
+  deltas: DeltaOp[][];
+}
+
+/**
+ * Index entry: version metadata plus where its content is stored
+ */
+interface VersionIndexEntry extends VersionMetadata {
+  /** Chunk number (1, 2, ...) */
+  chunk: number;
+  /** Position in the chunk (0 = snapshot, n = after n deltas) */
+  offset: number;
+}
+
+interface VersionIndexFile {
+  format: number;
+  versions: VersionIndexEntry[];
+}
+
+// =============================================================================
+// Paths
+// =============================================================================
+
 /**
  * Get versions directory path for a task
  * @param projectId - Project ID
@@ -82,7 +160,19 @@ export function getVersionIndexFilePath(projectId: string, taskId: string): stri
 }
 
 /**
- * Get version file path for a specific version
+ * Get chunk file path
+ * @param projectId - Project ID
+ * @param taskId - Task ID
+ * @param chunk - Chunk number
+ * @returns Absolute path to chunk JSON file
+ */
+export function getVersionChunkFilePath(projectId: string, taskId: string, chunk: number): string {
+  return path.join(getVersionsDirPath(projectId, taskId), `chunk-${chunk}.json`);
+}
+
+/**
+ * Get legacy per-version file path
+ * Only used to migrate tasks saved before delta compression.
  * @param projectId - Project ID
  * @param taskId - Task ID
  * @param versionId - Version ID
@@ -101,6 +191,10 @@ export function getVersionsFilePath(projectId: string): string {
   return path.join(WORKSPACE_PATH, projectId, 'versions.json');
 }
 
+function getVersionsLockKey(projectId: string, taskId: string): string {
+  return `versions:${projectId}:${taskId}`;
+}
+
 /**
  * Ensure versions directory exists
  * @param projectId - Project ID
@@ -111,50 +205,258 @@ async function ensureVersionsDirectory(projectId: string, taskId: string): Promi
   await fs.mkdir(versionsDir, { recursive: true });
 }
 
+// =============================================================================
+// Helpers
+// =============================================================================
+
 /**
- * Read version index file
- * @param projectId - Project ID
- * @param taskId - Task ID
- * @returns Array of version IDs, empty array if file doesn't exist
+ * Map items with at most `limit` operations in flight
+ * Results keep the order of `items`.
+ */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  async function worker(): Promise<void> {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  }
+
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, () => worker()));
+  return results;
+}
+
+/**
+ * Create a line delta that turns `base` into `target`
+ * @returns Delta operations, or null if the edit is too large to diff
+ */
+function createDelta(base: string, target: string): DeltaOp[] | null {
+  const parts = diff.diffLines(base, target, { maxEditLength: MAX_DELTA_EDIT_LENGTH });
+  if (!parts) {
+    return null;
+  }
+
+  const ops: DeltaOp[] = [];
+  for (const part of parts) {
+    if (part.added) {
+      ops.push(part.value);
+    } else if (part.removed) {
+      ops.push(-part.value.length);
+    } else {
+      ops.push(part.value.length);
+    }
+  }
+  return ops;
+}
+
+/**
+ * Apply a delta created by createDelta
+ */
+function applyDelta(base: string, ops: DeltaOp[]): string {
+  const output: string[] = [];
+  let position = 0;
+
+  for (const op of ops) {
+    if (typeof op === 'string') {
+      output.push(op);
+    } else if (op >= 0) {
+      output.push(base.slice(position, position + op));
+      position += op;
+    } else {
+      position -= op;
+    }
+  }
+
+  return output.join('');
+}
+
+/**
+ * Rebuild the content at `offset` in a chunk
  */
-async function readVersionIndex(projectId: string, taskId: string): Promise<string[]> {
+function reconstructContent(chunk: VersionChunk, offset: number): string {
+  let content = chunk.snapshot;
+  for (let i = 0; i < offset; i++) {
+    content = applyDelta(content, chunk.deltas[i]);
+  }
+  return content;
+}
+
+function toMetadata(entry: VersionIndexEntry): VersionMetadata {
+  const { chunk: _chunk, offset: _offset, ...metadata } = entry;
+  return metadata;
+}
+
+function toDocumentVersion(entry: VersionIndexEntry, content: string): DocumentVersion {
+  const { contentLength: _contentLength, ...metadata } = toMetadata(entry);
+  return { ...metadata, content };
+}
+
+// =============================================================================
+// Index and Chunk Files
+// =============================================================================
+
+/**
+ * Read the raw index file
+ * @returns Parsed JSON (legacy array or index object), null if missing
+ */
+async function readIndexFile(projectId: string, taskId: string): Promise<unknown> {
   try {
-    const indexPath = getVersionIndexFilePath(projectId, taskId);
-    const content = await fs.readFile(indexPath, 'utf-8');
-    return JSON.parse(content) as string[];
+    const content = await fs.readFile(getVersionIndexFilePath(projectId, taskId), 'utf-8');
+    return JSON.parse(content);
   } catch {
-    return [];
+    return null;
+  }
+}
+
+async function writeIndex(projectId: string, taskId: string, versions: VersionIndexEntry[]): Promise<void> {
+  const index: VersionIndexFile = { format: INDEX_FORMAT, versions };
+  await writeFileAtomic(getVersionIndexFilePath(projectId, taskId), JSON.stringify(index));
+}
+
+async function readChunk(projectId: string, taskId: string, chunk: number): Promise<VersionChunk | null> {
+  try {
+    const content = await fs.readFile(getVersionChunkFilePath(projectId, taskId, chunk), 'utf-8');
+    return JSON.parse(content) as VersionChunk;
+  } catch {
+    return null;
   }
 }
 
+async function writeChunk(projectId: string, taskId: string, chunk: number, data: VersionChunk): Promise<void> {
+  await writeFileAtomic(getVersionChunkFilePath(projectId, taskId, chunk), JSON.stringify(data));
+}
+
 /**
- * Write version index file
- * @param projectId - Project ID
- * @param taskId - Task ID
- * @param versionIds - Array of version IDs to write
+ * Place new content after the last version
+ * Appends a delta to the last chunk when possible, otherwise starts a new
+ * chunk. `chunks` must contain the last entry's chunk and is updated in place.
+ * @returns Chunk and offset of the new version
  */
-async function writeVersionIndex(projectId: string, taskId: string, versionIds: string[]): Promise<void> {
-  const indexPath = getVersionIndexFilePath(projectId, taskId);
-  await fs.writeFile(indexPath, JSON.stringify(versionIds, null, 2), 'utf-8');
+function appendContent(
+  chunks: Map<number, VersionChunk>,
+  last: VersionIndexEntry | undefined,
+  previousContent: string | null,
+  content: string
+): { chunk: number; offset: number } {
+  const lastChunk = last ? chunks.get(last.chunk) : undefined;
+
+  if (last && lastChunk && previousContent !== null && last.offset + 1 < SNAPSHOT_INTERVAL) {
+    const delta = createDelta(previousContent, content);
+    if (delta && JSON.stringify(delta).length < content.length) {
+      // Drop deltas left behind by an interrupted save
+      lastChunk.deltas.length = last.offset;
+      lastChunk.deltas.push(delta);
+      return { chunk: last.chunk, offset: last.offset + 1 };
+    }
+  }
+
+  const chunk = last ? last.chunk + 1 : 1;
+  chunks.set(chunk, { snapshot: content, deltas: [] });
+  return { chunk, offset: 0 };
 }
 
+// =============================================================================
+// Migration
+// =============================================================================
+
 /**
- * Calculate next version number for a task
- * @param projectId - Project ID
- * @param taskId - Task ID
- * @returns Next version number (1 if no versions exist)
+ * Convert a legacy task (one file per version) to chunk storage
+ * Callers must hold the task's version lock. Legacy files are removed only
+ * after the new index has been written.
  */
-async function getNextVersionNumber(projectId: string, taskId: string): Promise<number> {
-  const existingVersions = await getVersions(projectId, taskId);
+async function migrateLegacyIndex(
+  projectId: string,
+  taskId: string,
+  versionIds: string[]
+): Promise<VersionIndexEntry[]> {
+  const legacyVersions = await mapWithConcurrency(versionIds, READ_CONCURRENCY, async (versionId) => {
+    try {
+      const content = await fs.readFile(getVersionFilePath(projectId, taskId, versionId), 'utf-8');
+      const version = JSON.parse(content) as DocumentVersion;
+      return version.taskId === taskId ? version : null;
+    } catch {
+      return null;
+    }
+  });
 
-  if (existingVersions.length === 0) {
-    return 1;
+  const versions = legacyVersions
+    .filter((v): v is DocumentVersion => v !== null)
+    .sort((a, b) => a.versionNumber - b.versionNumber);
+
+  const chunks = new Map<number, VersionChunk>();
+  const entries: VersionIndexEntry[] = [];
+  let previousContent: string | null = null;
+
+  for (const version of versions) {
+    const { content, ...metadata } = version;
+    const location = appendContent(chunks, entries[entries.length - 1], previousContent, content);
+    entries.push({ ...metadata, contentLength: content.length, ...location });
+    previousContent = content;
   }
 
-  const maxVersionNumber = Math.max(...existingVersions.map((v) => v.versionNumber));
-  return maxVersionNumber + 1;
+  await mapWithConcurrency(Array.from(chunks), READ_CONCURRENCY, ([chunk, data]) =>
+    writeChunk(projectId, taskId, chunk, data)
+  );
+  await writeIndex(projectId, taskId, entries);
+
+  await mapWithConcurrency(versionIds, READ_CONCURRENCY, (versionId) =>
+    fs.unlink(getVersionFilePath(projectId, taskId, versionId)).catch(() => {
+      // Already removed or never written
+    })
+  );
+
+  return entries;
 }
 
+/**
+ * Load index entries, migrating legacy storage while holding the lock
+ */
+async function loadIndexEntriesLocked(projectId: string, taskId: string): Promise<VersionIndexEntry[]> {
+  const raw = await readIndexFile(projectId, taskId);
+  if (Array.isArray(raw)) {
+    return migrateLegacyIndex(projectId, taskId, raw as string[]);
+  }
+  return raw ? (raw as VersionIndexFile).versions : [];
+}
+
+/**
+ * Load index entries for reading
+ */
+async function loadIndexEntries(projectId: string, taskId: string): Promise<VersionIndexEntry[]> {
+  const raw = await readIndexFile(projectId, taskId);
+  if (Array.isArray(raw)) {
+    return withFileLock(getVersionsLockKey(projectId, taskId), () =>
+      loadIndexEntriesLocked(projectId, taskId)
+    );
+  }
+  return raw ? (raw as VersionIndexFile).versions : [];
+}
+
+/**
+ * Migrate a task's versions to delta-compressed storage
+ *
+ * Runs automatically on first access; exposed for bulk migration scripts.
+ * Tasks already migrated are left unchanged.
+ *
+ * @param projectId - Project ID
+ * @param taskId - Task ID
+ * @returns Metadata of all versions after migration
+ */
+export async function migrateVersionStore(projectId: string, taskId: string): Promise<VersionMetadata[]> {
+  const entries = await loadIndexEntries(projectId, taskId);
+  return entries.map(toMetadata);
+}
+
+// =============================================================================
+// Public API
+// =============================================================================
+
 /**
  * Save a new document version
  *
@@ -179,37 +481,62 @@ export async function saveVersion(
   projectId: string,
   input: SaveVersionInput
 ): Promise<DocumentVersion> {
-  await ensureVersionsDirectory(projectId, input.taskId);
+  return withFileLock(getVersionsLockKey(projectId, input.taskId), async () => {
+    await ensureVersionsDirectory(projectId, input.taskId);
+
+    const entries = await loadIndexEntriesLocked(projectId, input.taskId);
+    const last = entries[entries.length - 1];
 
-  const nextVersionNumber = await getNextVersionNumber(projectId, input.taskId);
+    const newVersion: DocumentVersion = {
+      id: uuidv4(),
+      taskId: input.taskId,
+      content: input.content,
+      author: input.author,
+      versionNumber: last ? last.versionNumber + 1 : 1,
+      timestamp: new Date().toISOString(),
+      changeDescription: input.changeDescription,
+      parentVersionId: input.parentVersionId,
+    };
 
-  const newVersion: DocumentVersion = {
-    id: uuidv4(),
-    taskId: input.taskId,
-    content: input.content,
-    author: input.author,
-    versionNumber: nextVersionNumber,
-    timestamp: new Date().toISOString(),
-    changeDescription: input.changeDescription,
-    parentVersionId: input.parentVersionId,
-  };
+    // Only the last chunk is needed to compute the delta
+    const chunks = new Map<number, VersionChunk>();
+    let previousContent: string | null = null;
+    if (last) {
+      const lastChunk = await readChunk(projectId, input.taskId, last.chunk);
+      if (lastChunk) {
+        chunks.set(last.chunk, lastChunk);
+        previousContent = reconstructContent(lastChunk, last.offset);
+      }
+    }
 
-  // Save version file
-  const versionFilePath = getVersionFilePath(projectId, input.taskId, newVersion.id);
-  await fs.writeFile(versionFilePath, JSON.stringify(newVersion, null, 2), 'utf-8');
+    const location = appendContent(chunks, last, previousContent, input.content);
+    await writeChunk(projectId, input.taskId, location.chunk, chunks.get(location.chunk)!);
 
-  // Update version index
-  const versionIds = await readVersionIndex(projectId, input.taskId);
-  versionIds.push(newVersion.id);
-  await writeVersionIndex(projectId, input.taskId, versionIds);
+    const { content, ...metadata } = newVersion;
+    entries.push({ ...metadata, contentLength: content.length, ...location });
+    await writeIndex(projectId, input.taskId, entries);
 
-  return newVersion;
+    return newVersion;
+  });
+}
+
+/**
+ * List version metadata for a task without loading content
+ *
+ * @param projectId - Project ID
+ * @param taskId - Task ID
+ * @returns Version metadata sorted by version number
+ */
+export async function listVersions(projectId: string, taskId: string): Promise<VersionMetadata[]> {
+  const entries = await loadIndexEntries(projectId, taskId);
+  return entries.map(toMetadata).sort((a, b) => a.versionNumber - b.versionNumber);
 }
 
 /**
  * Get all versions for a task
  *
  * Returns versions sorted by version number in ascending order.
+ * Chunks are read in parallel with bounded concurrency.
  *
  * @param projectId - Project ID
  * @param taskId - Task ID
@@ -223,23 +550,45 @@ export async function saveVersion(
  * ```
  */
 export async function getVersions(projectId: string, taskId: string): Promise<DocumentVersion[]> {
-  const versionIds = await readVersionIndex(projectId, taskId);
+  const entries = await loadIndexEntries(projectId, taskId);
 
-  if (versionIds.length === 0) {
+  if (entries.length === 0) {
     return [];
   }
 
-  const versions: DocumentVersion[] = [];
+  const entriesByChunk = new Map<number, VersionIndexEntry[]>();
+  for (const entry of entries) {
+    const chunkEntries = entriesByChunk.get(entry.chunk) ?? [];
+    chunkEntries.push(entry);
+    entriesByChunk.set(entry.chunk, chunkEntries);
+  }
+
+  const chunkVersions = await mapWithConcurrency(
+    Array.from(entriesByChunk),
+    READ_CONCURRENCY,
+    async ([chunkNumber, chunkEntries]) => {
+      const chunk = await readChunk(projectId, taskId, chunkNumber);
+      if (!chunk) {
+        return [];
+      }
 
-  for (const versionId of versionIds) {
-    const version = await getVersion(projectId, taskId, versionId);
-    if (version) {
-      versions.push(version);
+      // Walk the chunk once, emitting each indexed version on the way
+      chunkEntries.sort((a, b) => a.offset - b.offset);
+      const versions: DocumentVersion[] = [];
+      let content = chunk.snapshot;
+      let offset = 0;
+      for (const entry of chunkEntries) {
+        for (; offset < entry.offset; offset++) {
+          content = applyDelta(content, chunk.deltas[offset]);
+        }
+        versions.push(toDocumentVersion(entry, content));
+      }
+      return versions;
     }
-  }
+  );
 
   // Sort by version number ascending
-  return versions.sort((a, b) => a.versionNumber - b.versionNumber);
+  return chunkVersions.flat().sort((a, b) => a.versionNumber - b.versionNumber);
 }
 
 /**
@@ -266,16 +615,20 @@ export async function getVersion(
   versionId: string
 ): Promise<DocumentVersion | null> {
   try {
-    const versionFilePath = getVersionFilePath(projectId, taskId, versionId);
-    const content = await fs.readFile(versionFilePath, 'utf-8');
-    const version = JSON.parse(content) as DocumentVersion;
+    const entries = await loadIndexEntries(projectId, taskId);
+    const entry = entries.find((e) => e.id === versionId);
 
     // Verify the version belongs to the specified task
-    if (version.taskId !== taskId) {
+    if (!entry || entry.taskId !== taskId) {
+      return null;
+    }
+
+    const chunk = await readChunk(projectId, taskId, entry.chunk);
+    if (!chunk) {
       return null;
     }
 
-    return version;
+    return toDocumentVersion(entry, reconstructContent(chunk, entry.offset));
   } catch {
     return null;
   }
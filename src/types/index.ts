@@ -452,6 +452,12 @@ export interface TimelineDataPoint {
   tasksCreated: number;
   tasksCompleted: number;
   documentsGenerated: number;
+  /** Input tokens of generations for tasks created in this period (from generationHistory) */
+  inputTokens?: number;
+  /** Output tokens of generations for tasks created in this period */
+  outputTokens?: number;
+  /** Estimated USD cost of generations for tasks created in this period */
+  estimatedCost?: number;
 }
 
 /**
@@ -579,6 +585,8 @@ export interface GenerationHistoryEntry {
   };
   /** User feedback for modification requests */
   feedback?: string;
+  /** Served from the response cache; no tokens were spent */
+  cached?: boolean;
 }
 
 // =============================================================================
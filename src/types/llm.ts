@@ -89,6 +89,16 @@ export interface LLMModelConfig {
   topP: number;
 }
 
+/** Connection limits for an HTTP provider endpoint (server defaults when omitted) */
+export interface LLMProviderTransportSettings {
+  /** Maximum concurrent connections to the endpoint */
+  maxSockets?: number;
+  /** Sustained requests per second to the endpoint */
+  requestsPerSecond?: number;
+  /** Requests allowed in a burst (defaults to one second's worth) */
+  burst?: number;
+}
+
 /** Provider-specific settings including API credentials */
 export interface LLMProviderSettings {
   provider: LLMProvider;
@@ -98,6 +108,7 @@ export interface LLMProviderSettings {
   connectionStatus: ConnectionStatus;
   lastTestedAt?: string;
   errorMessage?: string;
+  transport?: LLMProviderTransportSettings;
 }
 
 /** Task stage specific model configuration */
@@ -108,11 +119,19 @@ export interface TaskStageConfig {
   defaultModel: LLMModelConfig;
 }
 
+/** Response cache settings (opt-in per project) */
+export interface LLMResponseCacheSettings {
+  enabled: boolean;
+  /** Maximum age of a reusable response in hours (server default when omitted) */
+  ttlHours?: number;
+}
+
 /** Complete LLM settings for a project */
 export interface ProjectLLMSettings {
   projectId: string;
   providers: LLMProviderSettings[];
   taskStageConfig: TaskStageConfig;
+  responseCache?: LLMResponseCacheSettings;
   updatedAt: string;
 }
 
@@ -128,6 +147,7 @@ export interface LLMResult {
     input: number;
     output: number;
   };
+  cached?: boolean; // Served from the response cache; tokens are the original call's
 }
 
 /** Result of connection test */
@@ -158,6 +178,26 @@ export function isValidConnectionStatus(value: string): value is ConnectionStatu
   return ['connected', 'disconnected', 'error', 'untested', 'testing'].includes(value);
 }
 
+/**
+ * Check that transport settings hold only positive, finite numbers
+ * maxSockets and burst must be whole numbers; omitted fields use server defaults.
+ */
+export function isValidTransportSettings(value: unknown): value is LLMProviderTransportSettings {
+  if (value === undefined) {
+    return true;
+  }
+  if (typeof value !== 'object' || value === null) {
+    return false;
+  }
+
+  const isPositive = (field: unknown, integer: boolean): boolean =>
+    field === undefined ||
+    (typeof field === 'number' && Number.isFinite(field) && field > 0 && (!integer || Number.isInteger(field)));
+
+  const { maxSockets, requestsPerSecond, burst } = value as Record<string, unknown>;
+  return isPositive(maxSockets, true) && isPositive(requestsPerSecond, false) && isPositive(burst, true);
+}
+
 // ============================================================================
 // Factory Functions
 // ============================================================================
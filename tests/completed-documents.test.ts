@@ -278,6 +278,32 @@ describe('Completed Documents API (SPEC-DOCREF-001)', () => {
       expect(titles).toContain('Archived Task 1');
     });
 
+    it('should list documents in file order, prototype tasks before archives', async () => {
+      const newer = await createPrototypeTask(testProjectId, {
+        title: 'Written First',
+        createdAt: '2024-02-01T00:00:00.000Z',
+      });
+      await createPrototypeTask(testProjectId, {
+        title: 'Written Second',
+        createdAt: '2024-01-01T00:00:00.000Z',
+      });
+      await createArchivedTask(testProjectId, { ...newer, id: uuidv4(), title: 'Archived First' });
+      await createArchivedTask(testProjectId, { ...newer, id: uuidv4(), title: 'Archived Second' });
+
+      const response = await request(app)
+        .get(`/api/projects/${testProjectId}/completed-documents`)
+        .expect(200);
+
+      const body = response.body as ApiResponse<CompletedDocumentSummary[]>;
+
+      expect(body.data!.map((d) => d.title)).toEqual([
+        'Written First',
+        'Written Second',
+        'Archived First',
+        'Archived Second',
+      ]);
+    });
+
     it('should not return non-prototype tasks', async () => {
       // Create tasks in various statuses
       const tasksPath = path.join(WORKSPACE_PATH, testProjectId, 'tasks', 'tasks.json');
@@ -417,6 +443,18 @@ describe('Completed Documents API (SPEC-DOCREF-001)', () => {
       expect(body.data![0].title).toBe('Task 1');
     });
 
+    it('should not search the PRD', async () => {
+      await createPrototypeTask(testProjectId, { prd: 'Only the PRD mentions quartz' });
+
+      const response = await request(app)
+        .get(`/api/projects/${testProjectId}/completed-documents?search=quartz`)
+        .expect(200);
+
+      const body = response.body as ApiResponse<CompletedDocumentSummary[]>;
+
+      expect(body.data).toEqual([]);
+    });
+
     it('should return empty array when no matches found', async () => {
       await createPrototypeTask(testProjectId, { title: 'Login Feature' });
 
@@ -459,6 +497,36 @@ describe('Completed Documents API (SPEC-DOCREF-001)', () => {
       expect(body.data).toHaveLength(1);
       expect(body.data![0].title).toContain('SPECIAL');
     });
+
+    it('should rank title matches above document body matches', async () => {
+      await createPrototypeTask(testProjectId, {
+        title: 'Inventory Screen',
+        designDocument: 'Shows the inventory grid next to the guild panel',
+      });
+      await createPrototypeTask(testProjectId, { title: 'Guild Management' });
+
+      const response = await request(app)
+        .get(`/api/projects/${testProjectId}/completed-documents?search=guild`)
+        .expect(200);
+
+      const body = response.body as ApiResponse<CompletedDocumentSummary[]>;
+
+      expect(body.data!.map((d) => d.title)).toEqual(['Guild Management', 'Inventory Screen']);
+    });
+
+    it('should paginate ranked search results', async () => {
+      for (let i = 1; i <= 5; i++) {
+        await createPrototypeTask(testProjectId, { title: `Quest ${i}` });
+      }
+
+      const response = await request(app)
+        .get(`/api/projects/${testProjectId}/completed-documents?search=quest&limit=2&offset=2`)
+        .expect(200);
+
+      const body = response.body as ApiResponse<CompletedDocumentSummary[]>;
+
+      expect(body.data).toHaveLength(2);
+    });
   });
 
   // -------------------------------------------------------------------------
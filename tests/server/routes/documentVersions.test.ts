@@ -178,6 +178,26 @@ describe('documentVersions API Routes', () => {
       expect(response.body.data[1].versionNumber).toBe(2);
       expect(response.body.data[2].versionNumber).toBe(3);
     });
+
+    it('should include content only when requested', async () => {
+      const { testProjectId, testTaskId } = createTestIds();
+
+      await request(app)
+        .post(`/api/tasks/${testTaskId}/versions`)
+        .send({ projectId: testProjectId, content: 'V1', author: 'user1' });
+
+      const metadataResponse = await request(app)
+        .get(`/api/tasks/${testTaskId}/versions`)
+        .query({ projectId: testProjectId });
+
+      const fullResponse = await request(app)
+        .get(`/api/tasks/${testTaskId}/versions`)
+        .query({ projectId: testProjectId, includeContent: 'true' });
+
+      expect(metadataResponse.body.data[0].content).toBeUndefined();
+      expect(metadataResponse.body.data[0].contentLength).toBe(2);
+      expect(fullResponse.body.data[0].content).toBe('V1');
+    });
   });
 
   describe('GET /api/tasks/:taskId/versions/:versionId', () => {
@@ -8,6 +8,7 @@ import request from 'supertest';
 import { generateRouter, setClaudeCodeRunner } from '../../../server/routes/generate';
 import * as llmSettingsStorage from '../../../server/utils/llmSettingsStorage';
 import * as llmProvider from '../../../server/utils/llmProvider';
+import { LLMLogger } from '../../../server/utils/llmLogger';
 import type { ProjectLLMSettings } from '../../../src/types/llm';
 import { createDefaultProjectLLMSettings, createDefaultModelConfig } from '../../../src/types/llm';
 
@@ -26,10 +27,13 @@ describe('Generate Routes - LLM Provider Selection', () => {
   beforeEach(() => {
     vi.clearAllMocks();
     setClaudeCodeRunner(mockClaudeCodeRunner);
+    // Keep call logs in memory instead of the workspace call log
+    llmProvider.setSharedLogger(new LLMLogger());
   });
 
   afterEach(() => {
     vi.restoreAllMocks();
+    llmProvider.clearSharedLogger();
   });
 
   describe('design-document endpoint with LLM selection', () => {
@@ -52,6 +56,31 @@ describe('Generate Routes - LLM Provider Selection', () => {
       expect(mockClaudeCodeRunner).toHaveBeenCalled();
     });
 
+    it('should log default Claude Code calls with project, duration and usage', async () => {
+      vi.spyOn(llmSettingsStorage, 'getLLMSettingsOrDefault').mockResolvedValue(
+        createDefaultProjectLLMSettings('test-project')
+      );
+      mockClaudeCodeRunner.mockResolvedValueOnce({
+        output: { type: 'result', result: 'Generated', usage: { input_tokens: 12, output_tokens: 34 } },
+        rawOutput: 'Raw output',
+      });
+
+      await request(app)
+        .post('/api/generate/design-document')
+        .send({
+          qaResponses: [{ question: 'Test?', answer: 'Answer' }],
+          projectId: 'test-project',
+        });
+
+      const [entry] = llmProvider.getSharedLogger().getLogs();
+      expect(entry).toMatchObject({
+        provider: 'claude-code',
+        projectId: 'test-project',
+        response: { usage: { prompt_tokens: 12, completion_tokens: 34, total_tokens: 46 } },
+      });
+      expect(entry.metrics?.duration_ms).toBeGreaterThanOrEqual(0);
+    });
+
     it('should use configured provider for design stage', async () => {
       // Create settings with OpenAI configured for designDoc
       const settings: ProjectLLMSettings = {
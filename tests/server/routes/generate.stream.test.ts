@@ -0,0 +1,203 @@
+/**
+ * Generate Routes Streaming Tests
+ * Tests for Server-Sent Events document generation endpoints
+ */
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import express from 'express';
+import request from 'supertest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { generateRouter, setClaudeCodeStreamRunner } from '../../../server/routes/generate';
+import * as llmSettingsStorage from '../../../server/utils/llmSettingsStorage';
+import * as llmProvider from '../../../server/utils/llmProvider';
+import * as taskStorage from '../../../server/utils/taskStorage';
+import { LLMResponseCache, setSharedResponseCache } from '../../../server/utils/llmResponseCache';
+import { LLMLogger } from '../../../server/utils/llmLogger';
+import type { ProjectLLMSettings } from '../../../src/types/llm';
+import { createDefaultProjectLLMSettings } from '../../../src/types/llm';
+
+// Create test app
+const app = express();
+app.use(express.json());
+app.use('/api/generate', generateRouter);
+
+/**
+ * Parse an SSE response body into events
+ */
+function parseEvents(text: string): Array<{ event: string; data: Record<string, unknown> }> {
+  return text
+    .split('\n\n')
+    .filter((block) => block.startsWith('event:'))
+    .map((block) => {
+      const [eventLine, dataLine] = block.split('\n');
+      return {
+        event: eventLine.replace('event: ', ''),
+        data: JSON.parse(dataLine.replace('data: ', '')) as Record<string, unknown>,
+      };
+    });
+}
+
+describe('Generate Routes - Streaming', () => {
+  const mockStreamRunner = vi.fn(async (_prompt: string, _dir: string, options: { onText: (text: string) => void }) => {
+    options.onText('# Design');
+    options.onText(' Document');
+    return {
+      success: true,
+      content: '# Design Document',
+      rawOutput: '{"type":"result"}',
+      usage: { input: 100, output: 20 },
+    };
+  });
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    setClaudeCodeStreamRunner(mockStreamRunner);
+    vi.spyOn(llmSettingsStorage, 'getLLMSettingsOrDefault').mockResolvedValue(
+      createDefaultProjectLLMSettings('test-project')
+    );
+    // Keep call logs in memory instead of the workspace call log
+    llmProvider.setSharedLogger(new LLMLogger());
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+    llmProvider.clearSharedLogger();
+  });
+
+  it('should stream tokens and a final done event from Claude Code', async () => {
+    const response = await request(app)
+      .post('/api/generate/design-document/stream')
+      .send({ qaResponses: [{ question: 'Test?', answer: 'Answer' }], projectId: 'test-project' });
+
+    expect(response.status).toBe(200);
+    expect(response.headers['content-type']).toContain('text/event-stream');
+
+    const events = parseEvents(response.text);
+    expect(events.map((e) => e.event)).toEqual(['token', 'token', 'done']);
+    expect(events[0].data.text).toBe('# Design');
+    expect(events[2].data.data).toBe('# Design Document');
+    expect(events[2].data.tokens).toEqual({ input: 100, output: 20 });
+  });
+
+  it('should record generation history with streamed token usage', async () => {
+    const historySpy = vi.spyOn(taskStorage, 'addGenerationHistoryEntry').mockResolvedValue(null);
+
+    await request(app)
+      .post('/api/generate/prd/stream')
+      .send({ designDocContent: '# Design', projectId: 'test-project', taskId: 'task-1' });
+
+    expect(historySpy).toHaveBeenCalledWith('test-project', 'task-1', expect.objectContaining({
+      documentType: 'prd',
+      action: 'create',
+      tokens: { input: 100, output: 20 },
+    }));
+  });
+
+  it('should use the configured provider stream when available', async () => {
+    const settings: ProjectLLMSettings = {
+      ...createDefaultProjectLLMSettings('test-project'),
+      providers: [
+        { provider: 'openai', apiKey: 'sk-test', isEnabled: true, connectionStatus: 'connected' },
+      ],
+    };
+    settings.taskStageConfig.prototype = {
+      provider: 'openai',
+      modelId: 'gpt-4o',
+      temperature: 0.7,
+      maxTokens: 4096,
+      topP: 1,
+    };
+    vi.spyOn(llmSettingsStorage, 'getLLMSettingsOrDefault').mockResolvedValue(settings);
+
+    const generateStream = vi.fn(async (_prompt: string, _config: unknown, handlers: { onToken: (t: string) => void }) => {
+      handlers.onToken('<html>');
+      return { success: true, content: '<html>', provider: 'openai' as const, model: 'gpt-4o', tokens: { input: 5, output: 1 } };
+    });
+    vi.spyOn(llmProvider, 'createLLMProvider').mockReturnValue({
+      provider: 'openai',
+      generate: vi.fn(),
+      generateStream,
+      testConnection: vi.fn(),
+      getAvailableModels: vi.fn(),
+    });
+
+    const response = await request(app)
+      .post('/api/generate/prototype/stream')
+      .send({ prdContent: '# PRD', projectId: 'test-project' });
+
+    const events = parseEvents(response.text);
+    expect(generateStream).toHaveBeenCalled();
+    expect(mockStreamRunner).not.toHaveBeenCalled();
+    expect(events.map((e) => e.event)).toEqual(['token', 'done']);
+    expect(events[1].data.provider).toBe('openai');
+  });
+
+  it('should record a cached generation without token usage', async () => {
+    const cacheDir = await fs.mkdtemp(path.join(os.tmpdir(), 'generate-cache-test-'));
+    setSharedResponseCache(new LLMResponseCache({ cacheDir }));
+    const settings: ProjectLLMSettings = {
+      ...createDefaultProjectLLMSettings('test-project'),
+      providers: [
+        { provider: 'openai', apiKey: 'sk-test', isEnabled: true, connectionStatus: 'connected' },
+      ],
+      responseCache: { enabled: true },
+    };
+    settings.taskStageConfig.prd = {
+      provider: 'openai',
+      modelId: 'gpt-4o',
+      temperature: 0,
+      maxTokens: 4096,
+      topP: 1,
+    };
+    vi.spyOn(llmSettingsStorage, 'getLLMSettingsOrDefault').mockResolvedValue(settings);
+    vi.spyOn(llmProvider, 'createLLMProvider').mockReturnValue({
+      provider: 'openai',
+      generate: vi.fn(),
+      generateStream: vi.fn(async (_prompt: string, _config: unknown, handlers: { onToken: (t: string) => void }) => {
+        handlers.onToken('# PRD');
+        return { success: true, content: '# PRD', provider: 'openai' as const, model: 'gpt-4o', tokens: { input: 5, output: 1 } };
+      }),
+      testConnection: vi.fn(),
+      getAvailableModels: vi.fn(),
+    });
+    const historySpy = vi.spyOn(taskStorage, 'addGenerationHistoryEntry').mockResolvedValue(null);
+
+    try {
+      for (let i = 0; i < 2; i++) {
+        await request(app)
+          .post('/api/generate/prd/stream')
+          .send({ designDocContent: '# Design', projectId: 'test-project', taskId: 'task-1' });
+      }
+    } finally {
+      setSharedResponseCache(null);
+      await fs.rm(cacheDir, { recursive: true, force: true });
+    }
+
+    expect(historySpy.mock.calls[0][2]).toMatchObject({ tokens: { input: 5, output: 1 } });
+    expect(historySpy.mock.calls[1][2]).toMatchObject({ cached: true, tokens: undefined });
+  });
+
+  it('should send an error event when generation fails', async () => {
+    mockStreamRunner.mockRejectedValueOnce(Object.assign(new Error('exited with code 1'), { name: 'ClaudeCodeError' }));
+
+    const response = await request(app)
+      .post('/api/generate/design-document/stream')
+      .send({ qaResponses: [{ question: 'Test?', answer: 'Answer' }], projectId: 'test-project' });
+
+    const events = parseEvents(response.text);
+    expect(events).toHaveLength(1);
+    expect(events[0].event).toBe('error');
+    expect(events[0].data.status).toBe(500);
+    expect(events[0].data.error).toBe('Claude Code execution failed');
+  });
+
+  it('should return 400 JSON before streaming when required fields are missing', async () => {
+    const response = await request(app)
+      .post('/api/generate/prd/stream')
+      .send({ projectId: 'test-project' });
+
+    expect(response.status).toBe(400);
+    expect(response.body.error).toContain('designDocContent');
+  });
+});
@@ -152,6 +152,18 @@ describe('LLM Settings API Routes', () => {
       expect(response.body.success).toBe(false);
       expect(response.body.error).toBe('Invalid provider');
     });
+
+    it('should return 400 for non-numeric transport settings', async () => {
+      for (const transport of [{ maxSockets: 'many' }, { requestsPerSecond: -1 }, { burst: 2.5 }]) {
+        const response = await request(app)
+          .put(`/api/projects/${TEST_PROJECT_ID}/llm-settings/provider/openai`)
+          .send({ transport })
+          .expect(400);
+
+        expect(response.body.success).toBe(false);
+        expect(response.body.error).toMatch(/Invalid transport settings/);
+      }
+    });
   });
 
   describe('PUT /api/projects/:projectId/llm-settings/task-stage', () => {
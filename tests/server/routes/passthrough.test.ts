@@ -11,6 +11,7 @@ import {
 } from '../../../server/routes/passthrough.ts';
 import * as taskStorage from '../../../server/utils/taskStorage.ts';
 import * as passthroughStorage from '../../../server/utils/passthroughStorage.ts';
+import { getPipelineScheduler } from '../../../server/utils/pipelineScheduler.ts';
 import type {
   PassthroughPipeline,
   PipelineStatus,
@@ -47,6 +48,8 @@ const createMockPipeline = (
 describe('Passthrough Routes', () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    // Pipelines are queued, never executed, in route tests
+    vi.spyOn(getPipelineScheduler(), 'enqueue').mockResolvedValue(undefined);
   });
 
   describe('POST /api/tasks/:taskId/passthrough/start - Start Pipeline', () => {
@@ -177,7 +180,8 @@ describe('Passthrough Routes', () => {
         .expect(200);
 
       expect(response.body.success).toBe(true);
-      expect(passthroughStorage.createPipeline).toHaveBeenCalledWith(
+      expect(getPipelineScheduler().enqueue).toHaveBeenCalledWith(
+        newPipeline,
         expect.objectContaining({
           resumeFromStage: 'prd',
         })
@@ -234,6 +238,10 @@ describe('Passthrough Routes', () => {
 
       expect(response.body.success).toBe(true);
       expect(response.body.data.pipeline.status).toBe('paused');
+      expect(passthroughStorage.updatePipelineStatus).toHaveBeenCalledWith(
+        runningPipeline.id,
+        'paused'
+      );
     });
   });
 
@@ -286,6 +294,10 @@ describe('Passthrough Routes', () => {
 
       expect(response.body.success).toBe(true);
       expect(response.body.data.pipeline.status).toBe('running');
+      expect(getPipelineScheduler().enqueue).toHaveBeenCalledWith(
+        pausedPipeline,
+        { resumeFromStage: 'design_doc' }
+      );
     });
   });
 
@@ -447,4 +459,18 @@ describe('Passthrough Routes', () => {
       expect(response.body.data.pipeline.status).toBe('running');
     });
   });
+
+  describe('GET /api/tasks/passthrough/metrics - Scheduler Metrics', () => {
+    it('should return queue depth and worker limits', async () => {
+      const app = createTestApp();
+      const response = await request(app)
+        .get('/api/tasks/passthrough/metrics')
+        .expect(200);
+
+      expect(response.body.success).toBe(true);
+      expect(response.body.data.queueDepth).toBe(0);
+      expect(response.body.data.maxWorkers).toBeGreaterThan(0);
+      expect(response.body.data.waitTime).toBeDefined();
+    });
+  });
 });
@@ -0,0 +1,265 @@
+/**
+ * @vitest-environment node
+ */
+/**
+ * LLM Log Store Tests
+ * Batched segment writes, paged and filtered queries, rollups, retention,
+ * crash recovery and the LLMLogger hot tail on top of the store
+ */
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { LLMLogStore } from '../../../server/utils/llmLogStore';
+import { LLMLogger, type LLMLogEntry } from '../../../server/utils/llmLogger';
+
+const BASE_TIME = Date.parse('2025-01-01T00:00:00Z');
+
+function makeEntry(i: number, overrides: Partial<LLMLogEntry> = {}): LLMLogEntry {
+  return {
+    id: `log-${i}`,
+    timestamp: new Date(BASE_TIME + i * 1000).toISOString(),
+    provider: i % 2 === 0 ? 'openai' : 'gemini',
+    model: i % 2 === 0 ? 'gpt-4o' : 'gemini-1.5-pro',
+    projectId: `project-${i % 3}`,
+    response: {
+      usage: { prompt_tokens: 100, completion_tokens: 50, total_tokens: 150 },
+    },
+    metrics: {
+      duration_ms: i + 1,
+      estimated_cost: 0.01,
+    },
+    ...overrides,
+  };
+}
+
+describe('LLMLogStore', () => {
+  let logDir: string;
+  let store: LLMLogStore;
+
+  beforeEach(async () => {
+    logDir = await fs.mkdtemp(path.join(os.tmpdir(), 'llm-log-test-'));
+    store = new LLMLogStore({ logDir, maxAgeMs: Infinity });
+  });
+
+  afterEach(async () => {
+    await store.close();
+    await fs.rm(logDir, { recursive: true, force: true });
+  });
+
+  async function appendAll(target: LLMLogStore, count: number): Promise<void> {
+    for (let i = 0; i < count; i++) {
+      target.append(makeEntry(i));
+    }
+    await target.flush();
+  }
+
+  describe('writing', () => {
+    it('should batch appended entries into one segment write', async () => {
+      await appendAll(store, 10);
+
+      const files = (await fs.readdir(logDir)).sort();
+      expect(files).toEqual(['00000001.idx', '00000001.json', '00000001.log']);
+
+      const lines = (await fs.readFile(path.join(logDir, '00000001.log'), 'utf-8')).trim().split('\n');
+      expect(lines).toHaveLength(10);
+      expect(JSON.parse(lines[0]).id).toBe('log-0');
+    });
+
+    it('should write an entry once when it is updated before the batch is written', async () => {
+      const entry = makeEntry(0);
+      store.append(entry);
+      entry.error = { message: 'failed' };
+      store.append(entry);
+
+      const stats = await store.getStats();
+      expect(stats.entries).toBe(1);
+      expect((await store.query()).entries[0].error?.message).toBe('failed');
+    });
+
+    it('should roll over to a new segment at the size limit', async () => {
+      store = new LLMLogStore({ logDir, maxSegmentBytes: 1024, maxAgeMs: Infinity });
+      await appendAll(store, 20);
+
+      const stats = await store.getStats();
+      expect(stats.segments).toBeGreaterThan(1);
+      expect(stats.entries).toBe(20);
+    });
+  });
+
+  describe('query', () => {
+    it('should page through entries newest first across segments', async () => {
+      store = new LLMLogStore({ logDir, maxSegmentBytes: 1024, maxAgeMs: Infinity });
+      await appendAll(store, 25);
+
+      const ids: string[] = [];
+      let cursor: string | undefined;
+      do {
+        const page = await store.query({ cursor, limit: 7 });
+        ids.push(...page.entries.map((entry) => entry.id));
+        cursor = page.nextCursor ?? undefined;
+      } while (cursor);
+
+      expect(ids).toEqual(Array.from({ length: 25 }, (_, i) => `log-${24 - i}`));
+    });
+
+    it('should filter by provider, model, project, status and time', async () => {
+      await appendAll(store, 12);
+      store.append(makeEntry(12, { error: { message: 'timeout' } }));
+
+      const gemini = await store.query({ provider: 'gemini', limit: 100 });
+      expect(gemini.entries.map((entry) => entry.id)).toEqual(['log-11', 'log-9', 'log-7', 'log-5', 'log-3', 'log-1']);
+
+      const project = await store.query({ projectId: 'project-0', model: 'gpt-4o' });
+      expect(project.entries.map((entry) => entry.id)).toEqual(['log-12', 'log-6', 'log-0']);
+
+      const errors = await store.query({ status: 'error' });
+      expect(errors.entries.map((entry) => entry.id)).toEqual(['log-12']);
+
+      const window = await store.query({ from: BASE_TIME + 3000, to: BASE_TIME + 5000 });
+      expect(window.entries.map((entry) => entry.id)).toEqual(['log-5', 'log-4', 'log-3']);
+
+      expect((await store.query({ provider: 'lmstudio' })).entries).toEqual([]);
+    });
+
+    it('should index the project of connection test entries', async () => {
+      store.append(makeEntry(0, {
+        projectId: undefined,
+        request: { parameters: { type: 'connection-test', projectId: 'project-x' } },
+      }));
+
+      expect((await store.query({ projectId: 'project-x' })).entries).toHaveLength(1);
+    });
+  });
+
+  describe('rollups', () => {
+    it('should compute latency percentiles, cost and tokens per model', async () => {
+      for (let i = 0; i < 200; i++) {
+        store.append(makeEntry(i * 2, { metrics: { duration_ms: i + 1, estimated_cost: 0.001 * (i + 1) } }));
+      }
+      store.append(makeEntry(1, { metrics: undefined, error: { message: 'failed' } }));
+
+      const rollups = await store.getRollups();
+      const openai = rollups.find((rollup) => rollup.model === 'gpt-4o')!;
+      const gemini = rollups.find((rollup) => rollup.model === 'gemini-1.5-pro')!;
+
+      expect(openai.provider).toBe('openai');
+      expect(openai.count).toBe(200);
+      expect(openai.latencyMs).toMatchObject({ p50: 100, p95: 190, p99: 198, max: 200 });
+      expect(openai.latencyMs.avg).toBeCloseTo(100.5);
+      expect(openai.cost.total).toBeCloseTo(20.1);
+      expect(openai.cost.p95).toBeCloseTo(0.19);
+      expect(openai.tokens).toEqual({ input: 20000, output: 10000 });
+
+      expect(gemini.errorCount).toBe(1);
+      expect(gemini.latencyMs.p99).toBe(0);
+    });
+
+    it('should group by project or roll everything up together', async () => {
+      await appendAll(store, 9);
+
+      const byProject = await store.getRollups({}, 'project');
+      expect(byProject.map((rollup) => [rollup.projectId, rollup.count]).sort()).toEqual([
+        ['project-0', 3],
+        ['project-1', 3],
+        ['project-2', 3],
+      ]);
+
+      const overall = await store.getRollups({ provider: 'openai' }, 'none');
+      expect(overall).toHaveLength(1);
+      expect(overall[0].count).toBe(5);
+      expect(overall[0].provider).toBeUndefined();
+    });
+  });
+
+  describe('retention', () => {
+    it('should drop the oldest segments beyond the size budget', async () => {
+      store = new LLMLogStore({ logDir, maxSegmentBytes: 1024, maxTotalBytes: 3000, maxAgeMs: Infinity });
+      await appendAll(store, 40);
+
+      const stats = await store.getStats();
+      expect(stats.bytes).toBeLessThanOrEqual(3000);
+
+      const ids = (await store.query({ limit: 1000 })).entries.map((entry) => entry.id);
+      expect(ids[0]).toBe('log-39');
+      expect(ids).not.toContain('log-0');
+    });
+
+    it('should drop segments older than the age limit', async () => {
+      store = new LLMLogStore({ logDir, segmentSpanMs: 1000, maxAgeMs: 5000 });
+      store.append(makeEntry(0, { timestamp: new Date(Date.now() - 60_000).toISOString() }));
+      store.append(makeEntry(1, { timestamp: new Date().toISOString() }));
+      await store.flush();
+
+      const ids = (await store.query()).entries.map((entry) => entry.id);
+      expect(ids).toEqual(['log-1']);
+    });
+  });
+
+  describe('recovery', () => {
+    it('should keep entries across restarts', async () => {
+      await appendAll(store, 5);
+
+      const reopened = new LLMLogStore({ logDir, maxAgeMs: Infinity });
+      reopened.append(makeEntry(5));
+
+      const ids = (await reopened.query()).entries.map((entry) => entry.id);
+      expect(ids).toEqual(['log-5', 'log-4', 'log-3', 'log-2', 'log-1', 'log-0']);
+    });
+
+    it('should drop a partially written last line and rebuild the index', async () => {
+      await appendAll(store, 3);
+      await fs.appendFile(path.join(logDir, '00000001.log'), '{"id":"log-3","timest');
+      await fs.writeFile(path.join(logDir, '00000001.idx'), '');
+
+      const reopened = new LLMLogStore({ logDir, maxAgeMs: Infinity });
+      reopened.append(makeEntry(4));
+
+      const ids = (await reopened.query()).entries.map((entry) => entry.id);
+      expect(ids).toEqual(['log-4', 'log-2', 'log-1', 'log-0']);
+    });
+  });
+
+  describe('LLMLogger integration', () => {
+    it('should persist completed entries beyond the in-memory hot tail', async () => {
+      const logger = new LLMLogger({ store });
+
+      for (let i = 0; i < 150; i++) {
+        logger.logRequest({ id: `call-${i}`, provider: 'openai', model: 'gpt-4o', projectId: 'project-1' });
+        logger.logResponse({ id: `call-${i}`, metrics: { duration_ms: 10 } });
+      }
+      logger.logRequest({ id: 'in-flight', provider: 'openai', model: 'gpt-4o' });
+
+      expect(logger.getLogs()).toHaveLength(100);
+
+      const page = await store.query({ projectId: 'project-1', limit: 1000 });
+      expect(page.entries).toHaveLength(150);
+      expect(page.entries[0].id).toBe('call-149');
+      expect((await store.getStats()).entries).toBe(150);
+    });
+
+    it('should persist untruncated entries while keeping the hot tail size limited', async () => {
+      const logger = new LLMLogger({ store });
+      const prompt = 'p'.repeat(5000);
+      const content = 'c'.repeat(5000);
+
+      logger.logRequest({ id: 'long', provider: 'openai', model: 'gpt-4o', request: { prompt } });
+      logger.logResponse({ id: 'long', response: { content }, metrics: { duration_ms: 10 } });
+      logger.logRequest({ id: 'failed', provider: 'openai', model: 'gpt-4o', request: { prompt } });
+      logger.logError({ id: 'failed', error: { message: 'e'.repeat(1000) } });
+      await store.flush();
+
+      const [memoryLong, memoryFailed] = logger.getLogs();
+      expect(memoryLong.request?.prompt?.length).toBeLessThan(prompt.length);
+      expect(memoryLong.response?.content?.length).toBeLessThan(content.length);
+      expect(memoryFailed.error?.message.length).toBeLessThan(1000);
+
+      const page = await store.query({ limit: 10 });
+      const stored = new Map(page.entries.map(entry => [entry.id, entry]));
+      expect(stored.get('long')?.request?.prompt).toBe(prompt);
+      expect(stored.get('long')?.response?.content).toBe(content);
+      expect(stored.get('failed')?.request?.prompt).toBe(prompt);
+      expect(stored.get('failed')?.error?.message).toBe('e'.repeat(1000));
+    });
+  });
+});
@@ -14,11 +14,21 @@ import {
   LMStudioProvider,
   ClaudeCodeProvider,
 } from '../../../server/utils/llmProvider';
+import { HttpTransport, getSharedTransport, setSharedTransport } from '../../../server/utils/httpTransport';
 import type { LLMProviderSettings } from '../../../src/types/llm';
 
 // Mock fetch for API tests
 const originalFetch = global.fetch;
 
+// Providers send through the shared transport; route it to the mocked fetch
+beforeEach(() => {
+  setSharedTransport(new HttpTransport({ fetch: (url, init) => global.fetch(url, init) }));
+});
+
+afterEach(() => {
+  setSharedTransport(null);
+});
+
 describe('LLM Provider Factory', () => {
   beforeEach(() => {
     // Reset fetch mock
@@ -98,6 +108,44 @@ describe('LLM Provider Factory', () => {
 
       expect(() => createLLMProvider(settings)).toThrow('Unknown provider');
     });
+
+    it('should apply connection limits from settings to the provider endpoint', () => {
+      const endpoint = 'https://open.bigmodel.cn/api/paas/v4';
+      const transport = getSharedTransport();
+      const configurePool = vi.spyOn(transport, 'configurePool');
+      const configureRateLimit = vi.spyOn(transport, 'configureRateLimit');
+
+      createLLMProvider({
+        provider: 'openai',
+        apiKey: 'sk-test-key',
+        endpoint,
+        isEnabled: true,
+        connectionStatus: 'untested',
+        transport: { maxSockets: 8, requestsPerSecond: 2 },
+      });
+
+      expect(configurePool).toHaveBeenCalledWith(endpoint, { maxSockets: 8 });
+      expect(configureRateLimit).toHaveBeenCalledWith('openai', { capacity: 2, refillPerSecond: 2 }, endpoint);
+    });
+
+    it('should fall back to default connection limits for invalid settings', () => {
+      const transport = getSharedTransport();
+      const configurePool = vi.spyOn(transport, 'configurePool');
+      const configureRateLimit = vi.spyOn(transport, 'configureRateLimit');
+
+      const provider = createLLMProvider({
+        provider: 'openai',
+        apiKey: 'sk-test-key',
+        endpoint: 'https://api.example.com/v1',
+        isEnabled: true,
+        connectionStatus: 'untested',
+        transport: { maxSockets: 'many', requestsPerSecond: 2 } as unknown as LLMProviderSettings['transport'],
+      });
+
+      expect(provider).toBeInstanceOf(OpenAIProvider);
+      expect(configurePool).not.toHaveBeenCalled();
+      expect(configureRateLimit).not.toHaveBeenCalled();
+    });
   });
 
   describe('createProviderById', () => {
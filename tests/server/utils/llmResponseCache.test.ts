@@ -0,0 +1,278 @@
+/**
+ * LLM Response Cache Tests
+ * Memory/disk tiers, TTL and size eviction, stats, and the provider wrapper
+ */
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { LLMResponseCache, withResponseCache } from '../../../server/utils/llmResponseCache';
+import type { LLMProviderInterface } from '../../../server/utils/llmProviders';
+import type { LLMModelConfig, LLMResult } from '../../../src/types/llm';
+
+const config: LLMModelConfig = {
+  provider: 'openai',
+  modelId: 'gpt-4o',
+  temperature: 0,
+  maxTokens: 1000,
+  topP: 1,
+};
+
+function makeResult(content: string): LLMResult {
+  return {
+    success: true,
+    content,
+    provider: 'openai',
+    model: 'gpt-4o',
+    tokens: { input: 1000, output: 500 },
+  };
+}
+
+function makeKey(prompt: string, overrides: Partial<LLMModelConfig> = {}): string {
+  return LLMResponseCache.createKey({ provider: 'openai', config: { ...config, ...overrides }, prompt });
+}
+
+describe('LLMResponseCache', () => {
+  let cacheDir: string;
+
+  beforeEach(async () => {
+    cacheDir = await fs.mkdtemp(path.join(os.tmpdir(), 'llm-cache-test-'));
+  });
+
+  afterEach(async () => {
+    vi.useRealTimers();
+    await fs.rm(cacheDir, { recursive: true, force: true });
+  });
+
+  describe('createKey', () => {
+    it('should be stable for identical requests', () => {
+      expect(makeKey('prompt')).toBe(makeKey('prompt'));
+    });
+
+    it('should change with prompt or sampling parameters', () => {
+      const base = makeKey('prompt');
+
+      expect(makeKey('other prompt')).not.toBe(base);
+      expect(makeKey('prompt', { temperature: 0.7 })).not.toBe(base);
+      expect(makeKey('prompt', { modelId: 'gpt-4o-mini' })).not.toBe(base);
+    });
+  });
+
+  describe('get/set', () => {
+    it('should return a stored result from memory', async () => {
+      const cache = new LLMResponseCache({ cacheDir });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      const result = await cache.get(makeKey('a'));
+
+      expect(result?.content).toBe('A');
+      expect(cache.getStats().memoryHits).toBe(1);
+    });
+
+    it('should serve entries from disk after a restart', async () => {
+      await new LLMResponseCache({ cacheDir }).set(makeKey('a'), makeResult('A'));
+
+      const restarted = new LLMResponseCache({ cacheDir });
+      const result = await restarted.get(makeKey('a'));
+
+      expect(result?.content).toBe('A');
+      expect(restarted.getStats().diskHits).toBe(1);
+    });
+
+    it('should not cache failed results', async () => {
+      const cache = new LLMResponseCache({ cacheDir });
+      await cache.set(makeKey('a'), { ...makeResult(''), success: false, error: 'boom' });
+
+      expect(await cache.get(makeKey('a'))).toBeNull();
+      expect(cache.getStats().misses).toBe(1);
+    });
+
+    it('should not let callers mutate cached results', async () => {
+      const cache = new LLMResponseCache({ cacheDir });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      const first = await cache.get(makeKey('a'));
+      first!.content = 'mutated';
+
+      expect((await cache.get(makeKey('a')))?.content).toBe('A');
+    });
+  });
+
+  describe('expiry and eviction', () => {
+    it('should expire entries older than the TTL', async () => {
+      vi.useFakeTimers({ toFake: ['Date'] });
+      vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+      const cache = new LLMResponseCache({ cacheDir, ttlMs: 60_000 });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      vi.setSystemTime(new Date('2026-01-01T00:02:00Z'));
+
+      expect(await cache.get(makeKey('a'))).toBeNull();
+    });
+
+    it('should honour a per-call TTL', async () => {
+      vi.useFakeTimers({ toFake: ['Date'] });
+      vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+      const cache = new LLMResponseCache({ cacheDir });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      vi.setSystemTime(new Date('2026-01-01T02:00:00Z'));
+
+      expect(await cache.get(makeKey('a'), 60 * 60 * 1000)).toBeNull();
+      expect(await cache.get(makeKey('a'))).not.toBeNull();
+    });
+
+    it('should remove disk entries once they are older than the TTL', async () => {
+      vi.useFakeTimers({ toFake: ['Date'] });
+      vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+      const cache = new LLMResponseCache({ cacheDir, ttlMs: 60_000 });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      // Reading an entry does not extend its lifetime
+      vi.setSystemTime(new Date('2026-01-01T00:00:50Z'));
+      await cache.get(makeKey('a'));
+
+      vi.setSystemTime(new Date('2026-01-01T00:01:30Z'));
+      await cache.set(makeKey('b'), makeResult('B'));
+
+      const entryPath = path.join(cacheDir, makeKey('a').slice(0, 2), `${makeKey('a')}.json`);
+      const exists = await fs.access(entryPath).then(() => true, () => false);
+      expect(exists).toBe(false);
+      expect(cache.getStats().diskEntries).toBe(1);
+      expect(cache.getStats().evictions).toBe(1);
+    });
+
+    it('should keep disk entries for the TTL they were stored with', async () => {
+      vi.useFakeTimers({ toFake: ['Date'] });
+      vi.setSystemTime(new Date('2026-01-01T00:00:00Z'));
+      const cache = new LLMResponseCache({ cacheDir, ttlMs: 60_000 });
+      await cache.set(makeKey('a'), makeResult('A'), 60 * 60 * 1000);
+
+      // A restarted cache rebuilds its index from disk and sweeps it
+      vi.setSystemTime(new Date('2026-01-01T00:30:00Z'));
+      const restarted = new LLMResponseCache({ cacheDir, ttlMs: 60_000 });
+      await restarted.set(makeKey('b'), makeResult('B'));
+
+      expect(restarted.getStats().evictions).toBe(0);
+      expect((await restarted.get(makeKey('a'), 60 * 60 * 1000))?.content).toBe('A');
+    });
+
+    it('should evict the least recently used memory entry', async () => {
+      const cache = new LLMResponseCache({ cacheDir, maxMemoryEntries: 2 });
+      await cache.set(makeKey('a'), makeResult('A'));
+      await cache.set(makeKey('b'), makeResult('B'));
+      await cache.get(makeKey('a'));
+      await cache.set(makeKey('c'), makeResult('C'));
+
+      await cache.get(makeKey('b'));
+
+      // 'b' was evicted from memory and had to come from disk
+      expect(cache.getStats().diskHits).toBe(1);
+      expect(cache.getStats().memoryEntries).toBe(2);
+    });
+
+    it('should keep the disk tier within its size budget', async () => {
+      const cache = new LLMResponseCache({ cacheDir, maxDiskBytes: 2000 });
+      for (let i = 0; i < 10; i++) {
+        await cache.set(makeKey(`prompt ${i}`), makeResult('x'.repeat(200)));
+      }
+
+      const stats = cache.getStats();
+      expect(stats.diskBytes).toBeLessThanOrEqual(2000);
+      expect(stats.diskEntries).toBeLessThan(10);
+      expect(stats.evictions).toBeGreaterThan(0);
+    });
+  });
+
+  describe('stats', () => {
+    it('should count tokens and cost saved on hits', async () => {
+      const cache = new LLMResponseCache({ cacheDir });
+      await cache.set(makeKey('a'), makeResult('A'));
+
+      await cache.get(makeKey('a'));
+      await cache.get(makeKey('a'));
+
+      const stats = cache.getStats();
+      expect(stats.hits).toBe(2);
+      expect(stats.tokensSaved).toEqual({ input: 2000, output: 1000 });
+      expect(stats.costSaved).toBeGreaterThan(0);
+    });
+  });
+});
+
+describe('withResponseCache', () => {
+  let cacheDir: string;
+  let cache: LLMResponseCache;
+  let provider: LLMProviderInterface;
+
+  beforeEach(async () => {
+    cacheDir = await fs.mkdtemp(path.join(os.tmpdir(), 'llm-cache-test-'));
+    cache = new LLMResponseCache({ cacheDir });
+    provider = {
+      provider: 'openai',
+      generate: vi.fn(async (prompt: string) => makeResult(`echo ${prompt}`)),
+      generateStream: vi.fn(async (prompt: string, _config: LLMModelConfig, handlers: { onToken: (t: string) => void }) => {
+        handlers.onToken(`echo ${prompt}`);
+        return makeResult(`echo ${prompt}`);
+      }),
+      testConnection: vi.fn(),
+      getAvailableModels: vi.fn(),
+    };
+  });
+
+  afterEach(async () => {
+    await fs.rm(cacheDir, { recursive: true, force: true });
+  });
+
+  it('should call the provider only once for identical requests', async () => {
+    const cached = withResponseCache(provider, { cache });
+
+    const first = await cached.generate('hello', config);
+    const second = await cached.generate('hello', config);
+
+    expect(provider.generate).toHaveBeenCalledTimes(1);
+    expect(first.cached).toBeUndefined();
+    expect(second).toEqual({ ...first, cached: true });
+  });
+
+  it('should retry requests whose previous attempt failed', async () => {
+    vi.mocked(provider.generate).mockResolvedValueOnce({ ...makeResult(''), success: false, error: 'rate limited' });
+    const cached = withResponseCache(provider, { cache });
+
+    await cached.generate('hello', config);
+    const result = await cached.generate('hello', config);
+
+    expect(provider.generate).toHaveBeenCalledTimes(2);
+    expect(result.success).toBe(true);
+  });
+
+  it('should replay cached content through the stream callback', async () => {
+    const cached = withResponseCache(provider, { cache });
+    await cached.generate('hello', config);
+    const tokens: string[] = [];
+
+    const result = await cached.generateStream!('hello', config, { onToken: (t) => tokens.push(t) });
+
+    expect(provider.generateStream).not.toHaveBeenCalled();
+    expect(tokens).toEqual(['echo hello']);
+    expect(result.content).toBe('echo hello');
+  });
+
+  it('should keep entries for different endpoints apart', async () => {
+    await withResponseCache(provider, { cache, endpoint: 'http://a/v1' }).generate('hello', config);
+    await withResponseCache(provider, { cache, endpoint: 'http://b/v1' }).generate('hello', config);
+
+    expect(provider.generate).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not cache providers that read the working directory', async () => {
+    const fileReader = { ...provider, readsWorkingDir: true };
+    const cached = withResponseCache(fileReader, { cache });
+
+    await cached.generate('hello', config, '/repo');
+    await cached.generate('hello', config, '/repo');
+
+    expect(cached).toBe(fileReader);
+    expect(provider.generate).toHaveBeenCalledTimes(2);
+  });
+});
@@ -105,7 +105,7 @@ describe('TokenExtractor', () => {
   });
 
   describe('ClaudeCode format', () => {
-    it('should return undefined for ClaudeCode (no token info)', () => {
+    it('should return undefined for ClaudeCode output without usage', () => {
       const response = {
         output: 'Generated content',
       };
@@ -114,10 +114,21 @@ describe('TokenExtractor', () => {
       expect(usage).toBeUndefined();
     });
 
-    it('should always return undefined for ClaudeCode provider', () => {
+    it('should return undefined for an empty ClaudeCode result', () => {
       const usage = extractTokenUsage('claude-code', {});
       expect(usage).toBeUndefined();
     });
+
+    it('should extract usage from a ClaudeCode CLI JSON result', () => {
+      const response = {
+        type: 'result',
+        result: 'Generated content',
+        usage: { input_tokens: 120, output_tokens: 30 },
+      };
+
+      const usage = extractTokenUsage('claude-code', response);
+      expect(usage).toEqual({ prompt_tokens: 120, completion_tokens: 30, total_tokens: 150 });
+    });
   });
 
   describe('Edge cases', () => {
@@ -7,6 +7,7 @@
  * - getVersions: Get all versions for a task
  * - getVersion: Get a specific version by ID
  * - restoreVersion: Restore a task to a specific version
+ * - Delta storage: snapshots, deltas, metadata listing, legacy migration
  */
 
 import { describe, it, expect, beforeEach, afterEach } from 'vitest';
@@ -18,7 +19,13 @@ import {
   getVersions,
   getVersion,
   restoreVersion,
-  getVersionFilePath
+  listVersions,
+  migrateVersionStore,
+  getVersionFilePath,
+  getVersionIndexFilePath,
+  getVersionChunkFilePath,
+  SNAPSHOT_INTERVAL,
+  type DocumentVersion
 } from '../../../server/utils/versionStorage';
 
 describe('versionStorage', () => {
@@ -114,19 +121,20 @@ describe('versionStorage', () => {
       expect(secondVersion.parentVersionId).toBe(firstVersion.id);
     });
 
-    it('should save version file to correct location', async () => {
+    it('should save the first version as a snapshot chunk', async () => {
       const { testProjectId, testTaskId } = createTestIds();
 
-      const version = await saveVersion(testProjectId, {
+      await saveVersion(testProjectId, {
         taskId: testTaskId,
         content: 'Test content',
         author: 'user1'
       });
 
-      const versionFilePath = getVersionFilePath(testProjectId, testTaskId, version.id);
-      const fileExists = await fs.access(versionFilePath).then(() => true).catch(() => false);
+      const chunkPath = getVersionChunkFilePath(testProjectId, testTaskId, 1);
+      const chunk = JSON.parse(await fs.readFile(chunkPath, 'utf-8'));
 
-      expect(fileExists).toBe(true);
+      expect(chunk.snapshot).toBe('Test content');
+      expect(chunk.deltas).toEqual([]);
     });
 
     it('should update versions index file', async () => {
@@ -301,4 +309,108 @@ describe('versionStorage', () => {
       expect(restored?.changeDescription).toContain('Restored from version');
     });
   });
+
+  describe('delta storage', () => {
+    // Document with many lines so single-line edits are stored as deltas
+    const makeDocument = (revision: number) =>
+      Array.from({ length: 40 }, (_, line) =>
+        line === revision % 40 ? `Line ${line} edited in revision ${revision}` : `Line ${line} of the document`
+      ).join('\n');
+
+    it('should reconstruct every version across snapshot boundaries', async () => {
+      const { testProjectId, testTaskId } = createTestIds();
+      const count = SNAPSHOT_INTERVAL + 5;
+
+      for (let i = 1; i <= count; i++) {
+        await saveVersion(testProjectId, { taskId: testTaskId, content: makeDocument(i), author: 'user1' });
+      }
+
+      const versions = await getVersions(testProjectId, testTaskId);
+      expect(versions.map((v) => v.content)).toEqual(
+        Array.from({ length: count }, (_, i) => makeDocument(i + 1))
+      );
+
+      // Versions after the first chunk start a new snapshot
+      const secondChunk = getVersionChunkFilePath(testProjectId, testTaskId, 2);
+      const chunk = JSON.parse(await fs.readFile(secondChunk, 'utf-8'));
+      expect(chunk.snapshot).toBe(makeDocument(SNAPSHOT_INTERVAL + 1));
+      expect(chunk.deltas).toHaveLength(4);
+
+      const middle = await getVersion(testProjectId, testTaskId, versions[12].id);
+      expect(middle?.content).toBe(makeDocument(13));
+    });
+
+    it('should list metadata without content', async () => {
+      const { testProjectId, testTaskId } = createTestIds();
+      await saveVersion(testProjectId, {
+        taskId: testTaskId,
+        content: 'Some content',
+        author: 'user1',
+        changeDescription: 'First'
+      });
+
+      const [metadata] = await listVersions(testProjectId, testTaskId);
+
+      expect(metadata).not.toHaveProperty('content');
+      expect(metadata.versionNumber).toBe(1);
+      expect(metadata.author).toBe('user1');
+      expect(metadata.changeDescription).toBe('First');
+      expect(metadata.contentLength).toBe('Some content'.length);
+    });
+
+    it('should migrate legacy per-version files', async () => {
+      const { testProjectId, testTaskId } = createTestIds();
+      const indexPath = getVersionIndexFilePath(testProjectId, testTaskId);
+      await fs.mkdir(path.dirname(indexPath), { recursive: true });
+
+      const legacy: DocumentVersion[] = [1, 2, 3].map((n) => ({
+        id: uuidv4(),
+        taskId: testTaskId,
+        content: makeDocument(n),
+        author: 'legacy-user',
+        versionNumber: n,
+        timestamp: new Date(2024, 0, n).toISOString()
+      }));
+      for (const version of legacy) {
+        await fs.writeFile(
+          getVersionFilePath(testProjectId, testTaskId, version.id),
+          JSON.stringify(version, null, 2),
+          'utf-8'
+        );
+      }
+      await fs.writeFile(indexPath, JSON.stringify(legacy.map((v) => v.id), null, 2), 'utf-8');
+
+      const migrated = await migrateVersionStore(testProjectId, testTaskId);
+      expect(migrated.map((v) => v.id)).toEqual(legacy.map((v) => v.id));
+
+      const versions = await getVersions(testProjectId, testTaskId);
+      expect(versions).toEqual(legacy);
+
+      const legacyFileExists = await fs
+        .access(getVersionFilePath(testProjectId, testTaskId, legacy[0].id))
+        .then(() => true)
+        .catch(() => false);
+      expect(legacyFileExists).toBe(false);
+
+      const next = await saveVersion(testProjectId, {
+        taskId: testTaskId,
+        content: makeDocument(4),
+        author: 'user1'
+      });
+      expect(next.versionNumber).toBe(4);
+    });
+
+    it('should number concurrent saves uniquely', async () => {
+      const { testProjectId, testTaskId } = createTestIds();
+
+      const saved = await Promise.all(
+        [1, 2, 3, 4, 5].map((n) =>
+          saveVersion(testProjectId, { taskId: testTaskId, content: makeDocument(n), author: 'user1' })
+        )
+      );
+
+      expect(saved.map((v) => v.versionNumber).sort()).toEqual([1, 2, 3, 4, 5]);
+      expect(await getVersions(testProjectId, testTaskId)).toHaveLength(5);
+    });
+  });
 });
@@ -14,6 +14,9 @@ import {
   getTags,
   isSystemNameDuplicate,
   ensureSystemsDirectoryExists,
+  searchSystemDocuments,
+  matchSystemDocuments,
+  matchSystemDocumentsBatch,
 } from '../server/utils/systemStorage.ts';
 import type { SystemDocument } from '../src/types/index.ts';
 
@@ -400,8 +403,7 @@ describe('System Storage Utilities', () => {
     });
   });
 
-  // TODO: Implement searchSystemDocuments function in systemStorage.ts
-  describe.skip('searchSystemDocuments', () => {
+  describe('searchSystemDocuments', () => {
     beforeEach(async () => {
       const docs: Omit<SystemDocument, 'content'>[] = [
         { id: '1', projectId: TEST_PROJECT_ID, name: 'Character System', category: 'System', tags: ['core', 'player'], dependencies: [], createdAt: '', updatedAt: '' },
@@ -444,5 +446,100 @@ describe('System Storage Utilities', () => {
       expect(results).toHaveLength(1);
       expect(results[0].name).toBe('Economy Rules');
     });
+
+    it('should rank name matches above content matches', async () => {
+      // The content-only match is listed first and mentions the term more often
+      const docs: Omit<SystemDocument, 'content'>[] = [
+        { id: '5', projectId: TEST_PROJECT_ID, name: 'Skill Tree', category: 'Progression', tags: ['skills'], dependencies: [], createdAt: '', updatedAt: '' },
+        { id: '2', projectId: TEST_PROJECT_ID, name: 'Combat System', category: 'System', tags: ['core', 'battle'], dependencies: [], createdAt: '', updatedAt: '' },
+      ];
+      const systemsDir = path.join(WORKSPACE_PATH, TEST_PROJECT_ID, 'systems');
+      await fs.writeFile(path.join(systemsDir, 'systems.json'), JSON.stringify(docs), 'utf-8');
+      await fs.writeFile(path.join(systemsDir, '5.md'), 'Unlocks combat skills and combat perks.', 'utf-8');
+      await fs.writeFile(path.join(systemsDir, '2.md'), 'Battle mechanics.', 'utf-8');
+
+      const ranked = await searchSystemDocuments(TEST_PROJECT_ID, 'combat');
+      expect(ranked.map(r => r.name)).toEqual(['Combat System', 'Skill Tree']);
+    });
+
+    it('should paginate inside the index', async () => {
+      const page = await searchSystemDocuments(TEST_PROJECT_ID, '', { limit: 2, offset: 1 });
+      expect(page).toHaveLength(2);
+      expect(page[0].content).toBeDefined();
+    });
+
+    it('should reflect documents saved after the index was built', async () => {
+      await searchSystemDocuments(TEST_PROJECT_ID, 'core');
+      await saveSystemDocument(TEST_PROJECT_ID, {
+        id: '4',
+        projectId: TEST_PROJECT_ID,
+        name: 'Guild System',
+        category: 'Social',
+        tags: ['core'],
+        content: 'Guild membership and ranks.',
+        dependencies: [],
+        createdAt: '',
+        updatedAt: '',
+      });
+
+      const results = await searchSystemDocuments(TEST_PROJECT_ID, 'core');
+      expect(results).toHaveLength(3);
+
+      await deleteSystemDocument(TEST_PROJECT_ID, '4');
+      expect(await searchSystemDocuments(TEST_PROJECT_ID, 'guild')).toHaveLength(0);
+    });
+  });
+
+  describe('matchSystemDocuments', () => {
+    function createDoc(id: string, name: string, tags: string[]): SystemDocument {
+      return {
+        id,
+        projectId: TEST_PROJECT_ID,
+        name,
+        category: 'System',
+        tags,
+        content: `# ${name}`,
+        dependencies: [],
+        createdAt: '',
+        updatedAt: '',
+      };
+    }
+
+    beforeEach(async () => {
+      await saveSystemDocument(TEST_PROJECT_ID, createDoc('1', 'Character System', ['core', 'character']));
+      await saveSystemDocument(TEST_PROJECT_ID, createDoc('2', 'Guild System', ['core', 'guild']));
+    });
+
+    it('should match keywords against system tags', async () => {
+      const results = await matchSystemDocuments(TEST_PROJECT_ID, [{ keyword: 'Guild', weight: 100 }]);
+
+      expect(results).toEqual([
+        { systemId: '2', systemName: 'Guild System', relevanceScore: 100, matchedTags: ['guild'] },
+      ]);
+    });
+
+    it('should reflect creates, updates and deletes after the index was built', async () => {
+      const keywords = [{ keyword: 'raid', weight: 100 }];
+      expect(await matchSystemDocuments(TEST_PROJECT_ID, keywords)).toEqual([]);
+
+      await saveSystemDocument(TEST_PROJECT_ID, createDoc('3', 'Raid System', ['raid']));
+      expect((await matchSystemDocuments(TEST_PROJECT_ID, keywords)).map((r) => r.systemId)).toEqual(['3']);
+
+      await saveSystemDocument(TEST_PROJECT_ID, createDoc('2', 'Guild System', ['guild', 'raid']));
+      expect((await matchSystemDocuments(TEST_PROJECT_ID, keywords)).map((r) => r.systemId).sort()).toEqual(['2', '3']);
+
+      await deleteSystemDocument(TEST_PROJECT_ID, '3');
+      expect((await matchSystemDocuments(TEST_PROJECT_ID, keywords)).map((r) => r.systemId)).toEqual(['2']);
+    });
+
+    it('should match several keyword sets in one call', async () => {
+      const results = await matchSystemDocumentsBatch(TEST_PROJECT_ID, [
+        [{ keyword: 'character', weight: 100 }],
+        [],
+        [{ keyword: 'core', weight: 100 }],
+      ]);
+
+      expect(results.map((list) => list.map((r) => r.systemId).sort())).toEqual([['1'], [], ['1', '2']]);
+    });
   });
 });